@@ -24,12 +24,13 @@ from cugraph.community import (
 from cugraph.centrality import katz_centrality
 from cugraph.cores import core_number, k_core
 from cugraph.components import weakly_connected_components, strongly_connected_components
-from cugraph.link_analysis import pagerank
-from cugraph.link_prediction import jaccard, overlap, jaccard_w, overlap_w
-from cugraph.structure import Graph, from_cudf_edgelist, renumber, symmetrize, symmetrize_df
-from cugraph.traversal import bfs, sssp, filter_unreachable
+from cugraph.link_analysis import pagerank, personalized_pagerank_batch, IncrementalPageRank
+from cugraph.link_prediction import jaccard, overlap, jaccard_w, overlap_w, jaccard_topk, score_pairs
+from cugraph.structure import Graph, from_cudf_edgelist, read_edgelist, load, renumber, VertexDictionary, symmetrize, symmetrize_df
+from cugraph import generators
+from cugraph.traversal import bfs, bfs_batch, sssp, filter_unreachable, shortest_path
 # from cugraph.utilities import grmat_gen
-from cugraph.utilities import device_of_gpu_pointer
+from cugraph.utilities import device_of_gpu_pointer, SolverStats, GraphExecutor, GraphFuture, submit
 
 from cugraph.snmg.link_analysis.mg_pagerank import mg_pagerank
 
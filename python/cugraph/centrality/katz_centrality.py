@@ -11,15 +11,24 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from cugraph.centrality import katz_centrality_wrapper
+from cugraph.centrality import katz_centrality_host
+from cugraph.structure.graph import memory_budgeted
+from cugraph.utilities.solver_stats import SolverStats
+try:
+    from cugraph.centrality import katz_centrality_wrapper
+except ImportError:
+    katz_centrality_wrapper = None
 
 
+@memory_budgeted
 def katz_centrality(G,
                     alpha=0.1,
                     max_iter=100,
                     tol=1.0e-6,
                     nstart=None,
-                    normalized=True):
+                    normalized=True,
+                    callback=None,
+                    return_stats=False):
     """
     Compute the Katz centrality for the nodes of the graph G. cuGraph does not
     currently support the 'beta' and 'weight' parameters as seen in the
@@ -65,6 +74,13 @@ def katz_centrality(G,
 
     normalized : bool
         If True normalize the resulting katz centrality values
+    callback : callable, optional
+        Called after every iteration as callback(iteration, residual), where
+        residual is the L1 norm of the change of the centrality vector. If it
+        returns True the solver stops and returns the current (unconverged)
+        values instead of raising. Only supported on the host backend.
+    return_stats : bool, optional
+        If True, also return a cugraph.SolverStats record of the run.
 
     Returns
     -------
@@ -77,6 +93,11 @@ def katz_centrality(G,
         df['katz_centrality'] : cudf.Series
             Contains the katz centrality of vertices
 
+        A pandas.DataFrame with the same columns is returned for graphs using
+        the host backend.
+    stats : cugraph.SolverStats
+        Only returned if return_stats is True.
+
     Examples
     --------
     >>> M = cudf.read_csv('datasets/karate.csv', delimiter=' ',
@@ -88,7 +109,16 @@ def katz_centrality(G,
     >>> kc = cugraph.katz_centrality(G)
     """
 
-    df = katz_centrality_wrapper.katz_centrality(G.graph_ptr, alpha, max_iter,
-                                                 tol, nstart, normalized)
+    stats = SolverStats(callback)
+    if G.backend == 'host':
+        df = katz_centrality_host.katz_centrality(
+            G.graph_ptr, alpha, max_iter, tol, nstart, normalized, stats)
+    else:
+        stats.start_device_run(callback)
+        with stats.phase('solve'):
+            df = katz_centrality_wrapper.katz_centrality(
+                G.graph_ptr, alpha, max_iter, tol, nstart, normalized)
 
+    if return_stats:
+        return df, stats
     return df
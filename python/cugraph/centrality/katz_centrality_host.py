@@ -0,0 +1,65 @@
+# Copyright (c) 2019, NVIDIA CORPORATION.
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from cugraph.structure import graph_host
+from cugraph.utilities.solver_stats import SolverStats
+import numpy as np
+import pandas as pd
+
+
+def katz_centrality(graph_ptr, alpha=0.1, max_iter=100, tol=1.0e-6,
+                    nstart=None, normalized=True, stats=None):
+    """
+    Host implementation of gdf_katz_centrality
+    """
+    if max_iter <= 0:
+        max_iter = 100
+    if tol == 0.0:
+        tol = 1.0e-6
+    if stats is None:
+        stats = SolverStats()
+
+    # x_{k+1} = alpha * A^T x_k + 1, pulling from the in-neighbors
+    with stats.phase('csr_build'):
+        T = graph_host.csr_matrix(graph_ptr, transposed=True,
+                                  weighted=False)
+    num_verts = T.shape[0]
+
+    x = np.zeros(num_verts, dtype=np.float64)
+    if nstart is not None:
+        x[graph_host.to_host_array(nstart['vertex'])] = \
+            graph_host.to_host_array(nstart['values'])
+
+    converged = False
+    with stats.phase('iterations'):
+        for _ in range(max_iter):
+            x_new = alpha * (T @ x) + 1.0
+            err = np.abs(x_new - x).sum()
+            x = x_new
+            converged = err < num_verts * tol
+            if stats.record(err) or converged:
+                break
+    stats.converged = converged
+    if not converged and not stats.stopped:
+        raise RuntimeError("katz_centrality failed to converge in %d "
+                           "iterations, alpha may be too large" % max_iter)
+
+    with stats.phase('output'):
+        if normalized:
+            x /= np.linalg.norm(x)
+
+        df = pd.DataFrame()
+        df['vertex'] = graph_host.vertex_ids(num_verts)
+        df['katz_centrality'] = x
+
+    return df
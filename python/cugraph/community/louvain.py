@@ -11,13 +11,24 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from cugraph.community import louvain_wrapper
+from cugraph.community import louvain_host
+from cugraph.structure.graph import memory_budgeted
+from cugraph.utilities.solver_stats import SolverStats
+try:
+    from cugraph.community import louvain_wrapper
+except ImportError:
+    louvain_wrapper = None
 
 
-def louvain(input_graph):
+@memory_budgeted
+def louvain(input_graph, resolution=1.0, max_level=None,
+            return_hierarchy=False, callback=None, return_stats=False):
     """
     Compute the modularity optimizing partition of the input graph using the
-    Louvain heuristic
+    Louvain heuristic. Each level moves the vertices (the communities of the
+    previous level) between neighboring communities while the modularity
+    improves, then collapses every community into a single vertex; the
+    levels form a dendrogram whose coarsest level is the result.
 
     Parameters
     ----------
@@ -26,16 +37,47 @@ def louvain(input_graph):
         as an edge list.
         The adjacency list will be computed if not already present. The graph
         should be undirected where an undirected edge is represented by a
-        directed edge in both direction.
+        directed edge in both direction. The host backend clusters a
+        directed graph as the undirected graph of its edges.
+    resolution : float, optional
+        Resolution of the modularity, 1.0 by default (the standard
+        modularity). The modularity of a partition is the fraction of the
+        edge weight inside communities minus resolution times its expected
+        value; larger resolutions give more, smaller communities. Only
+        supported on the host backend.
+    max_level : int, optional
+        Maximum number of levels, which bounds the run time. By default the
+        levels stop when the modularity stops improving. Only supported on
+        the host backend.
+    return_hierarchy : bool, optional
+        If True, also return the partition and modularity of every level.
+        Only supported on the host backend.
+    callback : callable, optional
+        Called after every local moving pass as callback(iteration,
+        residual), where residual is the modularity gained by the pass. If
+        it returns True the levels stop and the current partition is
+        returned. Only supported on the host backend.
+    return_stats : bool, optional
+        If True, also return a cugraph.SolverStats record of the run (one
+        iteration per local moving pass, stats.counters['levels'] is the
+        number of levels). The device backend only reports the total time.
 
     Returns
     -------
     parts : cudf.DataFrame
         GPU data frame of size V containing two columns the vertex id and the
-        partition id it is assigned to.
+        partition id it is assigned to. A pandas.DataFrame with the same
+        columns is returned for graphs using the host backend.
     modularity_score : float
         a floating point number containing the modularity score of the
-        partitioning.
+        partitioning (at the given resolution).
+    hierarchy : list of tuples
+        Only returned if return_hierarchy is True: the (parts,
+        modularity_score) of each level, from the finest to the coarsest,
+        parts assigning every vertex of the graph to its community at that
+        level. The last level is the result.
+    stats : cugraph.SolverStats
+        Only returned if return_stats is True.
 
     Examples
     --------
@@ -46,8 +88,33 @@ def louvain(input_graph):
     >>> G = cugraph.Graph()
     >>> G.add_edge_list(sources, destinations, None)
     >>> parts, modularity_score = cugraph.louvain(G)
+    >>> parts, modularity_score, hierarchy = cugraph.louvain(
+    >>>     G, resolution=2.0, max_level=3, return_hierarchy=True)
     """
+    if resolution <= 0:
+        raise ValueError('resolution must be positive')
+    if max_level is not None and max_level < 1:
+        raise ValueError('max_level must be at least 1')
 
-    parts, modularity_score = louvain_wrapper.louvain(input_graph.graph_ptr)
+    stats = SolverStats(callback)
+    if input_graph.backend == 'host':
+        parts, modularity_score, hierarchy = louvain_host.louvain(
+            input_graph.graph_ptr, resolution, max_level, stats)
+    else:
+        # nvgraph computes the levels internally but only returns the
+        # final partition, for the standard modularity
+        if resolution != 1.0 or max_level is not None or return_hierarchy:
+            raise NotImplementedError("resolution, max_level and "
+                                      "return_hierarchy are only supported "
+                                      "on the host backend")
+        stats.start_device_run(callback)
+        with stats.phase('solve'):
+            parts, modularity_score = louvain_wrapper.louvain(
+                input_graph.graph_ptr)
 
-    return parts, modularity_score
+    result = (parts, modularity_score)
+    if return_hierarchy:
+        result += (hierarchy,)
+    if return_stats:
+        result += (stats,)
+    return result
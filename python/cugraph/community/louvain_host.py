@@ -0,0 +1,163 @@
+# Copyright (c) 2019, NVIDIA CORPORATION.
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from cugraph.structure import graph_host
+from cugraph.utilities.solver_stats import SolverStats
+import numpy as np
+import pandas as pd
+from scipy import sparse
+
+
+# Local moving stops after MAX_PASSES passes over the vertices, or once a
+# pass improves the modularity by less than TOLERANCE
+MAX_PASSES = 100
+TOLERANCE = 1.0e-7
+
+
+def louvain(graph_ptr, resolution=1.0, max_level=None, stats=None):
+    """
+    Host implementation of gdf_louvain. Returns the final partition, its
+    modularity and the list of the (partition, modularity) of every level.
+    The residual recorded in stats for each local moving pass is the
+    modularity it gained; stats.counters['levels'] is the number of levels.
+    """
+    if stats is None:
+        stats = SolverStats()
+    with stats.phase('csr_build'):
+        A = graph_host.csr_matrix(graph_ptr).astype(np.float64)
+        if (A != A.T).nnz > 0:
+            # Directed graph: each edge counts for both endpoints, as in the
+            # undirected graph of the same edges
+            A = (A + A.T).tocsr()
+    num_verts = A.shape[0]
+
+    parts = np.arange(num_verts)
+    levels = []
+    level_graph = A
+    stats.converged = True
+    while max_level is None or len(levels) < max_level:
+        with stats.phase('local_moving'):
+            communities, converged = _local_moving(level_graph, resolution,
+                                                   stats)
+        stats.converged = stats.converged and converged
+        num_communities = communities.max() + 1 if num_verts > 0 else 0
+        if num_communities == level_graph.shape[0]:
+            break
+        parts = communities[parts]
+        levels.append((_parts_frame(parts),
+                       modularity(A, parts, resolution)))
+        if stats.stopped:
+            break
+
+        # Collapse each community into a single vertex, the weight of the
+        # edges inside a community becomes a self loop.
+        with stats.phase('coarsening'):
+            P = sparse.csr_matrix((np.ones(len(communities)),
+                                   (np.arange(len(communities)),
+                                    communities)),
+                                  shape=(len(communities), num_communities))
+            level_graph = (P.T @ level_graph @ P).tocsr()
+
+    if not levels:
+        # No move improves the modularity of the singleton partition
+        levels.append((_parts_frame(parts),
+                       modularity(A, parts, resolution)))
+
+    stats.counters['levels'] = len(levels)
+    df, modularity_score = levels[-1]
+    return df, modularity_score, levels
+
+
+def _parts_frame(parts):
+    num_verts = len(parts)
+    df = pd.DataFrame()
+    df['vertex'] = graph_host.vertex_ids(num_verts)
+    df['partition'] = parts.astype(graph_host.index_dtype(num_verts))
+    return df
+
+
+def modularity(A, parts, resolution=1.0):
+    """
+    Modularity of the partition parts of the symmetric weighted adjacency
+    matrix A.
+    """
+    degree = np.asarray(A.sum(axis=1)).ravel()
+    total_weight = degree.sum()
+    if total_weight == 0:
+        return 0.0
+
+    A = A.tocoo()
+    internal = A.data[parts[A.row] == parts[A.col]].sum()
+    community_degree = np.bincount(parts, weights=degree)
+
+    return (internal / total_weight -
+            resolution * ((community_degree / total_weight) ** 2).sum())
+
+
+def _local_moving(A, resolution=1.0, stats=None):
+    # Move each vertex, one at a time, to the neighboring community with the
+    # largest modularity gain until no move improves the modularity (or the
+    # passes stop improving it, see MAX_PASSES and TOLERANCE). A must be
+    # symmetric. Returns the community of each vertex, numbered from 0, and
+    # whether the passes converged. The gain of each pass is recorded in
+    # stats if set, whose callback can stop the passes.
+    num_verts = A.shape[0]
+    offsets, indices, weights = A.indptr, A.indices, A.data
+    degree = np.asarray(A.sum(axis=1)).ravel()
+    total_weight = degree.sum()
+    if total_weight == 0:
+        return np.arange(num_verts), True
+
+    communities = np.arange(num_verts)
+    converged = False
+    community_degree = degree.copy()
+    for _ in range(MAX_PASSES):
+        # Modularity gained by the moves of the pass
+        pass_gain = 0.0
+        for v in range(num_verts):
+            neighbors = indices[offsets[v]:offsets[v + 1]]
+            not_self = neighbors != v
+            current = communities[v]
+            community_degree[current] -= degree[v]
+
+            candidates, inverse = np.unique(communities[neighbors[not_self]],
+                                            return_inverse=True)
+            best = current
+            if len(candidates) > 0:
+                weight_to = np.bincount(
+                    inverse, weights=weights[offsets[v]:offsets[v + 1]][
+                        not_self])
+                gains = weight_to - resolution * \
+                    community_degree[candidates] * degree[v] / total_weight
+
+                stay = -resolution * community_degree[current] * \
+                    degree[v] / total_weight
+                position = np.searchsorted(candidates, current)
+                if position < len(candidates) and \
+                        candidates[position] == current:
+                    stay = gains[position]
+
+                if gains.max() > stay + 1e-12:
+                    best = candidates[gains.argmax()]
+                    pass_gain += 2 * (gains.max() - stay) / total_weight
+
+            communities[v] = best
+            community_degree[best] += degree[v]
+
+        converged = pass_gain < TOLERANCE
+        if stats is not None and stats.record(pass_gain):
+            break
+        if converged:
+            break
+
+    return np.unique(communities, return_inverse=True)[1], converged
@@ -11,16 +11,25 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from cugraph.community import spectral_clustering_wrapper
+from cugraph.community import spectral_clustering_host
+from cugraph.structure.graph import memory_budgeted
+from cugraph.utilities.solver_stats import SolverStats
+try:
+    from cugraph.community import spectral_clustering_wrapper
+except ImportError:
+    spectral_clustering_wrapper = None
 
 
+@memory_budgeted
 def spectralBalancedCutClustering(G,
                                   num_clusters,
                                   num_eigen_vects=2,
                                   evs_tolerance=.00001,
                                   evs_max_iter=100,
                                   kmean_tolerance=.00001,
-                                  kmean_max_iter=100):
+                                  kmean_max_iter=100,
+                                  callback=None,
+                                  return_stats=False):
     """
     Compute a clustering/partitioning of the given graph using the spectral
     balanced cut method.
@@ -42,6 +51,17 @@ def spectralBalancedCutClustering(G,
          Specifies the tolerance to use in the k-means solver
     kmean_max_iter: integer
          Specifies the maximum number of iterations for the k-means solver
+    callback : callable, optional
+         Called after every k-means iteration as callback(iteration,
+         residual), where residual is the relative change of the centroids.
+         If it returns True, k-means stops with the current clusters. The
+         eigensolver cannot be interrupted. Only supported on the host
+         backend.
+    return_stats : bool, optional
+         If True, also return a cugraph.SolverStats record of the run. On
+         the host backend its iterations and residuals are the k-means ones,
+         and counters['eigensolver_matvecs'] counts the operator
+         applications of the eigensolver.
 
     Returns
     -------
@@ -54,6 +74,11 @@ def spectralBalancedCutClustering(G,
         df['cluster'] : cudf.Series
             contains the cluster assignments
 
+        A pandas.DataFrame with the same columns is returned for graphs using
+        the host backend.
+    stats : cugraph.SolverStats
+        Only returned if return_stats is True.
+
     Examples
     --------
     >>> M = cudf.read_csv('datasets/karate.csv', delimiter=' ',
@@ -65,25 +90,44 @@ def spectralBalancedCutClustering(G,
     >>> df = cugraph.spectralBalancedCutClustering(G, 5)
     """
 
-    df = spectral_clustering_wrapper.spectralBalancedCutClustering(
-             G.graph_ptr,
-             num_clusters,
-             num_eigen_vects,
-             evs_tolerance,
-             evs_max_iter,
-             kmean_tolerance,
-             kmean_max_iter)
-
+    stats = SolverStats(callback)
+    if G.backend == 'host':
+        df = spectral_clustering_host.spectralBalancedCutClustering(
+                 G.graph_ptr,
+                 num_clusters,
+                 num_eigen_vects,
+                 evs_tolerance,
+                 evs_max_iter,
+                 kmean_tolerance,
+                 kmean_max_iter,
+                 stats)
+    else:
+        stats.start_device_run(callback)
+        with stats.phase('solve'):
+            df = spectral_clustering_wrapper.spectralBalancedCutClustering(
+                     G.graph_ptr,
+                     num_clusters,
+                     num_eigen_vects,
+                     evs_tolerance,
+                     evs_max_iter,
+                     kmean_tolerance,
+                     kmean_max_iter)
+
+    if return_stats:
+        return df, stats
     return df
 
 
+@memory_budgeted
 def spectralModularityMaximizationClustering(G,
                                              num_clusters,
                                              num_eigen_vects=2,
                                              evs_tolerance=.00001,
                                              evs_max_iter=100,
                                              kmean_tolerance=.00001,
-                                             kmean_max_iter=100):
+                                             kmean_max_iter=100,
+                                             callback=None,
+                                             return_stats=False):
     """
     Compute a clustering/partitioning of the given graph using the spectral
     modularity maximization method.
@@ -105,6 +149,17 @@ def spectralModularityMaximizationClustering(G,
          Specifies the tolerance to use in the k-means solver
     kmean_max_iter: integer
          Specifies the maximum number of iterations for the k-means solver
+    callback : callable, optional
+         Called after every k-means iteration as callback(iteration,
+         residual), where residual is the relative change of the centroids.
+         If it returns True, k-means stops with the current clusters. The
+         eigensolver cannot be interrupted. Only supported on the host
+         backend.
+    return_stats : bool, optional
+         If True, also return a cugraph.SolverStats record of the run. On
+         the host backend its iterations and residuals are the k-means ones,
+         and counters['eigensolver_matvecs'] counts the operator
+         applications of the eigensolver.
 
     Returns
     -------
@@ -114,6 +169,11 @@ def spectralModularityMaximizationClustering(G,
         df['cluster'] : cudf.Series
             contains the cluster assignments
 
+        A pandas.DataFrame with the same columns is returned for graphs using
+        the host backend.
+    stats : cugraph.SolverStats
+        Only returned if return_stats is True.
+
     Examples
     --------
     >>> M = cudf.read_csv('datasets/karate.csv', delimiter=' ',
@@ -126,18 +186,36 @@ def spectralModularityMaximizationClustering(G,
     >>> df = cugraph.spectralModularityMaximizationClustering(G, 5)
     """
 
-    df = spectral_clustering_wrapper.spectralModularityMaximizationClustering(
-             G.graph_ptr,
-             num_clusters,
-             num_eigen_vects,
-             evs_tolerance,
-             evs_max_iter,
-             kmean_tolerance,
-             kmean_max_iter)
-
+    stats = SolverStats(callback)
+    if G.backend == 'host':
+        df = spectral_clustering_host.spectralModularityMaximizationClustering(
+                 G.graph_ptr,
+                 num_clusters,
+                 num_eigen_vects,
+                 evs_tolerance,
+                 evs_max_iter,
+                 kmean_tolerance,
+                 kmean_max_iter,
+                 stats)
+    else:
+        stats.start_device_run(callback)
+        with stats.phase('solve'):
+            df = spectral_clustering_wrapper.\
+                spectralModularityMaximizationClustering(
+                     G.graph_ptr,
+                     num_clusters,
+                     num_eigen_vects,
+                     evs_tolerance,
+                     evs_max_iter,
+                     kmean_tolerance,
+                     kmean_max_iter)
+
+    if return_stats:
+        return df, stats
     return df
 
 
+@memory_budgeted
 def analyzeClustering_modularity(G, n_clusters, clustering):
     """
     Compute the modularity score for a partitioning/clustering
@@ -169,14 +247,21 @@ def analyzeClustering_modularity(G, n_clusters, clustering):
     >>> score = cugraph.analyzeClustering_modularity(G, 5, df['cluster'])
     """
 
-    score = spectral_clustering_wrapper.analyzeClustering_modularity(
-                G.graph_ptr,
-                n_clusters,
-                clustering)
+    if G.backend == 'host':
+        score = spectral_clustering_host.analyzeClustering_modularity(
+                    G.graph_ptr,
+                    n_clusters,
+                    clustering)
+    else:
+        score = spectral_clustering_wrapper.analyzeClustering_modularity(
+                    G.graph_ptr,
+                    n_clusters,
+                    clustering)
 
     return score
 
 
+@memory_budgeted
 def analyzeClustering_edge_cut(G, n_clusters, clustering):
     """
     Compute the edge cut score for a partitioning/clustering
@@ -207,14 +292,21 @@ def analyzeClustering_edge_cut(G, n_clusters, clustering):
     >>> score = cugraph.analyzeClustering_edge_cut(G, 5, df['cluster'])
     """
 
-    score = spectral_clustering_wrapper.analyzeClustering_edge_cut(
-                G.graph_ptr,
-                n_clusters,
-                clustering)
+    if G.backend == 'host':
+        score = spectral_clustering_host.analyzeClustering_edge_cut(
+                    G.graph_ptr,
+                    n_clusters,
+                    clustering)
+    else:
+        score = spectral_clustering_wrapper.analyzeClustering_edge_cut(
+                    G.graph_ptr,
+                    n_clusters,
+                    clustering)
 
     return score
 
 
+@memory_budgeted
 def analyzeClustering_ratio_cut(G, n_clusters, clustering):
     """
     Compute the ratio cut score for a partitioning/clustering
@@ -246,9 +338,15 @@ def analyzeClustering_ratio_cut(G, n_clusters, clustering):
     >>> score = cugraph.analyzeClustering_ratio_cut(G, 5, df['cluster'])
     """
 
-    score = spectral_clustering_wrapper.analyzeClustering_ratio_cut(
-                G.graph_ptr,
-                n_clusters,
-                clustering)
+    if G.backend == 'host':
+        score = spectral_clustering_host.analyzeClustering_ratio_cut(
+                    G.graph_ptr,
+                    n_clusters,
+                    clustering)
+    else:
+        score = spectral_clustering_wrapper.analyzeClustering_ratio_cut(
+                    G.graph_ptr,
+                    n_clusters,
+                    clustering)
 
     return score
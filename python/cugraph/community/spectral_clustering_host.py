@@ -0,0 +1,175 @@
+# Copyright (c) 2019, NVIDIA CORPORATION.
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from cugraph.structure import graph_host
+from cugraph.utilities.solver_stats import SolverStats
+import numpy as np
+import pandas as pd
+from scipy import sparse
+from scipy.cluster.vq import kmeans2
+from scipy.sparse.linalg import eigsh, LinearOperator
+
+
+def spectralBalancedCutClustering(graph_ptr,
+                                  num_clusters,
+                                  num_eigen_vects=2,
+                                  evs_tolerance=.00001,
+                                  evs_max_iter=100,
+                                  kmean_tolerance=.00001,
+                                  kmean_max_iter=100,
+                                  stats=None):
+    """
+    Host implementation of gdf_balancedCutClustering_nvgraph
+    """
+    if stats is None:
+        stats = SolverStats()
+    with stats.phase('csr_build'):
+        A = graph_host.csr_matrix(graph_ptr).astype(np.float64)
+        degree = np.asarray(A.sum(axis=1)).ravel()
+        L = sparse.diags(degree) - A
+
+    # The smallest eigenvalues of the Laplacian are the largest ones of
+    # shift * I - L (all the eigenvalues of L are in [0, 2 * max degree]),
+    # for which the Lanczos iteration converges much faster.
+    shift = 2.0 * degree.max() if len(degree) > 0 else 0.0
+    op = LinearOperator(A.shape, dtype=np.float64,
+                        matvec=lambda x: shift * x - L @ x)
+    vectors = _eigenvectors(op, num_eigen_vects, evs_tolerance, evs_max_iter,
+                            stats)
+
+    return _cluster(vectors, num_clusters, kmean_tolerance, kmean_max_iter,
+                    stats)
+
+
+def spectralModularityMaximizationClustering(graph_ptr,
+                                             num_clusters,
+                                             num_eigen_vects=2,
+                                             evs_tolerance=.00001,
+                                             evs_max_iter=100,
+                                             kmean_tolerance=.00001,
+                                             kmean_max_iter=100,
+                                             stats=None):
+    """
+    Host implementation of gdf_spectralModularityMaximization_nvgraph
+    """
+    if stats is None:
+        stats = SolverStats()
+    with stats.phase('csr_build'):
+        A = graph_host.csr_matrix(graph_ptr).astype(np.float64)
+        degree = np.asarray(A.sum(axis=1)).ravel()
+    total_weight = degree.sum()
+
+    # Modularity matrix B = A - d d^T / 2m, never materialized
+    op = LinearOperator(A.shape, dtype=np.float64,
+                        matvec=lambda x: A @ x -
+                        degree * (degree @ x) / total_weight)
+    vectors = _eigenvectors(op, num_eigen_vects, evs_tolerance, evs_max_iter,
+                            stats)
+
+    return _cluster(vectors, num_clusters, kmean_tolerance, kmean_max_iter,
+                    stats)
+
+
+def analyzeClustering_modularity(graph_ptr, n_clusters, clustering):
+    """
+    Host implementation of gdf_AnalyzeClustering_modularity_nvgraph
+    """
+    A = graph_host.csr_matrix(graph_ptr).astype(np.float64)
+    parts = graph_host.to_host_array(clustering)
+    degree = np.asarray(A.sum(axis=1)).ravel()
+    total_weight = degree.sum()
+
+    A = A.tocoo()
+    internal = A.data[parts[A.row] == parts[A.col]].sum()
+    cluster_degree = np.bincount(parts, weights=degree, minlength=n_clusters)
+
+    return (internal - (cluster_degree ** 2).sum() / total_weight) / \
+        total_weight
+
+
+def analyzeClustering_edge_cut(graph_ptr, n_clusters, clustering):
+    """
+    Host implementation of gdf_AnalyzeClustering_edge_cut_nvgraph
+    """
+    cut, _ = _cluster_cuts(graph_ptr, n_clusters, clustering)
+    return cut.sum() / 2
+
+
+def analyzeClustering_ratio_cut(graph_ptr, n_clusters, clustering):
+    """
+    Host implementation of gdf_AnalyzeClustering_ratio_cut_nvgraph
+    """
+    cut, size = _cluster_cuts(graph_ptr, n_clusters, clustering)
+    non_empty = size > 0
+    return (cut[non_empty] / size[non_empty]).sum()
+
+
+def _cluster_cuts(graph_ptr, n_clusters, clustering):
+    # Weight of the edges leaving each cluster and size of each cluster
+    A = graph_host.csr_matrix(graph_ptr).astype(np.float64).tocoo()
+    parts = graph_host.to_host_array(clustering)
+
+    crossing = parts[A.row] != parts[A.col]
+    cut = np.bincount(parts[A.row[crossing]], weights=A.data[crossing],
+                      minlength=n_clusters)
+    size = np.bincount(parts, minlength=n_clusters)
+    return cut, size
+
+
+def _eigenvectors(op, num_eigen_vects, tolerance, max_iter, stats):
+    # ARPACK cannot be interrupted: count its operator applications
+    matvecs = [0]
+
+    def matvec(x):
+        matvecs[0] += 1
+        return op.matvec(x)
+
+    with stats.phase('eigensolver'):
+        _, vectors = eigsh(LinearOperator(op.shape, dtype=op.dtype,
+                                          matvec=matvec),
+                           k=num_eigen_vects, which='LA', tol=tolerance,
+                           maxiter=max(max_iter, 1) * op.shape[0])
+    stats.counters['eigensolver_matvecs'] = matvecs[0]
+
+    # Whiten the eigenvectors before clustering their rows
+    vectors = vectors - vectors.mean(axis=0)
+    std = vectors.std(axis=0)
+    std[std == 0] = 1.0
+    return vectors / std
+
+
+def _cluster(vectors, num_clusters, tolerance, max_iter, stats):
+    # Lloyd iterations from a k-means++ initialization, one scipy k-means
+    # step at a time so that the relative shift of the centroids can be
+    # compared with tolerance (and reported to the callback)
+    with stats.phase('kmeans'):
+        centroids, labels = kmeans2(vectors, num_clusters, iter=1,
+                                    minit='++', seed=0)
+        converged = False
+        for _ in range(max(max_iter, 1) - 1):
+            new_centroids, labels = kmeans2(vectors, centroids, iter=1,
+                                            minit='matrix')
+            shift = np.linalg.norm(new_centroids - centroids) / \
+                max(np.linalg.norm(centroids), np.finfo(np.float64).tiny)
+            centroids = new_centroids
+            converged = shift <= tolerance
+            if stats.record(shift) or converged:
+                break
+        stats.converged = converged
+
+    with stats.phase('output'):
+        df = pd.DataFrame()
+        df['vertex'] = graph_host.vertex_ids(len(labels))
+        df['cluster'] = labels.astype(np.int32)
+
+    return df
@@ -11,10 +11,15 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from cugraph.community import subgraph_extraction_wrapper
-from cugraph.structure.graph import null_check, Graph
+from cugraph.community import subgraph_extraction_host
+from cugraph.structure.graph import Graph, memory_budgeted, null_check
+try:
+    from cugraph.community import subgraph_extraction_wrapper
+except ImportError:
+    subgraph_extraction_wrapper = None
 
 
+@memory_budgeted
 def subgraph(G, vertices):
     """
     Compute a subgraph of the existing graph including only the specified
@@ -33,6 +38,7 @@ def subgraph(G, vertices):
     -------
     Sg : cugraph.Graph
         A graph object containing the subgraph induced by the given vertex set.
+        The subgraph uses the same backend as G.
 
     Examples
     --------
@@ -52,11 +58,17 @@ def subgraph(G, vertices):
 
     null_check(vertices)
 
-    result_graph = Graph()
+    result_graph = Graph(backend=G.backend)
 
-    subgraph_extraction_wrapper.subgraph(
-        G.graph_ptr,
-        vertices,
-        result_graph.graph_ptr)
+    if G.backend == 'host':
+        subgraph_extraction_host.subgraph(
+            G.graph_ptr,
+            vertices,
+            result_graph.graph_ptr)
+    else:
+        subgraph_extraction_wrapper.subgraph(
+            G.graph_ptr,
+            vertices,
+            result_graph.graph_ptr)
 
     return result_graph
@@ -0,0 +1,34 @@
+# Copyright (c) 2019, NVIDIA CORPORATION.
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from cugraph.structure import graph_host
+import numpy as np
+
+
+def subgraph(graph_ptr, vertices, subgraph_ptr):
+    """
+    Host implementation of gdf_extract_subgraph_vertex_nvgraph
+    """
+    src, dst, value = graph_host.view_edge_list(graph_ptr)
+    num_verts = graph_host.number_of_vertices(graph_ptr)
+    vertices = graph_host.to_host_array(vertices)
+
+    # Vertices of the subgraph are numbered by their position in vertices
+    new_id = np.full(num_verts, -1, dtype=src.dtype)
+    new_id[vertices] = np.arange(len(vertices), dtype=src.dtype)
+
+    mask = (new_id[src] >= 0) & (new_id[dst] >= 0)
+    if value is not None:
+        value = value[mask]
+    graph_host.add_edge_list(subgraph_ptr, new_id[src[mask]],
+                             new_id[dst[mask]], value)
@@ -11,9 +11,15 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from cugraph.community import triangle_count_wrapper
+from cugraph.community import triangle_count_host
+from cugraph.structure.graph import memory_budgeted
+try:
+    from cugraph.community import triangle_count_wrapper
+except ImportError:
+    triangle_count_wrapper = None
 
 
+@memory_budgeted
 def triangles(G):
     """
     Compute the triangle (number of cycles of length three) count of the
@@ -42,6 +48,9 @@ def triangles(G):
     >>> count = cugraph.triangles(G)
     """
 
-    result = triangle_count_wrapper.triangles(G.graph_ptr)
+    if G.backend == 'host':
+        result = triangle_count_host.triangles(G.graph_ptr)
+    else:
+        result = triangle_count_wrapper.triangles(G.graph_ptr)
 
     return result
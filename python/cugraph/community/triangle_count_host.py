@@ -0,0 +1,27 @@
+# Copyright (c) 2019, NVIDIA CORPORATION.
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from cugraph.structure import graph_host
+from scipy import sparse
+
+
+def triangles(graph_ptr):
+    """
+    Host implementation of gdf_triangle_count_nvgraph
+    """
+    A = graph_host.csr_matrix(graph_ptr, weighted=False)
+    A = A - sparse.diags(A.diagonal())
+
+    # Each triangle of the (symmetric) graph is counted once per vertex and
+    # per direction by trace(A^3).
+    return int((A @ A).multiply(A).sum()) // 2
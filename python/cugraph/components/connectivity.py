@@ -11,9 +11,15 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from cugraph.components import connectivity_wrapper
+from cugraph.components import connectivity_host
+from cugraph.structure.graph import memory_budgeted
+try:
+    from cugraph.components import connectivity_wrapper
+except ImportError:
+    connectivity_wrapper = None
 
 
+@memory_budgeted
 def weakly_connected_components(G):
     """
     Generate the weakly connected components and attach a component label to
@@ -35,6 +41,9 @@ def weakly_connected_components(G):
       df['labels'][i] gives the label id of the i'th vertex
       df['vertices'][i] gives the vertex id of the i'th vertex
 
+        A pandas.DataFrame with the same columns is returned for graphs using
+        the host backend.
+
     Examples
     --------
     >>> M = cudf.read_csv('datasets/karate.csv', delimiter=' ',
@@ -46,11 +55,15 @@ def weakly_connected_components(G):
     >>> df = cugraph.weakly_connected_components(G)
     """
 
-    df = connectivity_wrapper.weakly_connected_components(G.graph_ptr)
+    if G.backend == 'host':
+        df = connectivity_host.weakly_connected_components(G.graph_ptr)
+    else:
+        df = connectivity_wrapper.weakly_connected_components(G.graph_ptr)
 
     return df
 
 
+@memory_budgeted
 def strongly_connected_components(G):
     """
     Generate the stronlgly connected components and attach a component label to
@@ -72,6 +85,9 @@ def strongly_connected_components(G):
       df['labels'][i] gives the label id of the i'th vertex
       df['vertices'][i] gives the vertex id of the i'th vertex
 
+        A pandas.DataFrame with the same columns is returned for graphs using
+        the host backend.
+
     Examples
     --------
     >>> M = cudf.read_csv('datasets/karate.csv', delimiter=' ',
@@ -83,6 +99,9 @@ def strongly_connected_components(G):
     >>> df = cugraph.strongly_connected_components(G)
     """
 
-    df = connectivity_wrapper.strongly_connected_components(G.graph_ptr)
+    if G.backend == 'host':
+        df = connectivity_host.strongly_connected_components(G.graph_ptr)
+    else:
+        df = connectivity_wrapper.strongly_connected_components(G.graph_ptr)
 
     return df
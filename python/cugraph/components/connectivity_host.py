@@ -0,0 +1,76 @@
+# Copyright (c) 2019, NVIDIA CORPORATION.
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from cugraph.structure import graph_host
+import numpy as np
+import pandas as pd
+from scipy.sparse import csgraph
+
+
+def weakly_connected_components(graph_ptr):
+    """
+    Host implementation of gdf_connected_components (weak connectivity)
+    """
+    offsets, indices, _ = graph_host.view_adj_list(graph_ptr)
+    if indices.dtype == np.int32 and offsets.dtype == np.int32:
+        return _connected_components(graph_ptr, 'weak')
+
+    # scipy.sparse.csgraph only handles 32 bit indices
+    src, dst, _ = graph_host._csr_to_coo(offsets, indices, None)
+    labels = _weak_labels(src, dst, len(offsets) - 1)
+
+    df = pd.DataFrame()
+    df['labels'] = labels
+    df['vertices'] = graph_host.vertex_ids(len(labels))
+
+    return df
+
+
+def _weak_labels(src, dst, num_verts):
+    # Label propagation with pointer jumping: every vertex ends up labeled
+    # with the smallest vertex id of its component.
+    labels = graph_host.vertex_ids(num_verts)
+    while True:
+        src_labels = labels[src]
+        dst_labels = labels[dst]
+        smallest = np.minimum(src_labels, dst_labels)
+        new_labels = labels.copy()
+        np.minimum.at(new_labels, src_labels, smallest)
+        np.minimum.at(new_labels, dst_labels, smallest)
+        while True:
+            jumped = new_labels[new_labels]
+            if np.array_equal(jumped, new_labels):
+                break
+            new_labels = jumped
+        if np.array_equal(new_labels, labels):
+            return labels
+        labels = new_labels
+
+
+def strongly_connected_components(graph_ptr):
+    """
+    Host implementation of gdf_connected_components (strong connectivity)
+    """
+    return _connected_components(graph_ptr, 'strong')
+
+
+def _connected_components(graph_ptr, connection):
+    A = graph_host.csr_matrix(graph_ptr, weighted=False)
+    _, labels = csgraph.connected_components(A, directed=True,
+                                             connection=connection)
+
+    df = pd.DataFrame()
+    df['labels'] = labels.astype(np.int32)
+    df['vertices'] = graph_host.vertex_ids(A.shape[0])
+
+    return df
@@ -11,9 +11,15 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from cugraph.cores import core_number_wrapper
+from cugraph.cores import core_number_host
+from cugraph.structure.graph import memory_budgeted
+try:
+    from cugraph.cores import core_number_wrapper
+except ImportError:
+    core_number_wrapper = None
 
 
+@memory_budgeted
 def core_number(G):
     """
     Compute the core numbers for the nodes of the graph G. A k-core of a graph
@@ -41,6 +47,9 @@ def core_number(G):
         df['core_number'] : cudf.Series
             Contains the core number of vertices
 
+        A pandas.DataFrame with the same columns is returned for graphs using
+        the host backend.
+
     Examples
     --------
     >>> M = cudf.read_csv('datasets/karate.csv', delimiter=' ',
@@ -52,6 +61,9 @@ def core_number(G):
     >>> cn = cugraph.core_number(G)
     """
 
-    df = core_number_wrapper.core_number(G.graph_ptr)
+    if G.backend == 'host':
+        df = core_number_host.core_number(G.graph_ptr)
+    else:
+        df = core_number_wrapper.core_number(G.graph_ptr)
 
     return df
@@ -0,0 +1,54 @@
+# Copyright (c) 2019, NVIDIA CORPORATION.
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from cugraph.structure import graph_host
+import numpy as np
+import pandas as pd
+
+
+def core_number(graph_ptr):
+    """
+    Host implementation of gdf_core_number
+    """
+    offsets, indices, _ = graph_host.view_adj_list(graph_ptr)
+    num_verts = len(offsets) - 1
+
+    df = pd.DataFrame()
+    df['vertex'] = graph_host.vertex_ids(num_verts)
+    df['core_number'] = _core_number(offsets, indices)
+
+    return df
+
+
+def _core_number(offsets, indices):
+    # Peel all the vertices of degree <= k at once, repeating until no such
+    # vertex remains, then move on to k + 1.
+    num_verts = len(offsets) - 1
+    degree = np.diff(offsets).astype(np.int64)
+    core = np.zeros(num_verts, dtype=np.int32)
+    removed = np.zeros(num_verts, dtype=bool)
+
+    k = 0
+    num_removed = 0
+    while num_removed < num_verts:
+        peel = np.flatnonzero(~removed & (degree <= k))
+        if len(peel) == 0:
+            k = int(degree[~removed].min())
+            continue
+        core[peel] = k
+        removed[peel] = True
+        num_removed += len(peel)
+        _, positions = graph_host.gather_neighbors(offsets, indices, peel)
+        degree -= np.bincount(indices[positions], minlength=num_verts)
+
+    return core
@@ -11,10 +11,16 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from cugraph.cores import k_core_wrapper, core_number_wrapper
-from cugraph.structure.graph import Graph
+from cugraph.cores import k_core_host, core_number_host
+from cugraph.structure.graph import Graph, memory_budgeted
+try:
+    from cugraph.cores import k_core_wrapper, core_number_wrapper
+except ImportError:
+    k_core_wrapper = None
+    core_number_wrapper = None
 
 
+@memory_budgeted
 def k_core(G,
            k=None,
            core_number=None):
@@ -48,7 +54,7 @@ def k_core(G,
     Returns
     -------
     KCoreGraph : cuGraph.Graph
-        K Core of the input graph
+        K Core of the input graph, using the same backend as G
 
     Examples
     --------
@@ -61,17 +67,22 @@ def k_core(G,
     >>> KCoreGraph = cugraph.k_core(G)
     """
 
-    KCoreGraph = Graph()
+    if G.backend == 'host':
+        core_number_impl, k_core_impl = core_number_host, k_core_host
+    else:
+        core_number_impl, k_core_impl = core_number_wrapper, k_core_wrapper
+
+    KCoreGraph = Graph(backend=G.backend)
     if core_number is None:
-        core_number = core_number_wrapper.core_number(G.graph_ptr)
+        core_number = core_number_impl.core_number(G.graph_ptr)
         core_number = core_number.rename(columns={"core_number": "values"})
 
     if k is None:
         k = core_number['values'].max()
 
-    k_core_wrapper.k_core(G.graph_ptr,
-                          KCoreGraph.graph_ptr,
-                          k,
-                          core_number)
+    k_core_impl.k_core(G.graph_ptr,
+                       KCoreGraph.graph_ptr,
+                       k,
+                       core_number)
 
     return KCoreGraph
@@ -0,0 +1,33 @@
+# Copyright (c) 2019, NVIDIA CORPORATION.
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from cugraph.structure import graph_host
+import numpy as np
+
+
+def k_core(graph_ptr, k_core_graph_ptr, k, core_number):
+    """
+    Host implementation of gdf_k_core
+    """
+    src, dst, value = graph_host.view_edge_list(graph_ptr)
+    num_verts = graph_host.number_of_vertices(graph_ptr)
+
+    in_core = np.zeros(num_verts, dtype=bool)
+    vertices = graph_host.to_host_array(core_number['vertex'])
+    values = graph_host.to_host_array(core_number['values'])
+    in_core[vertices[values >= k]] = True
+
+    mask = in_core[src] & in_core[dst]
+    if value is not None:
+        value = value[mask]
+    graph_host.add_edge_list(k_core_graph_ptr, src[mask], dst[mask], value)
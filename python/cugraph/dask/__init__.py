@@ -0,0 +1,2 @@
+from cugraph.dask.structure import DistributedGraph, PartitionStats, \
+    partition_1d, partition_2d, partition_hash
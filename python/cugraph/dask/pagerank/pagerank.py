@@ -1,14 +1,20 @@
 import cugraph
 import random
-import dask_cudf as dc
 from collections import defaultdict
-from cugraph.dask.core import new_ipc_thread, parse_host_port
-from cugraph.dask.core import device_of_devicendarray, get_device_id
+from cugraph.dask.structure import distributed_graph
 import os
 from dask.distributed import wait, default_client
 from toolz import first
 import dask.dataframe as dd
-import cudf
+try:
+    import cudf
+    import dask_cudf as dc
+    from cugraph.dask.core import new_ipc_thread, parse_host_port
+    from cugraph.dask.core import device_of_devicendarray, get_device_id
+except ImportError:
+    # CPU only cluster, only the host engine is available
+    cudf = None
+    dc = None
 
 
 def to_gpu_array(df):
@@ -115,18 +121,29 @@ def _mg_pagerank(data):
     return pr
 
 
-def pagerank(edge_list, alpha=0.85, max_iter=30):
+def pagerank(edge_list, alpha=0.85, max_iter=30, tol=1.0e-5, backend=None):
     """
-    Find the PageRank values for each vertex in a graph using multiple GPUs.
+    Find the PageRank values for each vertex in a graph using multiple GPUs
+    or multiple (possibly multi-host) CPU workers.
     cuGraph computes an approximation of the Pagerank using the power method.
     The input edge list should be provided in dask-cudf dataframe
-    with one partition per GPU.
+    with one partition per GPU, or in any dask dataframe for the host engine.
+
+    The host engine is distributed: the vertices are split into one range
+    per dask worker (ranges holding about the same number of in-edges), each
+    worker keeps the in-edges of its range (a 1D partition of the CSC
+    representation of the graph) and computes the ranks of its range. At
+    each iteration the workers exchange their slices of the rank vector with
+    each other through dask (worker to worker transfers); only the residuals
+    go through the client. The host engine runs with NumPy and SciPy and
+    does not need GPUs.
 
     Parameters
     ----------
-    edge_list : dask_cudf.DataFrame
+    edge_list : dask_cudf.DataFrame or dask.DataFrame
         Contain the connectivity information as an edge list.
-        Source 'src' and destination 'dst' columns must be of type 'int32'.
+        Source 'src' and destination 'dst' columns must be of type 'int32'
+        ('int32' or 'int64' for the host engine).
         Edge weights are not used for this algorithm.
         Indices must be in the range [0, V-1], where V is the global number
         of vertices.
@@ -139,12 +156,23 @@ def pagerank(edge_list, alpha=0.85, max_iter=30):
         The maximum number of iterations before an answer is returned.
         If this value is lower or equal to 0 cuGraph will use the default
         value, which is 30.
+    tol : float
+        Convergence tolerance of the host engine, on the L1 norm of the
+        difference of two successive rank vectors. The device engine always
+        runs max_iter iterations.
+    backend : string, optional
+        'device' for the single host multi-GPU engine, 'host' for the
+        distributed CPU engine. By default the device engine is used for
+        dask_cudf edge lists on a cluster spanning a single host and the
+        host engine otherwise.
 
     Returns
     -------
-    PageRank : dask_cudf.DataFrame
-        Dask GPU DataFrame containing two columns of size V: the vertex
-        identifiers and the corresponding PageRank values.
+    PageRank : dask_cudf.DataFrame or dask.DataFrame
+        Dask DataFrame containing two columns of size V: the vertex
+        identifiers and the corresponding PageRank values. The host engine
+        returns a dask DataFrame of pandas DataFrames, with one partition per
+        vertex range.
 
     Examples
     --------
@@ -159,13 +187,28 @@ def pagerank(edge_list, alpha=0.85, max_iter=30):
     """
 
     client = default_client()
+    if max_iter <= 0:
+        max_iter = 30
+    if backend is None:
+        hosts = set(address.rsplit('://', 1)[-1].rsplit(':', 1)[0]
+                    for address in client.scheduler_info()['workers'])
+        if _is_device_frame(edge_list) and len(hosts) == 1:
+            backend = 'device'
+        else:
+            backend = 'host'
+    if backend == 'host':
+        return _pagerank_host(client, edge_list, alpha, max_iter, tol)
+    if backend != 'device':
+        raise ValueError("backend must be 'host' or 'device'")
+
     gpu_futures = _get_mg_info(edge_list)
     # npartitions = len(gpu_futures)
 
     host_dict = _build_host_dict(gpu_futures, client).items()
     if len(host_dict) > 1:
         raise Exception("Dask cluster appears to span hosts. Current "
-                        "multi-GPU version is limited to single host")
+                        "multi-GPU version is limited to single host, "
+                        "use backend='host'")
 
     master_host = [(host, random.sample(ports, 1)[0])
                    for host, ports in host_dict][0]
@@ -193,6 +236,20 @@ def pagerank(edge_list, alpha=0.85, max_iter=30):
     return ddf
 
 
+def _is_device_frame(edge_list):
+    if cudf is None:
+        return False
+    if isinstance(edge_list, dd.DataFrame):
+        return isinstance(edge_list._meta, cudf.DataFrame)
+    # Lists of partitions come from read_split_csv
+    return True
+
+
+def _pagerank_host(client, edge_list, alpha, max_iter, tol):
+    dg = distributed_graph.DistributedGraph(edge_list, client=client)
+    return dg.pagerank(alpha=alpha, max_iter=max_iter, tol=tol)
+
+
 def _get_mg_info(ddf):
     # Get gpu data pointers of columns of each dataframe partition
 
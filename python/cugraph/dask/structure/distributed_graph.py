@@ -0,0 +1,280 @@
+# Copyright (c) 2019, NVIDIA CORPORATION.
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import operator
+
+from cugraph.dask.structure import distributed_graph_host as host
+from cugraph.structure import graph_host
+from cugraph.utilities.solver_stats import SolverStats
+from dask.distributed import default_client
+import dask.dataframe as dd
+import numpy as np
+import pandas as pd
+
+
+class DistributedGraph:
+    """
+    A graph partitioned over the workers of a dask cluster, for repeated
+    analytics on the same edge list. The edge list is shuffled once, when
+    the graph is built: the vertices are split into one range per worker
+    (ranges holding about the same number of edges) and each worker keeps
+    the out-edges (CSR) and the in-edges (CSC) of its range in memory for
+    the lifetime of the graph. The algorithms then only exchange per-vertex
+    values between the workers.
+
+    The partitions run on CPU workers with NumPy and SciPy; dask_cudf edge
+    lists are copied to host memory.
+
+    Parameters
+    ----------
+    edge_list : dask.DataFrame, dask_cudf.DataFrame or list of futures
+        Contain the connectivity information as an edge list, in the 'src'
+        and 'dst' columns (int32 or int64). Vertex ids must be in the range
+        [0, V-1], where V is the global number of vertices. Edge weights are
+        not used.
+    client : dask.distributed.Client, optional
+        The client of the cluster, the default client if not set.
+    workers : list of strings, optional
+        Addresses of the workers holding the graph, all the workers of the
+        cluster by default.
+
+    Examples
+    --------
+    >>> ddf = dask.dataframe.read_csv('datasets/karate.csv', delimiter=' ',
+    >>>                               names=['src', 'dst', 'value'])
+    >>> dg = cugraph.dask.DistributedGraph(ddf)
+    >>> pr = dg.pagerank().compute()
+    >>> labels = dg.weakly_connected_components().compute()
+    """
+    def __init__(self, edge_list, client=None, workers=None):
+        self.client = client if client is not None else default_client()
+        if workers is None:
+            workers = sorted(self.client.scheduler_info()['workers'])
+        self.workers = list(workers)
+        if len(self.workers) == 0:
+            raise ValueError('the cluster has no workers')
+        c = self.client
+
+        if isinstance(edge_list, dd.DataFrame):
+            parts = c.compute(edge_list.to_delayed())
+        else:
+            parts = list(edge_list)
+
+        # Global degrees, and vertex ranges of about the same number of edges
+        histograms = [c.submit(host.degrees, part) for part in parts]
+        degree_sums = c.submit(host.sum_degrees, histograms)
+        self.bounds = c.submit(host.vertex_bounds, degree_sums,
+                               len(self.workers)).result()
+
+        # Shuffle the edges to the ranks of their source and destination
+        pieces = [c.submit(host.split_edges, part, self.bounds)
+                  for part in parts]
+        self._parts = []
+        for rank, worker in enumerate(self.workers):
+            rank_pieces = [c.submit(operator.getitem, p, rank)
+                           for p in pieces]
+            self._parts.append(c.submit(host.local_graph, rank, self.bounds,
+                                        *rank_pieces, workers=[worker]))
+        self._num_edges = None
+
+    def _map(self, func, *args):
+        # Run func(local_graph, *args) on each rank
+        return [self.client.submit(func, part, *args, workers=[worker])
+                for part, worker in zip(self._parts, self.workers)]
+
+    def _step(self, func, states, *args):
+        # Run func(local_graph, state, *args) on each rank, with the state
+        # of the rank
+        return [self.client.submit(func, part, state, *args,
+                                   workers=[worker])
+                for part, state, worker in
+                zip(self._parts, states, self.workers)]
+
+    def _frame(self, futures, columns):
+        meta = pd.DataFrame({name: pd.Series(dtype=dtype)
+                             for name, dtype in columns})
+        return dd.from_delayed(futures, meta=meta)
+
+    def _vertex_dtype(self):
+        return graph_host.index_dtype(self.number_of_vertices())
+
+    def number_of_vertices(self):
+        return int(self.bounds[-1])
+
+    def number_of_nodes(self):
+        return self.number_of_vertices()
+
+    def number_of_edges(self):
+        if self._num_edges is None:
+            self._num_edges = sum(self.client.gather(
+                self._map(host.number_of_edges)))
+        return self._num_edges
+
+    def _degree(self, x=0):
+        return self._frame(self._map(host.degree, x),
+                           [('vertex', self._vertex_dtype()),
+                            ('degree', np.int32)])
+
+    def in_degree(self):
+        """
+        Compute the in-degree of every vertex. Return a dask DataFrame with
+        the 'vertex' and 'degree' columns, one partition per vertex range.
+        """
+        return self._degree(x=1)
+
+    def out_degree(self):
+        """
+        Compute the out-degree of every vertex. Return a dask DataFrame with
+        the 'vertex' and 'degree' columns, one partition per vertex range.
+        """
+        return self._degree(x=2)
+
+    def degree(self):
+        """
+        Compute the degree (in-degree plus out-degree) of every vertex.
+        Return a dask DataFrame with the 'vertex' and 'degree' columns, one
+        partition per vertex range.
+        """
+        return self._degree()
+
+    def _exchange(self, messages):
+        # All to all: rank j receives the j-th message of every rank
+        c = self.client
+        return [[c.submit(operator.getitem, m, rank) for m in messages]
+                for rank in range(len(self._parts))]
+
+    def _active(self, states):
+        return sum(self.client.gather([self.client.submit(host.active_count,
+                                                          s)
+                                       for s in states]))
+
+    def bfs(self, start):
+        """
+        Breadth first search from start, level by level: each rank expands
+        the frontier vertices of its range and sends the discovered vertices
+        to the ranks that own them.
+
+        Parameters
+        ----------
+        start : int
+            The index of the source vertex.
+
+        Returns
+        -------
+        df : dask.DataFrame
+            df['vertex'] : the vertex ids.
+            df['distance'] : the number of edges from start (the largest
+            int32 value for unreachable vertices).
+            df['predecessor'] : the predecessor of the vertex on a path from
+            start (-1 for start and unreachable vertices).
+        """
+        if start < 0 or start >= self.number_of_vertices():
+            raise ValueError('start must be in [0, %d)' %
+                             self.number_of_vertices())
+        states = self._map(host.bfs_init, start)
+        depth = 0
+        while self._active(states) > 0:
+            depth += 1
+            messages = self._exchange(self._step(host.bfs_expand, states))
+            states = [self.client.submit(host.bfs_update, part, state, depth,
+                                         *received, workers=[worker])
+                      for part, state, received, worker in
+                      zip(self._parts, states, messages, self.workers)]
+        return self._frame(self._step(host.bfs_result, states),
+                           [('vertex', self._vertex_dtype()),
+                            ('distance', np.int32),
+                            ('predecessor', self._vertex_dtype())])
+
+    def weakly_connected_components(self):
+        """
+        Find the weakly connected components by label propagation: at each
+        round the vertices whose label changed send it to their neighbors
+        (along out-edges and in-edges) and every vertex keeps the smallest
+        label received. Each vertex ends up labeled with the smallest vertex
+        id of its component.
+
+        Returns
+        -------
+        df : dask.DataFrame
+            df['labels'] : the component label of the vertex.
+            df['vertices'] : the vertex ids.
+        """
+        states = self._map(host.wcc_init)
+        while self._active(states) > 0:
+            messages = self._exchange(self._step(host.wcc_expand, states))
+            states = [self.client.submit(host.wcc_update, part, state,
+                                         *received, workers=[worker])
+                      for part, state, received, worker in
+                      zip(self._parts, states, messages, self.workers)]
+        return self._frame(self._step(host.wcc_result, states),
+                           [('labels', self._vertex_dtype()),
+                            ('vertices', self._vertex_dtype())])
+
+    def pagerank(self, alpha=0.85, max_iter=100, tol=1.0e-5, callback=None,
+                 return_stats=False):
+        """
+        Compute the PageRank of every vertex with the power method. At each
+        iteration every rank computes the ranks of its vertex range from its
+        in-edges and the slices of the rank vector of all the ranks (an
+        allgather between the workers); only the residuals go through the
+        client.
+
+        Parameters
+        ----------
+        alpha : float, optional
+            The damping factor, 0.85 by default.
+        max_iter : int, optional
+            The maximum number of iterations, 100 by default.
+        tol : float, optional
+            Convergence tolerance on the L1 norm of the difference of two
+            successive rank vectors, 1.0e-5 by default.
+        callback : callable, optional
+            Called on the client after every iteration as
+            callback(iteration, residual). If it returns True the iteration
+            stops and the current approximation is returned.
+        return_stats : bool, optional
+            If True, also return a cugraph.SolverStats record of the run.
+
+        Returns
+        -------
+        df : dask.DataFrame
+            df['vertex'] : the vertex ids.
+            df['pagerank'] : the PageRank of the vertex.
+        stats : cugraph.SolverStats
+            Only returned if return_stats is True.
+        """
+        c = self.client
+        stats = SolverStats(callback)
+        stats.converged = False
+        with stats.phase('iterations'):
+            states = self._map(host.pagerank_init)
+            for _ in range(max_iter):
+                messages = [c.submit(host.pagerank_message, state,
+                                     workers=[worker])
+                            for state, worker in zip(states, self.workers)]
+                new_states = self._step(host.pagerank_step, states, messages,
+                                        alpha)
+                err = sum(c.gather([c.submit(host.pagerank_residual, state,
+                                             new_state, workers=[worker])
+                                    for state, new_state, worker in
+                                    zip(states, new_states, self.workers)]))
+                states = new_states
+                stats.converged = bool(err < tol)
+                if stats.record(float(err)) or stats.converged:
+                    break
+        df = self._frame(self._step(host.pagerank_result, states),
+                         [('vertex', self._vertex_dtype()),
+                          ('pagerank', np.float32)])
+        if return_stats:
+            return df, stats
+        return df
@@ -0,0 +1,335 @@
+# Copyright (c) 2019, NVIDIA CORPORATION.
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# Worker side of DistributedGraph on CPU workers (NumPy/SciPy). The
+# functions of this module run as dask tasks and must not import cudf. They
+# never modify their arguments: the per-rank state of an algorithm is
+# replaced by a new one at every step.
+
+from cugraph.structure import graph_host
+import numpy as np
+import pandas as pd
+from scipy import sparse
+
+
+class LocalGraph:
+    """
+    The part of a DistributedGraph held by one rank: the out-edges (adj, a
+    CSR matrix) and the in-edges (t_adj, a CSR matrix of the transposed
+    adjacency matrix) of the vertex range [lo, hi). Rows are local vertices
+    (vertex - lo), columns are global vertex ids.
+    """
+    def __init__(self, rank, bounds, adj, t_adj):
+        self.rank = rank
+        self.bounds = bounds
+        self.lo = int(bounds[rank])
+        self.hi = int(bounds[rank + 1])
+        self.num_verts = int(bounds[-1])
+        self.adj = adj
+        self.t_adj = t_adj
+
+    def vertices(self):
+        return np.arange(self.lo, self.hi,
+                         dtype=graph_host.index_dtype(self.num_verts))
+
+    def owners(self, vertices):
+        # Rank of each of the given vertices
+        return np.searchsorted(self.bounds, vertices, side='right') - 1
+
+
+def _edges(df):
+    return (graph_host.to_host_array(df['src'], dtype=np.int64),
+            graph_host.to_host_array(df['dst'], dtype=np.int64))
+
+
+def degrees(df):
+    """
+    Return the out-degree and in-degree histograms of a partition of the
+    edge list (of length the largest vertex id of the partition plus one).
+    """
+    src, dst = _edges(df)
+    num_verts = int(max(src.max(), dst.max())) + 1 if len(src) else 0
+    return (np.bincount(src, minlength=num_verts),
+            np.bincount(dst, minlength=num_verts))
+
+
+def sum_degrees(histograms):
+    """
+    Sum the degree histograms of all the partitions of the edge list.
+    """
+    num_verts = max([len(out_degree) for out_degree, _ in histograms] + [0])
+    out_degree = np.zeros(num_verts, dtype=np.int64)
+    in_degree = np.zeros(num_verts, dtype=np.int64)
+    for o, i in histograms:
+        out_degree[:len(o)] += o
+        in_degree[:len(i)] += i
+    return out_degree, in_degree
+
+
+def vertex_bounds(degree_sums, num_parts, by=None):
+    """
+    Split [0, V) into num_parts vertex ranges holding about the same number
+    of edges: out-edges (by='src'), in-edges (by='dst') or both (by=None).
+    Return the num_parts + 1 range bounds.
+    """
+    out_degree, in_degree = degree_sums
+    num_verts = len(in_degree)
+    if by == 'src':
+        load = out_degree
+    elif by == 'dst':
+        load = in_degree
+    else:
+        load = out_degree + in_degree
+    total = int(load.sum())
+    if total == 0:
+        bounds = np.linspace(0, num_verts, num_parts + 1)
+        return bounds.astype(np.int64)
+    targets = np.arange(1, num_parts) * (total / num_parts)
+    inner = np.searchsorted(np.cumsum(load), targets, side='left') + 1
+    return np.concatenate([[0], np.minimum(inner, num_verts), [num_verts]])
+
+
+def split_edges(df, bounds):
+    """
+    Split a partition of the edge list by vertex range, once by source (the
+    out-edges of each range) and once by destination (the in-edges). Return
+    one (out_src, out_dst, in_src, in_dst) tuple per range.
+    """
+    src, dst = _edges(df)
+    out_pieces = _split(src, dst, src, bounds)
+    in_pieces = _split(src, dst, dst, bounds)
+    return [o + i for o, i in zip(out_pieces, in_pieces)]
+
+
+def _split(src, dst, key, bounds):
+    owner = np.searchsorted(bounds, key, side='right') - 1
+    order = np.argsort(owner, kind='stable')
+    splits = np.searchsorted(owner[order], np.arange(1, len(bounds) - 1))
+    return [(s, d) for s, d in zip(np.split(src[order], splits),
+                                   np.split(dst[order], splits))]
+
+
+def local_graph(rank, bounds, *pieces):
+    """
+    Build the LocalGraph of rank from its pieces of every partition of the
+    edge list.
+    """
+    def column(i):
+        return np.concatenate([np.empty(0, dtype=np.int64)] +
+                              [p[i] for p in pieces])
+
+    lo, hi = int(bounds[rank]), int(bounds[rank + 1])
+    num_verts = int(bounds[-1])
+    out_src, out_dst, in_src, in_dst = [column(i) for i in range(4)]
+    adj = sparse.csr_matrix((np.ones(len(out_src)), (out_src - lo, out_dst)),
+                            shape=(hi - lo, num_verts))
+    t_adj = sparse.csr_matrix((np.ones(len(in_src)), (in_dst - lo, in_src)),
+                              shape=(hi - lo, num_verts))
+    # Parallel edges are merged into one entry holding their count
+    adj.sum_duplicates()
+    t_adj.sum_duplicates()
+    return LocalGraph(rank, bounds, adj, t_adj)
+
+
+def number_of_edges(graph):
+    return int(graph.adj.sum())
+
+
+def degree(graph, x=0):
+    """
+    Return the degree (x=0), in-degree (x=1) or out-degree (x=2) of the
+    vertices of graph as a DataFrame with the 'vertex' and 'degree' columns.
+    """
+    in_degree = np.asarray(graph.t_adj.sum(axis=1)).ravel()
+    out_degree = np.asarray(graph.adj.sum(axis=1)).ravel()
+    df = pd.DataFrame()
+    df['vertex'] = graph.vertices()
+    df['degree'] = (in_degree * (x != 2) + out_degree * (x != 1)).astype(
+        np.int32)
+    return df
+
+
+def _route(graph, vertices, values):
+    # Split (vertex, value) messages by rank of the vertex
+    owner = graph.owners(vertices)
+    order = np.argsort(owner, kind='stable')
+    splits = np.searchsorted(owner[order],
+                             np.arange(1, len(graph.bounds) - 1))
+    return list(zip(np.split(vertices[order], splits),
+                    np.split(values[order], splits)))
+
+
+def _received(messages):
+    vertices = np.concatenate([np.empty(0, dtype=np.int64)] +
+                              [m[0] for m in messages])
+    values = np.concatenate([np.empty(0, dtype=np.int64)] +
+                            [m[1] for m in messages])
+    return vertices, values
+
+
+def bfs_init(graph, start):
+    """
+    Return the initial BFS state of graph: distances, predecessors and
+    frontier (global ids) of its vertex range.
+    """
+    num_local = graph.hi - graph.lo
+    distances = np.full(num_local, np.iinfo(np.int32).max, dtype=np.int32)
+    predecessors = np.full(num_local, -1,
+                           dtype=graph_host.index_dtype(graph.num_verts))
+    frontier = np.empty(0, dtype=np.int64)
+    if graph.lo <= start < graph.hi:
+        distances[start - graph.lo] = 0
+        frontier = np.asarray([start], dtype=np.int64)
+    return distances, predecessors, frontier
+
+
+def bfs_expand(graph, state):
+    """
+    Expand the frontier of the BFS state of graph. Return the discovered
+    (vertex, predecessor) pairs, one message per rank.
+    """
+    frontier = state[2]
+    owners, positions = graph_host.gather_neighbors(
+        graph.adj.indptr, graph.adj.indices, frontier - graph.lo)
+    neighbors = graph.adj.indices[positions].astype(np.int64)
+    return _route(graph, neighbors, owners + graph.lo)
+
+
+def bfs_update(graph, state, depth, *messages):
+    """
+    Visit the vertices of graph discovered at depth and return the new BFS
+    state.
+    """
+    distances, predecessors, _ = state
+    vertices, parents = _received(messages)
+    local = vertices - graph.lo
+    unvisited = distances[local] == np.iinfo(np.int32).max
+    local, first = np.unique(local[unvisited], return_index=True)
+    distances = distances.copy()
+    predecessors = predecessors.copy()
+    distances[local] = depth
+    predecessors[local] = parents[unvisited][first]
+    return distances, predecessors, local + graph.lo
+
+
+def active_count(state):
+    """
+    Return the number of active vertices of a BFS state (the frontier) or
+    of a weakly connected components state (the changed vertices).
+    """
+    return len(state[-1])
+
+
+def bfs_result(graph, state):
+    df = pd.DataFrame()
+    df['vertex'] = graph.vertices()
+    df['distance'] = state[0]
+    df['predecessor'] = state[1]
+    return df
+
+
+def wcc_init(graph):
+    """
+    Return the initial weakly connected components state of graph: the
+    label of each vertex of its range (its own id) and the vertices whose
+    label changed (all of them).
+    """
+    labels = graph.vertices().astype(np.int64)
+    return labels, labels
+
+
+def wcc_expand(graph, state):
+    """
+    Send the labels of the vertices whose label changed to their neighbors,
+    both along out-edges and in-edges. Return one message per rank.
+    """
+    labels, changed = state
+    local = changed - graph.lo
+    vertices = []
+    values = []
+    for A in (graph.adj, graph.t_adj):
+        owners, positions = graph_host.gather_neighbors(A.indptr, A.indices,
+                                                        local)
+        vertices.append(A.indices[positions].astype(np.int64))
+        values.append(labels[owners])
+    return _route(graph, np.concatenate(vertices), np.concatenate(values))
+
+
+def wcc_update(graph, state, *messages):
+    """
+    Lower the labels of the vertices of graph to the smallest label received
+    and return the new state.
+    """
+    labels, _ = state
+    vertices, received = _received(messages)
+    new_labels = labels.copy()
+    np.minimum.at(new_labels, vertices - graph.lo, received)
+    changed = np.flatnonzero(new_labels < labels) + graph.lo
+    return new_labels, changed
+
+
+def wcc_result(graph, state):
+    df = pd.DataFrame()
+    df['labels'] = state[0].astype(graph_host.index_dtype(graph.num_verts))
+    df['vertices'] = graph.vertices()
+    return df
+
+
+def pagerank_init(graph):
+    """
+    Return the initial PageRank state of graph: the ranks of its vertex
+    range and the inverse out-degrees and dangling flags of the range.
+    """
+    out_degree = np.asarray(graph.adj.sum(axis=1)).ravel()
+    dangling = out_degree == 0
+    inv_out_degree = np.zeros(len(out_degree))
+    inv_out_degree[~dangling] = 1.0 / out_degree[~dangling]
+    x = np.full(len(out_degree), 1.0 / graph.num_verts)
+    return x, inv_out_degree, dangling
+
+
+def pagerank_message(state):
+    """
+    Return what a rank sends to the other ranks at each iteration: the slice
+    of the rank vector scaled by the inverse out-degrees, and the rank held
+    by its dangling vertices.
+    """
+    x, inv_out_degree, dangling = state
+    return x * inv_out_degree, x[dangling].sum()
+
+
+def pagerank_step(graph, state, messages, alpha):
+    """
+    Run one PageRank iteration on the vertex range of graph, from the
+    messages of all the ranks (in rank order), and return the new state.
+    """
+    _, inv_out_degree, dangling = state
+    y = np.concatenate([m[0] for m in messages])
+    dangling_sum = sum(m[1] for m in messages)
+    # The columns of T scaled by the inverse out-degrees sum to one, so the
+    # new rank vector keeps the unit sum of the previous one: unlike the
+    # single node solver no normalization (and no global reduction) is needed
+    x = alpha * (graph.t_adj @ y) + \
+        (alpha * dangling_sum + 1.0 - alpha) / graph.num_verts
+    return x, inv_out_degree, dangling
+
+
+def pagerank_residual(state, new_state):
+    return np.abs(new_state[0] - state[0]).sum()
+
+
+def pagerank_result(graph, state):
+    df = pd.DataFrame()
+    df['vertex'] = graph.vertices()
+    df['pagerank'] = state[0].astype(np.float32)
+    return df
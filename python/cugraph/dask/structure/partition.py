@@ -0,0 +1,279 @@
+# Copyright (c) 2019, NVIDIA CORPORATION.
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from cugraph.dask.structure import distributed_graph_host as host
+from cugraph.structure import graph_host
+import dask
+import numpy as np
+
+
+class PartitionStats:
+    """
+    Description of a partition of an edge list, returned by the
+    partitioners of cugraph.dask to compare the work balance and the
+    communication volume of partitioning schemes.
+
+    Attributes
+    ----------
+    edges : NumPy array
+        Number of edges of each partition.
+    vertices : NumPy array
+        Number of distinct vertices of each partition (the endpoints of its
+        edges, including the vertices owned by other partitions).
+    replication_factor : float
+        Average number of partitions holding a (non isolated) vertex: the sum
+        of vertices over the number of vertices with at least one edge. It
+        bounds the number of vertex values exchanged at each iteration of an
+        algorithm, 1.0 meaning no communication.
+    edge_cut : int or None
+        Number of edges whose endpoints are owned by different partitions,
+        for the partitioners assigning vertices to partitions (None for the
+        2D and edge hash partitioners, which assign edges).
+    imbalance : float
+        Largest number of edges of a partition over the average, 1.0 for a
+        perfectly balanced partition.
+    bounds : NumPy array, tuple of NumPy arrays or None
+        Vertex range bounds of the 1D partitioner, (row bounds, column
+        bounds) of the 2D partitioner, None for the hash partitioner.
+    """
+    def __init__(self, edges, vertices, num_verts, edge_cut=None,
+                 bounds=None):
+        self.edges = edges
+        self.vertices = vertices
+        self.replication_factor = float(vertices.sum()) / max(num_verts, 1)
+        self.edge_cut = edge_cut
+        self.imbalance = float(edges.max() / edges.mean()) \
+            if edges.sum() > 0 else 1.0
+        self.bounds = bounds
+
+    def __repr__(self):
+        return ('PartitionStats(partitions=%d, imbalance=%.3f, '
+                'replication_factor=%.3f, edge_cut=%r)' %
+                (len(self.edges), self.imbalance, self.replication_factor,
+                 self.edge_cut))
+
+
+def _degree_sums(edge_list):
+    histograms = [dask.delayed(host.degrees)(part)
+                  for part in edge_list.to_delayed()]
+    return dask.delayed(host.sum_degrees)(histograms).compute()
+
+
+def _range_owner(vertices, bounds):
+    return np.searchsorted(bounds, vertices, side='right') - 1
+
+
+def _hash_owner(vertices, npartitions):
+    # Fibonacci hashing, spreads consecutive ids over all the partitions
+    h = vertices.astype(np.uint64) * np.uint64(11400714819323198485)
+    return ((h >> np.uint64(32)) % np.uint64(npartitions)).astype(np.int64)
+
+
+def _edge_ids(src, dst, scheme, args):
+    if scheme == '1d':
+        bounds, by = args
+        return _range_owner(src if by == 'src' else dst, bounds)
+    if scheme == '2d':
+        row_bounds, col_bounds = args
+        return _range_owner(src, row_bounds) * (len(col_bounds) - 1) + \
+            _range_owner(dst, col_bounds)
+    npartitions, by = args
+    if by == 'edge':
+        mixed = src.astype(np.uint64) * np.uint64(11400714819323198485) ^ \
+            dst.astype(np.uint64)
+        return _hash_owner(mixed, npartitions)
+    return _hash_owner(src if by == 'src' else dst, npartitions)
+
+
+def _owner(vertices, scheme, args):
+    # Owner of the vertices for the vertex partitioners, None otherwise
+    if scheme == '1d':
+        return _range_owner(vertices, args[0])
+    if scheme == 'hash' and args[1] != 'edge':
+        return _hash_owner(vertices, args[0])
+    return None
+
+
+def _tag(df, scheme, args):
+    src = graph_host.to_host_array(df['src'], dtype=np.int64)
+    dst = graph_host.to_host_array(df['dst'], dtype=np.int64)
+    return df.assign(_partition=_edge_ids(src, dst, scheme, args))
+
+
+def _part_stats(df, scheme, args):
+    src = graph_host.to_host_array(df['src'], dtype=np.int64)
+    dst = graph_host.to_host_array(df['dst'], dtype=np.int64)
+    vertices = len(np.unique(np.concatenate([src, dst])))
+    src_owner = _owner(src, scheme, args)
+    cut = None
+    if src_owner is not None:
+        cut = int((src_owner != _owner(dst, scheme, args)).sum())
+    return len(src), vertices, cut
+
+
+def _repartition(edge_list, npartitions, degree_sums, scheme, args,
+                 bounds):
+    meta = edge_list._meta.assign(_partition=np.empty(0, dtype=np.int64))
+    tagged = edge_list.map_partitions(_tag, scheme, args, meta=meta)
+    # Partition i holds the edges tagged i
+    result = tagged.set_index('_partition',
+                              divisions=list(range(npartitions + 1)))
+    result = result.reset_index(drop=True).persist()
+
+    parts = dask.compute(*[dask.delayed(_part_stats)(part, scheme, args)
+                           for part in result.to_delayed()])
+    edges, vertices, cuts = zip(*parts)
+    edge_cut = None if cuts[0] is None else sum(cuts)
+    out_degree, in_degree = degree_sums
+    num_verts = int(((out_degree + in_degree) > 0).sum())
+    stats = PartitionStats(np.asarray(edges, dtype=np.int64),
+                           np.asarray(vertices, dtype=np.int64), num_verts,
+                           edge_cut, bounds)
+    return result, stats
+
+
+def _check(edge_list, npartitions):
+    if npartitions < 1:
+        raise ValueError('npartitions must be at least 1')
+    for c in ['src', 'dst']:
+        if c not in edge_list.columns:
+            raise ValueError("edge_list must have the 'src' and 'dst' "
+                             "columns")
+
+
+def partition_1d(edge_list, npartitions, by='dst'):
+    """
+    Repartition an edge list into vertex range partitions holding about the
+    same number of edges. With by='dst' partition i holds the in-edges of
+    the i-th vertex range (a 1D partition of the CSC representation, for
+    pull algorithms such as PageRank), with by='src' it holds the out-edges
+    (a 1D partition of the CSR representation).
+
+    Parameters
+    ----------
+    edge_list : dask.DataFrame or dask_cudf.DataFrame
+        Edge list with the 'src' and 'dst' columns, any other column is kept.
+        Vertex ids must be in the range [0, V-1].
+    npartitions : int
+        Number of partitions of the result.
+    by : string, optional
+        'dst' (the default) or 'src', the endpoint defining the partition of
+        an edge.
+
+    Returns
+    -------
+    edge_list : dask.DataFrame or dask_cudf.DataFrame
+        The repartitioned edge list, persisted.
+    stats : cugraph.dask.PartitionStats
+        Edge and vertex counts of the partitions, replication factor and
+        edge cut. stats.bounds holds the npartitions + 1 bounds of the
+        vertex ranges.
+
+    Examples
+    --------
+    >>> ddf = dask_cudf.read_csv('datasets/karate.csv', delimiter=' ',
+    >>>                          names=['src', 'dst', 'value'],
+    >>>                          dtype=['int32', 'int32', 'float32'])
+    >>> ddf, stats = cugraph.dask.partition_1d(ddf, 4)
+    """
+    _check(edge_list, npartitions)
+    if by not in ['src', 'dst']:
+        raise ValueError("by must be 'src' or 'dst'")
+    degree_sums = _degree_sums(edge_list)
+    bounds = host.vertex_bounds(degree_sums, npartitions, by=by)
+    return _repartition(edge_list, npartitions, degree_sums, '1d',
+                        (bounds, by), bounds)
+
+
+def partition_2d(edge_list, npartitions, shape=None):
+    """
+    Repartition an edge list into the blocks of a 2D partition of the
+    adjacency matrix: the sources are split into row ranges holding about
+    the same number of out-edges, the destinations into column ranges
+    holding about the same number of in-edges, and the edges of the block
+    (r, c) form the partition r * columns + c. Every vertex value is then
+    exchanged among a row or a column of partitions only.
+
+    Parameters
+    ----------
+    edge_list : dask.DataFrame or dask_cudf.DataFrame
+        Edge list with the 'src' and 'dst' columns, any other column is kept.
+        Vertex ids must be in the range [0, V-1].
+    npartitions : int
+        Number of partitions of the result.
+    shape : tuple of two ints, optional
+        Number of row and column ranges, whose product must be npartitions.
+        By default the most square factorization of npartitions.
+
+    Returns
+    -------
+    edge_list : dask.DataFrame or dask_cudf.DataFrame
+        The repartitioned edge list, persisted.
+    stats : cugraph.dask.PartitionStats
+        Edge and vertex counts of the partitions and replication factor.
+        stats.bounds holds the bounds of the row and column ranges.
+
+    Examples
+    --------
+    >>> ddf, stats = cugraph.dask.partition_2d(ddf, 4)
+    """
+    _check(edge_list, npartitions)
+    if shape is None:
+        rows = int(np.sqrt(npartitions))
+        while npartitions % rows:
+            rows -= 1
+        shape = (rows, npartitions // rows)
+    if len(shape) != 2 or shape[0] * shape[1] != npartitions:
+        raise ValueError('shape must be two ints whose product is '
+                         'npartitions')
+    degree_sums = _degree_sums(edge_list)
+    row_bounds = host.vertex_bounds(degree_sums, shape[0], by='src')
+    col_bounds = host.vertex_bounds(degree_sums, shape[1], by='dst')
+    return _repartition(edge_list, npartitions, degree_sums, '2d',
+                        (row_bounds, col_bounds), (row_bounds, col_bounds))
+
+
+def partition_hash(edge_list, npartitions, by='dst'):
+    """
+    Repartition an edge list by hashing the vertex ids (by='src' or
+    by='dst', every vertex is owned by one partition) or the edges
+    (by='edge'). Hash partitions balance the vertices but not the edges of
+    skewed graphs, and ignore locality.
+
+    Parameters
+    ----------
+    edge_list : dask.DataFrame or dask_cudf.DataFrame
+        Edge list with the 'src' and 'dst' columns, any other column is kept.
+    npartitions : int
+        Number of partitions of the result.
+    by : string, optional
+        'dst' (the default), 'src' or 'edge', what is hashed.
+
+    Returns
+    -------
+    edge_list : dask.DataFrame or dask_cudf.DataFrame
+        The repartitioned edge list, persisted.
+    stats : cugraph.dask.PartitionStats
+        Edge and vertex counts of the partitions, replication factor and
+        edge cut (for vertex hashing).
+
+    Examples
+    --------
+    >>> ddf, stats = cugraph.dask.partition_hash(ddf, 4, by='src')
+    """
+    _check(edge_list, npartitions)
+    if by not in ['src', 'dst', 'edge']:
+        raise ValueError("by must be 'src', 'dst' or 'edge'")
+    degree_sums = _degree_sums(edge_list)
+    return _repartition(edge_list, npartitions, degree_sums, 'hash',
+                        (npartitions, by), None)
@@ -0,0 +1,497 @@
+# Copyright (c) 2019, NVIDIA CORPORATION.
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# Synthetic graph generators. The edges are drawn in blocks of BLOCK_SIZE
+# edges (or of about BLOCK_SIZE edges for Erdos-Renyi graphs), each from a
+# random state seeded with (seed, block index): a graph only depends on the
+# generator parameters and the seed, not on the chunk size, and the stream
+# can be replayed, which lets Graph.from_edge_stream build the adjacency list
+# in two passes without holding the edge list.
+
+import math
+
+import numpy as np
+
+from cugraph.structure import graph_file, graph_host
+from cugraph.structure.graph import Graph
+
+
+BLOCK_SIZE = 1 << 16
+DEFAULT_CHUNK_SIZE = 1 << 22
+
+
+def _seed(seed):
+    if seed is None:
+        return int(np.random.randint(np.iinfo(np.int32).max))
+    if not 0 <= seed < 2 ** 32:
+        raise ValueError('seed must be in the range [0, 2**32)')
+    return int(seed)
+
+
+def _check_chunk_size(chunk_size):
+    if chunk_size < 1:
+        raise ValueError('chunk_size must be at least 1')
+
+
+def _edge_blocks(num_edges, chunk_size, make_block):
+    # Group the blocks of BLOCK_SIZE edges into chunks of about chunk_size
+    # edges. make_block(block, start, stop) returns the (src, dst) arrays of
+    # the edges [start, stop).
+    blocks_per_chunk = max(1, chunk_size // BLOCK_SIZE)
+    num_blocks = -(-num_edges // BLOCK_SIZE)
+    for first in range(0, num_blocks, blocks_per_chunk):
+        parts = [make_block(b, b * BLOCK_SIZE,
+                            min((b + 1) * BLOCK_SIZE, num_edges))
+                 for b in range(first, min(first + blocks_per_chunk,
+                                           num_blocks))]
+        yield (np.concatenate([p[0] for p in parts]),
+               np.concatenate([p[1] for p in parts]))
+
+
+def _build(edges, num_vertices, path, backend, memory_budget):
+    if path is None:
+        return Graph.from_edge_stream(edges, num_vertices=num_vertices,
+                                      backend=backend,
+                                      memory_budget=memory_budget)
+    offsets, indices, _ = graph_host.edge_stream_to_csr(
+        edges, num_vertices=num_vertices)
+    graph_file.write(path, offsets, indices)
+    return None
+
+
+def _initiator(initiator):
+    P = np.asarray(initiator, dtype=np.float64)
+    if P.ndim != 2 or P.shape[0] != P.shape[1] or P.shape[0] < 2:
+        raise ValueError('initiator must be a square matrix of size at '
+                         'least 2')
+    if (P < 0).any() or P.sum() <= 0:
+        raise ValueError('initiator must be non-negative with a positive '
+                         'sum')
+    return P
+
+
+def kronecker_edges(initiator, k, num_edges=None, seed=None, scramble=False,
+                    chunk_size=DEFAULT_CHUNK_SIZE):
+    """
+    Generate the edges of a stochastic Kronecker graph in chunks. Each edge
+    descends k levels of the Kronecker power of the n x n initiator matrix,
+    choosing one of its n * n cells at every level with a probability
+    proportional to the cell value, which gives a graph of n**k vertices.
+    Edges are drawn independently: the graph may have self loops and
+    multiple edges.
+
+    Parameters
+    ----------
+    initiator : array-like
+        Square matrix of non-negative cell weights.
+    k : int
+        Kronecker power, the number of levels.
+    num_edges : int, optional
+        Number of edges to draw. Default is the expected number of edges of
+        the stochastic Kronecker graph, sum(initiator)**k, rounded.
+    seed : int, optional
+        Seed of the random draws, in the range [0, 2**32). The same seed
+        gives the same edges whatever the chunk size. Default is a random
+        seed.
+    scramble : bool, optional
+        If True, relabel the vertices with a random bijection so that the
+        vertex ids do not reveal the degree (low ids are the high degree
+        vertices of skewed initiators).
+    chunk_size : int, optional
+        Number of edges per chunk, rounded to a multiple of BLOCK_SIZE.
+
+    Returns
+    -------
+    chunks : iterator
+        Iterator of (src, dst) NumPy arrays of vertex ids.
+
+    Examples
+    --------
+    >>> for src, dst in cugraph.generators.kronecker_edges(
+    >>>         [[0.9, 0.5], [0.5, 0.1]], 10, seed=42):
+    >>>     print(len(src))
+    """
+    P = _initiator(initiator)
+    if k < 1:
+        raise ValueError('k must be at least 1')
+    _check_chunk_size(chunk_size)
+    n = P.shape[0]
+    num_vertices = n ** k
+    if num_edges is None:
+        num_edges = int(round(P.sum() ** k))
+    if num_edges < 0:
+        raise ValueError('num_edges must be non-negative')
+    seed = _seed(seed)
+    cumulative = np.cumsum(P.ravel() / P.sum())
+    dtype = graph_host.index_dtype(num_vertices)
+
+    scale = scramble_shift = None
+    if scramble:
+        # Affine bijection v -> (scale * v + shift) mod num_vertices, scale
+        # being coprime with num_vertices
+        rs = np.random.RandomState([seed])
+        scale = int(rs.randint(1, min(num_vertices, 2 ** 31)))
+        while math.gcd(scale, num_vertices) != 1:
+            scale = int(rs.randint(1, min(num_vertices, 2 ** 31)))
+        scramble_shift = int(rs.randint(0, min(num_vertices, 2 ** 31)))
+
+    def relabel(v):
+        if scale is None:
+            return v.astype(dtype)
+        v = v.astype(np.uint64) * np.uint64(scale) + \
+            np.uint64(scramble_shift)
+        return (v % np.uint64(num_vertices)).astype(dtype)
+
+    def make_block(block, start, stop):
+        rs = np.random.RandomState([seed, block])
+        src = np.zeros(stop - start, dtype=np.int64)
+        dst = np.zeros(stop - start, dtype=np.int64)
+        for _ in range(k):
+            u = rs.random_sample(stop - start)
+            if n * n <= 16:
+                # Cheaper than a binary search for small initiators
+                cell = np.zeros(stop - start, dtype=np.int64)
+                for bound in cumulative[:-1]:
+                    cell += u >= bound
+            else:
+                cell = np.searchsorted(cumulative, u, side='right')
+                np.minimum(cell, n * n - 1, out=cell)
+            src *= n
+            src += cell // n
+            dst *= n
+            dst += cell % n
+        return relabel(src), relabel(dst)
+
+    return _edge_blocks(num_edges, chunk_size, make_block)
+
+
+def kronecker(initiator, k, num_edges=None, seed=None, scramble=False,
+              path=None, chunk_size=DEFAULT_CHUNK_SIZE, backend=None,
+              memory_budget=None):
+    """
+    Generate a stochastic Kronecker graph of n**k vertices, n being the size
+    of the initiator matrix. See kronecker_edges for the parameters.
+
+    The edges are streamed into the adjacency list builder of
+    Graph.from_edge_stream (the stream is generated twice), so the edge list
+    is never held in memory.
+
+    Parameters
+    ----------
+    path : string, optional
+        If set, the adjacency list is written to path in the binary graph
+        file format (see Graph.save and cugraph.load) instead of being
+        returned as a Graph.
+    backend : string, optional
+        Backend of the new graph, see Graph.
+    memory_budget : int, optional
+        Memory budget of the new graph, see Graph.
+
+    Returns
+    -------
+    G : cugraph.Graph
+        The graph, or None if path is set.
+
+    Examples
+    --------
+    >>> G = cugraph.generators.kronecker([[0.9, 0.5], [0.5, 0.1]], 16,
+    >>>                                  seed=42)
+    """
+    seed = _seed(seed)
+    num_vertices = _initiator(initiator).shape[0] ** k
+
+    def edges():
+        return kronecker_edges(initiator, k, num_edges, seed, scramble,
+                               chunk_size)
+    return _build(edges, num_vertices, path, backend, memory_budget)
+
+
+def _rmat_initiator(a, b, c):
+    d = 1.0 - a - b - c
+    if min(a, b, c) < 0 or d < -1e-9:
+        raise ValueError('a, b and c must be non-negative with a sum of at '
+                         'most 1')
+    return [[a, b], [c, max(d, 0.0)]]
+
+
+def rmat_edges(scale, edge_factor=16, a=0.57, b=0.19, c=0.19, seed=None,
+               scramble=False, chunk_size=DEFAULT_CHUNK_SIZE):
+    """
+    Generate the edges of an R-MAT graph of 2**scale vertices and
+    edge_factor * 2**scale edges in chunks: each edge recursively falls in
+    one of the four quadrants of the adjacency matrix with probabilities a,
+    b, c and d = 1 - a - b - c. The defaults are the Graph 500 parameters.
+    The graph may have self loops and multiple edges.
+
+    Parameters
+    ----------
+    scale : int
+        Logarithm in base 2 of the number of vertices.
+    edge_factor : int, optional
+        Average number of edges per vertex.
+    a, b, c : float, optional
+        Probabilities of the top left, top right and bottom left quadrants.
+    seed : int, optional
+        Seed of the random draws, see kronecker_edges.
+    scramble : bool, optional
+        If True, relabel the vertices with a random bijection.
+    chunk_size : int, optional
+        Number of edges per chunk.
+
+    Returns
+    -------
+    chunks : iterator
+        Iterator of (src, dst) NumPy arrays of vertex ids.
+
+    Examples
+    --------
+    >>> for src, dst in cugraph.generators.rmat_edges(20, seed=42):
+    >>>     print(len(src))
+    """
+    return kronecker_edges(_rmat_initiator(a, b, c), scale,
+                           edge_factor * 2 ** scale, seed, scramble,
+                           chunk_size)
+
+
+def rmat(scale, edge_factor=16, a=0.57, b=0.19, c=0.19, seed=None,
+         scramble=False, path=None, chunk_size=DEFAULT_CHUNK_SIZE,
+         backend=None, memory_budget=None):
+    """
+    Generate an R-MAT graph of 2**scale vertices and edge_factor * 2**scale
+    edges. See rmat_edges for the graph parameters and kronecker for path,
+    backend and memory_budget.
+
+    Returns
+    -------
+    G : cugraph.Graph
+        The graph, or None if path is set.
+
+    Examples
+    --------
+    >>> G = cugraph.generators.rmat(16, seed=42)
+    >>> df = cugraph.pagerank(G)
+    >>> cugraph.generators.rmat(24, seed=42, path='rmat24.cugraph')
+    >>> G = cugraph.load('rmat24.cugraph')
+    """
+    return kronecker(_rmat_initiator(a, b, c), scale,
+                     edge_factor * 2 ** scale, seed, scramble, path,
+                     chunk_size, backend, memory_budget)
+
+
+def _skip_sample(rs, p, size):
+    # Positions in [0, size) each drawn with probability p, from the
+    # geometric gaps between consecutive positions.
+    positions = []
+    last = -1
+    while True:
+        count = int((size - last) * p * 1.05) + 64
+        batch = last + np.cumsum(rs.geometric(p, count))
+        if batch[-1] >= size:
+            positions.append(batch[batch < size])
+            return np.concatenate(positions)
+        positions.append(batch)
+        last = int(batch[-1])
+
+
+def erdos_renyi_edges(num_vertices, p, seed=None,
+                      chunk_size=DEFAULT_CHUNK_SIZE):
+    """
+    Generate the edges of a directed Erdos-Renyi graph G(n, p) in chunks:
+    each of the n * (n - 1) possible edges (no self loops) is present with
+    probability p. Only the present edges are drawn, so the cost is
+    proportional to the number of edges, about p * n * (n - 1). Use
+    cugraph.symmetrize for an undirected graph.
+
+    Parameters
+    ----------
+    num_vertices : int
+        Number of vertices.
+    p : float
+        Probability of each edge, in the range [0, 1].
+    seed : int, optional
+        Seed of the random draws, see kronecker_edges.
+    chunk_size : int, optional
+        Approximate number of edges per chunk.
+
+    Returns
+    -------
+    chunks : iterator
+        Iterator of (src, dst) NumPy arrays of vertex ids, sorted by source.
+
+    Examples
+    --------
+    >>> for src, dst in cugraph.generators.erdos_renyi_edges(1000, 0.01):
+    >>>     print(len(src))
+    """
+    if num_vertices < 0:
+        raise ValueError('num_vertices must be non-negative')
+    if not 0.0 <= p <= 1.0:
+        raise ValueError('p must be in the range [0, 1]')
+    _check_chunk_size(chunk_size)
+    seed = _seed(seed)
+    if num_vertices < 2 or p == 0.0:
+        return iter([])
+    dtype = graph_host.index_dtype(num_vertices)
+    row_size = num_vertices - 1
+    # Rows per block, about BLOCK_SIZE edges each
+    rows = max(1, int(BLOCK_SIZE / (p * row_size)))
+    num_blocks = -(-num_vertices // rows)
+
+    def make_block(block):
+        rs = np.random.RandomState([seed, block])
+        first_row = block * rows
+        last_row = min(first_row + rows, num_vertices)
+        slot = first_row * row_size + \
+            _skip_sample(rs, p, (last_row - first_row) * row_size)
+        src = slot // row_size
+        dst = slot % row_size
+        # Skip the diagonal
+        dst += dst >= src
+        return src.astype(dtype), dst.astype(dtype)
+
+    def chunks():
+        src, dst, size = [], [], 0
+        for block in range(num_blocks):
+            s, d = make_block(block)
+            src.append(s)
+            dst.append(d)
+            size += len(s)
+            if size >= chunk_size:
+                yield np.concatenate(src), np.concatenate(dst)
+                src, dst, size = [], [], 0
+        if src:
+            yield np.concatenate(src), np.concatenate(dst)
+
+    return chunks()
+
+
+def erdos_renyi(num_vertices, p, seed=None, path=None,
+                chunk_size=DEFAULT_CHUNK_SIZE, backend=None,
+                memory_budget=None):
+    """
+    Generate a directed Erdos-Renyi graph G(n, p). See erdos_renyi_edges for
+    the graph parameters and kronecker for path, backend and memory_budget.
+
+    Returns
+    -------
+    G : cugraph.Graph
+        The graph, or None if path is set.
+
+    Examples
+    --------
+    >>> G = cugraph.generators.erdos_renyi(2 ** 16, 16 / 2 ** 16, seed=42)
+    """
+    seed = _seed(seed)
+
+    def edges():
+        return erdos_renyi_edges(num_vertices, p, seed, chunk_size)
+    return _build(edges, num_vertices, path, backend, memory_budget)
+
+
+def barabasi_albert_edges(num_vertices, m, seed=None,
+                          chunk_size=DEFAULT_CHUNK_SIZE):
+    """
+    Generate the edges of a Barabasi-Albert preferential attachment graph in
+    chunks. Vertex m is connected to vertices 0 to m - 1, then every next
+    vertex is connected to m earlier vertices chosen with a probability
+    proportional to their degree, which gives a power-law degree
+    distribution. Each edge is drawn once, from the new vertex to the
+    earlier one (use cugraph.symmetrize for an undirected graph); the graph
+    may have multiple edges.
+
+    The edges are drawn with the method of Batagelj and Brandes: the target
+    of an edge is an endpoint of a uniformly drawn earlier edge, resolved in
+    vectorized pointer jumping steps. The targets of the earlier edges are
+    kept: the generator holds one vertex id per edge.
+
+    Parameters
+    ----------
+    num_vertices : int
+        Number of vertices.
+    m : int
+        Number of edges of each new vertex, in the range [1, num_vertices).
+    seed : int, optional
+        Seed of the random draws, see kronecker_edges.
+    chunk_size : int, optional
+        Number of edges per chunk, rounded to a multiple of BLOCK_SIZE.
+
+    Returns
+    -------
+    chunks : iterator
+        Iterator of (src, dst) NumPy arrays of vertex ids.
+
+    Examples
+    --------
+    >>> for src, dst in cugraph.generators.barabasi_albert_edges(1000, 3):
+    >>>     print(len(src))
+    """
+    if not 1 <= m < num_vertices:
+        raise ValueError('m must be in the range [1, num_vertices)')
+    _check_chunk_size(chunk_size)
+    seed = _seed(seed)
+    num_edges = m * (num_vertices - m)
+    dtype = graph_host.index_dtype(num_vertices)
+    targets = np.empty(num_edges, dtype=dtype)
+
+    def make_block(block, start, stop):
+        rs = np.random.RandomState([seed, block])
+        edge = np.arange(start, stop, dtype=np.int64)
+        src = m + edge // m
+        # Edge i draws one of the 2 * m * (src - m) endpoints of the edges of
+        # the vertices before its source, even positions being sources and
+        # odd positions targets. The edges of vertex m have no draw.
+        draw = (rs.random_sample(stop - start) *
+                (2 * m * (src - m))).astype(np.int64)
+        fixed = edge < m
+        targets[start:stop][fixed] = edge[fixed]
+
+        pending = np.flatnonzero(~fixed)
+        position = draw[pending]
+        while len(pending):
+            previous = position // 2
+            source = position % 2 == 0
+            targets[start + pending[source]] = m + previous[source] // m
+            pending = pending[~source]
+            previous = previous[~source]
+            resolved = (previous < start) | (previous < m)
+            targets[start + pending[resolved]] = targets[previous[resolved]]
+            # The target of an edge of this block, follow its draw
+            pending = pending[~resolved]
+            position = draw[previous[~resolved] - start]
+        return src.astype(dtype), targets[start:stop].copy()
+
+    return _edge_blocks(num_edges, chunk_size, make_block)
+
+
+def barabasi_albert(num_vertices, m, seed=None, path=None,
+                    chunk_size=DEFAULT_CHUNK_SIZE, backend=None,
+                    memory_budget=None):
+    """
+    Generate a Barabasi-Albert preferential attachment graph. See
+    barabasi_albert_edges for the graph parameters and kronecker for path,
+    backend and memory_budget.
+
+    Returns
+    -------
+    G : cugraph.Graph
+        The graph, or None if path is set.
+
+    Examples
+    --------
+    >>> G = cugraph.generators.barabasi_albert(2 ** 16, 8, seed=42)
+    """
+    seed = _seed(seed)
+
+    def edges():
+        return barabasi_albert_edges(num_vertices, m, seed, chunk_size)
+    return _build(edges, num_vertices, path, backend, memory_budget)
@@ -11,4 +11,6 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from cugraph.link_analysis.pagerank import pagerank
+from cugraph.link_analysis.pagerank import (pagerank,
+                                             personalized_pagerank_batch)
+from cugraph.link_analysis.incremental_pagerank import IncrementalPageRank
@@ -0,0 +1,331 @@
+# Copyright (c) 2019, NVIDIA CORPORATION.
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from cugraph.link_analysis import pagerank_host
+from cugraph.structure import graph_host
+from cugraph.structure.graph import memory_budgeted
+from cugraph.utilities.solver_stats import SolverStats
+import numpy as np
+import pandas as pd
+from scipy import sparse
+
+
+# The pending edge batches are merged into the matrix once they hold more
+# than this fraction of its edges
+MERGE_FRACTION = 1 / 16
+
+
+class IncrementalPageRank:
+    """
+    PageRank of an evolving graph. The solver keeps the transposed adjacency
+    matrix (CSR of the in-edges) of the graph, the adjacency matrix (CSR of
+    the out-edges) and the last rank vector. Batches of edge insertions and
+    deletions only touch the inserted and deleted edges: they are
+    accumulated as pending per-edge count changes, merged into the matrices
+    (a linear-time sparse addition) once they hold more than
+    MERGE_FRACTION of the edges or before a solve over the whole graph.
+    update() reconverges from the previous ranks instead of solving from
+    scratch.
+
+    The matrices and the ranks are kept in host memory (NumPy/SciPy) for both
+    backends. Edge weights are not used; each parallel edge counts as one
+    edge.
+
+    Parameters
+    ----------
+    G : cugraph.Graph
+        The initial graph.
+    alpha : float, optional
+        The damping factor, 0.85 by default.
+    max_iter : int, optional
+        The maximum number of iterations of each solve, 100 by default.
+    tol : float, optional
+        The convergence tolerance of each solve, 1.0e-5 by default.
+
+    Examples
+    --------
+    >>> G = cugraph.Graph()
+    >>> G.add_edge_list(sources, destinations, None)
+    >>> ipr = cugraph.IncrementalPageRank(G)
+    >>> pr = ipr.pagerank()
+    >>> ipr.add_edges(new_sources, new_destinations)
+    >>> ipr.remove_edges(old_sources, old_destinations)
+    >>> pr = ipr.update()
+    """
+    @memory_budgeted
+    def __init__(self, G, alpha=0.85, max_iter=100, tol=1.0e-5):
+        self.alpha = alpha
+        self.max_iter = max_iter
+        self.tol = tol
+        # Number of iterations of the last solve
+        self.iterations = 0
+
+        offsets, indices, _ = G.view_adj_list()
+        offsets = graph_host.to_host_array(offsets)
+        indices = graph_host.to_host_array(indices)
+        num_verts = len(offsets) - 1
+        A = sparse.csr_matrix((np.ones(len(indices)), indices, offsets),
+                              shape=(num_verts, num_verts))
+        A.sum_duplicates()
+        self._A = A
+        self._T = A.T.tocsr()
+        self._out_degree = np.diff(offsets).astype(np.int64)
+        self._num_edges = len(indices)
+        # Pending changes: edge dst <- src appears count more (or fewer)
+        # times than in the matrices, unique (dst, src) pairs
+        self._delta = (np.empty(0, dtype=np.int64),
+                       np.empty(0, dtype=np.int64),
+                       np.empty(0, dtype=np.int64))
+        self._x = None
+        # Vertices whose in-edges or out-degree changed since the last solve
+        self._affected = []
+
+    def number_of_vertices(self):
+        return self._T.shape[0]
+
+    def number_of_edges(self):
+        return self._num_edges
+
+    def _patch(self, source_col, dest_col, sign):
+        src = graph_host.to_host_array(source_col, dtype=np.int64)
+        dst = graph_host.to_host_array(dest_col, dtype=np.int64)
+        if len(src) != len(dst):
+            raise ValueError('source_col and dest_col must have the same '
+                             'length')
+        if len(src) == 0:
+            return
+        if min(src.min(), dst.min()) < 0:
+            raise ValueError('vertex ids must be non-negative')
+
+        old_num_verts = self.number_of_vertices()
+        num_verts = max(old_num_verts, int(max(src.max(), dst.max())) + 1)
+        if sign < 0 and num_verts > old_num_verts:
+            raise ValueError('cannot remove edges of missing vertices')
+
+        # Add the batch to the pending changes, in O(batch + pending)
+        delta_dst, delta_src, delta_count = self._delta
+        keys, inverse = np.unique(
+            np.concatenate([delta_dst * num_verts + delta_src,
+                            dst * num_verts + src]), return_inverse=True)
+        counts = np.bincount(inverse, weights=np.concatenate(
+            [delta_count, np.full(len(src), sign)])).astype(np.int64)
+        keys, counts = keys[counts != 0], counts[counts != 0]
+        delta_dst, delta_src = keys // num_verts, keys % num_verts
+
+        if sign < 0:
+            # Edges removed more often than they appear in the graph
+            removed = counts < 0
+            present = np.asarray(self._T[delta_dst[removed],
+                                         delta_src[removed]]).ravel()
+            if (present + counts[removed] < 0).any():
+                raise ValueError('cannot remove edges missing from the graph')
+
+        if num_verts > old_num_verts:
+            self._T = _grow(self._T, num_verts)
+            self._A = _grow(self._A, num_verts)
+            self._out_degree = np.append(
+                self._out_degree,
+                np.zeros(num_verts - old_num_verts, dtype=np.int64))
+            if self._x is not None:
+                self._x = np.append(self._x,
+                                    np.zeros(num_verts - old_num_verts))
+        np.add.at(self._out_degree, src, sign)
+        self._num_edges += sign * len(src)
+        self._delta = (delta_dst, delta_src, counts)
+        self._affected.extend([src, dst])
+        if len(counts) > MERGE_FRACTION * self._T.nnz:
+            self._merge()
+
+    def _delta_matrix(self):
+        # Pending changes as a sparse matrix of the shape of T
+        delta_dst, delta_src, delta_count = self._delta
+        num_verts = self.number_of_vertices()
+        return sparse.csr_matrix((delta_count.astype(np.float64),
+                                  (delta_dst, delta_src)),
+                                 shape=(num_verts, num_verts))
+
+    def _merge(self):
+        if len(self._delta[0]) == 0:
+            return
+        T = self._T + self._delta_matrix()
+        T.eliminate_zeros()
+        self._T = T
+        self._A = T.T.tocsr()
+        self._delta = tuple(np.empty(0, dtype=np.int64) for _ in range(3))
+
+    def add_edges(self, source_col, dest_col):
+        """
+        Insert a batch of edges. Vertex ids beyond the current number of
+        vertices add new vertices to the graph.
+        """
+        self._patch(source_col, dest_col, 1)
+
+    def remove_edges(self, source_col, dest_col):
+        """
+        Delete a batch of edges (one occurrence of each edge). Raises
+        ValueError if an edge is not in the graph.
+        """
+        self._patch(source_col, dest_col, -1)
+
+    def pagerank(self, callback=None, return_stats=False):
+        """
+        Solve PageRank from scratch (uniform initial guess) and return it as
+        a pandas.DataFrame with the 'vertex' and 'pagerank' columns.
+
+        Parameters
+        ----------
+        callback : callable, optional
+            Called after every iteration as callback(iteration, residual),
+            see cugraph.pagerank. If it returns True the solver stops and
+            keeps the current approximation.
+        return_stats : bool, optional
+            If True, also return a cugraph.SolverStats record of the solve.
+        """
+        num_verts = self.number_of_vertices()
+        self._x = np.full(num_verts, 1.0 / num_verts)
+        self._affected = []
+        stats = SolverStats(callback)
+        df = self._solve(stats)
+        if return_stats:
+            return df, stats
+        return df
+
+    def update(self, local=False, callback=None, return_stats=False):
+        """
+        Reconverge from the ranks of the previous solve after the edge
+        batches added or removed since then, and return the new PageRank.
+
+        Parameters
+        ----------
+        local : bool, optional
+            If False (the default), run the power iteration over the whole
+            graph from the previous ranks. If True, only recompute the ranks
+            of the vertices reached from the modified edges: an iteration
+            updates the active vertices and the next one only the
+            out-neighbors of the vertices whose rank changed by more than
+            tol / V. This is much cheaper for small batches, at the cost of
+            a (tol-bounded) approximation far from the modified edges.
+            The residual of an iteration is then the L1 norm of the change
+            of the ranks of its active vertices.
+        callback : callable, optional
+            Called after every iteration as callback(iteration, residual). If
+            it returns True the solver stops and keeps the current
+            approximation.
+        return_stats : bool, optional
+            If True, also return a cugraph.SolverStats record of the solve.
+            With local=True, stats.counters['updated_vertices'] is the total
+            number of rank updates.
+        """
+        if self._x is None:
+            return self.pagerank(callback, return_stats)
+        stats = SolverStats(callback)
+        if local:
+            self._solve_local(stats)
+            with stats.phase('output'):
+                df = self._result()
+        else:
+            self._affected = []
+            df = self._solve(stats)
+        if return_stats:
+            return df, stats
+        return df
+
+    def _teleport(self):
+        num_verts = self.number_of_vertices()
+        dangling = self._out_degree == 0
+        inv_out_degree = np.zeros(num_verts)
+        inv_out_degree[~dangling] = 1.0 / self._out_degree[~dangling]
+        return inv_out_degree, dangling, np.full(num_verts, 1.0 / num_verts)
+
+    def _solve(self, stats):
+        # The solve reads every edge, merging the pending changes first
+        # does not change its cost
+        with stats.phase('merge'):
+            self._merge()
+        inv_out_degree, dangling, p = self._teleport()
+        with stats.phase('iterations'):
+            self._x, self.iterations = pagerank_host.power_iteration(
+                self._T, inv_out_degree, dangling, p,
+                self._x / self._x.sum(), self.alpha, self.max_iter, self.tol,
+                stats)
+        with stats.phase('output'):
+            return self._result()
+
+    def _solve_local(self, stats):
+        num_verts = self.number_of_vertices()
+        inv_out_degree, dangling, p = self._teleport()
+        T = self._T
+        A = self._A
+        # Only the rows of the pending changes, O(changes + V)
+        D = self._delta_matrix()
+        D_out = D.T.tocsr()
+        x = self._x / self._x.sum()
+        dangling_sum = x[dangling].sum()
+
+        # The in-edges of the affected vertices changed, so did the
+        # contributions of the affected sources to their out-neighbors
+        affected = np.unique(np.concatenate([np.empty(0, dtype=np.int64)] +
+                                            self._affected))
+        active = np.union1d(affected, _out_neighbors(A, D_out, affected))
+        self._affected = []
+
+        self.iterations = 0
+        updated_vertices = 0
+        threshold = self.tol / num_verts
+        with stats.phase('iterations'):
+            while len(active) > 0 and self.iterations < self.max_iter:
+                self.iterations += 1
+                updated_vertices += len(active)
+                y = x * inv_out_degree
+                values = self.alpha * (T[active] @ y + D[active] @ y)
+                values += (self.alpha * dangling_sum + 1.0 - self.alpha) * \
+                    p[active]
+                delta = values - x[active]
+                x[active] = values
+                dangling_sum += delta[dangling[active]].sum()
+                changed = active[np.abs(delta) > threshold]
+                active = _out_neighbors(A, D_out, changed)
+                if stats.record(float(np.abs(delta).sum())):
+                    break
+
+        stats.converged = len(active) == 0
+        stats.counters['updated_vertices'] = updated_vertices
+        self._x = x / x.sum()
+
+    def _result(self):
+        df = pd.DataFrame()
+        df['vertex'] = graph_host.vertex_ids(self.number_of_vertices())
+        df['pagerank'] = self._x.astype(np.float32)
+        return df
+
+
+def _grow(M, num_verts):
+    # Pad the square CSR matrix M with empty rows and columns
+    indptr = np.append(M.indptr, np.full(num_verts - M.shape[0],
+                                         M.indptr[-1]))
+    return sparse.csr_matrix((M.data, M.indices, indptr),
+                             shape=(num_verts, num_verts))
+
+
+def _out_neighbors(A, D_out, vertices):
+    # Return the sorted unique out-neighbors of the vertices, in the
+    # adjacency matrix A or the pending changes D_out (a removed edge may
+    # still be listed, which only widens the local update)
+    if len(vertices) == 0:
+        return np.empty(0, dtype=np.int64)
+    neighbors = []
+    for M in (A, D_out):
+        _, positions = graph_host.gather_neighbors(M.indptr, M.indices,
+                                                   vertices)
+        neighbors.append(M.indices[positions])
+    return np.unique(np.concatenate(neighbors)).astype(np.int64)
@@ -11,16 +11,29 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from cugraph.link_analysis import pagerank_wrapper
-from cugraph.structure.graph import null_check
+from cugraph.link_analysis import pagerank_host
+from cugraph.structure import graph_host
+from cugraph.structure.graph import memory_budgeted, null_check
+from cugraph.utilities.solver_stats import SolverStats
+import numpy as np
+import pandas as pd
+try:
+    import cudf
+    from cugraph.link_analysis import pagerank_wrapper
+except ImportError:
+    cudf = None
+    pagerank_wrapper = None
 
 
+@memory_budgeted
 def pagerank(G,
              alpha=0.85,
              personalization=None,
              max_iter=100,
              tol=1.0e-5,
-             nstart=None):
+             nstart=None,
+             callback=None,
+             return_stats=False):
     """
     Find the PageRank vertex values for a graph. cuGraph computes an
     approximation of the Pagerank eigenvector using the power method. The
@@ -68,12 +81,24 @@ def pagerank(G,
             Subset of vertices of graph for initial guess for pagerank values
         nstart['values'] : cudf.Series
             Pagerank values for vertices
+    callback : callable, optional
+        Called after every iteration as callback(iteration, residual), where
+        residual is the L1 norm of the change of the PageRank vector. If it
+        returns True the solver stops and returns the current approximation.
+        Only supported on the host backend.
+    return_stats : bool, optional
+        If True, also return a cugraph.SolverStats record of the run
+        (iterations, residual of each iteration, time of each phase and
+        convergence flag). The device backend only reports the total time.
 
     Returns
     -------
     PageRank : cudf.DataFrame
         GPU data frame containing two cudf.Series of size V: the vertex
-        identifiers and the corresponding PageRank values.
+        identifiers and the corresponding PageRank values. A pandas.DataFrame
+        with the same columns is returned for graphs using the host backend.
+    stats : cugraph.SolverStats
+        Only returned if return_stats is True.
 
     Examples
     --------
@@ -84,17 +109,178 @@ def pagerank(G,
     >>> G = cugraph.Graph()
     >>> G.add_edge_list(sources, destinations, None)
     >>> pr = cugraph.pagerank(G, alpha = 0.85, max_iter = 500, tol = 1.0e-05)
+    >>> pr, stats = cugraph.pagerank(G, return_stats=True)
     """
 
     if personalization is not None:
         null_check(personalization['vertex'])
         null_check(personalization['values'])
 
-    df = pagerank_wrapper.pagerank(G.graph_ptr,
-                                   alpha,
-                                   personalization,
-                                   max_iter,
-                                   tol,
-                                   nstart)
+    stats = SolverStats(callback)
+    if G.backend == 'host':
+        df = pagerank_host.pagerank(G.graph_ptr,
+                                    alpha,
+                                    personalization,
+                                    max_iter,
+                                    tol,
+                                    nstart,
+                                    stats)
+    else:
+        stats.start_device_run(callback)
+        with stats.phase('solve'):
+            df = pagerank_wrapper.pagerank(G.graph_ptr,
+                                           alpha,
+                                           personalization,
+                                           max_iter,
+                                           tol,
+                                           nstart)
 
+    if return_stats:
+        return df, stats
     return df
+
+
+@memory_budgeted
+def personalized_pagerank_batch(G,
+                                seeds,
+                                alpha=0.85,
+                                max_iter=100,
+                                tol=1.0e-5,
+                                top_n=None,
+                                batch_size=32,
+                                callback=None,
+                                return_stats=False):
+    """
+    Compute the personalized PageRank of many seed sets in one solve. On the
+    host backend the rank vectors of batch_size seed sets are iterated
+    together as the columns of a [V, batch_size] block, so every iteration
+    walks the transposed adjacency list once for the whole block (a sparse
+    matrix - dense matrix product instead of one sparse matrix - vector
+    product per seed set). Columns stop being updated as soon as they
+    converge.
+
+    Parameters
+    ----------
+    G : cugraph.Graph
+        cuGraph graph descriptor (edge weights are not used).
+    seeds : cudf.DataFrame or pandas.DataFrame
+        The seed sets, one row per (seed set, vertex) pair.
+
+        seeds['seed'] : Series
+            Identifier of the seed set of the row
+        seeds['vertex'] : Series
+            A vertex of the seed set
+        seeds['values'] : Series, optional
+            Personalization value of the vertex in its seed set (1 by
+            default). The values of each seed set are normalized.
+    alpha : float
+        The damping factor, see pagerank.
+    max_iter : int
+        The maximum number of iterations, see pagerank.
+    tol : float
+        The tolerance of each seed set, see pagerank.
+    top_n : int, optional
+        If set, only return the top_n vertices of each seed set, which bounds
+        the size of the result to top_n rows per seed set.
+    batch_size : int, optional
+        The number of seed sets solved together, 32 by default. The solver
+        holds a few [V, batch_size] arrays of float32.
+    callback : callable, optional
+        Called after every iteration of a block of seed sets as
+        callback(iteration, residual), where residual is the largest residual
+        of the seed sets of the block not converged yet. If it returns True
+        the solver stops and returns the current approximations. Only
+        supported on the host backend.
+    return_stats : bool, optional
+        If True, also return a cugraph.SolverStats record of the run. On the
+        host backend stats.counters['seed_iterations'] and
+        stats.counters['seed_residuals'] hold the number of iterations and the
+        last residual of each seed set (in increasing identifier order). The
+        device backend only reports the total time.
+
+    Returns
+    -------
+    df : cudf.DataFrame or pandas.DataFrame
+        df['seed'] : the seed set identifier
+        df['vertex'] : the vertex id
+        df['pagerank'] : the personalized PageRank of the vertex for the seed
+        set
+
+        Rows are grouped by seed set (in increasing identifier order); the
+        vertices of a seed set are sorted by vertex id, or by decreasing
+        PageRank if top_n is set. A pandas.DataFrame is returned for graphs
+        using the host backend.
+    stats : cugraph.SolverStats
+        Only returned if return_stats is True.
+
+    Examples
+    --------
+    >>> seeds = cudf.DataFrame()
+    >>> seeds['seed'] = [0, 0, 1]
+    >>> seeds['vertex'] = [3, 5, 8]
+    >>> pr = cugraph.personalized_pagerank_batch(G, seeds, top_n=10)
+    """
+    null_check(seeds['seed'])
+    null_check(seeds['vertex'])
+    seed_col = graph_host.to_host_array(seeds['seed'])
+    vertices = graph_host.to_host_array(seeds['vertex'], dtype=np.int64)
+    if 'values' in seeds.columns:
+        null_check(seeds['values'])
+        values = graph_host.to_host_array(seeds['values'], dtype=np.float64)
+    else:
+        values = np.ones(len(vertices), dtype=np.float64)
+
+    num_verts = G.number_of_vertices()
+    if len(vertices) and (vertices.min() < 0 or vertices.max() >= num_verts):
+        raise ValueError('seed vertices must be in [0, %d)' % num_verts)
+    if len(values) and values.min() < 0:
+        raise ValueError('personalization values must be non-negative')
+    if top_n is not None and top_n <= 0:
+        raise ValueError('top_n must be positive')
+    if batch_size <= 0:
+        raise ValueError('batch_size must be positive')
+    seed_ids, columns = np.unique(seed_col, return_inverse=True)
+    if (np.bincount(columns, weights=values,
+                    minlength=len(seed_ids)) == 0).any():
+        raise ValueError('the values of a seed set must not all be zero')
+
+    stats = SolverStats(callback)
+    if G.backend == 'host':
+        df = pagerank_host.personalized_pagerank_batch(
+            G.graph_ptr, seed_col, vertices, values, alpha, max_iter, tol,
+            top_n, batch_size, stats)
+    else:
+        stats.start_device_run(callback)
+        with stats.phase('solve'):
+            df = _personalized_pagerank_batch_device(
+                G, seed_ids, columns, vertices, values, alpha, max_iter, tol,
+                top_n)
+
+    if return_stats:
+        return df, stats
+    return df
+
+
+def _personalized_pagerank_batch_device(G, seed_ids, columns, vertices,
+                                        values, alpha, max_iter, tol, top_n):
+    # libcugraph has a single personalization vector: one solve per seed set
+    frames = []
+    for i, seed in enumerate(seed_ids):
+        personalization = cudf.DataFrame()
+        personalization['vertex'] = cudf.Series(
+            vertices[columns == i].astype(np.int32))
+        personalization['values'] = cudf.Series(
+            values[columns == i].astype(np.float32))
+        pr = pagerank_wrapper.pagerank(G.graph_ptr, alpha, personalization,
+                                       max_iter, tol, None).to_pandas()
+        if top_n is not None:
+            pr = pr.sort_values('pagerank', ascending=False,
+                                kind='mergesort').head(top_n)
+        pr.insert(0, 'seed', seed)
+        frames.append(pr)
+    if not frames:
+        frames.append(pd.DataFrame({'seed': seed_ids,
+                                    'vertex': np.empty(0, dtype=np.int32),
+                                    'pagerank': np.empty(0,
+                                                         dtype=np.float32)}))
+    return cudf.DataFrame.from_pandas(pd.concat(frames, ignore_index=True))
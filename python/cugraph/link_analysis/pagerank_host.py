@@ -0,0 +1,221 @@
+# Copyright (c) 2019, NVIDIA CORPORATION.
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from cugraph.structure import graph_host
+from cugraph.utilities.solver_stats import SolverStats
+import numpy as np
+import pandas as pd
+
+
+def pagerank(graph_ptr, alpha=0.85, personalization=None, max_iter=100,
+             tol=1.0e-5, nstart=None, stats=None):
+    """
+    Host implementation of gdf_pagerank
+    """
+    g = graph_ptr
+    if max_iter <= 0:
+        max_iter = 100
+    if tol == 0.0:
+        tol = 1.0e-5
+    if stats is None:
+        stats = SolverStats()
+
+    # PageRank pulls the rank of the in-neighbors: iterate over the
+    # transposed adjacency list (edge weights are not used).
+    with stats.phase('csr_build'):
+        T = graph_host.csr_matrix(g, transposed=True, weighted=False)
+        out_degree = np.diff(graph_host.view_adj_list(g)[0])
+    num_verts = T.shape[0]
+
+    dangling = out_degree == 0
+    inv_out_degree = np.zeros(num_verts, dtype=np.float64)
+    inv_out_degree[~dangling] = 1.0 / out_degree[~dangling]
+
+    if personalization is None:
+        p = np.full(num_verts, 1.0 / num_verts)
+    else:
+        p = np.zeros(num_verts, dtype=np.float64)
+        p[graph_host.to_host_array(personalization['vertex'])] = \
+            graph_host.to_host_array(personalization['values'])
+        p /= p.sum()
+
+    if nstart is None:
+        x = np.full(num_verts, 1.0 / num_verts)
+    else:
+        x = np.zeros(num_verts, dtype=np.float64)
+        x[graph_host.to_host_array(nstart['vertex'])] = \
+            graph_host.to_host_array(nstart['values'])
+        x /= x.sum()
+
+    with stats.phase('iterations'):
+        x, _ = power_iteration(T, inv_out_degree, dangling, p, x, alpha,
+                               max_iter, tol, stats)
+
+    with stats.phase('output'):
+        df = pd.DataFrame()
+        df['vertex'] = graph_host.vertex_ids(num_verts)
+        df['pagerank'] = x.astype(np.float32)
+
+    return df
+
+
+def power_iteration(T, inv_out_degree, dangling, p, x, alpha, max_iter, tol,
+                    stats=None):
+    """
+    Run the PageRank power iteration from x on the transposed adjacency
+    matrix T. Return the rank vector and the number of iterations run. If
+    stats (a SolverStats) is set, the residual of every iteration is recorded
+    in it and its callback can stop the iteration.
+    """
+    iterations = 0
+    converged = False
+    while iterations < max_iter:
+        iterations += 1
+        x_new = alpha * (T @ (x * inv_out_degree))
+        x_new += (alpha * x[dangling].sum() + 1.0 - alpha) * p
+        x_new /= x_new.sum()
+        err = np.abs(x_new - x).sum()
+        x = x_new
+        converged = err < tol
+        if stats is not None and stats.record(err):
+            break
+        if converged:
+            break
+    if stats is not None:
+        stats.converged = converged
+    return x, iterations
+
+
+def personalized_pagerank_batch(graph_ptr, seeds, vertices, values,
+                                alpha=0.85, max_iter=100, tol=1.0e-5,
+                                top_n=None, batch_size=32, stats=None):
+    """
+    Host implementation of personalized_pagerank_batch. The residual recorded
+    in stats at each iteration is the largest residual of the seed sets of
+    the block; stats.counters['seed_iterations'] and
+    stats.counters['seed_residuals'] give the number of iterations and the
+    last residual of each seed set (in increasing identifier order).
+    """
+    g = graph_ptr
+    if max_iter <= 0:
+        max_iter = 100
+    if tol == 0.0:
+        tol = 1.0e-5
+    if stats is None:
+        stats = SolverStats()
+
+    with stats.phase('csr_build'):
+        T = graph_host.csr_matrix(g, transposed=True, weighted=False)
+        out_degree = np.diff(graph_host.view_adj_list(g)[0])
+    num_verts = T.shape[0]
+    inv_out_degree = np.zeros(num_verts, dtype=np.float32)
+    inv_out_degree[out_degree != 0] = 1.0 / out_degree[out_degree != 0]
+    dangling = (out_degree == 0).astype(np.float32)
+
+    seed_ids, columns = np.unique(seeds, return_inverse=True)
+    seed_iterations = np.zeros(len(seed_ids), dtype=np.int64)
+    seed_residuals = np.full(len(seed_ids), np.inf)
+    frames = []
+    # Solve batch_size seed sets at a time, each iteration multiplies T with
+    # a [V, batch_size] block of rank vectors (in single precision, the type
+    # of T, to avoid converting T at every product)
+    for start in range(0, len(seed_ids), batch_size):
+        k = min(batch_size, len(seed_ids) - start)
+        with stats.phase('iterations'):
+            ranks = _solve_block(T, inv_out_degree, dangling,
+                                 vertices, columns, values, start, k, alpha,
+                                 max_iter, tol, stats,
+                                 seed_iterations[start:start + k],
+                                 seed_residuals[start:start + k])
+        with stats.phase('output'):
+            frames.append(_rank_frame(ranks, seed_ids[start:start + k],
+                                      top_n))
+
+    stats.counters['seed_iterations'] = seed_iterations
+    stats.counters['seed_residuals'] = seed_residuals
+    stats.converged = bool((seed_residuals < tol).all())
+    if not frames:
+        frames.append(_rank_frame(np.empty((num_verts, 0)), seed_ids, top_n))
+    return pd.concat(frames, ignore_index=True)
+
+
+def _solve_block(T, inv_out_degree, dangling, vertices, columns, values,
+                 start, k, alpha, max_iter, tol, stats, iterations,
+                 residuals):
+    # Personalized PageRank of the seed sets start to start + k - 1, filling
+    # their number of iterations and last residual
+    num_verts = T.shape[0]
+    selected = (columns >= start) & (columns < start + k)
+    # The personalization vectors are sparse: keep them as (row, column,
+    # value) triplets, normalized per column
+    p_rows = vertices[selected]
+    p_cols = columns[selected] - start
+    p_values = values[selected] / np.bincount(
+        p_cols, weights=values[selected], minlength=k)[p_cols]
+
+    X = np.zeros((num_verts, k), dtype=np.float32)
+    np.add.at(X, (p_rows, p_cols), p_values)
+    ranks = np.empty_like(X)
+    # Seed sets (columns of X) that have not converged yet
+    active = np.arange(k)
+    for _ in range(max_iter):
+        if len(active) == 0 or stats.stopped:
+            # A callback stop leaves every seed set not converged yet with
+            # its current approximation
+            break
+        X_new = T @ (X * inv_out_degree[:, None])
+        X_new *= alpha
+        teleport = alpha * (dangling @ X) + 1.0 - alpha
+        np.add.at(X_new, (p_rows, p_cols), teleport[p_cols] * p_values)
+        X_new /= X_new.sum(axis=0, dtype=np.float64).astype(np.float32)
+        X -= X_new
+        err = np.abs(X).sum(axis=0, dtype=np.float64)
+        X = X_new
+        iterations[active] += 1
+        residuals[active] = err
+        stats.record(float(err.max()))
+
+        done = err < tol
+        if done.any():
+            # Drop the converged columns from the block
+            ranks[:, active[done]] = X[:, done]
+            keep = ~done
+            X = X[:, keep]
+            active = active[keep]
+            remap = np.cumsum(keep) - 1
+            kept = keep[p_cols]
+            p_rows = p_rows[kept]
+            p_cols = remap[p_cols[kept]]
+            p_values = p_values[kept]
+    ranks[:, active] = X
+    return ranks
+
+
+def _rank_frame(X, seed_ids, top_n):
+    # Long-form (seed, vertex, pagerank) frame of the columns of X, keeping
+    # the top_n vertices of each column (by decreasing rank) if set
+    num_verts, k = X.shape
+    columns = np.arange(k)[:, None]
+    if top_n is None:
+        rows = np.tile(np.arange(num_verts), (k, 1))
+    else:
+        top_n = min(top_n, num_verts)
+        rows = np.argpartition(-X.T, top_n - 1, axis=1)[:, :top_n]
+        order = np.argsort(-X.T[columns, rows], axis=1, kind='stable')
+        rows = rows[columns, order]
+
+    df = pd.DataFrame()
+    df['seed'] = np.repeat(seed_ids, rows.shape[1])
+    df['vertex'] = rows.ravel().astype(graph_host.index_dtype(num_verts))
+    df['pagerank'] = X.T[columns, rows].ravel().astype(np.float32)
+    return df
@@ -13,5 +13,8 @@
 
 from cugraph.link_prediction.jaccard import jaccard
 from cugraph.link_prediction.overlap import overlap
+from cugraph.link_prediction.jaccard_topk import jaccard_topk
+from cugraph.link_prediction.minhash import MinHash
+from cugraph.link_prediction.score_pairs import score_pairs
 from cugraph.link_prediction.wjaccard import jaccard_w
 from cugraph.link_prediction.woverlap import overlap_w
@@ -11,11 +11,17 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from cugraph.link_prediction import jaccard_wrapper
-from cugraph.structure.graph import null_check
-import cudf
+from cugraph.link_prediction import jaccard_host
+from cugraph.structure.graph import memory_budgeted, null_check
+try:
+    from cugraph.link_prediction import jaccard_wrapper
+    import cudf
+except ImportError:
+    jaccard_wrapper = None
+    cudf = None
 
 
+@memory_budgeted
 def jaccard(input_graph, first=None, second=None):
     """
     Compute the Jaccard similarity between each pair of vertices connected by
@@ -60,6 +66,9 @@ def jaccard(input_graph, first=None, second=None):
             The computed Jaccard coefficient between the source and destination
             vertices
 
+        A pandas.DataFrame with the same columns is returned for graphs using
+        the host backend.
+
     Examples
     --------
     >>> M = cudf.read_csv('datasets/karate.csv', delimiter=' ',
@@ -71,8 +80,13 @@ def jaccard(input_graph, first=None, second=None):
     >>> df = cugraph.jaccard(G)
     """
 
-    if (type(first) == cudf.Series and
-            type(second) == cudf.Series):
+    if input_graph.backend == 'host':
+        pairs_given = first is not None and second is not None
+    else:
+        pairs_given = (type(first) == cudf.Series and
+                       type(second) == cudf.Series)
+
+    if pairs_given:
         null_check(first)
         null_check(second)
     elif first is None and second is None:
@@ -80,6 +94,9 @@ def jaccard(input_graph, first=None, second=None):
     else:
         raise ValueError("Specify first and second or neither")
 
-    df = jaccard_wrapper.jaccard(input_graph.graph_ptr, first, second)
+    if input_graph.backend == 'host':
+        df = jaccard_host.jaccard(input_graph.graph_ptr, first, second)
+    else:
+        df = jaccard_wrapper.jaccard(input_graph.graph_ptr, first, second)
 
     return df
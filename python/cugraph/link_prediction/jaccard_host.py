@@ -0,0 +1,170 @@
+# Copyright (c) 2019, NVIDIA CORPORATION.
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from cugraph.structure import graph_host
+import numpy as np
+import pandas as pd
+from scipy import sparse
+
+
+def neighborhood_volumes(graph_ptr, weights=None, first=None, second=None):
+    """
+    Compute, for each pair of vertices (each edge of the graph if first and
+    second are None), the volume of the intersection of the neighborhoods of
+    the two vertices and the volume of each neighborhood. The volume of a set
+    of vertices is its size, or the sum of the vertex weights if weights is
+    not None.
+    """
+    offsets, indices, _ = graph_host.view_adj_list(graph_ptr)
+    num_verts = len(offsets) - 1
+
+    if weights is None:
+        v = np.ones(num_verts, dtype=np.float64)
+    else:
+        v = graph_host.to_host_array(weights, dtype=np.float64)
+
+    if first is None:
+        first = np.repeat(np.arange(num_verts, dtype=indices.dtype),
+                          np.diff(offsets))
+        second = indices
+    else:
+        first = graph_host.to_host_array(first)
+        second = graph_host.to_host_array(second)
+
+    A = sparse.csr_matrix((np.ones(len(indices)), indices, offsets),
+                          shape=(num_verts, num_verts))
+    Av = sparse.csr_matrix((v[indices], indices, offsets),
+                           shape=(num_verts, num_verts))
+
+    volume = Av @ np.ones(num_verts)
+    intersection = np.asarray(
+        A[first].multiply(Av[second]).sum(axis=1)).ravel()
+
+    return first, second, intersection, volume[first], volume[second]
+
+
+def jaccard(graph_ptr, first=None, second=None):
+    """
+    Host implementation of gdf_jaccard and gdf_jaccard_list
+    """
+    return _jaccard(graph_ptr, None, first, second)
+
+
+def jaccard_w(graph_ptr, weights, first=None, second=None):
+    """
+    Host implementation of the weighted gdf_jaccard and gdf_jaccard_list
+    """
+    return _jaccard(graph_ptr, weights, first, second)
+
+
+def _jaccard(graph_ptr, weights, first, second):
+    first, second, intersection, volume_first, volume_second = \
+        neighborhood_volumes(graph_ptr, weights, first, second)
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        coeff = intersection / (volume_first + volume_second - intersection)
+
+    df = pd.DataFrame()
+    df['source'] = first
+    df['destination'] = second
+    df['jaccard_coeff'] = coeff.astype(np.float32)
+
+    return df
+
+
+# Largest number of two-hop paths expanded at once by jaccard_topk
+TOPK_BATCH_PATHS = 1 << 22
+
+
+def jaccard_topk(graph_ptr, k, vertices=None, metric='jaccard',
+                 batch_paths=TOPK_BATCH_PATHS):
+    """
+    Host implementation of jaccard_topk. The sources are processed in
+    batches expanding about batch_paths two-hop paths (a single hub can
+    exceed it): the candidate pairs of a batch are scored and only the top k
+    of each source are kept, so the memory is bounded by the batch and the
+    V * k result rows.
+    """
+    A = graph_host.csr_matrix(graph_ptr, weighted=False)
+    # Row z of AT lists the vertices having z as neighbor
+    AT = graph_host.csr_matrix(graph_ptr, transposed=True, weighted=False)
+    num_verts = A.shape[0]
+    degree = np.diff(A.indptr)
+    in_degree = np.diff(AT.indptr)
+    if metric == 'adamic_adar':
+        # A common neighbor has an in-degree of at least 2
+        with np.errstate(divide='ignore'):
+            weights = np.where(in_degree > 1, 1.0 / np.log(in_degree), 0.0)
+        AT = sparse.diags(weights) @ AT
+
+    if vertices is None:
+        vertices = graph_host.vertex_ids(num_verts)
+    paths = (A @ in_degree.astype(np.float64))[vertices]
+    scanned = np.cumsum(paths + 1)
+
+    sources, destinations, scores = [], [], []
+    start = 0
+    while start < len(vertices):
+        base = scanned[start - 1] if start > 0 else 0
+        stop = int(np.searchsorted(scanned, base + batch_paths,
+                                   side='right'))
+        stop = max(stop, start + 1)
+        batch = vertices[start:stop]
+        s, d, c = _topk_batch(A, AT, batch, degree, k, metric)
+        sources.append(s)
+        destinations.append(d)
+        scores.append(c)
+        start = stop
+
+    dtype = A.indices.dtype
+    df = pd.DataFrame()
+    df['source'] = np.concatenate(sources).astype(dtype) \
+        if sources else np.empty(0, dtype=dtype)
+    df['destination'] = np.concatenate(destinations).astype(dtype) \
+        if destinations else np.empty(0, dtype=dtype)
+    column = {'jaccard': 'jaccard_coeff', 'overlap': 'overlap_coeff',
+              'adamic_adar': 'adamic_adar'}[metric]
+    df[column] = np.concatenate(scores).astype(np.float32) \
+        if scores else np.empty(0, dtype=np.float32)
+
+    return df
+
+
+def _topk_batch(A, AT, batch, degree, k, metric):
+    rows = A[batch]
+    # Common neighbors (or their Adamic-Adar weights) of each pair
+    C = rows @ AT
+    # Existing edges and the sources themselves are not predictions
+    C = (C - C.multiply(rows != 0)).tocoo()
+    row, col, common = C.row, C.col, C.data
+    first = batch[row]
+    keep = (common > 0) & (col != first)
+    row, first, second, common = row[keep], first[keep], col[keep], \
+        common[keep]
+
+    if metric == 'jaccard':
+        score = common / (degree[first] + degree[second] - common)
+    elif metric == 'overlap':
+        score = common / np.minimum(degree[first], degree[second])
+    else:
+        score = common
+
+    # Top k of each source, ties broken by destination
+    order = np.lexsort((second, -score, row))
+    row = row[order]
+    group = np.flatnonzero(np.r_[True, row[1:] != row[:-1]]) \
+        if len(row) else np.empty(0, dtype=np.int64)
+    rank = np.arange(len(row)) - np.repeat(group, np.diff(np.r_[group,
+                                                                len(row)]))
+    order = order[rank < k]
+    return first[order], second[order], score[order]
@@ -0,0 +1,100 @@
+# Copyright (c) 2019, NVIDIA CORPORATION.
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from cugraph.link_prediction import jaccard_host
+from cugraph.structure import graph_host
+from cugraph.structure.graph import memory_budgeted
+import numpy as np
+try:
+    import cudf
+except ImportError:
+    cudf = None
+
+
+METRICS = ['jaccard', 'overlap', 'adamic_adar']
+
+
+@memory_budgeted
+def jaccard_topk(G, k, vertices=None, metric='jaccard'):
+    """
+    Predict the k most likely new links of each vertex: the vertices sharing
+    neighbors with it, ranked by the similarity of the two neighborhoods.
+    Unlike scoring the pairs returned by Graph.get_two_hop_neighbors, the
+    candidate pairs are generated and ranked for a batch of source vertices
+    at a time and only the top k of each source are kept, so the memory is
+    proportional to V * k (plus one batch) instead of the number of two-hop
+    pairs, which grows with the square of the hub degrees.
+
+    Parameters
+    ----------
+    G : cugraph.Graph
+        cuGraph graph descriptor (edge weights are not used). The graph
+        should be undirected, an undirected edge being represented by a
+        directed edge in both directions; for directed graphs the
+        out-neighborhoods are compared.
+    k : int
+        Number of predictions per source vertex.
+    vertices : array-like, optional
+        The source vertices, all the vertices by default.
+    metric : string, optional
+        The similarity of a pair (u, w) of neighborhoods N(u) and N(w):
+
+        'jaccard' (the default): |N(u) & N(w)| / |N(u) | N(w)|
+        'overlap': |N(u) & N(w)| / min(|N(u)|, |N(w)|)
+        'adamic_adar': sum of 1 / log(degree(z)) over the common neighbors z
+
+    Returns
+    -------
+    df : cudf.DataFrame or pandas.DataFrame
+        Up to k rows per source vertex. Existing edges and the source itself
+        are not predicted.
+
+        df['source'] : the source vertex
+        df['destination'] : the predicted neighbor
+        df['jaccard_coeff'], df['overlap_coeff'] or df['adamic_adar'] : the
+        score of the pair, named after the metric
+
+        Rows are sorted by source, then by decreasing score (ties by
+        destination). A pandas.DataFrame is returned for graphs using the
+        host backend.
+
+    Examples
+    --------
+    >>> M = cudf.read_csv('datasets/karate.csv', delimiter=' ',
+    >>>                   dtype=['int32', 'int32', 'float32'], header=None)
+    >>> G = cugraph.Graph()
+    >>> G.add_edge_list(M['0'], M['1'], None)
+    >>> df = cugraph.jaccard_topk(G, 5, metric='adamic_adar')
+    """
+    if k < 1:
+        raise ValueError('k must be at least 1')
+    if metric not in METRICS:
+        raise ValueError('metric must be one of %s' % METRICS)
+    num_verts = G.number_of_vertices()
+    if vertices is not None:
+        vertices = np.unique(graph_host.to_host_array(vertices,
+                                                      dtype=np.int64))
+        if len(vertices) and (vertices[0] < 0 or vertices[-1] >= num_verts):
+            raise ValueError('vertices must be in [0, %d)' % num_verts)
+
+    if G.backend == 'host':
+        return jaccard_host.jaccard_topk(G.graph_ptr, k, vertices, metric)
+
+    # libcugraph has no top-k link prediction: rank the candidates on a host
+    # copy of the adjacency list
+    offsets, indices, _ = G.view_adj_list()
+    graph_ptr = graph_host.allocate_host_graph()
+    graph_host.add_adj_list(graph_ptr, graph_host.to_host_array(offsets),
+                            graph_host.to_host_array(indices))
+    df = jaccard_host.jaccard_topk(graph_ptr, k, vertices, metric)
+    return cudf.DataFrame.from_pandas(df)
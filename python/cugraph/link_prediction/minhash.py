@@ -0,0 +1,289 @@
+# Copyright (c) 2019, NVIDIA CORPORATION.
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from cugraph.structure import graph_host
+from cugraph.structure.graph import memory_budgeted, null_check
+import numpy as np
+import pandas as pd
+try:
+    import cudf
+except ImportError:
+    cudf = None
+
+
+# Signature value of the vertices without neighbors
+EMPTY = np.iinfo(np.uint32).max
+# Largest number of hash values (edges * hash functions) computed at once
+_BLOCK_VALUES = 1 << 24
+# Number of pairs estimated at once
+_PAIR_BATCH = 1 << 16
+
+
+def _mix(values):
+    # SplitMix64 finalizer: consecutive vertex ids become unrelated 64-bit
+    # keys, which multiply-shift hashing alone does not achieve
+    x = values.astype(np.uint64)
+    with np.errstate(over='ignore'):
+        x = (x ^ (x >> np.uint64(30))) * np.uint64(0xbf58476d1ce4e5b9)
+        x = (x ^ (x >> np.uint64(27))) * np.uint64(0x94d049bb133111eb)
+    return x ^ (x >> np.uint64(31))
+
+
+def _hash(keys, a, b):
+    # Multiply-shift hashing of the mixed keys to 32-bit values: the high
+    # half of a * x + b modulo 2**64, a odd
+    with np.errstate(over='ignore'):
+        h = keys[:, None] * a[None, :] + b[None, :]
+    return (h >> np.uint64(32)).astype(np.uint32)
+
+
+class MinHash:
+    """
+    MinHash signatures of the vertex neighborhoods, to estimate the Jaccard
+    and overlap similarities of many vertex pairs without intersecting their
+    neighborhoods. The signature of a vertex holds, for each of num_hashes
+    random hash functions, the smallest hash of its neighbors; two vertices
+    get the same value for a function with a probability equal to the
+    Jaccard similarity of their neighborhoods, so the fraction of equal
+    values estimates it with a standard error of about
+    sqrt(J * (1 - J) / num_hashes).
+
+    The signatures are built once, in O(E * num_hashes) time, and take
+    4 * V * num_hashes bytes; each estimate then costs O(num_hashes)
+    whatever the degrees. They are computed in host memory for both
+    backends.
+
+    Parameters
+    ----------
+    G : cugraph.Graph
+        cuGraph graph descriptor (edge weights are not used). The graph
+        should be undirected, an undirected edge being represented by a
+        directed edge in both directions; for directed graphs the
+        out-neighborhoods are compared.
+    num_hashes : int, optional
+        Number of hash functions, 128 by default.
+    seed : int, optional
+        Seed of the hash functions. Default is a random seed.
+
+    Attributes
+    ----------
+    signatures : NumPy array
+        The [V, num_hashes] uint32 signatures. Vertices without neighbors
+        have signatures of EMPTY values.
+    degrees : NumPy array
+        The neighborhood sizes (out-degrees).
+
+    Examples
+    --------
+    >>> M = cudf.read_csv('datasets/karate.csv', delimiter=' ',
+    >>>                   dtype=['int32', 'int32', 'float32'], header=None)
+    >>> G = cugraph.Graph()
+    >>> G.add_edge_list(M['0'], M['1'], None)
+    >>> mh = cugraph.link_prediction.minhash.MinHash(G, num_hashes=256)
+    >>> df = mh.jaccard(M['0'], M['1'])
+    >>> candidates = mh.candidates(bands=32, threshold=0.5)
+    """
+    @memory_budgeted
+    def __init__(self, G, num_hashes=128, seed=None):
+        if num_hashes < 1:
+            raise ValueError('num_hashes must be at least 1')
+        offsets, indices, _ = G.view_adj_list()
+        offsets = graph_host.to_host_array(offsets, dtype=np.int64)
+        indices = graph_host.to_host_array(indices)
+        self.backend = G.backend
+        self.num_hashes = num_hashes
+        self.degrees = np.diff(offsets)
+        num_verts = len(offsets) - 1
+
+        rs = np.random.RandomState(seed)
+        a = rs.randint(0, 2 ** 32, size=(2, num_hashes), dtype=np.uint64)
+        a = (a[0] << np.uint64(32)) | a[1] | np.uint64(1)
+        b = rs.randint(0, 2 ** 32, size=(2, num_hashes), dtype=np.uint64)
+        b = (b[0] << np.uint64(32)) | b[1]
+
+        self.signatures = np.full((num_verts, num_hashes), EMPTY,
+                                  dtype=np.uint32)
+        nonempty = np.flatnonzero(self.degrees)
+        starts = offsets[nonempty]
+        step = max(1, _BLOCK_VALUES // max(len(indices), 1))
+        keys = _mix(indices)
+        for h in range(0, num_hashes, step):
+            values = _hash(keys, a[h:h + step], b[h:h + step])
+            if len(nonempty):
+                # The rows between two non-empty rows are empty: each
+                # segment is exactly the neighborhood of its vertex
+                self.signatures[nonempty, h:h + step] = \
+                    np.minimum.reduceat(values, starts, axis=0)
+
+    def _pairs(self, first, second):
+        null_check(first)
+        null_check(second)
+        first = graph_host.to_host_array(first, dtype=np.int64)
+        second = graph_host.to_host_array(second, dtype=np.int64)
+        if len(first) != len(second):
+            raise ValueError('first and second must have the same length')
+        num_verts = len(self.degrees)
+        for v in [first, second]:
+            if len(v) and (v.min() < 0 or v.max() >= num_verts):
+                raise ValueError('vertices must be in [0, %d)' % num_verts)
+        return first, second
+
+    def _estimate(self, first, second):
+        coeff = np.empty(len(first), dtype=np.float64)
+        for i in range(0, len(first), _PAIR_BATCH):
+            j = i + _PAIR_BATCH
+            coeff[i:j] = (self.signatures[first[i:j]] ==
+                          self.signatures[second[i:j]]).mean(axis=1)
+        # The Jaccard similarity of two empty sets is undefined, and a set
+        # is not similar to an empty one
+        empty_first = self.degrees[first] == 0
+        empty_second = self.degrees[second] == 0
+        coeff[empty_first | empty_second] = 0.0
+        coeff[empty_first & empty_second] = np.nan
+        return coeff
+
+    def _frame(self, first, second, column, coeff):
+        dtype = graph_host.index_dtype(len(self.degrees))
+        df = pd.DataFrame()
+        df['source'] = first.astype(dtype)
+        df['destination'] = second.astype(dtype)
+        df[column] = coeff.astype(np.float32)
+        if self.backend == 'device':
+            df = cudf.DataFrame.from_pandas(df)
+        return df
+
+    def jaccard(self, first, second):
+        """
+        Estimate the Jaccard similarity of the neighborhoods of each pair
+        (first[i], second[i]).
+
+        Parameters
+        ----------
+        first : cudf.Series, pandas.Series or array-like
+            The first vertex of each pair.
+        second : cudf.Series, pandas.Series or array-like
+            The second vertex of each pair.
+
+        Returns
+        -------
+        df : cudf.DataFrame or pandas.DataFrame
+            df['source'] : the first vertex of the pair
+            df['destination'] : the second vertex of the pair
+            df['jaccard_coeff'] : the estimated Jaccard similarity
+
+            A pandas.DataFrame is returned for graphs using the host
+            backend.
+        """
+        first, second = self._pairs(first, second)
+        return self._frame(first, second, 'jaccard_coeff',
+                           self._estimate(first, second))
+
+    def overlap(self, first, second):
+        """
+        Estimate the overlap coefficient of the neighborhoods of each pair
+        (first[i], second[i]), |N(u) & N(w)| / min(|N(u)|, |N(w)|), from
+        the estimated Jaccard similarity J and the neighborhood sizes: the
+        intersection is J * (|N(u)| + |N(w)|) / (1 + J).
+
+        Parameters
+        ----------
+        first : cudf.Series, pandas.Series or array-like
+            The first vertex of each pair.
+        second : cudf.Series, pandas.Series or array-like
+            The second vertex of each pair.
+
+        Returns
+        -------
+        df : cudf.DataFrame or pandas.DataFrame
+            df['source'], df['destination'] and df['overlap_coeff'], see
+            jaccard.
+        """
+        first, second = self._pairs(first, second)
+        J = self._estimate(first, second)
+        d1 = self.degrees[first]
+        d2 = self.degrees[second]
+        with np.errstate(divide='ignore', invalid='ignore'):
+            coeff = J * (d1 + d2) / (1.0 + J) / np.minimum(d1, d2)
+        return self._frame(first, second, 'overlap_coeff',
+                           np.minimum(coeff, 1.0))
+
+    def candidates(self, bands, threshold=None, max_bucket_size=None):
+        """
+        Find the pairs of vertices likely to be similar with locality
+        sensitive hashing: the signatures are cut into bands of
+        num_hashes // bands values and the vertices with the same values in
+        at least one band are candidates. A pair of Jaccard similarity J is
+        found with probability 1 - (1 - J**r)**bands, r being the number of
+        values per band: more bands find less similar pairs, at the cost of
+        more candidates.
+
+        Parameters
+        ----------
+        bands : int
+            Number of bands, at most num_hashes.
+        threshold : float, optional
+            If set, only return the candidates of estimated Jaccard
+            similarity at least threshold.
+        max_bucket_size : int, optional
+            If set, skip the buckets of more than max_bucket_size vertices
+            (a bucket of n vertices yields n * (n - 1) / 2 pairs).
+
+        Returns
+        -------
+        df : cudf.DataFrame or pandas.DataFrame
+            df['source'] : the first vertex of the pair
+            df['destination'] : the second vertex of the pair, larger than
+            the first
+            df['jaccard_coeff'] : the estimated Jaccard similarity
+
+            The pairs are sorted. A pandas.DataFrame is returned for graphs
+            using the host backend.
+        """
+        if not 1 <= bands <= self.num_hashes:
+            raise ValueError('bands must be in [1, num_hashes]')
+        rows = self.num_hashes // bands
+        vertices = np.flatnonzero(self.degrees)
+        keys = []
+        for band in range(bands):
+            key = np.zeros(len(vertices), dtype=np.uint64)
+            with np.errstate(over='ignore'):
+                for c in range(band * rows, (band + 1) * rows):
+                    key = key * np.uint64(0x100000001b3) ^ \
+                        self.signatures[vertices, c].astype(np.uint64)
+            order = np.argsort(key, kind='stable')
+            key = key[order]
+            starts = np.flatnonzero(np.r_[True, key[1:] != key[:-1]])
+            sizes = np.diff(np.r_[starts, len(key)])
+            # Pair each vertex with the next ones of its bucket
+            ends = np.repeat(starts + sizes, sizes)
+            position = np.arange(len(key))
+            counts = ends - position - 1
+            if max_bucket_size is not None:
+                counts[np.repeat(sizes > max_bucket_size, sizes)] = 0
+            owners = np.repeat(position, counts)
+            partners = owners + 1 + np.arange(len(owners)) - \
+                np.repeat(np.cumsum(counts) - counts, counts)
+            u = vertices[order[owners]]
+            w = vertices[order[partners]]
+            keys.append(np.minimum(u, w) * len(self.degrees) +
+                        np.maximum(u, w))
+
+        pairs = np.unique(np.concatenate(keys)) if keys else \
+            np.empty(0, dtype=np.int64)
+        first = pairs // len(self.degrees)
+        second = pairs % len(self.degrees)
+        coeff = self._estimate(first, second)
+        if threshold is not None:
+            keep = coeff >= threshold
+            first, second, coeff = first[keep], second[keep], coeff[keep]
+        return self._frame(first, second, 'jaccard_coeff', coeff)
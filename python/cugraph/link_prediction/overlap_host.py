@@ -0,0 +1,45 @@
+# Copyright (c) 2019, NVIDIA CORPORATION.
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from cugraph.link_prediction.jaccard_host import neighborhood_volumes
+import numpy as np
+import pandas as pd
+
+
+def overlap(graph_ptr, first=None, second=None):
+    """
+    Host implementation of gdf_overlap and gdf_overlap_list
+    """
+    return _overlap(graph_ptr, None, first, second)
+
+
+def overlap_w(graph_ptr, weights, first=None, second=None):
+    """
+    Host implementation of the weighted gdf_overlap and gdf_overlap_list
+    """
+    return _overlap(graph_ptr, weights, first, second)
+
+
+def _overlap(graph_ptr, weights, first, second):
+    first, second, intersection, volume_first, volume_second = \
+        neighborhood_volumes(graph_ptr, weights, first, second)
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        coeff = intersection / np.minimum(volume_first, volume_second)
+
+    df = pd.DataFrame()
+    df['source'] = first
+    df['destination'] = second
+    df['overlap_coeff'] = coeff.astype(np.float32)
+
+    return df
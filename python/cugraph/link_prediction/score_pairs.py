@@ -0,0 +1,148 @@
+# Copyright (c) 2019, NVIDIA CORPORATION.
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from cugraph.link_prediction import score_pairs_host
+from cugraph.structure import graph_host
+from cugraph.structure.graph import memory_budgeted, null_check
+import numpy as np
+import pandas as pd
+try:
+    import cudf
+except ImportError:
+    cudf = None
+
+
+METRICS = ['jaccard', 'overlap', 'common_neighbors', 'adamic_adar',
+           'preferential_attachment']
+COLUMNS = {'jaccard': 'jaccard_coeff', 'overlap': 'overlap_coeff'}
+
+
+def _vertex_statistics(G, weighted):
+    # Computed on the first call and kept on the graph until it is modified
+    # (the add_* and delete_* methods of the graph drop them)
+    stats = G._vertex_statistics.get(weighted)
+    if stats is None:
+        offsets, indices, values = G.view_adj_list()
+        offsets = graph_host.to_host_array(offsets)
+        indices = graph_host.to_host_array(indices)
+        values = graph_host.to_host_array(values)
+        stats = score_pairs_host.vertex_statistics(offsets, indices, values,
+                                                   weighted)
+        if G.backend == 'device' and stats['adj_list'] is None:
+            # Keep the host copy of the adjacency list
+            stats['adj_list'] = (offsets, indices, values)
+        G._vertex_statistics[weighted] = stats
+        # Counted toward the memory budget of the graph
+        G._touch('vertex_statistics')
+    return stats
+
+
+@memory_budgeted
+def score_pairs(G, pairs, metrics=METRICS, first='first', second='second',
+                weighted=False):
+    """
+    Compute link prediction scores of many vertex pairs in one pass. The
+    neighborhoods of each pair are intersected once for all the requested
+    metrics, walking the neighbors of the endpoint of smaller degree and
+    binary searching them in the sorted adjacency list of the other. The
+    per-vertex degrees, weight sums and Adamic-Adar weights are computed on
+    the first call and cached on the graph, so scoring pairs in many batches
+    does not pay that setup again.
+
+    Parameters
+    ----------
+    G : cugraph.Graph
+        cuGraph graph descriptor. The graph should be undirected, an
+        undirected edge being represented by a directed edge in both
+        directions; for directed graphs the out-neighborhoods are compared.
+    pairs : cudf.DataFrame or pandas.DataFrame
+        The vertex pairs, for instance the result of
+        Graph.get_two_hop_neighbors.
+    metrics : list of strings, optional
+        The scores to compute, among (all by default):
+
+        'jaccard': |N(u) & N(w)| / |N(u) | N(w)|
+        'overlap': |N(u) & N(w)| / min(|N(u)|, |N(w)|)
+        'common_neighbors': |N(u) & N(w)|
+        'adamic_adar': sum of 1 / log(degree(z)) over the common neighbors z
+        'preferential_attachment': |N(u)| * |N(w)|
+    first : string or integer, optional
+        This is used to index the first vertex column of pairs.
+    second : string or integer, optional
+        This is used to index the second vertex column of pairs.
+    weighted : bool, optional
+        If True, neighborhoods are weighted by the edge weights: the size of
+        an intersection is the sum over the common neighbors z of
+        min(weight(u, z), weight(w, z)) and the size of a neighborhood the
+        sum of its edge weights. Adamic-Adar is not weighted.
+
+    Returns
+    -------
+    df : cudf.DataFrame or pandas.DataFrame
+        The pair columns, followed by one column per metric:
+        df['jaccard_coeff'], df['overlap_coeff'], df['common_neighbors'],
+        df['adamic_adar'] and df['preferential_attachment'] (float32 for
+        the coefficients, float64 for the other scores). Pairs are in the
+        order of the input. A pandas.DataFrame is returned for graphs using
+        the host backend.
+
+    Examples
+    --------
+    >>> M = cudf.read_csv('datasets/karate.csv', delimiter=' ',
+    >>>                   dtype=['int32', 'int32', 'float32'], header=None)
+    >>> G = cugraph.Graph()
+    >>> G.add_edge_list(M['0'], M['1'], None)
+    >>> pairs = G.get_two_hop_neighbors()
+    >>> df = cugraph.score_pairs(G, pairs, metrics=['jaccard', 'adamic_adar'])
+    """
+    if isinstance(metrics, str):
+        metrics = [metrics]
+    for metric in metrics:
+        if metric not in METRICS:
+            raise ValueError("unknown metric '%s', must be one of %s" %
+                             (metric, METRICS))
+    null_check(pairs[first])
+    null_check(pairs[second])
+    u = graph_host.to_host_array(pairs[first], dtype=np.int64)
+    w = graph_host.to_host_array(pairs[second], dtype=np.int64)
+    num_verts = G.number_of_vertices()
+    for v in [u, w]:
+        if len(v) and (v.min() < 0 or v.max() >= num_verts):
+            raise ValueError('vertices must be in [0, %d)' % num_verts)
+
+    stats = _vertex_statistics(G, weighted)
+    offsets, indices, values = stats['adj_list'] or G.view_adj_list()
+    common, adamic_adar = score_pairs_host.score_pairs(
+        offsets, indices, values, stats, u, w, weighted)
+
+    volume_u = stats['volume'][u]
+    volume_w = stats['volume'][w]
+    scores = {'common_neighbors': common, 'adamic_adar': adamic_adar,
+              'preferential_attachment': volume_u * volume_w}
+    with np.errstate(divide='ignore', invalid='ignore'):
+        if 'jaccard' in metrics:
+            scores['jaccard'] = (common / (volume_u + volume_w - common)
+                                 ).astype(np.float32)
+        if 'overlap' in metrics:
+            scores['overlap'] = (common / np.minimum(volume_u, volume_w)
+                                 ).astype(np.float32)
+
+    df = pd.DataFrame()
+    df[first] = graph_host.to_host_array(pairs[first])
+    df[second] = graph_host.to_host_array(pairs[second])
+    for metric in metrics:
+        df[COLUMNS.get(metric, metric)] = scores[metric]
+
+    if G.backend == 'device':
+        df = cudf.DataFrame.from_pandas(df)
+    return df
@@ -0,0 +1,122 @@
+# Copyright (c) 2019, NVIDIA CORPORATION.
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from cugraph.structure import graph_host
+import numpy as np
+
+
+# Largest number of neighbors looked up at once
+BATCH_NEIGHBORS = 1 << 22
+
+
+def _rows_sorted(offsets, indices):
+    # True if the neighbors of every vertex are sorted
+    if len(indices) < 2:
+        return True
+    decreasing = np.flatnonzero(indices[1:] < indices[:-1]) + 1
+    row_starts = offsets[1:-1]
+    return bool(np.isin(decreasing, row_starts).all())
+
+
+def vertex_statistics(offsets, indices, values, weighted):
+    """
+    Compute the per-vertex vectors used by score_pairs: the neighborhood
+    volumes (degrees, or weight sums if weighted), the Adamic-Adar weights
+    and a copy of the adjacency list if its rows are not sorted.
+    """
+    num_verts = len(offsets) - 1
+    degree = np.diff(offsets).astype(np.int64)
+    if weighted and values is not None:
+        rows = np.repeat(np.arange(num_verts), degree)
+        volume = np.bincount(rows, weights=values, minlength=num_verts)
+    else:
+        volume = degree.astype(np.float64)
+    # A common neighbor has an in-degree of at least 2
+    in_degree = np.bincount(indices, minlength=num_verts)
+    with np.errstate(divide='ignore'):
+        adamic_adar = np.where(in_degree > 1, 1.0 / np.log(in_degree), 0.0)
+
+    stats = {'degree': degree, 'volume': volume,
+             'adamic_adar': adamic_adar, 'adj_list': None}
+    if not _rows_sorted(offsets, indices):
+        indices = indices.copy()
+        if values is not None:
+            values = values.copy()
+        graph_host._sort_adjacency(offsets, indices, values, BATCH_NEIGHBORS)
+        stats['adj_list'] = (offsets, indices, values)
+    return stats
+
+
+def _find(offsets, indices, rows, keys):
+    # Binary search of each key among the sorted neighbors of its row
+    end = offsets[rows + 1].astype(np.int64)
+    lo = offsets[rows].astype(np.int64)
+    hi = end.copy()
+    active = np.flatnonzero(lo < hi)
+    while len(active):
+        mid = (lo[active] + hi[active]) // 2
+        less = indices[mid] < keys[active]
+        lo[active[less]] = mid[less] + 1
+        hi[active[~less]] = mid[~less]
+        active = active[lo[active] < hi[active]]
+    found = lo < end
+    found[found] = indices[lo[found]] == keys[found]
+    return found, lo
+
+
+def score_pairs(offsets, indices, values, stats, first, second, weighted):
+    """
+    Host implementation of score_pairs: intersect the neighborhoods of every
+    pair in one pass over the sorted adjacency list, walking the neighbors
+    of the endpoint of smaller degree and searching them among the neighbors
+    of the other. Returns the common neighbor count (or the sum of the
+    smaller edge weights if weighted) and the Adamic-Adar sum of each pair.
+    """
+    if stats['adj_list'] is not None:
+        offsets, indices, values = stats['adj_list']
+    if not weighted:
+        values = None
+    degree = stats['degree']
+    swap = degree[first] > degree[second]
+    small = np.where(swap, second, first)
+    large = np.where(swap, first, second)
+
+    common = np.zeros(len(first), dtype=np.float64)
+    adamic_adar = np.zeros(len(first), dtype=np.float64)
+    scanned = np.cumsum(degree[small])
+    start = 0
+    while start < len(first):
+        base = scanned[start - 1] if start > 0 else 0
+        stop = int(np.searchsorted(scanned, base + BATCH_NEIGHBORS,
+                                   side='right'))
+        stop = max(stop, start + 1)
+        counts = degree[small[start:stop]]
+        pair = np.repeat(np.arange(start, stop), counts)
+        _, positions = graph_host.gather_neighbors(offsets, indices,
+                                                   small[start:stop])
+        neighbors = indices[positions]
+        found, where = _find(offsets, indices, large[pair], neighbors)
+        pair = pair[found]
+        neighbors = neighbors[found]
+        if values is None:
+            weight = None
+        else:
+            weight = np.minimum(values[positions[found]], values[where[found]])
+        common[start:stop] = np.bincount(pair - start, weights=weight,
+                                         minlength=stop - start)
+        adamic_adar[start:stop] = np.bincount(
+            pair - start, weights=stats['adamic_adar'][neighbors],
+            minlength=stop - start)
+        start = stop
+
+    return common, adamic_adar
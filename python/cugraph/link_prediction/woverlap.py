@@ -11,11 +11,17 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from cugraph.link_prediction import woverlap_wrapper
-from cugraph.structure.graph import null_check
-import cudf
+from cugraph.link_prediction import overlap_host
+from cugraph.structure.graph import memory_budgeted, null_check
+try:
+    from cugraph.link_prediction import woverlap_wrapper
+    import cudf
+except ImportError:
+    woverlap_wrapper = None
+    cudf = None
 
 
+@memory_budgeted
 def overlap_w(input_graph, weights, first=None, second=None):
     """
     Compute the weighted Overlap Coefficient between each pair of vertices
@@ -62,6 +68,9 @@ def overlap_w(input_graph, weights, first=None, second=None):
             The computed weighted Overlap coefficient between the source and
             destination vertices.
 
+        A pandas.DataFrame with the same columns is returned for graphs using
+        the host backend.
+
     Examples
     --------
     >>> M = cudf.read_csv('datasets/karate.csv', delimiter=' ',
@@ -75,8 +84,13 @@ def overlap_w(input_graph, weights, first=None, second=None):
     >>> df = cugraph.overlap_w(G, weights)
     """
 
-    if (type(first) == cudf.Series and
-            type(second) == cudf.Series):
+    if input_graph.backend == 'host':
+        pairs_given = first is not None and second is not None
+    else:
+        pairs_given = (type(first) == cudf.Series and
+                       type(second) == cudf.Series)
+
+    if pairs_given:
         null_check(first)
         null_check(second)
     elif first is None and second is None:
@@ -84,7 +98,11 @@ def overlap_w(input_graph, weights, first=None, second=None):
     else:
         raise ValueError("Specify first and second or neither")
 
-    df = woverlap_wrapper.overlap_w(input_graph.graph_ptr,
+    if input_graph.backend == 'host':
+        df = overlap_host.overlap_w(input_graph.graph_ptr,
                                     weights, first, second)
+    else:
+        df = woverlap_wrapper.overlap_w(input_graph.graph_ptr,
+                                        weights, first, second)
 
     return df
@@ -12,7 +12,10 @@
 # limitations under the License.
 
 
-import cudf
+try:
+    import cudf
+except ImportError:
+    cudf = None
 import cugraph
 import numpy as np
 
@@ -12,7 +12,10 @@
 # limitations under the License.
 
 # Import needed libraries
-import cudf
+try:
+    import cudf
+except ImportError:
+    cudf = None
 import numpy as np
 from collections import OrderedDict
 
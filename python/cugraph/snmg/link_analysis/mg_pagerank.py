@@ -11,13 +11,59 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from cugraph.snmg.link_analysis import mg_pagerank_wrapper
+from cugraph.snmg.link_analysis import mg_pagerank_host
+try:
+    from cugraph.snmg.link_analysis import mg_pagerank_wrapper
+except ImportError:
+    mg_pagerank_wrapper = None
 
 
 def mg_pagerank(src_ptrs_info,
                 dest_ptrs_info,
                 alpha=0.85,
-                max_iter=30):
+                max_iter=30,
+                tol=0.0):
+    """
+    Find the PageRank values of the vertices of a graph split over several
+    GPUs of a node (snmg).
+
+    The edge list slices are given either as the __cuda_array_interface__
+    of device columns (one per GPU), or as host arrays (NumPy arrays, pandas
+    Series). Host slices run on the host emulation of the snmg pipeline:
+    one process per slice, each holding the partial CSR matrix of a vertex
+    range (part_offsets), with the x vectors of the power iteration in
+    shared memory. It runs on CPU machines and uses one core per slice.
+
+    Parameters
+    ----------
+    src_ptrs_info : list
+        Source vertices of the edge list slices.
+    dest_ptrs_info : list
+        Destination vertices of the edge list slices.
+    alpha : float
+        The damping factor, 0.85 by default.
+    max_iter : int
+        The number of iterations, 30 by default.
+    tol : float
+        Convergence tolerance of the host engine, on the L1 norm of the
+        difference of two successive rank vectors. The default (0.0) and
+        the device engine run max_iter iterations.
+
+    Returns
+    -------
+    df : cudf.DataFrame or pandas.DataFrame
+        The 'vertex' and 'pagerank' columns.
+
+    Examples
+    --------
+    >>> src = np.array_split(M['0'].to_array(), 4)
+    >>> dst = np.array_split(M['1'].to_array(), 4)
+    >>> pr = cugraph.mg_pagerank(src, dst, alpha=0.85, max_iter=50)
+    """
+    if not all(isinstance(info, dict) for info in src_ptrs_info):
+        return mg_pagerank_host.mg_pagerank(src_ptrs_info, dest_ptrs_info,
+                                            alpha, max_iter, tol)
+
     df = mg_pagerank_wrapper.mg_pagerank(src_ptrs_info,
                                          dest_ptrs_info,
                                          alpha,
@@ -0,0 +1,111 @@
+# Copyright (c) 2019, NVIDIA CORPORATION.
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from cugraph.snmg import snmg_host
+from cugraph.structure import graph_host
+import numpy as np
+import pandas as pd
+
+
+def mg_pagerank(src_ptrs_info, dest_ptrs_info, alpha=0.85, max_iter=30,
+                tol=0.0):
+    """
+    Host implementation of gdf_snmg_pagerank, one process per edge list
+    slice
+    """
+    sources = [graph_host.to_host_array(s, dtype=np.int64)
+               for s in src_ptrs_info]
+    destinations = [graph_host.to_host_array(d, dtype=np.int64)
+                    for d in dest_ptrs_info]
+    if len(sources) != len(destinations) or len(sources) == 0:
+        raise ValueError('src_ptrs_info and dest_ptrs_info must be non empty '
+                         'lists of the same length')
+    for s, d in zip(sources, destinations):
+        if len(s) != len(d):
+            raise ValueError('source and destination slices must have the '
+                             'same length')
+    num_ranks = len(sources)
+    num_edges = sum(len(s) for s in sources)
+    num_verts = 1 + int(max([max(s.max(), d.max())
+                             for s, d in zip(sources, destinations)
+                             if len(s)] + [-1]))
+    if max_iter <= 0:
+        max_iter = 30
+
+    env = snmg_host.SNMGHostEnv(num_ranks, num_verts)
+    input_offsets = np.concatenate([[0],
+                                    np.cumsum([len(s) for s in sources])])
+    for name in ['coo_rows', 'coo_cols', 'send_rows', 'send_cols']:
+        env.allocate(name, np.int64, num_edges)
+    env.allocate('row_counts', np.int64, (num_ranks, num_ranks))
+    env.allocate('x', np.float64, (2, num_verts))
+    env.allocate('iterations', np.int64, 1)
+    # Source and destination are swapped, pagerank needs the transposed CSR
+    coo_rows, coo_cols = env.array('coo_rows'), env.array('coo_cols')
+    for i in range(num_ranks):
+        coo_rows[input_offsets[i]:input_offsets[i + 1]] = destinations[i]
+        coo_cols[input_offsets[i]:input_offsets[i + 1]] = sources[i]
+
+    snmg_host.run(env, _pagerank_rank, input_offsets, alpha, max_iter, tol)
+
+    iterations = int(env.array('iterations')[0])
+    df = pd.DataFrame()
+    df['vertex'] = graph_host.vertex_ids(num_verts)
+    df['pagerank'] = env.array('x')[iterations % 2].astype(np.float32)
+    return df
+
+
+def _pagerank_rank(env, input_offsets, alpha, max_iter, tol):
+    i = env.rank
+    num_verts = env.num_verts
+    a, b = input_offsets[i], input_offsets[i + 1]
+    part_offsets, T = snmg_host.coo2csr(
+        env, env.array('coo_rows')[a:b], env.array('coo_cols')[a:b],
+        env.array('send_rows'), env.array('send_cols'),
+        env.array('row_counts'), input_offsets)
+    lo, hi = part_offsets[i], part_offsets[i + 1]
+
+    # Transition matrix: the values of column u are 1 / out_degree(u)
+    out_degree = snmg_host.degree(env, part_offsets, T, x=1)
+    inv_out_degree = np.zeros(num_verts)
+    inv_out_degree[out_degree != 0] = 1.0 / out_degree[out_degree != 0]
+    T.data *= inv_out_degree[T.indices]
+    dangling = out_degree[lo:hi] == 0
+
+    x = env.array('x')
+    scalars = env.array('scalars')
+    x[0, lo:hi] = 1.0 / num_verts
+    env.sync_all()
+
+    iterations = 0
+    while iterations < max_iter:
+        current, new = x[iterations % 2], x[(iterations + 1) % 2]
+        scalars[i, 0] = current[lo:hi][dangling].sum()
+        env.sync_all()
+
+        dangling_sum = scalars[:, 0].sum()
+        # new = T current, then each rank adds the teleport term to its
+        # slice (the other ranks only read it after the next barrier)
+        snmg_host.csrmv(env, part_offsets, T, current, new)
+        y_loc = new[lo:hi]
+        y_loc *= alpha
+        y_loc += (alpha * dangling_sum + 1.0 - alpha) / num_verts
+        scalars[i, 1] = np.abs(y_loc - current[lo:hi]).sum()
+        env.sync_all()
+
+        iterations += 1
+        if scalars[:, 1].sum() < tol:
+            break
+
+    if i == 0:
+        env.array('iterations')[0] = iterations
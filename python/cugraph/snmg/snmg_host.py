@@ -0,0 +1,204 @@
+# Copyright (c) 2019, NVIDIA CORPORATION.
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# Host emulation of the snmg (single node multi-GPU) layer: every GPU of the
+# device implementation (an OpenMP thread) is a process here, and the arrays
+# the GPUs share (partition offsets, source counts, x vectors) live in shared
+# memory. The partitioning follows cpp/src/snmg: COO2CSR splits the vertices
+# into part_offsets ranges of about the same number of edges and builds a
+# partial CSR matrix per rank, and the SpMV allgathers the local results
+# into the x vector of every rank.
+
+import multiprocessing
+
+import numpy as np
+from scipy import sparse
+
+
+class SNMGHostEnv:
+    """
+    Shared state of the ranks of a host snmg run, the equivalent of SNMGinfo
+    and of the coo2csr communicator of the device implementation. Buffers
+    are allocated before the ranks start and mapped as NumPy arrays in every
+    rank.
+    """
+    def __init__(self, num_ranks, num_verts, context=None):
+        if context is None:
+            context = multiprocessing.get_context()
+        self.context = context
+        self.num_ranks = num_ranks
+        self.num_verts = num_verts
+        # Set in each rank by run()
+        self.rank = 0
+        self.barrier = context.Barrier(num_ranks)
+        self._buffers = {}
+        self.allocate('part_offsets', np.int64, num_ranks + 1)
+        self.allocate('reduce', np.int64, (num_ranks, num_verts))
+        self.allocate('scalars', np.float64, (num_ranks, 4))
+
+    def allocate(self, name, dtype, shape):
+        dtype = np.dtype(dtype)
+        size = int(np.prod(shape)) * dtype.itemsize
+        self._buffers[name] = (self.context.RawArray('b', max(size, 1)),
+                               dtype.str, shape)
+
+    def array(self, name):
+        raw, dtype, shape = self._buffers[name]
+        count = int(np.prod(shape))
+        return np.frombuffer(raw, dtype=dtype, count=count).reshape(shape)
+
+    def sync_all(self):
+        self.barrier.wait()
+
+    def allreduce_sum(self, values):
+        """
+        Sum the given vectors of length V of all the ranks. Each rank reduces
+        one slice of the vertices (a reduce-scatter) before the result is
+        read by all the ranks.
+        """
+        reduce = self.array('reduce')
+        reduce[self.rank] = values
+        self.sync_all()
+        lo, hi = _chunk(self.num_verts, self.num_ranks, self.rank)
+        reduce[0, lo:hi] = reduce[:, lo:hi].sum(axis=0)
+        self.sync_all()
+        result = reduce[0].copy()
+        self.sync_all()
+        return result
+
+
+def _chunk(n, num_ranks, rank):
+    return n * rank // num_ranks, n * (rank + 1) // num_ranks
+
+
+def _main(env, rank, target, args):
+    env.rank = rank
+    try:
+        target(env, *args)
+    except BaseException:
+        # Release the ranks waiting for this one
+        env.barrier.abort()
+        raise
+
+
+def run(env, target, *args):
+    """
+    Run target(env, *args) on every rank of env, in one process per rank (in
+    the calling process if env has a single rank). Raises RuntimeError if a
+    rank fails.
+    """
+    if env.num_ranks == 1:
+        _main(env, 0, target, args)
+        return
+    processes = [env.context.Process(target=_main,
+                                     args=(env, rank, target, args))
+                 for rank in range(env.num_ranks)]
+    for p in processes:
+        p.start()
+    for p in processes:
+        p.join()
+    failed = [rank for rank, p in enumerate(processes) if p.exitcode != 0]
+    if failed:
+        raise RuntimeError('snmg host rank(s) %s failed' % failed)
+
+
+def part_offsets_from_counts(counts, num_ranks):
+    """
+    Split the vertices into num_ranks ranges of about the same number of
+    edges, from the global source counts (findStartRange of COO2CSR).
+    """
+    num_verts = len(counts)
+    scanned = np.concatenate([[0], np.cumsum(counts)])
+    edge_count = scanned[-1] // num_ranks * np.arange(1, num_ranks)
+    starts = np.searchsorted(scanned, edge_count, side='left')
+    return np.concatenate([[0], np.minimum(starts, num_verts),
+                           [num_verts]]).astype(np.int64)
+
+
+def coo2csr(env, rows, cols, send_rows, send_cols, row_counts, input_offsets):
+    """
+    Host equivalent of snmg_coo2csr. Each rank holds a slice of the COO
+    edges; the global source counts give the part_offsets vertex ranges, the
+    edges are exchanged so that each rank gets the rows of its range, and a
+    local CSR matrix (local rows, global columns) is built. Returns the
+    part_offsets and the local matrix (with unit values).
+
+    send_rows, send_cols are shared buffers of the size of the whole edge
+    list, row_counts a shared [p, p] buffer and input_offsets the bounds of
+    the COO slices of the ranks.
+    """
+    i, p = env.rank, env.num_ranks
+    num_verts = env.num_verts
+
+    counts = env.allreduce_sum(np.bincount(rows, minlength=num_verts))
+    if i == 0:
+        env.array('part_offsets')[:] = part_offsets_from_counts(counts, p)
+    env.sync_all()
+    part_offsets = env.array('part_offsets').copy()
+
+    # Each rank writes its edges sorted by owner in its slice of the send
+    # buffers, then reads the pieces of all the slices it owns
+    owner = np.searchsorted(part_offsets, rows, side='right') - 1
+    order = np.argsort(owner, kind='stable')
+    start = input_offsets[i]
+    send_rows[start:start + len(rows)] = rows[order]
+    send_cols[start:start + len(rows)] = cols[order]
+    row_counts[i] = np.bincount(owner, minlength=p)
+    env.sync_all()
+
+    piece_starts = input_offsets[:-1] + np.cumsum(row_counts, axis=1)[:, i] - \
+        row_counts[:, i]
+    pieces = [(s, s + n) for s, n in zip(piece_starts, row_counts[:, i])]
+    local_rows = np.concatenate([send_rows[a:b] for a, b in pieces])
+    local_cols = np.concatenate([send_cols[a:b] for a, b in pieces])
+    env.sync_all()
+
+    lo, hi = part_offsets[i], part_offsets[i + 1]
+    A = sparse.csr_matrix((np.ones(len(local_rows)),
+                           (local_rows - lo, local_cols)),
+                          shape=(hi - lo, num_verts))
+    return part_offsets, A
+
+
+def degree(env, part_offsets, A, x):
+    """
+    Host equivalent of snmg_degree on the partial CSR matrices: the global
+    column counts (x=1, the in-degree of a CSR matrix, the out-degree of the
+    graph for a transposed CSR matrix) or row counts (x=2) of every vertex.
+    """
+    if x == 1:
+        local = np.bincount(A.indices, weights=A.data,
+                            minlength=env.num_verts).astype(np.int64)
+    else:
+        local = np.zeros(env.num_verts, dtype=np.int64)
+        lo, hi = part_offsets[env.rank], part_offsets[env.rank + 1]
+        local[lo:hi] = np.diff(A.indptr)
+    return env.allreduce_sum(local)
+
+
+def allgather(env, part_offsets, y_loc, x):
+    """
+    Write the local result of each rank in its part_offsets slice of the
+    shared vector x and wait for all the ranks.
+    """
+    lo, hi = part_offsets[env.rank], part_offsets[env.rank + 1]
+    x[lo:hi] = y_loc
+    env.sync_all()
+
+
+def csrmv(env, part_offsets, A, x, y):
+    """
+    Host equivalent of SNMGcsrmv: y = A x, with A the partial CSR matrices of
+    the ranks, x and y shared vectors of length V.
+    """
+    allgather(env, part_offsets, A @ x, y)
@@ -12,6 +12,9 @@
 # limitations under the License.
 
 from cugraph.structure.graph import Graph
-from cugraph.structure.convert_matrix import from_cudf_edgelist
+from cugraph.structure.convert_matrix import (from_cudf_edgelist,
+                                             read_edgelist,
+                                             load)
 from cugraph.structure.renumber import renumber
+from cugraph.structure.vertex_dictionary import VertexDictionary
 from cugraph.structure.symmetrize import symmetrize, symmetrize_df
@@ -15,19 +15,27 @@
 # issue #146 is addressed, this file's extension should be changed from .pyx to
 # .py and should be located outside the python/cugraph/bindings directory.
 
-from cugraph.structure.graph import Graph
+from cugraph.structure import graph_file
+from cugraph.structure.graph import Graph, is_device_column
+import numpy as np
+import pandas as pd
+try:
+    import cudf
+except ImportError:
+    cudf = None
 
 
 def from_cudf_edgelist(df, source='source', target='target', weight=None):
     """
     Return a new graph created from the edge list representaion. This function
     is added for NetworkX compatibility (this function is a RAPIDS version of
-    NetworkX's from_pandas_edge_list()).
+    NetworkX's from_pandas_edge_list()). If df is a pandas.DataFrame, the
+    returned graph uses the host backend.
 
     Parameters
     ----------
-    df : cudf.DataFrame
-        This cudf.DataFrame contains columns storing edge source vertices,
+    df : cudf.DataFrame or pandas.DataFrame
+        This DataFrame contains columns storing edge source vertices,
         destination (or target following NetworkX's terminology) vertices, and
         (optional) weights.
     source : string or integer
@@ -47,7 +55,10 @@ def from_cudf_edgelist(df, source='source', target='target', weight=None):
     >>> G = cugraph.from_cudf_edgelist(M, source='0', target='1', weight='2')
     """
 
-    G = Graph()
+    if is_device_column(df[source]):
+        G = Graph(backend='device')
+    else:
+        G = Graph(backend='host')
 
     if weight is None:
         G.add_edge_list(df[source], df[target])
@@ -55,3 +66,130 @@ def from_cudf_edgelist(df, source='source', target='target', weight=None):
         G.add_edge_list(df[source], df[target], df[weight])
 
     return G
+
+
+def read_edgelist(path, chunksize=1000000, file_type='csv', delimiter=' ',
+                  weighted=False, num_vertices=None, backend=None,
+                  memory_budget=None):
+    """
+    Return a new graph built from an edge list file read chunksize edges at
+    a time (see Graph.from_edge_stream), without holding the whole edge list
+    in memory.
+
+    Parameters
+    ----------
+    path : string
+        Path to the edge list file.
+    chunksize : int
+        Number of edges read at a time.
+    file_type : string
+        'csv' for a text file with one edge per line (source, destination
+        and optionally weight, separated by delimiter) or 'binary' for a
+        file of packed little-endian records of an int32 source, an int32
+        destination and, if weighted, a float32 weight.
+    delimiter : string
+        Delimiter of the fields of csv files.
+    weighted : bool
+        If True, the third field of each edge is read as its weight.
+        Otherwise, fields after the destination are ignored and an
+        unweighted graph is created.
+    num_vertices : int, optional
+        Number of vertices of the graph. If not set, it is one more than the
+        largest vertex id in the file.
+    backend : string, optional
+        Backend of the new graph, see Graph.
+    memory_budget : int, optional
+        Memory budget of the new graph, see Graph.
+
+    Returns
+    -------
+    G : cugraph.Graph
+        A graph holding the adjacency list of the edges.
+
+    Examples
+    --------
+    >>> G = cugraph.read_edgelist('datasets/karate.csv', chunksize=100,
+    >>>                           weighted=True)
+    """
+    if file_type == 'csv':
+        dtype = {0: np.int32, 1: np.int32}
+        if weighted:
+            dtype[2] = np.float32
+
+        def chunks():
+            return pd.read_csv(path, delimiter=delimiter, header=None,
+                               usecols=list(dtype.keys()), dtype=dtype,
+                               chunksize=chunksize)
+        source, target, weight = 0, 1, 2
+    elif file_type == 'binary':
+        fields = [('source', '<i4'), ('target', '<i4')]
+        if weighted:
+            fields.append(('weight', '<f4'))
+        edges = np.memmap(path, dtype=np.dtype(fields), mode='r')
+
+        def chunks():
+            return (edges[i:i + chunksize]
+                    for i in range(0, len(edges), chunksize))
+        source, target, weight = 'source', 'target', 'weight'
+    else:
+        raise ValueError("bad file type: '%s'" % file_type)
+
+    if not weighted:
+        weight = None
+
+    return Graph.from_edge_stream(chunks, source=source, target=target,
+                                  weight=weight, num_vertices=num_vertices,
+                                  backend=backend,
+                                  memory_budget=memory_budget)
+
+
+def load(path, mmap=True, backend=None, memory_budget=None):
+    """
+    Return a new graph loaded from a file written by Graph.save.
+
+    Parameters
+    ----------
+    path : string
+        Path to the graph file.
+    mmap : bool
+        If True, the arrays of a graph using the host backend are read-only
+        memory maps of the file: loading takes no copy and the pages are
+        read on first access. If False, the arrays are read into memory.
+        Graphs using the device backend are always copied to the GPU.
+    backend : string, optional
+        Backend of the new graph, see Graph.
+    memory_budget : int, optional
+        Memory budget of the new graph, see Graph.
+
+    Returns
+    -------
+    G : cugraph.Graph
+        A graph holding the adjacency list of the file. G.renumber_map holds
+        the renumbering map saved with the graph, or None.
+
+    Examples
+    --------
+    >>> G = cugraph.load('karate.cugraph')
+    >>> df = cugraph.pagerank(G)
+    """
+    G = Graph(backend=backend, memory_budget=memory_budget)
+    arrays = graph_file.read(path, mmap=mmap and G.backend == 'host')
+    offsets = arrays['offsets']
+    indices = arrays['indices']
+    weights = arrays['weights']
+    renumber_map = arrays['renumber_map']
+
+    if G.backend == 'device':
+        offsets = cudf.Series(offsets)
+        indices = cudf.Series(indices)
+        if weights is not None:
+            weights = cudf.Series(weights)
+        if renumber_map is not None:
+            renumber_map = cudf.Series(renumber_map)
+    elif renumber_map is not None:
+        renumber_map = pd.Series(renumber_map)
+
+    G.add_adj_list(offsets, indices, weights)
+    G.renumber_map = renumber_map
+
+    return G
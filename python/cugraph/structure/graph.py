@@ -11,23 +11,123 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from cugraph.structure import graph_wrapper
-import cudf
+from cugraph.structure import graph_file, graph_host
+import functools
 import numpy as np
+import pandas as pd
+try:
+    from cugraph.structure import graph_wrapper
+    import cudf
+except ImportError:
+    # libcugraph or cudf is not available (e.g. on a CPU-only node), only the
+    # host backend can be used.
+    graph_wrapper = None
+    cudf = None
+
+
+BACKENDS = ('device', 'host')
+REPRESENTATIONS = ('edge_list', 'adj_list', 'transposed_adj_list')
+# Per-vertex vectors cached on the graph by the algorithms, counted toward
+# the memory budget and released first (see score_pairs)
+CACHES = ('vertex_statistics',)
+
+
+def default_backend():
+    """
+    Return the backend used by Graph objects created without an explicit
+    backend: 'device' if libcugraph and cudf can be imported, 'host'
+    otherwise.
+    """
+    if graph_wrapper is None:
+        return 'host'
+    return 'device'
+
+
+def is_device_column(col):
+    """
+    Return True if col is a cudf.Series (and should be processed by the
+    device backend).
+    """
+    return cudf is not None and isinstance(col, cudf.Series)
 
 
 def null_check(col):
-    if col.null_count != 0:
+    if hasattr(col, 'null_count'):
+        null_count = col.null_count
+    else:
+        null_count = pd.isnull(col).sum()
+    if null_count != 0:
         raise ValueError('Series contains NULL values')
 
 
+def memory_budgeted(algorithm):
+    """
+    Decorator of the algorithm entry points. The algorithms build the
+    representations they need (e.g. pagerank the transposed adjacency list)
+    in the backend, outside of the Graph methods; once the algorithm returns,
+    the memory budget of every graph argument is enforced again, releasing
+    the least recently used representations as needed.
+    """
+    @functools.wraps(algorithm)
+    def wrapper(*args, **kwargs):
+        try:
+            return algorithm(*args, **kwargs)
+        finally:
+            for arg in list(args) + list(kwargs.values()):
+                if isinstance(arg, Graph):
+                    arg._enforce_memory_budget()
+    return wrapper
+
+
+def _cache_bytes(cache):
+    # Bytes held by the arrays of a cache, tuples of arrays included
+    total = 0
+    for value in cache.values():
+        if isinstance(value, dict):
+            total += _cache_bytes(value)
+        elif isinstance(value, tuple):
+            total += sum(a.nbytes for a in value if a is not None)
+        elif value is not None:
+            total += value.nbytes
+    return total
+
+
 class Graph:
     """
     cuGraph graph class containing basic graph creation and transformation
     operations.
+
+    A graph is bound to a backend when created. The 'device' backend stores
+    the graph in GPU memory (cudf columns) and runs the algorithms in
+    libcugraph. The 'host' backend stores the graph in host memory (NumPy
+    arrays, possibly memory-mapped) and runs NumPy/SciPy implementations of
+    the algorithms, returning pandas DataFrames with the same columns as the
+    device backend returns in cudf DataFrames.
+
+    The edge list (COO), adjacency list (CSR) and transposed adjacency list
+    (CSC) of a graph are computed on demand from one another and kept
+    afterwards. A memory budget bounds the bytes held by these
+    representations: when it is exceeded, the least recently used
+    representations that can be rebuilt from the remaining ones are
+    released (e.g. the edge list once the adjacency list exists) and are
+    recomputed the next time they are needed. The budget is enforced by the
+    Graph methods and after every algorithm, and also covers the per-vertex
+    vectors the algorithms cache on the graph. On the device backend the
+    columns returned by the view methods reference the memory of the graph:
+    they become invalid once their representation is released, copy them to
+    keep them beyond the next call on the graph.
     """
-    def __init__(self):
+    def __init__(self, backend=None, memory_budget=None):
         """
+        Parameters
+        ----------
+        backend : string, optional
+            Either 'device' or 'host'. If not set, 'device' is used when
+            libcugraph and cudf are available and 'host' otherwise.
+        memory_budget : int, optional
+            Maximum number of bytes held by the representations of the graph
+            and its caches. If not set, every computed representation is kept.
+
         Returns
         -------
         G : cuGraph.Graph.
@@ -36,8 +136,30 @@ class Graph:
         --------
         >>> import cuGraph
         >>> G = cuGraph.Graph()
+        >>> H = cuGraph.Graph(backend='host', memory_budget=2 << 30)
         """
-        self.graph_ptr = graph_wrapper.allocate_cpp_graph()
+        if backend is None:
+            backend = default_backend()
+        if backend not in BACKENDS:
+            raise ValueError("backend must be one of %s, got '%s'" %
+                             (", ".join(BACKENDS), backend))
+        if backend == 'device' and graph_wrapper is None:
+            raise RuntimeError("The device backend requires libcugraph and "
+                               "cudf, which could not be imported.")
+
+        if memory_budget is not None and memory_budget < 0:
+            raise ValueError("memory_budget must be non-negative")
+
+        self.backend = backend
+        self.memory_budget = memory_budget
+        # Representations held by the graph, least recently used first
+        self._recently_used = []
+        if backend == 'host':
+            self._wrapper = graph_host
+            self.graph_ptr = graph_host.allocate_host_graph()
+        else:
+            self._wrapper = graph_wrapper
+            self.graph_ptr = graph_wrapper.allocate_cpp_graph()
 
         self.edge_list_source_col = None
         self.edge_list_dest_col = None
@@ -47,12 +169,88 @@ class Graph:
         self.adj_list_index_col = None
         self.adj_list_value_col = None
 
+        # Original ids of the vertices if they were renumbered, saved and
+        # loaded with the graph.
+        self.renumber_map = None
+
+        # Per-vertex vectors computed by the link prediction functions and
+        # reused by their next calls (see score_pairs)
+        self._vertex_statistics = {}
+
+    @classmethod
+    def from_edge_stream(cls, chunks, source='source', target='target',
+                         weight=None, num_vertices=None, backend=None,
+                         memory_budget=None):
+        """
+        Return a new graph built from an edge list read in chunks. The
+        chunks are read twice: the vertex degrees are counted in the first
+        pass and the edges are scattered into a preallocated adjacency list
+        in the second, so that the peak memory is about the size of the
+        adjacency list plus one chunk. The adjacency list is built in host
+        memory and copied to the GPU for the device backend.
+
+        Parameters
+        ----------
+        chunks : iterable or callable
+            An iterable of chunks that can be iterated over twice (e.g. a
+            list) or a callable returning a new iterator of chunks each time
+            it is called (e.g. a function calling pandas.read_csv with
+            chunksize). A chunk is either a DataFrame (cudf or pandas) or a
+            tuple of columns (source, destination) or (source, destination,
+            weight).
+        source : string or integer
+            This is used to index the source column of DataFrame chunks.
+        target : string or integer
+            This is used to index the destination column of DataFrame
+            chunks.
+        weight : string or integer, optional
+            This is used to index the weight column of DataFrame chunks. If
+            ``None``, an unweighted graph is created.
+        num_vertices : int, optional
+            Number of vertices of the graph. If not set, it is one more than
+            the largest vertex id in the stream.
+        backend : string, optional
+            Backend of the new graph, see Graph.
+        memory_budget : int, optional
+            Memory budget of the new graph, see Graph.
+
+        Returns
+        -------
+        G : cugraph.Graph
+            A graph holding the adjacency list of the edges.
+
+        Examples
+        --------
+        >>> def chunks():
+        >>>     return pandas.read_csv('datasets/karate.csv', delimiter=' ',
+        >>>                            header=None, dtype='int32',
+        >>>                            usecols=[0, 1], chunksize=100)
+        >>> G = cugraph.Graph.from_edge_stream(chunks, source=0, target=1)
+        """
+        offsets, indices, values = graph_host.edge_stream_to_csr(
+            chunks, source, target, weight, num_vertices)
+
+        G = cls(backend=backend, memory_budget=memory_budget)
+        if G.backend == 'device':
+            offsets = cudf.Series(offsets)
+            indices = cudf.Series(indices)
+            if values is not None:
+                values = cudf.Series(values)
+        G.add_adj_list(offsets, indices, values)
+
+        return G
+
     def __del__(self):
+        # __init__ may have failed before a graph was allocated
+        if getattr(self, 'graph_ptr', None) is None:
+            return
+
         self.delete_edge_list()
         self.delete_adj_list()
         self.delete_transposed_adj_list()
 
-        graph_wrapper.release_cpp_graph(self.graph_ptr)
+        if self.backend == 'device':
+            graph_wrapper.release_cpp_graph(self.graph_ptr)
 
     def clear(self):
         """
@@ -69,11 +267,11 @@ class Graph:
         dest_col arguments wrap gdf_column objects that represent a graph
         using the edge list format.
         Source and destination indices must be in the range [0, V) where V is
-        the number of vertices. They must be 32 bit integers. Please refer to
-        cuGraph's renumbering feature if your input does not match these
-        requierments. When using cudf.read_csv to load a CSV edge list,
-        make sure to set dtype to int32 for the source and destination
-        columns.
+        the number of vertices. They must be 32 bit integers (32 or 64 bit
+        integers for the host backend). Please refer to cuGraph's renumbering
+        feature if your input does not match these requierments. When using
+        cudf.read_csv to load a CSV edge list, make sure to set dtype to int32
+        for the source and destination columns.
         If value_col is None, an unweighted graph is created. If value_col is
         not None, a weighted graph is created.
         If copy is False, this function stores references to the passed objects
@@ -81,6 +279,12 @@ class Graph:
         stores references to the deep-copies of the passed objects pointed by
         source_col and dest_col.
         Undirected edges must be stored as directed edges in both directions.
+        For graphs using the host backend, the columns can also be
+        pandas.Series, NumPy arrays (including numpy.memmap) or any other
+        array-like container; they are stored as NumPy arrays. The adjacency
+        lists computed from the edge list use 32 bit offsets and vertex ids
+        when the numbers of edges and vertices allow it and 64 bit integers
+        otherwise.
 
         Parameters
         ----------
@@ -112,16 +316,17 @@ class Graph:
         >>> G = cugraph.Graph()
         >>> G.add_edge_list(sources, destinations, None)
         """
+        self._vertex_statistics = {}
         null_check(source_col)
         null_check(dest_col)
         if value_col is not None:
             null_check(value_col)
-        if source_col.dtype != np.int32:
-            raise TypeError("cugraph currently supports only 32bit integer"
-                            "vertex ids.")
-        if dest_col.dtype != np.int32:
-            raise TypeError("cugraph currently supports only 32bit integer"
-                            "vertex ids.")
+        if self.backend == 'host':
+            source_col = graph_host.to_host_array(source_col)
+            dest_col = graph_host.to_host_array(dest_col)
+            value_col = graph_host.to_host_array(value_col)
+        self._check_index_dtype(source_col, "vertex ids")
+        self._check_index_dtype(dest_col, "vertex ids")
 
         # Create temporary references first as the member variables should not
         # be updated on failure.
@@ -132,9 +337,11 @@ class Graph:
         else:
             tmp_source_col = source_col.copy()
             tmp_dest_col = dest_col.copy()
-            tmp_value_col = value_col.copy()
+            tmp_value_col = None
+            if value_col is not None:
+                tmp_value_col = value_col.copy()
 
-        graph_wrapper.add_edge_list(self.graph_ptr,
+        self._wrapper.add_edge_list(self.graph_ptr,
                                     tmp_source_col,
                                     tmp_dest_col,
                                     tmp_value_col)
@@ -146,6 +353,19 @@ class Graph:
         self.edge_list_dest_col = tmp_dest_col
         self.edge_list_value_col = tmp_value_col
 
+        self._touch('edge_list')
+
+    def _check_index_dtype(self, col, name):
+        # libcugraph only supports 32 bit integers, the host backend supports
+        # 32 and 64 bit integers.
+        if self.backend == 'host':
+            if col.dtype not in (np.int32, np.int64):
+                raise TypeError("cugraph supports only 32 and 64 bit integer "
+                                "%s." % name)
+        elif col.dtype != np.int32:
+            raise TypeError("cugraph currently supports only 32bit integer "
+                            "%s on the device backend." % name)
+
     def view_edge_list(self):
         """
         Display the edge list. Compute it if needed.
@@ -170,9 +390,15 @@ class Graph:
             The gdf column contains the weight value for each edge.
             The expected type of the gdf_column element is floating point
             number.
+
+        For graphs using the host backend, the columns are returned as NumPy
+        arrays instead of cudf.Series. On the device backend the columns are
+        views of the graph memory, invalid once the representation is
+        released (by a delete method or the memory budget).
         """
         source_col, dest_col, value_col = \
-            graph_wrapper.view_edge_list(self.graph_ptr)
+            self._wrapper.view_edge_list(self.graph_ptr)
+        self._touch('edge_list')
 
         return source_col, dest_col, value_col
 
@@ -180,7 +406,8 @@ class Graph:
         """
         Delete the edge list.
         """
-        graph_wrapper.delete_edge_list(self.graph_ptr)
+        self._vertex_statistics = {}
+        self._wrapper.delete_edge_list(self.graph_ptr)
 
         # decrease reference count to free memory if the referenced objects are
         # no longer used.
@@ -201,6 +428,10 @@ class Graph:
         stores references to the deep-copies of the passed objects pointed by
         offset_col and index_col.
         Undirected edges must be stored as directed edges in both directions.
+        For graphs using the host backend, the columns can also be
+        pandas.Series, NumPy arrays (including numpy.memmap) or any other
+        array-like container; they are stored as NumPy arrays, and offsets and
+        indices can be 32 or 64 bit integers.
 
         Parameters
         ----------
@@ -234,16 +465,17 @@ class Graph:
         >>> G = cugraph.Graph()
         >>> G.add_adj_list(offsets, indices, None)
         """
+        self._vertex_statistics = {}
         null_check(offset_col)
         null_check(index_col)
         if value_col is not None:
             null_check(value_col)
-        if offset_col.dtype != np.int32:
-            raise TypeError("cugraph currently supports only 32bit integer"
-                            "offsets.")
-        if index_col.dtype != np.int32:
-            raise TypeError("cugraph currently supports only 32bit integer"
-                            "vertex ids.")
+        if self.backend == 'host':
+            offset_col = graph_host.to_host_array(offset_col)
+            index_col = graph_host.to_host_array(index_col)
+            value_col = graph_host.to_host_array(value_col)
+        self._check_index_dtype(offset_col, "offsets")
+        self._check_index_dtype(index_col, "vertex ids")
 
         # Create temporary references first as the member variables should not
         # be updated on failure.
@@ -254,9 +486,11 @@ class Graph:
         else:
             tmp_offset_col = offset_col.copy()
             tmp_index_col = index_col.copy()
-            tmp_value_col = value_col.copy()
+            tmp_value_col = None
+            if value_col is not None:
+                tmp_value_col = value_col.copy()
 
-        graph_wrapper.add_adj_list(self.graph_ptr,
+        self._wrapper.add_adj_list(self.graph_ptr,
                                    tmp_offset_col,
                                    tmp_index_col,
                                    tmp_value_col)
@@ -268,6 +502,8 @@ class Graph:
         self.adj_list_index_col = tmp_index_col
         self.adj_list_value_col = tmp_value_col
 
+        self._touch('adj_list')
+
     def view_adj_list(self):
         """
         Display the adjacency list. Compute it if needed.
@@ -291,9 +527,15 @@ class Graph:
             The gdf column contains the weight value for each edge.
             The expected type of the gdf_column element is floating point
             number.
+
+        For graphs using the host backend, the columns are returned as NumPy
+        arrays instead of cudf.Series. On the device backend the columns are
+        views of the graph memory, invalid once the representation is
+        released (by a delete method or the memory budget).
         """
         offset_col, index_col, value_col = \
-            graph_wrapper.view_adj_list(self.graph_ptr)
+            self._wrapper.view_adj_list(self.graph_ptr)
+        self._touch('adj_list')
 
         return offset_col, index_col, value_col
 
@@ -301,7 +543,8 @@ class Graph:
         """
         Delete the adjacency list.
         """
-        graph_wrapper.delete_adj_list(self.graph_ptr)
+        self._vertex_statistics = {}
+        self._wrapper.delete_adj_list(self.graph_ptr)
 
         # decrease reference count to free memory if the referenced objects are
         # no longer used.
@@ -315,7 +558,9 @@ class Graph:
         method on an uninitialized Graph object or a Graph object without an
         existing edge list.
         """
-        graph_wrapper.add_transposed_adj_list(self.graph_ptr)
+        self._vertex_statistics = {}
+        self._wrapper.add_transposed_adj_list(self.graph_ptr)
+        self._touch('transposed_adj_list')
 
     def view_transposed_adj_list(self):
         """
@@ -339,9 +584,15 @@ class Graph:
             The gdf column contains the weight value for each edge.
             The expected type of the gdf_column element is floating point
             number.
+
+        For graphs using the host backend, the columns are returned as NumPy
+        arrays instead of cudf.Series. On the device backend the columns are
+        views of the graph memory, invalid once the representation is
+        released (by a delete method or the memory budget).
         """
         offset_col, index_col, value_col = \
-            graph_wrapper.view_transposed_adj_list(self.graph_ptr)
+            self._wrapper.view_transposed_adj_list(self.graph_ptr)
+        self._touch('transposed_adj_list')
 
         return offset_col, index_col, value_col
 
@@ -349,12 +600,47 @@ class Graph:
         """
         Delete the transposed adjacency list.
         """
-        graph_wrapper.delete_transposed_adj_list(self.graph_ptr)
+        self._vertex_statistics = {}
+        self._wrapper.delete_transposed_adj_list(self.graph_ptr)
+
+    def save(self, path, renumber_map=None):
+        """
+        Save the adjacency list of the graph to path in the cugraph binary
+        graph file format (a versioned header followed by the offset, index,
+        weight and renumbering map arrays, little-endian and page-aligned).
+        Graphs saved this way are loaded with cugraph.load, without parsing
+        and, for the host backend, without copies.
+
+        Parameters
+        ----------
+        path : string
+            Path of the file to write.
+        renumber_map : cudf.Series or array-like, optional
+            Original ids of the vertices (e.g. the numbering map returned by
+            cugraph.renumber), saved with the graph. If not set,
+            self.renumber_map is saved if set.
+
+        Examples
+        --------
+        >>> M = cudf.read_csv('datasets/karate.csv', delimiter=' ',
+        >>>                   dtype=['int32', 'int32', 'float32'], header=None)
+        >>> G = cugraph.Graph()
+        >>> G.add_edge_list(M['0'], M['1'], M['2'])
+        >>> G.save('karate.cugraph')
+        >>> G2 = cugraph.load('karate.cugraph')
+        """
+        if renumber_map is None:
+            renumber_map = self.renumber_map
+        offset_col, index_col, value_col = self.view_adj_list()
+        graph_file.write(path, offset_col, index_col, value_col,
+                         renumber_map)
 
     def get_two_hop_neighbors(self):
         """
         Compute vertex pairs that are two hops apart. The resulting pairs are
-        sorted before returning.
+        sorted before returning. The number of pairs grows with the square of
+        the hub degrees, see estimate_two_hop_neighbors and
+        get_two_hop_neighbors_chunks for large graphs.
 
         Returns
         -------
@@ -364,15 +650,224 @@ class Graph:
             df['second'] : cudf.Series
                 the second vertex id of a pair.
         """
-        df = graph_wrapper.get_two_hop_neighbors(self.graph_ptr)
+        df = self._wrapper.get_two_hop_neighbors(self.graph_ptr)
+        self._enforce_memory_budget()
 
         return df
 
+    def estimate_two_hop_neighbors(self, max_degree=None):
+        """
+        Estimate the number of pairs returned by get_two_hop_neighbors (or
+        yielded by get_two_hop_neighbors_chunks) from the degree sequence,
+        before any pair is computed: the number of two-hop paths u -> z -> w,
+        the sum over the intermediate vertices z of in_degree(z) *
+        out_degree(z). It is an upper bound, pairs joined by several paths
+        and pairs (u, u) being counted more than once.
+
+        Parameters
+        ----------
+        max_degree : int, optional
+            Only count the paths through intermediate vertices of out-degree
+            at most max_degree, see get_two_hop_neighbors_chunks.
+
+        Returns
+        -------
+        count : int
+            The number of two-hop paths.
+
+        Examples
+        --------
+        >>> G = cugraph.Graph()
+        >>> G.add_edge_list(sources, destinations, None)
+        >>> if G.estimate_two_hop_neighbors() < 10 ** 8:
+        >>>     df = G.get_two_hop_neighbors()
+        """
+        df = self.degrees()
+        in_degree = graph_host.to_host_array(df['in_degree'], dtype=np.int64)
+        out_degree = graph_host.to_host_array(df['out_degree'],
+                                              dtype=np.int64)
+        paths = in_degree * out_degree
+        if max_degree is not None:
+            paths = paths[out_degree <= max_degree]
+        return int(paths.sum())
+
+    def get_two_hop_neighbors_chunks(self, max_bytes=1 << 30,
+                                     max_degree=None):
+        """
+        Compute the vertex pairs that are two hops apart in chunks: each
+        chunk holds the pairs of a range of first vertices, the ranges being
+        sized from the degree sequence so that the working memory of a chunk
+        stays within max_bytes. Unlike get_two_hop_neighbors, the pairs of
+        the whole graph, which grow with the square of the hub degrees, are
+        never held at once. The pairs are computed in host memory.
+
+        Parameters
+        ----------
+        max_bytes : int, optional
+            Memory budget of a chunk (1 GiB by default): its pairs and the
+            temporary arrays of their computation, about 32 bytes per
+            two-hop path for 32-bit vertex ids. A range is a single vertex
+            if it exceeds the budget on its own.
+        max_degree : int, optional
+            If set, the paths through intermediate vertices of out-degree
+            above max_degree are skipped: a hub of degree d alone yields up
+            to d * d pairs, which are rarely useful (its neighbors are only
+            related through it).
+
+        Returns
+        -------
+        chunks : iterator of cudf.DataFrame
+            df['first'] : cudf.Series
+                the first vertex id of a pair.
+            df['second'] : cudf.Series
+                the second vertex id of a pair.
+
+            The pairs are sorted within and across chunks. pandas.DataFrame
+            chunks are yielded for graphs using the host backend.
+
+        Examples
+        --------
+        >>> G = cugraph.Graph()
+        >>> G.add_edge_list(sources, destinations, None)
+        >>> for df in G.get_two_hop_neighbors_chunks(1 << 28,
+        >>>                                          max_degree=1000):
+        >>>     process(df)
+        """
+        if max_bytes <= 0:
+            raise ValueError('max_bytes must be positive')
+        if max_degree is not None and max_degree < 0:
+            raise ValueError('max_degree must be non-negative')
+        offsets, indices, _ = self.view_adj_list()
+        if self.backend == 'host':
+            graph_ptr = self.graph_ptr
+        else:
+            graph_ptr = graph_host.allocate_host_graph()
+            graph_host.add_adj_list(graph_ptr,
+                                    graph_host.to_host_array(offsets),
+                                    graph_host.to_host_array(indices))
+        itemsize = np.dtype(graph_host.index_dtype(
+            self.number_of_vertices())).itemsize
+        # The pair columns, plus the sparse product and sort temporaries
+        max_pairs = max(1, max_bytes // (2 * itemsize + 24))
+        chunks = graph_host.get_two_hop_neighbors_chunks(graph_ptr, max_pairs,
+                                                         max_degree)
+        if self.backend == 'device':
+            return (cudf.DataFrame.from_pandas(df) for df in chunks)
+        return chunks
+
+    def memory_usage(self):
+        """
+        Report the memory held by the representations of the graph (GPU
+        memory for the device backend, host memory for the host backend).
+
+        Returns
+        -------
+        usage : dict
+            usage['edge_list'], usage['adj_list'] and
+            usage['transposed_adj_list'] give the number of bytes held by
+            each representation (0 if it is not held),
+            usage['vertex_statistics'] the bytes of the per-vertex vectors
+            cached by score_pairs (in host memory for both backends) and
+            usage['total'] the sum of the four. Columns shared by two
+            representations are counted once.
+
+        Examples
+        --------
+        >>> M = cudf.read_csv('datasets/karate.csv', delimiter=' ',
+        >>>                   dtype=['int32', 'int32', 'float32'], header=None)
+        >>> G = cugraph.Graph()
+        >>> G.add_edge_list(M['0'], M['1'], M['2'])
+        >>> G.view_adj_list()
+        >>> usage = G.memory_usage()
+        """
+        sizes = self._sizes()
+        usage = {name: sizes.get(name, 0) for name in REPRESENTATIONS + CACHES}
+        usage['total'] = sum(sizes.values())
+
+        return usage
+
+    def set_memory_budget(self, memory_budget):
+        """
+        Set the maximum number of bytes held by the representations of the
+        graph, releasing the least recently used representations right away
+        if needed.
+
+        Parameters
+        ----------
+        memory_budget : int or None
+            Maximum number of bytes. None removes the limit.
+        """
+        if memory_budget is not None and memory_budget < 0:
+            raise ValueError("memory_budget must be non-negative")
+        self.memory_budget = memory_budget
+        self._enforce_memory_budget()
+
+    def _touch(self, representation):
+        if representation in self._recently_used:
+            self._recently_used.remove(representation)
+        self._recently_used.append(representation)
+        self._enforce_memory_budget(keep=representation)
+
+    def _sizes(self):
+        sizes = self._wrapper.representation_sizes(self.graph_ptr)
+        if self._vertex_statistics:
+            sizes['vertex_statistics'] = _cache_bytes(self._vertex_statistics)
+        return sizes
+
+    def _enforce_memory_budget(self, keep=None):
+        if self.memory_budget is None:
+            return
+
+        while True:
+            sizes = self._sizes()
+            # Representations computed internally (by an algorithm or while
+            # computing another representation) were never requested and
+            # come first in the eviction order.
+            self._recently_used = \
+                [r for r in REPRESENTATIONS + CACHES
+                 if r in sizes and r not in self._recently_used] + \
+                [r for r in self._recently_used if r in sizes]
+            if sum(sizes.values()) <= self.memory_budget:
+                return
+
+            for representation in self._recently_used:
+                if representation != keep and \
+                        self._can_evict(representation, sizes):
+                    break
+            else:
+                # Everything left is needed, the budget cannot be met.
+                return
+
+            if representation in CACHES:
+                setattr(self, '_' + representation, {})
+            else:
+                # The graph is unchanged, keep its caches
+                caches = self._vertex_statistics
+                getattr(self, 'delete_' + representation)()
+                self._vertex_statistics = caches
+
+    def _can_evict(self, representation, sizes):
+        # A representation can only be released if it can be recomputed from
+        # the remaining ones: the edge list and the adjacency list are
+        # computed from each other, the transposed adjacency list from the
+        # edge list. Caches are recomputed on demand.
+        if representation in CACHES:
+            return True
+        if representation == 'transposed_adj_list':
+            return 'edge_list' in sizes or 'adj_list' in sizes
+        if representation == 'edge_list':
+            return 'adj_list' in sizes
+        # On the device backend, an edge list computed from the adjacency list
+        # references its index column, so only an edge list added with
+        # add_edge_list allows releasing the adjacency list.
+        return 'edge_list' in sizes and (
+            self.backend == 'host' or self.edge_list_source_col is not None)
+
     def number_of_vertices(self):
         """
         Get the number of vertices in the graph.
         """
-        num_vertices = graph_wrapper.number_of_vertices(self.graph_ptr)
+        num_vertices = self._wrapper.number_of_vertices(self.graph_ptr)
 
         return num_vertices
 
@@ -387,7 +882,7 @@ class Graph:
         """
         Get the number of edges in the graph.
         """
-        num_edges = graph_wrapper.number_of_edges(self.graph_ptr)
+        num_edges = self._wrapper.number_of_edges(self.graph_ptr)
 
         return num_edges
 
@@ -404,6 +899,8 @@ class Graph:
         vertex_subset : cudf.Series or iterable container, optional
             A container of vertices for displaying corresponding in-degree.
             If not set, degrees are computed for the entire set of vertices.
+            Vertex ids must be in the range [0, V), a ValueError is raised
+            otherwise.
 
         Returns
         -------
@@ -444,6 +941,8 @@ class Graph:
         vertex_subset : cudf.Series or iterable container, optional
             A container of vertices for displaying corresponding out-degree.
             If not set, degrees are computed for the entire set of vertices.
+            Vertex ids must be in the range [0, V), a ValueError is raised
+            otherwise.
 
         Returns
         -------
@@ -483,6 +982,8 @@ class Graph:
         vertex_subset : cudf.Series or iterable container, optional
             A container of vertices for displaying corresponding degree. If not
             set, degrees are computed for the entire set of vertices.
+            Vertex ids must be in the range [0, V), a ValueError is raised
+            otherwise.
 
         Returns
         -------
@@ -522,6 +1023,8 @@ class Graph:
         vertex_subset : cudf.Series or iterable container, optional
             A container of vertices for displaying corresponding degree. If not
             set, degrees are computed for the entire set of vertices.
+            Vertex ids must be in the range [0, V), a ValueError is raised
+            otherwise.
 
         Returns
         -------
@@ -545,46 +1048,73 @@ class Graph:
         >>> G.add_edge_list(sources, destinations, None)
         >>> df = G.degrees([0,9,12])
         """
-        vertex_col, in_degree_col, out_degree_col = graph_wrapper._degrees(
+        vertex_col, in_degree_col, out_degree_col = self._wrapper._degrees(
                                                         self.graph_ptr)
+        self._enforce_memory_budget()
 
-        df = cudf.DataFrame()
+        df = self._df_lib().DataFrame()
         if vertex_subset is None:
             df['vertex'] = vertex_col
             df['in_degree'] = in_degree_col
             df['out_degree'] = out_degree_col
         else:
-            df['vertex'] = cudf.Series(
-                np.asarray(vertex_subset, dtype=np.int32))
-            df['in_degree'] = cudf.Series(
-                np.asarray([in_degree_col[i] for i in vertex_subset],
-                           dtype=np.int32))
-            df['out_degree'] = cudf.Series(
-                np.asarray([out_degree_col[i] for i in vertex_subset],
-                           dtype=np.int32))
-            # is this necessary???
-            del vertex_col
-            del in_degree_col
-            del out_degree_col
+            vertex_subset = self._vertex_subset(vertex_subset, vertex_col)
+            df['vertex'] = vertex_subset
+            df['in_degree'] = self._gather(in_degree_col, vertex_subset)
+            df['out_degree'] = self._gather(out_degree_col, vertex_subset)
 
         return df
 
     def _degree(self, vertex_subset, x=0):
-        vertex_col, degree_col = graph_wrapper._degree(self.graph_ptr, x)
+        vertex_col, degree_col = self._wrapper._degree(self.graph_ptr, x)
+        self._enforce_memory_budget()
 
-        df = cudf.DataFrame()
+        df = self._df_lib().DataFrame()
         if vertex_subset is None:
             df['vertex'] = vertex_col
             df['degree'] = degree_col
         else:
-            df['vertex'] = cudf.Series(np.asarray(
-                vertex_subset, dtype=np.int32
-            ))
-            df['degree'] = cudf.Series(np.asarray(
-                [degree_col[i] for i in vertex_subset], dtype=np.int32
-            ))
-            # is this necessary???
-            del vertex_col
-            del degree_col
+            vertex_subset = self._vertex_subset(vertex_subset, vertex_col)
+            df['vertex'] = vertex_subset
+            df['degree'] = self._gather(degree_col, vertex_subset)
 
         return df
+
+    def _vertex_subset(self, vertex_subset, vertex_col):
+        # Return vertex_subset as a column of the backend of the graph with
+        # the type of vertex_col, after checking that the ids are in
+        # [0, len(vertex_col)).
+        num_vertices = len(vertex_col)
+        if is_device_column(vertex_subset):
+            if self.backend == 'host':
+                vertex_subset = vertex_subset.to_array()
+        elif not hasattr(vertex_subset, '__len__'):
+            # e.g. a generator
+            vertex_subset = np.fromiter(vertex_subset, dtype=np.int64)
+        else:
+            vertex_subset = np.asarray(vertex_subset, dtype=np.int64)
+
+        if len(vertex_subset) > 0 and (vertex_subset.min() < 0 or
+                                       vertex_subset.max() >= num_vertices):
+            raise ValueError("vertex_subset contains vertex ids out of the "
+                             "range [0, %d)" % num_vertices)
+
+        vertex_subset = vertex_subset.astype(vertex_col.dtype)
+        if self.backend == 'host':
+            return pd.Series(vertex_subset)
+        if not is_device_column(vertex_subset):
+            vertex_subset = cudf.Series(vertex_subset)
+        return vertex_subset.reset_index(drop=True)
+
+    def _gather(self, col, vertex_subset):
+        # col[vertex_subset] as a single gather, in the order of vertex_subset
+        if self.backend == 'host':
+            return pd.Series(col[vertex_subset.values])
+        return col.take(vertex_subset).reset_index(drop=True)
+
+    def _df_lib(self):
+        # DataFrame library of the results: cudf for the device backend and
+        # pandas for the host backend.
+        if self.backend == 'host':
+            return pd
+        return cudf
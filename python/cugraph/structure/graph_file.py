@@ -0,0 +1,131 @@
+# Copyright (c) 2019, NVIDIA CORPORATION.
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# Binary graph file format. All values are little-endian.
+#
+#   header (padded to one page):
+#       magic          8 bytes   b'CUGRAPH\0'
+#       version        uint32
+#       page_size      uint32
+#       num_vertices   uint64
+#       num_edges      uint64
+#       one section descriptor per array in SECTIONS order:
+#           dtype      8 bytes   NumPy dtype string (e.g. b'<i4'), or
+#                                zeros if the array is absent
+#           offset     uint64    position in the file (a multiple of
+#                                page_size)
+#           length     uint64    number of elements
+#   arrays, each starting on a page boundary
+#
+# Readers reject files with a version newer than VERSION.
+
+import struct
+
+import numpy as np
+
+from cugraph.structure import graph_host
+
+
+MAGIC = b'CUGRAPH\0'
+VERSION = 1
+PAGE_SIZE = 4096
+SECTIONS = ('offsets', 'indices', 'weights', 'renumber_map')
+
+_HEADER = struct.Struct('<8sIIQQ')
+_SECTION = struct.Struct('<8sQQ')
+
+
+def _align(position):
+    return (position + PAGE_SIZE - 1) // PAGE_SIZE * PAGE_SIZE
+
+
+def write(path, offsets, indices, weights=None, renumber_map=None):
+    """
+    Write an adjacency list (and optionally the renumbering map of its
+    vertex ids) to path in the binary graph file format.
+    """
+    arrays = {'offsets': offsets, 'indices': indices, 'weights': weights,
+              'renumber_map': renumber_map}
+    for name in SECTIONS:
+        if arrays[name] is not None:
+            a = graph_host.to_host_array(arrays[name])
+            if a.dtype.kind not in 'iuf':
+                raise TypeError("%s must be numeric, got %s" %
+                                (name, a.dtype))
+            arrays[name] = np.ascontiguousarray(
+                a.astype(a.dtype.newbyteorder('<'), copy=False))
+
+    descriptors = []
+    position = _align(_HEADER.size + len(SECTIONS) * _SECTION.size)
+    for name in SECTIONS:
+        a = arrays[name]
+        if a is None:
+            descriptors.append((b'', 0, 0))
+        else:
+            descriptors.append((a.dtype.str.encode(), position, len(a)))
+            position = _align(position + a.nbytes)
+
+    with open(path, 'wb') as f:
+        f.write(_HEADER.pack(MAGIC, VERSION, PAGE_SIZE,
+                             len(arrays['offsets']) - 1,
+                             len(arrays['indices'])))
+        for descriptor in descriptors:
+            f.write(_SECTION.pack(*descriptor))
+        for name, (_, offset, _) in zip(SECTIONS, descriptors):
+            if arrays[name] is not None:
+                f.seek(offset)
+                arrays[name].tofile(f)
+        # Pad the last array to a page boundary
+        f.truncate(position)
+
+
+def read(path, mmap=True):
+    """
+    Read a file in the binary graph file format. Return a dictionary mapping
+    the names in SECTIONS to NumPy arrays (memory-mapped read-only if mmap is
+    True) or None for absent arrays.
+    """
+    with open(path, 'rb') as f:
+        header = f.read(_HEADER.size + len(SECTIONS) * _SECTION.size)
+    if len(header) < _HEADER.size or \
+            _HEADER.unpack_from(header)[0] != MAGIC:
+        raise ValueError("'%s' is not a cugraph graph file" % path)
+    _, version, page_size, num_vertices, num_edges = \
+        _HEADER.unpack_from(header)
+    if version > VERSION:
+        raise ValueError("'%s' uses version %d of the graph file format, "
+                         "this version of cugraph reads up to version %d" %
+                         (path, version, VERSION))
+
+    arrays = {}
+    for i, name in enumerate(SECTIONS):
+        dtype, offset, length = _SECTION.unpack_from(
+            header, _HEADER.size + i * _SECTION.size)
+        dtype = dtype.rstrip(b'\0')
+        if not dtype:
+            arrays[name] = None
+        elif length == 0:
+            arrays[name] = np.empty(0, dtype=np.dtype(dtype.decode()))
+        elif mmap:
+            arrays[name] = np.memmap(path, dtype=np.dtype(dtype.decode()),
+                                     mode='r', offset=offset,
+                                     shape=(length,))
+        else:
+            arrays[name] = np.fromfile(path, dtype=np.dtype(dtype.decode()),
+                                       count=length, offset=offset)
+
+    if len(arrays['offsets']) != num_vertices + 1 or \
+            len(arrays['indices']) != num_edges:
+        raise ValueError("'%s' is corrupted" % path)
+
+    return arrays
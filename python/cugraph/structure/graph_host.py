@@ -0,0 +1,437 @@
+# Copyright (c) 2019, NVIDIA CORPORATION.
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# Host (NumPy/SciPy) counterpart of graph_wrapper.pyx. Every function takes
+# the same arguments as its graph_wrapper equivalent, except that graph_ptr is
+# a HostGraph instance instead of the address of a gdf_graph.
+
+import numpy as np
+import pandas as pd
+from scipy import sparse
+
+
+class HostGraph:
+    """
+    Host memory counterpart of the gdf_graph structure. Each representation
+    is either None or a tuple of NumPy arrays (which may be memory-mapped);
+    the value array of a representation is None for unweighted graphs.
+    """
+    def __init__(self):
+        self.edge_list = None
+        self.adj_list = None
+        self.transposed_adj_list = None
+        self.number_of_vertices = 0
+
+
+def index_dtype(n):
+    """
+    Return the integer type used for vertex ids, offsets or counts up to n:
+    int32 if it holds n, int64 otherwise.
+    """
+    if n <= np.iinfo(np.int32).max:
+        return np.int32
+    return np.int64
+
+
+def vertex_ids(num_verts):
+    return np.arange(num_verts, dtype=index_dtype(num_verts))
+
+
+def to_host_array(col, dtype=None):
+    """
+    Return the content of a cudf.Series, pandas.Series, NumPy array or any
+    other array-like container as a NumPy array.
+    """
+    if col is None:
+        return None
+    if hasattr(col, 'to_array'):
+        col = col.to_array()
+    return np.asarray(col, dtype=dtype)
+
+
+def allocate_host_graph():
+    return HostGraph()
+
+
+def renumber(source_col, dest_col):
+    src = to_host_array(source_col)
+    dst = to_host_array(dest_col)
+
+    numbering_map, inverse = np.unique(np.concatenate([src, dst]),
+                                       return_inverse=True)
+    inverse = inverse.astype(index_dtype(len(numbering_map)))
+
+    return (pd.Series(inverse[:len(src)]),
+            pd.Series(inverse[len(src):]),
+            pd.Series(numbering_map))
+
+
+def _coo_to_csr(src, dst, value, num_verts):
+    order = np.lexsort((dst, src))
+    offsets = np.zeros(num_verts + 1, dtype=index_dtype(len(src)))
+    np.cumsum(np.bincount(src, minlength=num_verts), out=offsets[1:])
+    indices = dst[order].astype(index_dtype(num_verts), copy=False)
+    if value is not None:
+        value = value[order]
+    return offsets, indices, value
+
+
+def _csr_to_coo(offsets, indices, value):
+    num_verts = len(offsets) - 1
+    src = np.repeat(np.arange(num_verts, dtype=indices.dtype),
+                    np.diff(offsets))
+    return src, indices, value
+
+
+def add_edge_list(graph_ptr, source_col, dest_col, value_col=None):
+    g = graph_ptr
+    g.edge_list = (source_col, dest_col, value_col)
+    g.number_of_vertices = 0
+
+
+def view_edge_list(graph_ptr):
+    g = graph_ptr
+    if g.edge_list is None:
+        if g.adj_list is not None:
+            g.edge_list = _csr_to_coo(*g.adj_list)
+        elif g.transposed_adj_list is not None:
+            dst, src, value = _csr_to_coo(*g.transposed_adj_list)
+            g.edge_list = (src, dst, value)
+        else:
+            raise ValueError("Graph is empty")
+
+    return g.edge_list
+
+
+def delete_edge_list(graph_ptr):
+    graph_ptr.edge_list = None
+
+
+def add_adj_list(graph_ptr, offset_col, index_col, value_col=None):
+    g = graph_ptr
+    g.adj_list = (offset_col, index_col, value_col)
+    g.number_of_vertices = 0
+
+
+def view_adj_list(graph_ptr):
+    g = graph_ptr
+    if g.adj_list is None:
+        src, dst, value = view_edge_list(g)
+        g.adj_list = _coo_to_csr(src, dst, value, number_of_vertices(g))
+
+    return g.adj_list
+
+
+def delete_adj_list(graph_ptr):
+    graph_ptr.adj_list = None
+
+
+def add_transposed_adj_list(graph_ptr):
+    view_transposed_adj_list(graph_ptr)
+
+
+def view_transposed_adj_list(graph_ptr):
+    g = graph_ptr
+    if g.transposed_adj_list is None:
+        src, dst, value = view_edge_list(g)
+        g.transposed_adj_list = _coo_to_csr(dst, src, value,
+                                            number_of_vertices(g))
+
+    return g.transposed_adj_list
+
+
+def delete_transposed_adj_list(graph_ptr):
+    graph_ptr.transposed_adj_list = None
+
+
+def gather_neighbors(offsets, indices, vertices):
+    """
+    Expand the adjacency lists of the given vertices in a single vectorized
+    step. Returns the owning vertex and the position in indices of every
+    expanded edge; the neighbors are indices[positions].
+    """
+    starts = offsets[vertices].astype(np.int64)
+    counts = offsets[vertices + 1] - starts
+    total = int(counts.sum())
+    owners = np.repeat(vertices, counts)
+    positions = np.arange(total, dtype=np.int64) + \
+        np.repeat(starts - np.cumsum(counts) + counts, counts)
+    return owners, positions
+
+
+def csr_matrix(graph_ptr, transposed=False, weighted=True):
+    """
+    Return a scipy.sparse.csr_matrix sharing the arrays of the (transposed)
+    adjacency list. Unweighted graphs (or weighted=False) get unit values.
+    """
+    if transposed:
+        offsets, indices, value = view_transposed_adj_list(graph_ptr)
+    else:
+        offsets, indices, value = view_adj_list(graph_ptr)
+    if value is None or not weighted:
+        value = np.ones(len(indices), dtype=np.float32)
+    num_verts = len(offsets) - 1
+    return sparse.csr_matrix((value, indices, offsets),
+                             shape=(num_verts, num_verts))
+
+
+def get_two_hop_neighbors(graph_ptr):
+    A = csr_matrix(graph_ptr, weighted=False)
+    A2 = (A @ A).tocoo()
+    mask = A2.row != A2.col
+    first = A2.row[mask]
+    second = A2.col[mask]
+    order = np.lexsort((second, first))
+
+    df = pd.DataFrame()
+    df['first'] = first[order].astype(A.indices.dtype)
+    df['second'] = second[order].astype(A.indices.dtype)
+
+    return df
+
+
+def _intermediate_matrix(A, max_degree):
+    # First hops of the two-hop paths, without the intermediate vertices of
+    # out-degree above max_degree
+    if max_degree is None:
+        return A
+    keep = (np.diff(A.indptr) <= max_degree).astype(A.dtype)
+    return A @ sparse.diags(keep)
+
+
+def get_two_hop_neighbors_chunks(graph_ptr, max_pairs, max_degree=None):
+    """
+    Yield the two-hop pairs of consecutive ranges of first vertices, each
+    range expanding at most max_pairs two-hop paths (an upper bound of its
+    pairs) unless it is a single vertex.
+    """
+    A = csr_matrix(graph_ptr, weighted=False)
+    first_hop = _intermediate_matrix(A, max_degree)
+    num_verts = A.shape[0]
+    paths = first_hop @ np.diff(A.indptr).astype(np.float64)
+    scanned = np.cumsum(paths)
+
+    start = 0
+    while start < num_verts:
+        base = scanned[start - 1] if start > 0 else 0
+        stop = int(np.searchsorted(scanned, base + max_pairs, side='right'))
+        stop = min(max(stop, start + 1), num_verts)
+        A2 = (first_hop[start:stop] @ A).tocoo()
+        first = A2.row.astype(np.int64) + start
+        mask = (first != A2.col) & (A2.data != 0)
+        first = first[mask]
+        second = A2.col[mask]
+        start = stop
+        if len(first) == 0:
+            continue
+        order = np.lexsort((second, first))
+
+        df = pd.DataFrame()
+        df['first'] = first[order].astype(A.indices.dtype)
+        df['second'] = second[order].astype(A.indices.dtype)
+        yield df
+
+
+def _chunk_iterator(chunks):
+    if callable(chunks):
+        return iter(chunks())
+    it = iter(chunks)
+    if it is chunks:
+        raise TypeError("chunks is read twice and cannot be a one-shot "
+                        "iterator, pass a callable returning a new iterator "
+                        "instead")
+    return it
+
+
+def _chunk_columns(chunk, source, target, weight):
+    if isinstance(chunk, (tuple, list)):
+        columns = [to_host_array(c) for c in chunk]
+        if len(columns) == 2:
+            columns.append(None)
+        return columns
+    value = None
+    if weight is not None:
+        value = to_host_array(chunk[weight])
+    return to_host_array(chunk[source]), to_host_array(chunk[target]), value
+
+
+def edge_stream_to_csr(chunks, source='source', target='target', weight=None,
+                       num_vertices=None):
+    """
+    Build the adjacency list of the edges read from chunks in two passes:
+    the out-degrees are counted in the first and the edges are scattered to
+    their final position in the second, so that only the adjacency list and
+    one chunk are held in memory.
+    """
+    counts = np.zeros(num_vertices or 0, dtype=np.int64)
+    num_edges = 0
+    max_chunk_size = 0
+    value_dtype = None
+    for chunk in _chunk_iterator(chunks):
+        src, dst, value = _chunk_columns(chunk, source, target, weight)
+        if len(src) == 0:
+            continue
+        if min(src.min(), dst.min()) < 0:
+            raise ValueError("Vertex ids must be non-negative")
+        top = int(max(src.max(), dst.max())) + 1
+        if top > len(counts):
+            if num_vertices is not None:
+                raise ValueError("Vertex ids must be smaller than "
+                                 "num_vertices")
+            counts = np.concatenate(
+                [counts, np.zeros(top - len(counts), dtype=np.int64)])
+        counts += np.bincount(src, minlength=len(counts))
+        num_edges += len(src)
+        max_chunk_size = max(max_chunk_size, len(src))
+        if value is not None:
+            value_dtype = value.dtype
+
+    offsets = np.zeros(len(counts) + 1, dtype=index_dtype(num_edges))
+    np.cumsum(counts, out=offsets[1:])
+    indices = np.empty(num_edges, dtype=index_dtype(len(counts)))
+    del counts
+    values = None
+    if value_dtype is not None:
+        values = np.empty(num_edges, dtype=value_dtype)
+
+    # Next free position in the adjacency list of each vertex
+    fill = offsets[:-1].astype(np.int64)
+    for chunk in _chunk_iterator(chunks):
+        src, dst, value = _chunk_columns(chunk, source, target, weight)
+        if len(src) == 0:
+            continue
+        order = np.argsort(src, kind='stable')
+        src = src[order]
+        first = np.flatnonzero(np.r_[True, src[1:] != src[:-1]])
+        group_size = np.diff(np.r_[first, len(src)])
+        # Rank of each edge among the edges of the same source in this chunk
+        rank = np.arange(len(src)) - np.repeat(first, group_size)
+        positions = fill[src] + rank
+        if len(positions) > 0 and positions.max() >= num_edges:
+            raise ValueError("The edge stream changed between the two "
+                             "passes")
+        indices[positions] = dst[order]
+        if values is not None:
+            values[positions] = value[order]
+        fill[src[first]] += group_size
+
+    if not np.array_equal(fill, offsets[1:]):
+        raise ValueError("The edge stream changed between the two passes")
+    del fill
+
+    _sort_adjacency(offsets, indices, values, max(max_chunk_size, 1))
+
+    return offsets, indices, values
+
+
+def _sort_adjacency(offsets, indices, values, block_size):
+    # Sort the neighbors of every vertex, processing about block_size edges
+    # at a time.
+    num_verts = len(offsets) - 1
+    first_row = 0
+    while first_row < num_verts:
+        last_row = int(np.searchsorted(offsets, offsets[first_row] +
+                                       block_size, side='right')) - 1
+        last_row = min(max(last_row, first_row + 1), num_verts)
+        begin = offsets[first_row]
+        end = offsets[last_row]
+        rows = np.repeat(np.arange(first_row, last_row),
+                         np.diff(offsets[first_row:last_row + 1]))
+        order = np.lexsort((indices[begin:end], rows))
+        indices[begin:end] = indices[begin:end][order]
+        if values is not None:
+            values[begin:end] = values[begin:end][order]
+        first_row = last_row
+
+
+def representation_sizes(graph_ptr):
+    """
+    Return a dictionary mapping each representation held by the graph
+    ('edge_list', 'adj_list', 'transposed_adj_list') to its size in bytes.
+    """
+    g = graph_ptr
+    sizes = {}
+    # An edge list computed from an adjacency list shares its index and value
+    # arrays, count them with the adjacency list only.
+    counted = set()
+    for name in ('adj_list', 'transposed_adj_list', 'edge_list'):
+        arrays = getattr(g, name)
+        if arrays is None:
+            continue
+        sizes[name] = 0
+        for a in arrays:
+            if a is not None and id(a) not in counted:
+                counted.add(id(a))
+                sizes[name] += a.nbytes
+
+    return sizes
+
+
+def number_of_vertices(graph_ptr):
+    g = graph_ptr
+    if g.number_of_vertices == 0:
+        if g.adj_list is not None:
+            g.number_of_vertices = len(g.adj_list[0]) - 1
+        elif g.transposed_adj_list is not None:
+            g.number_of_vertices = len(g.transposed_adj_list[0]) - 1
+        elif g.edge_list is not None and len(g.edge_list[0]) > 0:
+            g.number_of_vertices = int(max(g.edge_list[0].max(),
+                                           g.edge_list[1].max())) + 1
+
+    return g.number_of_vertices
+
+
+def number_of_edges(graph_ptr):
+    g = graph_ptr
+    if g.adj_list is not None:
+        return len(g.adj_list[1])
+    elif g.transposed_adj_list is not None:
+        return len(g.transposed_adj_list[1])
+    elif g.edge_list is not None:
+        return len(g.edge_list[0])
+    else:
+        # An empty graph
+        return 0
+
+
+def _degree(graph_ptr, x=0):
+    g = graph_ptr
+    num_verts = number_of_vertices(g)
+    vertex_col = vertex_ids(num_verts)
+
+    degree_dtype = index_dtype(number_of_edges(g))
+    degree_col = np.zeros(num_verts, dtype=degree_dtype)
+    if x != 2:
+        if g.transposed_adj_list is not None:
+            degree_col += np.diff(g.transposed_adj_list[0]).astype(
+                degree_dtype)
+        else:
+            degree_col += np.bincount(view_edge_list(g)[1],
+                                      minlength=num_verts).astype(
+                                          degree_dtype)
+    if x != 1:
+        if g.adj_list is not None:
+            degree_col += np.diff(g.adj_list[0]).astype(degree_dtype)
+        else:
+            degree_col += np.bincount(view_edge_list(g)[0],
+                                      minlength=num_verts).astype(
+                                          degree_dtype)
+
+    return vertex_col, degree_col
+
+
+def _degrees(graph_ptr):
+    vertex_col, in_degree_col = _degree(graph_ptr, 1)
+    _, out_degree_col = _degree(graph_ptr, 2)
+
+    return vertex_col, in_degree_col, out_degree_col
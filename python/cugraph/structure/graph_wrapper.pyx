@@ -116,13 +116,13 @@ def view_edge_list(graph_ptr):
     src_data = rmm.device_array_from_ptr(
                    src_col_data,
                    nelem=col_size,
-                   dtype=np.int32)
+                   dtype=np_dtype_from_gdf_column(g.edgeList.src_indices))
     source_col = cudf.Series(src_data)
 
     dest_data = rmm.device_array_from_ptr(
                     dest_col_data,
                     nelem=col_size,
-                    dtype=np.int32)
+                    dtype=np_dtype_from_gdf_column(g.edgeList.dest_indices))
     dest_col = cudf.Series(dest_data)
 
     value_col = None
@@ -185,13 +185,13 @@ def view_adj_list(graph_ptr):
     offset_data = rmm.device_array_from_ptr(
                        offset_col_data,
                        nelem=offset_col_size,
-                       dtype=np.int32)
+                       dtype=np_dtype_from_gdf_column(g.adjList.offsets))
     offset_col = cudf.Series(offset_data)
 
     index_data = rmm.device_array_from_ptr(
                        index_col_data,
                        nelem=index_col_size,
-                       dtype=np.int32)
+                       dtype=np_dtype_from_gdf_column(g.adjList.indices))
     index_col = cudf.Series(index_data)
 
     value_col = None
@@ -242,13 +242,15 @@ def view_transposed_adj_list(graph_ptr):
     offset_data = rmm.device_array_from_ptr(
                        offset_col_data,
                        nelem=offset_col_size,
-                       dtype=np.int32)
+                       dtype=np_dtype_from_gdf_column(
+                           g.transposedAdjList.offsets))
     offset_col = cudf.Series(offset_data)
 
     index_data = rmm.device_array_from_ptr(
                      index_col_data,
                      nelem=index_col_size,
-                     dtype=np.int32)
+                     dtype=np_dtype_from_gdf_column(
+                         g.transposedAdjList.indices))
     index_col = cudf.Series(index_data)
 
     value_col = None
@@ -269,6 +271,50 @@ def delete_transposed_adj_list(graph_ptr):
     err = gdf_delete_transposed_adj_list(<gdf_graph*> graph)
     libcudf.cudf.check_gdf_error(err)
 
+cdef _column_bytes(gdf_column * col):
+    if col is NULL:
+        return 0
+    return col.size * np.dtype(np_dtype_from_gdf_column(col)).itemsize
+
+cdef _shared_column_bytes(gdf_column * col, gdf_column * other):
+    # Derived representations may point to the columns of the representation
+    # they were computed from, count those columns only once.
+    if col is NULL or (other is not NULL and col.data == other.data):
+        return 0
+    return _column_bytes(col)
+
+def representation_sizes(graph_ptr):
+    """
+    Return a dictionary mapping each representation held by the graph
+    ('edge_list', 'adj_list', 'transposed_adj_list') to its size in bytes.
+    """
+    cdef uintptr_t graph = graph_ptr
+    cdef gdf_graph * g = <gdf_graph*> graph
+    sizes = {}
+    if g.adjList:
+        sizes['adj_list'] = (_column_bytes(g.adjList.offsets) +
+                             _column_bytes(g.adjList.indices) +
+                             _column_bytes(g.adjList.edge_data))
+    if g.transposedAdjList:
+        sizes['transposed_adj_list'] = (
+            _column_bytes(g.transposedAdjList.offsets) +
+            _column_bytes(g.transposedAdjList.indices) +
+            _column_bytes(g.transposedAdjList.edge_data))
+    if g.edgeList:
+        if g.adjList:
+            sizes['edge_list'] = (
+                _column_bytes(g.edgeList.src_indices) +
+                _shared_column_bytes(g.edgeList.dest_indices,
+                                     g.adjList.indices) +
+                _shared_column_bytes(g.edgeList.edge_data,
+                                     g.adjList.edge_data))
+        else:
+            sizes['edge_list'] = (_column_bytes(g.edgeList.src_indices) +
+                                  _column_bytes(g.edgeList.dest_indices) +
+                                  _column_bytes(g.edgeList.edge_data))
+
+    return sizes
+
 def get_two_hop_neighbors(graph_ptr):
     cdef uintptr_t graph = graph_ptr
     cdef gdf_graph * g = <gdf_graph*> graph
@@ -320,14 +366,21 @@ def number_of_edges(graph_ptr):
         # An empty graph
         return 0
 
+cdef _index_dtype(gdf_graph * g):
+    # Type of the vertex ids of the graph, also used for the degrees
+    if g.adjList:
+        return np_dtype_from_gdf_column(g.adjList.indices)
+    return np_dtype_from_gdf_column(g.transposedAdjList.indices)
+
 def _degree(graph_ptr, x=0):
     cdef uintptr_t graph = graph_ptr
     cdef gdf_graph* g = <gdf_graph*> graph
 
     err = gdf_add_adj_list(g)
     n = number_of_vertices(graph_ptr)
+    dtype = _index_dtype(g)
 
-    vertex_col = cudf.Series(np.zeros(n, dtype=np.int32))
+    vertex_col = cudf.Series(np.zeros(n, dtype=dtype))
     c_vertex_col = get_gdf_column_view(vertex_col)
     if g.adjList:
         err = g.adjList.get_vertex_identifiers(&c_vertex_col)
@@ -335,7 +388,7 @@ def _degree(graph_ptr, x=0):
         err = g.transposedAdjList.get_vertex_identifiers(&c_vertex_col)
     libcudf.cudf.check_gdf_error(err)
 
-    degree_col = cudf.Series(np.zeros(n, dtype=np.int32))
+    degree_col = cudf.Series(np.zeros(n, dtype=dtype))
     cdef gdf_column c_degree_col = get_gdf_column_view(degree_col)
     err = gdf_degree(g, &c_degree_col, <int>x)
     libcudf.cudf.check_gdf_error(err)
@@ -348,8 +401,9 @@ def _degrees(graph_ptr):
 
     err = gdf_add_adj_list(g)
     n = number_of_vertices(graph_ptr)
+    dtype = _index_dtype(g)
 
-    vertex_col = cudf.Series(np.zeros(n, dtype=np.int32))
+    vertex_col = cudf.Series(np.zeros(n, dtype=dtype))
     c_vertex_col = get_gdf_column_view(vertex_col)
     if g.adjList:
         err = g.adjList.get_vertex_identifiers(&c_vertex_col)
@@ -357,12 +411,12 @@ def _degrees(graph_ptr):
         err = g.transposedAdjList.get_vertex_identifiers(&c_vertex_col)
     libcudf.cudf.check_gdf_error(err)
 
-    in_degree_col = cudf.Series(np.zeros(n, dtype=np.int32))
+    in_degree_col = cudf.Series(np.zeros(n, dtype=dtype))
     cdef gdf_column c_in_degree_col = get_gdf_column_view(in_degree_col)
     err = gdf_degree(g, &c_in_degree_col, <int>1)
     libcudf.cudf.check_gdf_error(err)
 
-    out_degree_col = cudf.Series(np.zeros(n, dtype=np.int32))
+    out_degree_col = cudf.Series(np.zeros(n, dtype=dtype))
     cdef gdf_column c_out_degree_col = get_gdf_column_view(out_degree_col)
     err = gdf_degree(g, &c_out_degree_col, <int>2)
     libcudf.cudf.check_gdf_error(err)
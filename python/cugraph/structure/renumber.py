@@ -11,8 +11,12 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from cugraph.structure import graph_wrapper
-from cugraph.structure.graph import null_check
+from cugraph.structure import graph_host
+from cugraph.structure.graph import null_check, is_device_column
+try:
+    from cugraph.structure import graph_wrapper
+except ImportError:
+    graph_wrapper = None
 
 
 def renumber(source_col, dest_col):
@@ -28,7 +32,14 @@ def renumber(source_col, dest_col):
 
     Return from this call will be three cudf Series - the renumbered
     source_col, the renumbered dest_col and a numbering map that maps the new
-    ids to the original ids.
+    ids to the original ids. If the input columns are host columns (pandas
+    Series or NumPy arrays), the renumbering is computed on the host and three
+    pandas Series are returned; the renumbered ids are then int32 if there
+    are at most 2^31-1 unique values and int64 otherwise.
+
+    The renumbering is one-shot. To renumber further batches of edges
+    against the same ids, or to map results back to the original ids, use a
+    cugraph.VertexDictionary (which can be created from numbering_map).
 
     Parameters
     ----------
@@ -59,7 +70,11 @@ def renumber(source_col, dest_col):
     null_check(source_col)
     null_check(dest_col)
 
-    source_col, dest_col, numbering_map = graph_wrapper.renumber(source_col,
-                                                                 dest_col)
+    if is_device_column(source_col):
+        wrapper = graph_wrapper
+    else:
+        wrapper = graph_host
+    source_col, dest_col, numbering_map = wrapper.renumber(source_col,
+                                                           dest_col)
 
     return source_col, dest_col, numbering_map
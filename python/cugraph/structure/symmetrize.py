@@ -11,8 +11,12 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from cugraph.structure.graph import null_check
-import cudf
+from cugraph.structure.graph import null_check, is_device_column
+import pandas as pd
+try:
+    import cudf
+except ImportError:
+    cudf = None
 
 
 def symmetrize_df(df, src_name, dst_name):
@@ -29,6 +33,9 @@ def symmetrize_df(df, src_name, dst_name):
     data will contain both (u,v,data) and (v,u,data) with matching
     data.
 
+    If df is a pandas.DataFrame, the symmetrization is computed on the host
+    and a pandas.DataFrame is returned.
+
     If (u,v,data1) and (v,u,data2) exist in the input data where data1
     != data2 then this code will arbitrarily pick the smaller data
     element to keep, if this is not desired then the caller should
@@ -53,6 +60,9 @@ def symmetrize_df(df, src_name, dst_name):
     >>> G = cugraph.Graph()
     >>> G.add_edge_list(sym_df['0]', sym_df['1'], sym_df['2'])
     """
+    if isinstance(df, pd.DataFrame):
+        return _symmetrize_host_df(df, src_name, dst_name)
+
     gdf = cudf.DataFrame()
 
     #
@@ -90,6 +100,16 @@ def symmetrize_df(df, src_name, dst_name):
         return gdf.drop_duplicates(subset=[src_name, dst_name], keep='first')
 
 
+def _symmetrize_host_df(df, src_name, dst_name):
+    reverse_df = df.rename(columns={src_name: dst_name, dst_name: src_name})
+    pdf = pd.concat([df, reverse_df[df.columns]], ignore_index=True)
+
+    if len(df.columns) > 2:
+        return pdf.groupby(by=[src_name, dst_name], as_index=False).min()
+    else:
+        return pdf.drop_duplicates(subset=[src_name, dst_name], keep='first')
+
+
 def symmetrize(source_col, dest_col, value_col=None):
     """
     Take a COO set of source destination pairs along with associated values and
@@ -100,6 +120,8 @@ def symmetrize(source_col, dest_col, value_col=None):
     symmetrized source column and the symmetrized dest column, along with
     an optional cudf Series containing the associated values (only if the
     values are passed in).
+    If the input columns are host columns (pandas Series or NumPy arrays),
+    pandas Series are returned.
 
     Parameters
     ----------
@@ -131,12 +153,19 @@ def symmetrize(source_col, dest_col, value_col=None):
     null_check(source_col)
     null_check(dest_col)
 
-    input_df = cudf.DataFrame([('source', source_col),
-                               ('destination', dest_col)])
+    if is_device_column(source_col):
+        input_df = cudf.DataFrame([('source', source_col),
+                                   ('destination', dest_col)])
+    else:
+        input_df = pd.DataFrame({'source': source_col,
+                                 'destination': dest_col})
 
     if value_col is not None:
         null_check(value_col)
-        input_df.add_column('value', value_col)
+        if is_device_column(source_col):
+            input_df.add_column('value', value_col)
+        else:
+            input_df['value'] = value_col
 
     output_df = symmetrize_df(input_df, 'source', 'destination')
 
@@ -0,0 +1,300 @@
+# Copyright (c) 2019, NVIDIA CORPORATION.
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from cugraph.structure import graph_host
+from cugraph.structure.graph import null_check
+import numpy as np
+import pandas as pd
+from pandas.api.extensions import take
+try:
+    import cudf
+except ImportError:
+    cudf = None
+
+
+def _is_device(obj):
+    return cudf is not None and isinstance(obj, (cudf.Series,
+                                                 cudf.DataFrame))
+
+
+def _to_pandas(obj):
+    if hasattr(obj, 'to_pandas'):
+        return obj.to_pandas()
+    if isinstance(obj, (pd.Series, pd.DataFrame)):
+        return obj
+    return pd.Series(np.asarray(obj))
+
+
+class VertexDictionary:
+    """
+    Persistent mapping between external vertex ids and the dense vertex ids
+    (0 to V-1) used by cuGraph.
+
+    Unlike cugraph.renumber, which renumbers one set of edges, a
+    VertexDictionary keeps its hash table of external ids: new batches of
+    edges are encoded against the same dictionary (unknown ids get the next
+    free vertex ids, known ids keep theirs) and algorithm results are decoded
+    back to external ids. External ids can be integers, strings or tuples of
+    several columns (multi-column keys, passed as DataFrames).
+
+    The dictionary is kept in host memory; device inputs (cudf.Series or
+    cudf.DataFrame) are copied to the host and encoded or decoded results
+    are returned as cudf objects.
+
+    Parameters
+    ----------
+    numbering_map : cudf.Series, pandas.Series or DataFrame, optional
+        External ids of the vertices 0 to V-1, for instance the numbering map
+        returned by cugraph.renumber. A DataFrame defines multi-column keys.
+
+    Examples
+    --------
+    >>> M = cudf.read_csv('datasets/karate.csv', delimiter=' ',
+    >>>                   dtype=['int32', 'int32', 'float32'], header=None)
+    >>> vd = cugraph.VertexDictionary()
+    >>> src, dst = vd.encode(M['0'], M['1'])
+    >>> G = cugraph.Graph()
+    >>> G.add_edge_list(src, dst)
+    >>> df = vd.decode(cugraph.pagerank(G), columns=['vertex'])
+    """
+    def __init__(self, numbering_map=None):
+        # Key column names, None for single column keys
+        self.names = None
+        # Key frames of the successive batches of new ids, concatenated when
+        # the whole numbering map is needed
+        self._chunks = []
+        # Hash table of the external ids (tuples for multi-column keys),
+        # only the new ids of a batch are inserted
+        self._index = {}
+        if numbering_map is not None:
+            keys = self._key_frame(numbering_map)
+            if keys.duplicated().any():
+                raise ValueError('numbering_map contains duplicate ids')
+            self._append(keys)
+
+    def __len__(self):
+        return len(self._index)
+
+    @property
+    def _keys(self):
+        if not self._chunks:
+            return None
+        if len(self._chunks) > 1:
+            self._chunks = [pd.concat(self._chunks, ignore_index=True)]
+        return self._chunks[0]
+
+    @property
+    def numbering_map(self):
+        """
+        External ids of the vertices 0 to V-1, as a pandas Series (or a
+        pandas DataFrame for multi-column keys).
+        """
+        if self._keys is None:
+            return pd.Series(dtype=np.int64)
+        if self.names is None:
+            return self._keys[0].rename(None).copy()
+        return self._keys.copy()
+
+    def _key_frame(self, obj):
+        obj = _to_pandas(obj)
+        if isinstance(obj, pd.DataFrame):
+            names = list(obj.columns)
+            if not self._chunks:
+                self.names = names
+            elif self.names is None or len(names) != len(self.names):
+                raise ValueError('expected %s key column(s), got %d' %
+                                 (1 if self.names is None
+                                  else len(self.names), len(names)))
+            keys = pd.DataFrame({i: obj[c].to_numpy()
+                                 for i, c in enumerate(names)})
+        else:
+            if self.names is not None:
+                raise ValueError('expected %d key columns, got 1' %
+                                 len(self.names))
+            keys = pd.DataFrame({0: obj.to_numpy()})
+        for i in keys.columns:
+            null_check(keys[i])
+        return keys
+
+    def _hashable(self, keys):
+        # The keys as Python objects, tuples for multi-column keys
+        if self.names is None:
+            return keys[0].tolist()
+        return list(zip(*[keys[i].tolist() for i in keys.columns]))
+
+    def _lookup(self, keys):
+        get = self._index.get
+        return np.fromiter((get(k, -1) for k in self._hashable(keys)),
+                           dtype=np.int64, count=len(keys))
+
+    def _append(self, keys):
+        start = len(self)
+        self._index.update(zip(self._hashable(keys),
+                               range(start, start + len(keys))))
+        self._chunks.append(keys.reset_index(drop=True))
+
+    def encode(self, source_col, dest_col=None, add=True):
+        """
+        Map external ids to vertex ids. External ids missing from the
+        dictionary are added (in order of first appearance) if add is True,
+        or mapped to -1 otherwise.
+
+        Parameters
+        ----------
+        source_col : cudf.Series, pandas.Series, DataFrame or array-like
+            External source ids of a batch of edges (or any set of vertices).
+            Multi-column keys are passed as a DataFrame with one column per
+            key column.
+        dest_col : same type as source_col, optional
+            External destination ids of the batch of edges.
+        add : bool, optional
+            Add missing ids to the dictionary, True by default.
+
+        Returns
+        -------
+        source_col : cudf.Series or pandas.Series
+            Vertex ids of source_col. The ids are int32 if the dictionary
+            holds at most 2^31-1 vertices and int64 otherwise.
+        dest_col : cudf.Series or pandas.Series
+            Vertex ids of dest_col, only returned if dest_col is set.
+
+        Examples
+        --------
+        >>> vd = cugraph.VertexDictionary()
+        >>> src, dst = vd.encode(M['0'], M['1'])
+        >>> new_src, new_dst = vd.encode(N['0'], N['1'])
+        """
+        cols = [source_col] if dest_col is None else [source_col, dest_col]
+        frames = [self._key_frame(col) for col in cols]
+        keys = pd.concat(frames, ignore_index=True)
+
+        codes = self._lookup(keys)
+        missing = codes == -1
+        if add and missing.any():
+            self._append(keys[missing].drop_duplicates())
+            codes[missing] = self._lookup(keys[missing])
+        codes = codes.astype(graph_host.index_dtype(len(self)))
+
+        results = []
+        start = 0
+        for col, frame in zip(cols, frames):
+            result = pd.Series(codes[start:start + len(frame)])
+            start += len(frame)
+            if _is_device(col):
+                result = cudf.Series(result.to_numpy())
+            results.append(result)
+
+        if dest_col is None:
+            return results[0]
+        return tuple(results)
+
+    def decode(self, df, columns=['vertex']):
+        """
+        Return a copy of df with the vertex ids in the given columns replaced
+        by their external ids. Negative vertex ids (such as the -1
+        predecessor of unreachable vertices) are decoded to nulls. For
+        multi-column keys each column c is replaced by one column per key
+        column, named c + '_' + the name of the key column.
+
+        Parameters
+        ----------
+        df : cudf.DataFrame or pandas.DataFrame
+            A result of a cuGraph algorithm, or any DataFrame of vertex ids.
+        columns : list of strings, optional
+            Columns of df holding vertex ids, ['vertex'] by default.
+
+        Returns
+        -------
+        df : cudf.DataFrame or pandas.DataFrame
+
+        Examples
+        --------
+        >>> df = cugraph.bfs(G, vd.encode([start])[0])
+        >>> df = vd.decode(df, columns=['vertex', 'predecessor'])
+        """
+        device = _is_device(df)
+        result = _to_pandas(df).copy()
+        keys = self._keys
+        if keys is None:
+            keys = pd.DataFrame({0: np.empty(0, dtype=np.int64)})
+
+        for c in columns:
+            codes = graph_host.to_host_array(result[c]).astype(np.int64)
+            if len(codes) and codes.max() >= len(self):
+                raise ValueError('%s holds vertex ids missing from the '
+                                 'dictionary' % c)
+            codes[codes < 0] = -1
+            decoded = [take(keys[i].to_numpy(), codes, allow_fill=True)
+                       for i in keys.columns]
+
+            if self.names is None:
+                result[c] = decoded[0]
+            else:
+                position = result.columns.get_loc(c)
+                result = result.drop(columns=[c])
+                for name, values in zip(self.names, decoded):
+                    result.insert(position, '%s_%s' % (c, name), values)
+                    position += 1
+
+        if device:
+            result = cudf.DataFrame.from_pandas(result)
+        return result
+
+    def save(self, path):
+        """
+        Save the dictionary to path (in NumPy's .npz format). String keys are
+        saved as fixed-width unicode arrays.
+        """
+        arrays = {}
+        if self._keys is not None:
+            for i in self._keys.columns:
+                keys = self._keys[i]
+                if keys.dtype.kind in 'biuf':
+                    arrays['key_%d' % i] = keys.to_numpy()
+                else:
+                    if not keys.map(lambda k: isinstance(k, str)).all():
+                        raise TypeError('only integer, floating point and '
+                                        'string keys can be saved')
+                    arrays['key_%d' % i] = keys.to_numpy().astype(str)
+        if self.names is not None:
+            arrays['names'] = np.array([str(n) for n in self.names])
+            arrays['names_are_int'] = np.array(
+                [isinstance(n, (int, np.integer)) for n in self.names])
+        with open(path, 'wb') as f:
+            np.savez(f, **arrays)
+
+    @classmethod
+    def load(cls, path):
+        """
+        Load a dictionary saved with VertexDictionary.save.
+
+        Examples
+        --------
+        >>> vd.save('karate.vdict')
+        >>> vd = cugraph.VertexDictionary.load('karate.vdict')
+        """
+        vd = cls()
+        with np.load(path, allow_pickle=False) as data:
+            num_keys = len([k for k in data.files if k.startswith('key_')])
+            keys = {}
+            for i in range(num_keys):
+                key = data['key_%d' % i]
+                keys[i] = key.astype(object) if key.dtype.kind == 'U' \
+                    else key
+            if 'names' in data.files:
+                vd.names = [int(n) if is_int else n for n, is_int in
+                            zip(data['names'].tolist(),
+                                data['names_are_int'].tolist())]
+        if num_keys:
+            vd._append(pd.DataFrame(keys))
+        return vd
@@ -0,0 +1,92 @@
+# Copyright (c) 2019, NVIDIA CORPORATION.
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import gc
+
+import numpy as np
+import pandas as pd
+import pytest
+from dask.distributed import Client, LocalCluster
+import dask.dataframe as dd
+
+import cugraph
+import cugraph.dask
+
+
+@pytest.fixture(scope='module')
+def client():
+    cluster = LocalCluster(n_workers=3, threads_per_worker=1,
+                           processes=True)
+    client = Client(cluster)
+    yield client
+    client.close()
+    cluster.close()
+
+
+@pytest.mark.parametrize('graph_file', ['../datasets/karate.csv',
+                                        '../datasets/netscience.csv'])
+def test_distributed_graph(client, graph_file):
+    gc.collect()
+    df = pd.read_csv(graph_file, delimiter=' ',
+                     names=['src', 'dst', 'value'],
+                     dtype={'src': 'int32', 'dst': 'int32',
+                            'value': 'float32'})
+    dg = cugraph.dask.DistributedGraph(dd.from_pandas(df, npartitions=4))
+    G = cugraph.Graph(backend='host')
+    G.add_edge_list(df['src'], df['dst'])
+
+    assert dg.number_of_vertices() == G.number_of_vertices()
+    assert dg.number_of_edges() == G.number_of_edges()
+
+    for method in ['degree', 'in_degree', 'out_degree']:
+        result = getattr(dg, method)().compute().reset_index(drop=True)
+        expected = getattr(G, method)()
+        assert (result['vertex'].to_numpy() ==
+                expected['vertex'].to_numpy()).all()
+        assert (result['degree'].to_numpy() ==
+                expected['degree'].to_numpy()).all()
+
+    result = dg.bfs(1).compute().reset_index(drop=True)
+    expected = cugraph.bfs(G, 1)
+    assert (result['distance'].to_numpy() ==
+            expected['distance'].to_numpy()).all()
+    # Any predecessor one level closer to the start is valid
+    distance = result['distance'].to_numpy()
+    predecessor = result['predecessor'].to_numpy()
+    reached = (predecessor >= 0)
+    assert (distance[predecessor[reached]] == distance[reached] - 1).all()
+
+    result = dg.weakly_connected_components().compute()
+    expected = cugraph.weakly_connected_components(G)
+    result = result.sort_values('vertices')['labels'].to_numpy()
+    expected = expected.sort_values('vertices')['labels'].to_numpy()
+    # Same partition of the vertices into components
+    pairs = np.unique(np.stack([result, expected]), axis=1)
+    assert len(np.unique(pairs[0])) == len(np.unique(pairs[1])) == \
+        pairs.shape[1]
+
+    # The partitions stay resident: pagerank reuses them
+    result = dg.pagerank(tol=1.0e-6).compute().reset_index(drop=True)
+    expected = cugraph.pagerank(G, tol=1.0e-6)
+    assert np.allclose(result['pagerank'].to_numpy(),
+                       expected['pagerank'].to_numpy(), atol=1.0e-6)
+
+    result, stats = dg.pagerank(tol=1.0e-6, return_stats=True)
+    _, expected_stats = cugraph.pagerank(G, tol=1.0e-6, return_stats=True)
+    assert stats.converged and not stats.stopped
+    assert stats.iterations == expected_stats.iterations
+    assert np.allclose(stats.residuals, expected_stats.residuals)
+    result, stats = dg.pagerank(tol=1.0e-6, callback=lambda i, r: i == 2,
+                                return_stats=True)
+    assert stats.iterations == 2 and stats.stopped and not stats.converged
+    assert len(result.compute()) == G.number_of_vertices()
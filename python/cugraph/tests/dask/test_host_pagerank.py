@@ -0,0 +1,58 @@
+# Copyright (c) 2019, NVIDIA CORPORATION.
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import gc
+
+import numpy as np
+import pandas as pd
+import pytest
+from dask.distributed import Client, LocalCluster
+import dask.dataframe as dd
+
+import cugraph
+import cugraph.dask.pagerank as dcg
+
+
+@pytest.fixture(scope='module')
+def client():
+    # CPU workers in separate processes, as on a multi-host cluster
+    cluster = LocalCluster(n_workers=3, threads_per_worker=1,
+                           processes=True)
+    client = Client(cluster)
+    yield client
+    client.close()
+    cluster.close()
+
+
+@pytest.mark.parametrize('graph_file', ['../datasets/karate.csv',
+                                        '../datasets/netscience.csv'])
+def test_host_pagerank(client, graph_file):
+    gc.collect()
+    df = pd.read_csv(graph_file, delimiter=' ',
+                     names=['src', 'dst', 'value'],
+                     dtype={'src': 'int32', 'dst': 'int32',
+                            'value': 'float32'})
+    ddf = dd.from_pandas(df, npartitions=4)
+
+    pr = dcg.pagerank(ddf, alpha=0.85, max_iter=100, tol=1.0e-6)
+    assert pr.npartitions == 3
+    pr = pr.compute().reset_index(drop=True)
+
+    G = cugraph.Graph(backend='host')
+    G.add_edge_list(df['src'], df['dst'])
+    expected = cugraph.pagerank(G, alpha=0.85, max_iter=100, tol=1.0e-6)
+
+    assert len(pr) == len(expected)
+    assert (pr['vertex'].to_numpy() == np.arange(len(pr))).all()
+    assert np.allclose(pr['pagerank'].to_numpy(),
+                       expected['pagerank'].to_numpy(), atol=1.0e-6)
@@ -0,0 +1,100 @@
+# Copyright (c) 2019, NVIDIA CORPORATION.
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import numpy as np
+import pandas as pd
+import pytest
+import dask.dataframe as dd
+
+import cugraph.dask
+
+
+def _edges(graph_file):
+    return pd.read_csv(graph_file, delimiter=' ',
+                       names=['src', 'dst', 'value'],
+                       dtype={'src': 'int32', 'dst': 'int32',
+                              'value': 'float32'})
+
+
+def _check_stats(df, parts, stats):
+    assert len(parts) == len(stats.edges)
+    assert sum(len(p) for p in parts) == len(df)
+    assert [len(p) for p in parts] == stats.edges.tolist()
+    assert [len(np.unique(np.concatenate([p['src'], p['dst']])))
+            for p in parts] == stats.vertices.tolist()
+    num_verts = len(np.unique(np.concatenate([df['src'], df['dst']])))
+    assert np.isclose(stats.replication_factor,
+                      stats.vertices.sum() / num_verts)
+    assert stats.replication_factor >= 1.0
+    assert stats.imbalance >= 1.0
+
+
+@pytest.mark.parametrize('graph_file', ['../datasets/karate.csv',
+                                        '../datasets/netscience.csv'])
+@pytest.mark.parametrize('by', ['src', 'dst'])
+def test_partition_1d(graph_file, by):
+    df = _edges(graph_file)
+    ddf, stats = cugraph.dask.partition_1d(dd.from_pandas(df, npartitions=3),
+                                           4, by=by)
+    assert ddf.npartitions == 4
+    parts = [ddf.get_partition(i).compute() for i in range(4)]
+    _check_stats(df, parts, stats)
+
+    bounds = stats.bounds
+    for i, p in enumerate(parts):
+        assert (p[by] >= bounds[i]).all() and (p[by] < bounds[i + 1]).all()
+    owner = np.searchsorted(bounds, df[['src', 'dst']].to_numpy(),
+                            side='right') - 1
+    assert stats.edge_cut == (owner[:, 0] != owner[:, 1]).sum()
+    # Vertex ranges of equal edge counts
+    assert stats.imbalance < 1.2
+
+
+def test_partition_2d():
+    df = _edges('../datasets/netscience.csv')
+    ddf, stats = cugraph.dask.partition_2d(dd.from_pandas(df, npartitions=3),
+                                           6)
+    parts = [ddf.get_partition(i).compute() for i in range(6)]
+    _check_stats(df, parts, stats)
+    assert stats.edge_cut is None
+
+    row_bounds, col_bounds = stats.bounds
+    assert len(row_bounds) == 3 and len(col_bounds) == 4
+    for i, p in enumerate(parts):
+        r, c = divmod(i, 3)
+        assert (p['src'] >= row_bounds[r]).all()
+        assert (p['src'] < row_bounds[r + 1]).all()
+        assert (p['dst'] >= col_bounds[c]).all()
+        assert (p['dst'] < col_bounds[c + 1]).all()
+
+    with pytest.raises(ValueError):
+        cugraph.dask.partition_2d(dd.from_pandas(df, npartitions=3), 6,
+                                  shape=(4, 2))
+
+
+@pytest.mark.parametrize('by', ['src', 'dst', 'edge'])
+def test_partition_hash(by):
+    df = _edges('../datasets/netscience.csv')
+    ddf, stats = cugraph.dask.partition_hash(
+        dd.from_pandas(df, npartitions=3), 4, by=by)
+    parts = [ddf.get_partition(i).compute() for i in range(4)]
+    _check_stats(df, parts, stats)
+    if by == 'edge':
+        assert stats.edge_cut is None
+    else:
+        # Every vertex is owned by a single partition
+        owned = [set(p[by]) for p in parts]
+        for i in range(4):
+            for j in range(i + 1, 4):
+                assert not owned[i] & owned[j]
+        assert 0 < stats.edge_cut <= len(df)
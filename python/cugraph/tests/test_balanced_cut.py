@@ -17,11 +17,16 @@ import random
 
 import pytest
 
-import cudf
+try:
+    import cudf
+    import rmm
+    from rmm import rmm_config
+except ImportError:
+    cudf = None
+    rmm = None
+    rmm_config = None
 import cugraph
 from cugraph.tests import utils
-import rmm
-from rmm import rmm_config
 
 
 def cugraph_call(G, partitions):
@@ -50,6 +55,7 @@ PARTITIONS = [2, 4, 8]
 
 
 # Test all combinations of default/managed and pooled/non-pooled allocation
+@utils.requires_device
 @pytest.mark.parametrize('managed, pool',
                          list(product([False, True], [False, True])))
 @pytest.mark.parametrize('graph_file', DATASETS)
@@ -97,6 +103,7 @@ def test_modularity_clustering(managed, pool, graph_file, partitions):
     assert cu_score < rand_score
 
 
+@utils.requires_device
 @pytest.mark.parametrize('graph_file', DATASETS)
 @pytest.mark.parametrize('partitions', PARTITIONS)
 def test_modularity_clustering_with_edgevals(graph_file, partitions):
@@ -135,3 +142,29 @@ def test_modularity_clustering_with_edgevals(graph_file, partitions):
     # Assert that the partitioning has better modularity than the random
     # assignment
     assert cu_score < rand_score
+
+
+@pytest.mark.parametrize('graph_file', DATASETS)
+@pytest.mark.parametrize('backend', utils.BACKENDS)
+def test_balanced_cut_backend(graph_file, backend):
+    G = utils.read_graph(graph_file, backend, edgevals=True)
+
+    df = cugraph.spectralBalancedCutClustering(G, 2)
+    assert df['cluster'].nunique() <= 2
+    edge_cut = cugraph.analyzeClustering_edge_cut(G, 2, df['cluster'])
+    assert edge_cut >= 0
+
+
+@pytest.mark.parametrize('graph_file', DATASETS)
+def test_spectral_clustering_stats(graph_file):
+    G = utils.read_graph(graph_file, edgevals=True)
+
+    df, stats = cugraph.spectralBalancedCutClustering(G, 3,
+                                                      return_stats=True)
+    assert stats.counters['eigensolver_matvecs'] > 0
+    assert list(stats.times) == ['csr_build', 'eigensolver', 'kmeans',
+                                 'output']
+    df, stats = cugraph.spectralModularityMaximizationClustering(
+        G, 3, callback=lambda i, r: True, return_stats=True)
+    assert stats.iterations <= 1
+    assert len(df) == G.number_of_vertices()
@@ -19,8 +19,12 @@ import pytest
 
 import cugraph
 from cugraph.tests import utils
-import rmm
-from rmm import rmm_config
+try:
+    import rmm
+    from rmm import rmm_config
+except ImportError:
+    rmm = None
+    rmm_config = None
 
 # Temporarily suppress warnings till networkX fixes deprecation warnings
 # (Using or importing the ABCs from 'collections' instead of from
@@ -152,6 +156,7 @@ def get_uniq_counts(lst):
 
 
 # Test all combinations of default/managed and pooled/non-pooled allocation
+@utils.requires_device
 @pytest.mark.parametrize('managed, pool',
                          list(product([False, True], [False, True])))
 @pytest.mark.parametrize('graph_file', DATASETS)
@@ -192,6 +197,7 @@ def test_weak_cc(managed, pool, graph_file):
 
 
 # Test all combinations of default/managed and pooled/non-pooled allocation
+@utils.requires_device
 @pytest.mark.parametrize('managed, pool',
                          list(product([False, True], [False, True])))
 @pytest.mark.parametrize('graph_file', STRONGDATASETS)
@@ -229,3 +235,25 @@ def test_strong_cc(managed, pool, graph_file):
     lst_cg_components_lens = sorted(get_uniq_counts(cugraph_labels))
 
     assert lst_nx_components_lens == lst_cg_components_lens
+
+
+@pytest.mark.parametrize('graph_file', DATASETS)
+@pytest.mark.parametrize('backend', utils.BACKENDS)
+def test_weak_cc_backend(graph_file, backend):
+    G = utils.read_graph(graph_file, backend)
+    Gnx = utils.networkx_graph(graph_file)
+
+    df = cugraph.weakly_connected_components(G)
+    assert df['labels'].nunique() == \
+        nx.number_weakly_connected_components(Gnx)
+
+
+@pytest.mark.parametrize('graph_file', STRONGDATASETS)
+@pytest.mark.parametrize('backend', utils.BACKENDS)
+def test_strong_cc_backend(graph_file, backend):
+    G = utils.read_graph(graph_file, backend)
+    Gnx = utils.networkx_graph(graph_file)
+
+    df = cugraph.strongly_connected_components(G)
+    assert df['labels'].nunique() == \
+        nx.number_strongly_connected_components(Gnx)
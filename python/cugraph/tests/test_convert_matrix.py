@@ -0,0 +1,101 @@
+# Copyright (c) 2019, NVIDIA CORPORATION.
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+import struct
+
+import numpy as np
+import pytest
+
+import cugraph
+from cugraph.tests import utils
+
+
+DATASETS = ['../datasets/dolphins.csv',
+            '../datasets/karate.csv',
+            '../datasets/netscience.csv']
+
+
+@pytest.mark.parametrize('graph_file', DATASETS)
+@pytest.mark.parametrize('chunksize', [10, 1000, 100000])
+def test_read_edgelist(graph_file, chunksize, tmpdir):
+    M = utils.read_csv_for_nx(graph_file).tocsr()
+
+    G = cugraph.read_edgelist(graph_file, chunksize=chunksize, weighted=True,
+                              backend='host')
+    offsets, indices, values = G.view_adj_list()
+    assert np.array_equal(offsets, M.indptr)
+    assert np.array_equal(indices, M.indices)
+    assert np.array_equal(values, M.data.astype(np.float32))
+
+    # Packed binary records
+    coo = M.tocoo()
+    records = np.empty(len(coo.row), dtype=[('source', '<i4'),
+                                            ('target', '<i4')])
+    records['source'] = coo.row
+    records['target'] = coo.col
+    path = str(tmpdir.join('edges.bin'))
+    records.tofile(path)
+    G = cugraph.read_edgelist(path, chunksize=chunksize, file_type='binary',
+                              backend='host')
+    offsets, indices, values = G.view_adj_list()
+    assert np.array_equal(offsets, M.indptr)
+    assert np.array_equal(indices, M.indices)
+    assert values is None
+
+
+@pytest.mark.parametrize('graph_file', DATASETS)
+@pytest.mark.parametrize('mmap', [True, False])
+def test_save_load(graph_file, mmap, tmpdir):
+    M = utils.read_csv_file_host(graph_file)
+    G = utils.read_graph(graph_file, edgevals=True)
+    renumber_map = np.arange(G.number_of_vertices(), dtype=np.int64) * 10
+    path = str(tmpdir.join('graph.cugraph'))
+    G.save(path, renumber_map=renumber_map)
+
+    # Header and arrays are page-aligned
+    assert os.path.getsize(path) % 4096 == 0
+
+    G2 = cugraph.load(path, mmap=mmap, backend='host')
+    offsets, indices, values = G.view_adj_list()
+    offsets2, indices2, values2 = G2.view_adj_list()
+    # Memory maps of the file are read-only
+    assert offsets2.flags.writeable != mmap
+    assert np.array_equal(offsets, offsets2)
+    assert np.array_equal(indices, indices2)
+    assert np.array_equal(values, values2)
+    assert np.array_equal(G2.renumber_map, renumber_map)
+    assert G2.number_of_edges() == len(M)
+
+    # Algorithms run on the read-only memory maps
+    df = cugraph.pagerank(G)
+    df2 = cugraph.pagerank(G2)
+    assert np.array_equal(df['pagerank'], df2['pagerank'])
+    df = cugraph.bfs(G2, 0)
+    assert len(df) == G2.number_of_vertices()
+
+
+def test_load_errors(tmpdir):
+    path = str(tmpdir.join('graph.cugraph'))
+    with open(path, 'wb') as f:
+        f.write(b'src dst\n0 1\n')
+    with pytest.raises(ValueError):
+        cugraph.load(path, backend='host')
+
+    G = utils.read_graph('../datasets/karate.csv')
+    G.save(path)
+    with open(path, 'r+b') as f:
+        f.seek(8)
+        f.write(struct.pack('<I', 1000))
+    with pytest.raises(ValueError):
+        cugraph.load(path, backend='host')
@@ -19,8 +19,12 @@ import pytest
 import pandas as pd
 import cugraph
 from cugraph.tests import utils
-import rmm
-from rmm import rmm_config
+try:
+    import rmm
+    from rmm import rmm_config
+except ImportError:
+    rmm = None
+    rmm_config = None
 
 # Temporarily suppress warnings till networkX fixes deprecation warnings
 # (Using or importing the ABCs from 'collections' instead of from
@@ -57,6 +61,7 @@ DATASETS = ['../datasets/dolphins.csv',
             '../datasets/netscience.csv']
 
 
+@utils.requires_device
 @pytest.mark.parametrize('managed, pool',
                          list(product([False, True], [False, True])))
 @pytest.mark.parametrize('graph_file', DATASETS)
@@ -73,3 +78,15 @@ def test_core_number(managed, pool, graph_file):
     cn = calc_core_number(graph_file)
 
     assert cn['cu_core_number'].equals(cn['nx_core_number'])
+
+
+@pytest.mark.parametrize('graph_file', DATASETS)
+@pytest.mark.parametrize('backend', utils.BACKENDS)
+def test_core_number_backend(graph_file, backend):
+    G = utils.read_graph(graph_file, backend)
+    Gnx = utils.networkx_graph(graph_file, directed=False)
+
+    df = utils.to_host(cugraph.core_number(G))
+    nx_core = nx.core_number(Gnx)
+    for v, c in zip(df['vertex'], df['core_number']):
+        assert c == nx_core[v]
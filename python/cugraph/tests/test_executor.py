@@ -0,0 +1,96 @@
+# Copyright (c) 2019, NVIDIA CORPORATION.
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+import concurrent.futures
+import queue
+import threading
+import time
+
+import numpy as np
+import pytest
+
+import cugraph
+from cugraph.tests import utils
+
+
+def test_submit():
+    G = utils.read_graph('../datasets/netscience.csv')
+    expected = cugraph.pagerank(G)
+
+    future = cugraph.submit(cugraph.pagerank, G)
+    assert np.allclose(future.result()['pagerank'], expected['pagerank'])
+
+    async def run():
+        return await cugraph.submit('pagerank', G)
+    loop = asyncio.new_event_loop()
+    try:
+        df = loop.run_until_complete(run())
+    finally:
+        loop.close()
+    assert np.allclose(df['pagerank'], expected['pagerank'])
+
+    with pytest.raises(ValueError):
+        cugraph.submit('not_an_algorithm', G)
+
+    with cugraph.GraphExecutor(max_workers=1, max_queue=0) as executor:
+        # Cancel a running solver between two iterations
+        started = threading.Event()
+        iterations = []
+
+        def slow(iteration, residual):
+            iterations.append(iteration)
+            started.set()
+            time.sleep(0.01)
+
+        future = executor.submit(cugraph.pagerank, G, tol=0.0,
+                                 max_iter=10000, callback=slow)
+        started.wait()
+        # The queue is full while pagerank runs
+        with pytest.raises(queue.Full):
+            executor.submit(cugraph.pagerank, G, block=False)
+        assert future.cancel()
+        with pytest.raises(concurrent.futures.CancelledError):
+            future.result()
+        assert future.cancelled()
+        assert len(iterations) < 10000
+
+        # The slot is released once the job is done
+        df = executor.submit(cugraph.pagerank, G, timeout=10).result()
+        assert np.allclose(df['pagerank'], expected['pagerank'])
+
+    with cugraph.GraphExecutor(max_workers=2) as executor:
+        # The jobs waiting for a busy graph do not hold a worker: the other
+        # graphs still run on the second one
+        release = threading.Event()
+        order = []
+
+        def wait(iteration, residual):
+            release.wait()
+
+        first = executor.submit(cugraph.pagerank, G, callback=wait)
+        queued = [executor.submit(cugraph.pagerank, G,
+                                  callback=lambda i, r, n=n: order.append(n))
+                  for n in range(2)]
+        G2 = utils.read_graph('../datasets/karate.csv')
+        other = executor.submit(cugraph.pagerank, G2)
+        try:
+            assert len(other.result(timeout=10)) == G2.number_of_vertices()
+            assert not any(f.done() for f in [first] + queued)
+        finally:
+            release.set()
+        for f in [first] + queued:
+            assert np.allclose(f.result(timeout=10)['pagerank'],
+                               expected['pagerank'])
+        # Jobs on the same graph run one at a time, in submission order
+        assert order == sorted(order) and set(order) == {0, 1}
@@ -0,0 +1,110 @@
+# Copyright (c) 2019, NVIDIA CORPORATION.
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import numpy as np
+import pytest
+
+import cugraph
+
+
+def _generated_edges(chunks):
+    src, dst = zip(*chunks)
+    return np.concatenate(src), np.concatenate(dst)
+
+
+@pytest.mark.parametrize('scramble', [False, True])
+def test_rmat(scramble, tmpdir):
+    src, dst = _generated_edges(cugraph.generators.rmat_edges(
+        10, seed=7, scramble=scramble, chunk_size=1))
+    assert len(src) == 16 * 2 ** 10
+    assert max(src.max(), dst.max()) < 2 ** 10
+    # The edges only depend on the seed, not on the chunk size
+    src2, dst2 = _generated_edges(cugraph.generators.rmat_edges(
+        10, seed=7, scramble=scramble, chunk_size=2 ** 20))
+    assert np.array_equal(src, src2) and np.array_equal(dst, dst2)
+    src3, _ = _generated_edges(cugraph.generators.rmat_edges(
+        10, seed=8, scramble=scramble))
+    assert not np.array_equal(src, src3)
+    # Skewed degrees, the largest being vertex 0 unless scrambled
+    degree = np.bincount(src, minlength=2 ** 10)
+    assert degree.max() > 10 * degree.mean()
+    assert (degree.argmax() == 0) != scramble
+
+    G = cugraph.generators.rmat(10, seed=7, scramble=scramble,
+                                backend='host')
+    assert G.number_of_vertices() == 2 ** 10
+    assert G.number_of_edges() == len(src)
+    assert np.array_equal(G.degrees()['out_degree'], degree)
+
+    path = str(tmpdir.join('rmat.cugraph'))
+    assert cugraph.generators.rmat(10, seed=7, scramble=scramble,
+                                   path=path) is None
+    G2 = cugraph.load(path, backend='host')
+    assert np.array_equal(G.view_adj_list()[1], G2.view_adj_list()[1])
+
+    with pytest.raises(ValueError):
+        cugraph.generators.rmat(10, a=0.5, b=0.5, c=0.5, backend='host')
+
+
+def test_kronecker():
+    initiator = [[0.9, 0.6, 0.1], [0.6, 0.4, 0.3], [0.1, 0.3, 0.2]]
+    src, dst = _generated_edges(cugraph.generators.kronecker_edges(
+        initiator, 5, seed=3))
+    assert len(src) == round(3.5 ** 5)
+    assert max(src.max(), dst.max()) < 3 ** 5
+    G = cugraph.generators.kronecker(initiator, 5, seed=3, backend='host')
+    assert G.number_of_edges() == len(src)
+    with pytest.raises(ValueError):
+        cugraph.generators.kronecker([[0.5, 0.5]], 5, backend='host')
+
+
+def test_erdos_renyi():
+    n, p = 2000, 0.01
+    src, dst = _generated_edges(cugraph.generators.erdos_renyi_edges(
+        n, p, seed=5, chunk_size=1000))
+    expected = p * n * (n - 1)
+    assert abs(len(src) - expected) < 5 * np.sqrt(expected)
+    # No self loops nor multiple edges
+    assert not (src == dst).any()
+    assert len(np.unique(src.astype(np.int64) * n + dst)) == len(src)
+    src2, dst2 = _generated_edges(cugraph.generators.erdos_renyi_edges(
+        n, p, seed=5))
+    assert np.array_equal(src, src2) and np.array_equal(dst, dst2)
+
+    src, dst = _generated_edges(cugraph.generators.erdos_renyi_edges(
+        20, 1.0))
+    assert len(src) == 20 * 19
+    G = cugraph.generators.erdos_renyi(20, 0.0, backend='host')
+    assert G.number_of_vertices() == 20 and G.number_of_edges() == 0
+
+
+def test_barabasi_albert():
+    n, m = 5000, 3
+    src, dst = _generated_edges(cugraph.generators.barabasi_albert_edges(
+        n, m, seed=11, chunk_size=1))
+    assert len(src) == m * (n - m)
+    assert (dst < src).all()
+    assert np.array_equal(np.bincount(src), [0] * m + [m] * (n - m))
+    src2, dst2 = _generated_edges(cugraph.generators.barabasi_albert_edges(
+        n, m, seed=11))
+    assert np.array_equal(dst, dst2)
+    # Preferential attachment: the earliest vertices have the largest
+    # degrees
+    degree = np.bincount(np.concatenate([src, dst]))
+    assert degree.min() >= m
+    assert degree[:10].mean() > 5 * degree.mean()
+
+    G = cugraph.generators.barabasi_albert(n, m, seed=11, backend='host')
+    assert G.number_of_edges() == len(src)
+    with pytest.raises(ValueError):
+        cugraph.generators.barabasi_albert(3, 3, backend='host')
@@ -20,12 +20,18 @@ import pytest
 
 from scipy.io import mmread
 
-import cudf
-import cudf._lib as libcudf
+try:
+    import cudf
+    import cudf._lib as libcudf
+    import rmm
+    from rmm import rmm_config
+except ImportError:
+    cudf = None
+    libcudf = None
+    rmm = None
+    rmm_config = None
 import cugraph
 from cugraph.tests import utils
-import rmm
-from rmm import rmm_config
 '''
 import socket
 import struct
@@ -193,6 +199,7 @@ def test_read_csv_for_nx(graph_file):
 
 
 # Test all combinations of default/managed and pooled/non-pooled allocation
+@utils.requires_device
 @pytest.mark.parametrize('managed, pool',
                          list(product([False, True], [False, True])))
 @pytest.mark.parametrize('graph_file', DATASETS)
@@ -230,6 +237,7 @@ def test_add_edge_list_to_adj_list(managed, pool, graph_file):
 
 
 # Test all combinations of default/managed and pooled/non-pooled allocation
+@utils.requires_device
 @pytest.mark.parametrize('managed, pool',
                          list(product([False, True], [False, True])))
 @pytest.mark.parametrize('graph_file', DATASETS)
@@ -269,6 +277,7 @@ def test_add_adj_list_to_edge_list(managed, pool, graph_file):
 
 
 # Test all combinations of default/managed and pooled/non-pooled allocation
+@utils.requires_device
 @pytest.mark.parametrize('managed, pool',
                          list(product([False, True], [False, True])))
 @pytest.mark.parametrize('graph_file', DATASETS)
@@ -297,6 +306,7 @@ def test_transpose_from_adj_list(managed, pool, graph_file):
 
 
 # Test all combinations of default/managed and pooled/non-pooled allocation
+@utils.requires_device
 @pytest.mark.parametrize('managed, pool',
                          list(product([False, True], [False, True])))
 @pytest.mark.parametrize('graph_file', DATASETS)
@@ -326,6 +336,7 @@ def test_view_edge_list_from_adj_list(managed, pool, graph_file):
 
 
 # Test all combinations of default/managed and pooled/non-pooled allocation
+@utils.requires_device
 @pytest.mark.parametrize('managed, pool',
                          list(product([False, True], [False, True])))
 @pytest.mark.parametrize('graph_file', DATASETS)
@@ -369,6 +380,7 @@ def test_delete_edge_list_delete_adj_list(managed, pool, graph_file):
 
 
 # Test all combinations of default/managed and pooled/non-pooled allocation
+@utils.requires_device
 @pytest.mark.parametrize('managed, pool',
                          list(product([False, True], [False, True])))
 @pytest.mark.parametrize('graph_file', DATASETS)
@@ -425,6 +437,7 @@ def test_add_edge_or_adj_list_after_add_edge_or_adj_list(
 
 
 # Test all combinations of default/managed and pooled/non-pooled allocation
+@utils.requires_device
 @pytest.mark.parametrize('managed, pool',
                          list(product([False, True], [False, True])))
 @pytest.mark.parametrize('graph_file', DATASETS)
@@ -484,6 +497,7 @@ DATASETS2 = ['../datasets/karate.csv',
 
 
 # Test all combinations of default/managed and pooled/non-pooled allocation
+@utils.requires_device
 @pytest.mark.parametrize('managed, pool',
                          list(product([False, True], [False, True])))
 @pytest.mark.parametrize('graph_file', DATASETS2)
@@ -513,6 +527,7 @@ def test_two_hop_neighbors(managed, pool, graph_file):
 
 
 # Test all combinations of default/managed and pooled/non-pooled allocation
+@utils.requires_device
 @pytest.mark.parametrize('managed, pool',
                          list(product([False, True], [False, True])))
 @pytest.mark.parametrize('graph_file', DATASETS)
@@ -562,6 +577,7 @@ def test_degree_functionality(managed, pool, graph_file):
 
 
 # Test all combinations of default/managed and pooled/non-pooled allocation
+@utils.requires_device
 @pytest.mark.parametrize('managed, pool',
                          list(product([False, True], [False, True])))
 @pytest.mark.parametrize('graph_file', DATASETS)
@@ -604,6 +620,18 @@ def test_degrees_functionality(managed, pool, graph_file):
     assert err_in_degree == 0
     assert err_out_degree == 0
 
+    vertex_subset = np.random.randint(0, G.number_of_vertices(), size=100,
+                                      dtype=np.int32)
+    df = G.degrees(cudf.Series(vertex_subset))
+    assert compare_series(df['vertex'], vertex_subset)
+    assert compare_series(df['in_degree'],
+                          [nx_in_degree[v] for v in vertex_subset])
+    assert compare_series(df['out_degree'],
+                          [nx_out_degree[v] for v in vertex_subset])
+
+    with pytest.raises(ValueError):
+        G.degrees([G.number_of_vertices()])
+
 
 '''
 def test_renumber():
@@ -642,6 +670,7 @@ def test_renumber():
 '''
 
 
+@utils.requires_device
 def test_renumber_negative():
     source_list = [4, 6, 8, -20, 1]
     dest_list = [1, 29, 35, 0, 77]
@@ -662,6 +691,7 @@ def test_renumber_negative():
 
 
 # Test all combinations of default/managed and pooled/non-pooled allocation
+@utils.requires_device
 @pytest.mark.parametrize('managed, pool',
                          list(product([False, True], [False, True])))
 @pytest.mark.parametrize('graph_file', DATASETS)
@@ -693,6 +723,7 @@ def test_renumber_files(managed, pool, graph_file):
 
 
 # Test all combinations of default/managed and pooled/non-pooled allocation
+@utils.requires_device
 @pytest.mark.parametrize('managed, pool',
                          list(product([False, True], [False, True])))
 @pytest.mark.parametrize('graph_file', DATASETS)
@@ -719,3 +750,261 @@ def test_number_of_vertices(managed, pool, graph_file):
     G = cugraph.Graph()
     G.add_edge_list(sources, destinations, None)
     assert(G.number_of_vertices() == M.shape[0])
+
+
+# Test all combinations of default/managed and pooled/non-pooled allocation
+@utils.requires_device
+@pytest.mark.parametrize('managed, pool',
+                         list(product([False, True], [False, True])))
+@pytest.mark.parametrize('graph_file', DATASETS)
+def test_memory_budget(managed, pool, graph_file):
+    gc.collect()
+
+    rmm.finalize()
+    rmm_config.use_managed_memory = managed
+    rmm_config.use_pool_allocator = pool
+    rmm_config.initial_pool_size = 2 << 27
+    rmm.initialize()
+
+    assert rmm.is_initialized()
+
+    cu_M = utils.read_csv_file(graph_file)
+    sources = cu_M['0']
+    destinations = cu_M['1']
+    M = utils.read_csv_for_nx(graph_file).tocsr()
+
+    # Without a budget every representation is kept
+    G = cugraph.Graph()
+    G.add_edge_list(sources, destinations, None)
+    G.view_adj_list()
+    G.view_transposed_adj_list()
+    usage = G.memory_usage()
+    assert usage['edge_list'] == 8 * len(sources)
+    assert usage['adj_list'] == 4 * (M.shape[0] + 1) + 4 * len(sources)
+    assert usage['transposed_adj_list'] > 0
+
+    # A budget fitting a single adjacency list drops the edge list and the
+    # transposed adjacency list, which are rebuilt on demand
+    G = cugraph.Graph(memory_budget=usage['adj_list'])
+    G.add_edge_list(sources, destinations, None)
+    offsets, indices, _ = G.view_adj_list()
+    assert compare_offsets(offsets, M.indptr)
+    usage = G.memory_usage()
+    assert usage['edge_list'] == 0
+    assert usage['total'] <= G.memory_budget
+
+    src, dst, _ = G.view_edge_list()
+    assert compare_series(src, M.tocoo().row)
+    assert G.memory_usage()['edge_list'] > 0
+
+
+def test_backend_selection():
+    with pytest.raises(ValueError):
+        cugraph.Graph(backend='tpu')
+
+    G = cugraph.Graph(backend='host')
+    assert G.backend == 'host'
+
+    M = utils.read_csv_file_host('../datasets/karate.csv')
+    G = cugraph.from_cudf_edgelist(M, source='0', target='1')
+    assert G.backend == 'host'
+
+
+@pytest.mark.parametrize('graph_file', DATASETS)
+@pytest.mark.parametrize('backend', utils.BACKENDS)
+def test_views_and_degree(graph_file, backend):
+    M = utils.read_csv_file_host(graph_file)
+    G = utils.read_graph(graph_file, backend, edgevals=True)
+    Gnx = utils.networkx_graph(graph_file)
+
+    offsets, indices, values = G.view_adj_list()
+    assert len(offsets) == G.number_of_vertices() + 1
+    assert len(indices) == len(M)
+    assert values.dtype == np.float32
+
+    src, dst, _ = G.view_edge_list()
+    assert len(src) == len(M)
+
+    df = utils.to_host(G.degrees())
+    for v, d_in, d_out in zip(df['vertex'], df['in_degree'],
+                              df['out_degree']):
+        assert d_in == Gnx.in_degree(v)
+        assert d_out == Gnx.out_degree(v)
+
+
+@pytest.mark.parametrize('graph_file', DATASETS)
+def test_memory_budget_host(graph_file):
+    M = utils.read_csv_file_host(graph_file)
+    num_edges = len(M)
+
+    G = utils.read_graph(graph_file)
+    G.view_adj_list()
+    G.view_transposed_adj_list()
+    usage = G.memory_usage()
+    assert usage['edge_list'] == 8 * num_edges
+    assert usage['adj_list'] == 4 * (G.number_of_vertices() + 1) + \
+        4 * num_edges
+    assert usage['total'] == sum(usage[r] for r in
+                                 ('edge_list', 'adj_list',
+                                  'transposed_adj_list'))
+
+    # Only the most recently used representation fits the budget
+    G = cugraph.Graph(backend='host', memory_budget=usage['adj_list'])
+    G.add_edge_list(M['0'], M['1'])
+    offsets, indices, _ = G.view_adj_list()
+    usage = G.memory_usage()
+    assert usage['edge_list'] == 0
+    assert usage['total'] <= G.memory_budget
+
+    # The transposed adjacency list is computed from an edge list rebuilt
+    # from the adjacency list, the edge list is released again afterwards
+    T_offsets, T_indices, _ = G.view_transposed_adj_list()
+    assert len(T_indices) == num_edges
+    usage = G.memory_usage()
+    assert usage['edge_list'] == 0
+    assert usage['adj_list'] > 0
+
+    # Released representations are rebuilt on demand
+    G.delete_adj_list()
+    offsets2, indices2, _ = G.view_adj_list()
+    assert np.array_equal(offsets, offsets2)
+    assert np.array_equal(indices, indices2)
+    usage = G.memory_usage()
+    assert usage['transposed_adj_list'] == 0
+    assert usage['total'] <= G.memory_budget
+    df = cugraph.pagerank(G)
+    assert len(df) == G.number_of_vertices()
+    # The representations built by the algorithms are released afterwards
+    assert G.memory_usage()['total'] <= G.memory_budget
+    cugraph.bfs(G, 0)
+    assert G.memory_usage()['total'] <= G.memory_budget
+
+    # The vectors cached by score_pairs count toward the budget
+    G.set_memory_budget(None)
+    G.view_adj_list()
+    pairs = G.get_two_hop_neighbors()
+    cugraph.score_pairs(G, pairs, metrics=['jaccard'])
+    usage = G.memory_usage()
+    assert usage['vertex_statistics'] > 0
+    assert usage['total'] == sum(usage[r] for r in
+                                 ('edge_list', 'adj_list',
+                                  'transposed_adj_list', 'vertex_statistics'))
+    G.set_memory_budget(usage['total'] - usage['vertex_statistics'])
+    assert G.memory_usage()['vertex_statistics'] == 0
+    assert G.memory_usage()['total'] <= G.memory_budget
+    G.set_memory_budget(usage['adj_list'])
+    cugraph.score_pairs(G, pairs, metrics=['jaccard'])
+    assert G.memory_usage()['total'] <= G.memory_budget
+    usage = G.memory_usage()
+
+    G.set_memory_budget(None)
+    G.view_edge_list()
+    G.view_transposed_adj_list()
+    assert G.memory_usage()['total'] > usage['total']
+
+
+@pytest.mark.parametrize('graph_file', DATASETS)
+def test_degree_vertex_subset(graph_file):
+    G = utils.read_graph(graph_file)
+    Gnx = utils.networkx_graph(graph_file)
+
+    vertex_subset = np.random.randint(0, G.number_of_vertices(), size=100)
+    df = G.in_degree(vertex_subset)
+    assert np.array_equal(df['vertex'], vertex_subset)
+    assert list(df['degree']) == [Gnx.in_degree(v) for v in vertex_subset]
+
+    df = G.degrees(list(vertex_subset))
+    assert list(df['out_degree']) == \
+        [Gnx.out_degree(v) for v in vertex_subset]
+    assert list(df['in_degree']) == [Gnx.in_degree(v) for v in vertex_subset]
+
+    with pytest.raises(ValueError):
+        G.degree([0, G.number_of_vertices()])
+    with pytest.raises(ValueError):
+        G.degrees([-1])
+
+
+def test_from_edge_stream():
+    src = np.array([2, 0, 1, 0, 2, 3], dtype=np.int32)
+    dst = np.array([0, 2, 2, 1, 1, 0], dtype=np.int32)
+    chunks = [(src[:4], dst[:4]), (src[4:], dst[4:])]
+
+    G = cugraph.Graph.from_edge_stream(chunks, num_vertices=5,
+                                       backend='host')
+    offsets, indices, _ = G.view_adj_list()
+    assert list(offsets) == [0, 2, 3, 5, 6, 6]
+    assert list(indices) == [1, 2, 2, 0, 1, 0]
+
+    with pytest.raises(TypeError):
+        cugraph.Graph.from_edge_stream(iter(chunks), backend='host')
+    with pytest.raises(ValueError):
+        cugraph.Graph.from_edge_stream(chunks, num_vertices=3,
+                                       backend='host')
+
+
+@pytest.mark.parametrize('graph_file', DATASETS)
+def test_two_hop_neighbors_chunks(graph_file):
+    G = utils.read_graph(graph_file)
+    df = G.get_two_hop_neighbors()
+    chunks = list(G.get_two_hop_neighbors_chunks(max_bytes=4096))
+    assert len(chunks) > 1
+    assert pd.concat(chunks, ignore_index=True).equals(df)
+    assert G.estimate_two_hop_neighbors() >= len(df)
+
+    # Skip the paths through the intermediate vertices of degree above 4
+    Gnx = utils.networkx_graph(graph_file)
+    expected = set()
+    for z in Gnx.nodes():
+        if Gnx.out_degree(z) <= 4:
+            expected.update((u, w) for u in Gnx.predecessors(z)
+                            for w in Gnx.successors(z) if u != w)
+    df = pd.concat(G.get_two_hop_neighbors_chunks(max_degree=4),
+                   ignore_index=True)
+    assert set(zip(df['first'], df['second'])) == expected
+    assert len(df) == len(expected)
+    assert G.estimate_two_hop_neighbors(max_degree=4) >= len(expected)
+
+    with pytest.raises(ValueError):
+        G.get_two_hop_neighbors_chunks(max_bytes=0)
+
+
+@pytest.mark.parametrize('graph_file', DATASETS)
+def test_int64_indices(graph_file):
+    G = utils.read_graph(graph_file, edgevals=True)
+    offsets, indices, values = G.view_adj_list()
+    # Small graphs get 32 bit offsets and indices
+    assert offsets.dtype == np.int32
+    assert indices.dtype == np.int32
+
+    G64 = cugraph.Graph(backend='host')
+    G64.add_adj_list(offsets.astype(np.int64), indices.astype(np.int64),
+                     values)
+    src, dst, _ = G64.view_edge_list()
+    assert src.dtype == np.int64
+    assert dst.dtype == np.int64
+
+    df = G.degrees()
+    df64 = G64.degrees()
+    assert np.array_equal(df['in_degree'], df64['in_degree'])
+    assert np.array_equal(df['out_degree'], df64['out_degree'])
+
+    df = cugraph.pagerank(G)
+    df64 = cugraph.pagerank(G64)
+    assert np.allclose(df['pagerank'], df64['pagerank'])
+
+    df = cugraph.bfs(G, 0)
+    df64 = cugraph.bfs(G64, 0)
+    # Result vertex ids are sized by the number of vertices
+    assert df64['predecessor'].dtype == df64['vertex'].dtype == np.int32
+    assert np.array_equal(df['distance'], df64['distance'])
+
+    df = cugraph.sssp(G, 0)
+    df64 = cugraph.sssp(G64, 0)
+    assert np.allclose(df['distance'], df64['distance'])
+
+    df = cugraph.weakly_connected_components(G)
+    df64 = cugraph.weakly_connected_components(G64)
+    assert df['labels'].nunique() == df64['labels'].nunique()
+
+    assert cugraph.structure.graph_host.index_dtype(2**31 - 1) == np.int32
+    assert cugraph.structure.graph_host.index_dtype(2**31) == np.int64
@@ -0,0 +1,107 @@
+# Copyright (c) 2019, NVIDIA CORPORATION.
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import numpy as np
+import pytest
+
+import cugraph
+from cugraph.tests import utils
+
+
+DATASETS = ['../datasets/dolphins.csv',
+            '../datasets/karate.csv',
+            '../datasets/netscience.csv']
+
+
+@pytest.mark.parametrize('graph_file', DATASETS)
+def test_incremental_pagerank(graph_file):
+    M = utils.read_csv_file_host(graph_file)
+    src = M['0'].to_numpy()
+    dst = M['1'].to_numpy()
+    rng = np.random.RandomState(0)
+    removed = rng.choice(len(M), max(1, len(M) // 100), replace=False)
+    kept = np.setdiff1d(np.arange(len(M)), removed)
+
+    G = cugraph.Graph(backend='host')
+    G.add_edge_list(src[kept], dst[kept])
+    ipr = cugraph.IncrementalPageRank(G, tol=1.0e-8, max_iter=500)
+    pr = ipr.pagerank()
+    assert np.allclose(pr['pagerank'],
+                       cugraph.pagerank(G, tol=1.0e-8,
+                                        max_iter=500)['pagerank'],
+                       atol=1.0e-6)
+    full_iterations = ipr.iterations
+
+    # Add the removed edges back (and a new vertex), remove a few others
+    new_vertex = G.number_of_vertices()
+    ipr.add_edges(np.append(src[removed], 0), np.append(dst[removed],
+                                                        new_vertex))
+    ipr.remove_edges([src[kept[0]]], [dst[kept[0]]])
+    assert ipr.number_of_vertices() == new_vertex + 1
+    pr = ipr.update()
+    assert ipr.iterations < full_iterations
+
+    G = cugraph.Graph(backend='host')
+    G.add_edge_list(np.append(src[kept[1:]], [0] + list(src[removed])),
+                    np.append(dst[kept[1:]], [new_vertex] +
+                              list(dst[removed])))
+    expected = cugraph.pagerank(G, tol=1.0e-8, max_iter=500)['pagerank']
+    assert np.allclose(pr['pagerank'], expected, atol=1.0e-6)
+
+    # Local updates only revisit the vertices reached from the changes
+    ipr.remove_edges([0], [new_vertex])
+    ipr.add_edges([0], [new_vertex])
+    pr = ipr.update(local=True)
+    assert np.allclose(pr['pagerank'], expected, atol=1.0e-5)
+
+    with pytest.raises(ValueError):
+        ipr.remove_edges([new_vertex], [0])
+
+    # Small batches only touch the pending changes, not the matrix
+    T = ipr._T
+    ipr.add_edges([0, 0], [new_vertex, new_vertex])
+    ipr.remove_edges([0, src[kept[1]]], [new_vertex, dst[kept[1]]])
+    assert ipr._T is T
+    assert ipr.number_of_edges() == len(kept) + len(removed)
+    with pytest.raises(ValueError):
+        ipr.remove_edges([0, 0, 0], [new_vertex] * 3)
+    G = cugraph.Graph(backend='host')
+    G.add_edge_list(np.append(src[kept[2:]], [0, 0] + list(src[removed])),
+                    np.append(dst[kept[2:]], [new_vertex, new_vertex] +
+                              list(dst[removed])))
+    expected = cugraph.pagerank(G, tol=1.0e-8, max_iter=500)['pagerank']
+    pr = ipr.update(local=True)
+    assert ipr._T is T
+    assert np.allclose(pr['pagerank'], expected, atol=1.0e-5)
+    pr = ipr.update()
+    assert np.allclose(pr['pagerank'], expected, atol=1.0e-6)
+
+
+@pytest.mark.parametrize('graph_file', DATASETS)
+def test_incremental_pagerank_stats(graph_file):
+    G = utils.read_graph(graph_file, edgevals=True)
+    num_verts = G.number_of_vertices()
+
+    # Incremental PageRank, full and local updates
+    ipr = cugraph.IncrementalPageRank(G, tol=1.0e-8, max_iter=500)
+    pr, stats = ipr.pagerank(return_stats=True)
+    assert stats.converged and stats.iterations == ipr.iterations
+    assert list(stats.times) == ['merge', 'iterations', 'output']
+    ipr.add_edges([0], [num_verts - 1])
+    pr, stats = ipr.update(local=True, return_stats=True)
+    assert stats.converged and stats.iterations == ipr.iterations
+    assert 0 < stats.counters['updated_vertices'] <= \
+        stats.iterations * num_verts
+    ipr.add_edges([1], [num_verts - 1])
+    pr, stats = ipr.update(callback=lambda i, r: True, return_stats=True)
+    assert stats.iterations == 1 and stats.stopped and not stats.converged
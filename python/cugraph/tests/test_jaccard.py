@@ -15,13 +15,19 @@ import gc
 from itertools import product
 import time
 
+import numpy as np
 import pytest
 
-import cudf
+try:
+    import cudf
+    import rmm
+    from rmm import rmm_config
+except ImportError:
+    cudf = None
+    rmm = None
+    rmm_config = None
 import cugraph
 from cugraph.tests import utils
-import rmm
-from rmm import rmm_config
 
 # Temporarily suppress warnings till networkX fixes deprecation warnings
 # (Using or importing the ABCs from 'collections' instead of from
@@ -105,6 +111,7 @@ DATASETS = ['../datasets/dolphins.csv',
 
 
 # Test all combinations of default/managed and pooled/non-pooled allocation
+@utils.requires_device
 @pytest.mark.parametrize('managed, pool',
                          list(product([False, True], [False, True])))
 @pytest.mark.parametrize('graph_file', DATASETS)
@@ -139,6 +146,7 @@ def test_jaccard(managed, pool, graph_file):
 
 
 # Test all combinations of default/managed and pooled/non-pooled allocation
+@utils.requires_device
 @pytest.mark.parametrize('managed, pool',
                          list(product([False, True], [False, True])))
 @pytest.mark.parametrize('graph_file', ['../datasets/netscience.csv'])
@@ -173,6 +181,7 @@ def test_jaccard_edgevals(managed, pool, graph_file):
 
 
 # Test all combinations of default/managed and pooled/non-pooled allocation
+@utils.requires_device
 @pytest.mark.parametrize('managed, pool',
                          list(product([False, True], [False, True])))
 @pytest.mark.parametrize('graph_file', DATASETS)
@@ -210,6 +219,7 @@ def test_jaccard_two_hop(managed, pool, graph_file):
 
 
 # Test all combinations of default/managed and pooled/non-pooled allocation
+@utils.requires_device
 @pytest.mark.parametrize('managed, pool',
                          list(product([False, True], [False, True])))
 @pytest.mark.parametrize('graph_file', DATASETS)
@@ -245,3 +255,15 @@ def test_jaccard_two_hop_edge_vals(managed, pool, graph_file):
     for i in range(len(df)):
         diff = abs(nx_coeff[i] - df['jaccard_coeff'][i])
         assert diff < 1.0e-6
+
+
+@pytest.mark.parametrize('graph_file', DATASETS)
+@pytest.mark.parametrize('backend', utils.BACKENDS)
+def test_jaccard_backend(graph_file, backend):
+    G = utils.read_graph(graph_file, backend)
+    Gnx = utils.networkx_graph(graph_file, directed=False)
+
+    df = utils.to_host(cugraph.jaccard(G))
+    pairs = list(zip(df['source'], df['destination']))
+    nx_coeff = [p for _, _, p in nx.jaccard_coefficient(Gnx, pairs)]
+    assert np.allclose(df['jaccard_coeff'], nx_coeff, atol=1.0e-6)
@@ -18,8 +18,12 @@ import pytest
 
 import cugraph
 from cugraph.tests import utils
-import rmm
-from rmm import rmm_config
+try:
+    import rmm
+    from rmm import rmm_config
+except ImportError:
+    rmm = None
+    rmm_config = None
 
 # Temporarily suppress warnings till networkX fixes deprecation warnings
 # (Using or importing the ABCs from 'collections' instead of from
@@ -62,6 +66,7 @@ DATASETS = ['../datasets/dolphins.csv',
             '../datasets/netscience.csv']
 
 
+@utils.requires_device
 @pytest.mark.parametrize('managed, pool',
                          list(product([False, True], [False, True])))
 @pytest.mark.parametrize('graph_file', DATASETS)
@@ -78,3 +83,16 @@ def test_core_number(managed, pool, graph_file):
     cu_kcore, nx_kcore = calc_k_cores(graph_file)
 
     assert compare_edges(cu_kcore, nx_kcore)
+
+
+@pytest.mark.parametrize('graph_file', DATASETS)
+@pytest.mark.parametrize('backend', utils.BACKENDS)
+def test_k_core_backend(graph_file, backend):
+    G = utils.read_graph(graph_file, backend)
+    Gnx = utils.networkx_graph(graph_file, directed=False)
+
+    kc = cugraph.k_core(G)
+    assert kc.backend == backend
+    src, dst, _ = kc.view_edge_list()
+    nx_kc = nx.k_core(Gnx)
+    assert len(src) == 2 * nx_kc.number_of_edges()
@@ -14,13 +14,18 @@
 import gc
 from itertools import product
 
+import numpy as np
 import pytest
 
 import pandas as pd
 import cugraph
 from cugraph.tests import utils
-import rmm
-from rmm import rmm_config
+try:
+    import rmm
+    from rmm import rmm_config
+except ImportError:
+    rmm = None
+    rmm_config = None
 
 # Temporarily suppress warnings till networkX fixes deprecation warnings
 # (Using or importing the ABCs from 'collections' instead of from
@@ -67,6 +72,7 @@ DATASETS = ['../datasets/dolphins.csv',
             '../datasets/netscience.csv']
 
 
+@utils.requires_device
 @pytest.mark.parametrize('managed, pool',
                          list(product([False, True], [False, True])))
 @pytest.mark.parametrize('graph_file', DATASETS)
@@ -86,3 +92,34 @@ def test_katz_centrality(managed, pool, graph_file):
     topKCU = topKVertices(katz_scores, 'cu_katz', 10)
 
     assert topKNX.equals(topKCU)
+
+
+@pytest.mark.parametrize('graph_file', DATASETS)
+@pytest.mark.parametrize('backend', utils.BACKENDS)
+def test_katz_centrality_backend(graph_file, backend):
+    G = utils.read_graph(graph_file, backend)
+    Gnx = utils.networkx_graph(graph_file)
+
+    largest_out_degree = utils.to_host(G.degrees())['out_degree'].max()
+    katz_alpha = 1 / (largest_out_degree + 1)
+
+    df = utils.to_host(cugraph.katz_centrality(G, katz_alpha, max_iter=1000))
+    nk = nx.katz_centrality(Gnx, alpha=katz_alpha)
+
+    expected = np.array([nk[v] for v in df['vertex']])
+    assert np.allclose(df['katz_centrality'], expected, atol=1.0e-4)
+
+
+@pytest.mark.parametrize('graph_file', DATASETS)
+def test_katz_centrality_stats(graph_file):
+    G = utils.read_graph(graph_file, edgevals=True)
+
+    df, stats = cugraph.katz_centrality(G, alpha=0.01, return_stats=True)
+    assert stats.converged and stats.iterations == len(stats.residuals)
+    # An early stop is not a convergence failure
+    df, stats = cugraph.katz_centrality(G, alpha=0.01, max_iter=2,
+                                        callback=lambda i, r: i == 2,
+                                        return_stats=True)
+    assert stats.stopped and not stats.converged
+    with pytest.raises(RuntimeError):
+        cugraph.katz_centrality(G, alpha=0.01, max_iter=2)
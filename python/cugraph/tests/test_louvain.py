@@ -15,12 +15,18 @@ import gc
 from itertools import product
 import time
 
+import numpy as np
 import pytest
+from scipy import sparse
 
 import cugraph
 from cugraph.tests import utils
-import rmm
-from rmm import rmm_config
+try:
+    import rmm
+    from rmm import rmm_config
+except ImportError:
+    rmm = None
+    rmm_config = None
 
 # Temporarily suppress warnings till networkX fixes deprecation warnings
 # (Using or importing the ABCs from 'collections' instead of from
@@ -30,12 +36,20 @@ from rmm import rmm_config
 import warnings
 with warnings.catch_warnings():
     warnings.filterwarnings("ignore", category=DeprecationWarning)
-    import community
+    try:
+        import community
+    except ImportError:
+        community = None
     import networkx as nx
 
 
 print('Networkx version : {} '.format(nx.__version__))
 
+# The reference partitions of the device tests come from python-louvain
+requires_community = pytest.mark.skipif(community is None,
+                                        reason='python-louvain is not '
+                                               'installed')
+
 
 def cugraph_call(cu_M, edgevals=False):
 
@@ -80,6 +94,8 @@ DATASETS = ['../datasets/karate.csv',
 
 
 # Test all combinations of default/managed and pooled/non-pooled allocation
+@utils.requires_device
+@requires_community
 @pytest.mark.parametrize('managed, pool',
                          list(product([False, True], [False, True])))
 @pytest.mark.parametrize('graph_file', DATASETS)
@@ -120,6 +136,8 @@ DATASETS = ['../datasets/karate.csv',
 
 
 # Test all combinations of default/managed and pooled/non-pooled allocation
+@utils.requires_device
+@requires_community
 @pytest.mark.parametrize('managed, pool',
                          list(product([False, True], [False, True])))
 @pytest.mark.parametrize('graph_file', DATASETS)
@@ -153,3 +171,93 @@ def test_louvain(managed, pool, graph_file):
     print(cu_mod_nx)
     print(nx_mod)
     assert abs(cu_mod - cu_mod_nx) < .0001
+
+
+@pytest.mark.parametrize('graph_file', DATASETS)
+@pytest.mark.parametrize('backend', utils.BACKENDS)
+def test_louvain_backend(graph_file, backend):
+    G = utils.read_graph(graph_file, backend, edgevals=True)
+    Gnx = utils.networkx_graph(graph_file, directed=False)
+
+    parts, modularity_score = cugraph.louvain(G)
+    parts = utils.to_host(parts)
+    communities = parts.groupby('partition')['vertex'].apply(list)
+    nx_modularity = nx.algorithms.community.modularity(
+        Gnx, [set(c) for c in communities])
+    assert modularity_score == pytest.approx(nx_modularity, abs=1.0e-5)
+    assert modularity_score > 0.35
+
+
+@pytest.mark.parametrize('graph_file', DATASETS)
+def test_louvain_hierarchy(graph_file):
+    G = utils.read_graph(graph_file, edgevals=True)
+
+    parts, modularity_score, hierarchy = cugraph.louvain(
+        G, return_hierarchy=True)
+    assert len(hierarchy) >= 1
+    assert (hierarchy[-1][0] == parts).all().all()
+    assert hierarchy[-1][1] == modularity_score
+    counts = [level['partition'].nunique() for level, _ in hierarchy]
+    scores = [score for _, score in hierarchy]
+    assert counts == sorted(counts, reverse=True)
+    assert scores == sorted(scores)
+    # Each level merges communities of the previous one
+    for (finer, _), (coarser, _) in zip(hierarchy, hierarchy[1:]):
+        merged = coarser.groupby(finer['partition'])['partition'].nunique()
+        assert (merged == 1).all()
+
+    first, first_score, levels = cugraph.louvain(G, max_level=1,
+                                                 return_hierarchy=True)
+    assert len(levels) == 1
+    assert (first == hierarchy[0][0]).all().all()
+    assert first_score == pytest.approx(hierarchy[0][1])
+
+    fine, _ = cugraph.louvain(G, resolution=4.0)
+    coarse, _ = cugraph.louvain(G, resolution=0.25)
+    assert fine['partition'].nunique() > parts['partition'].nunique()
+    assert coarse['partition'].nunique() <= parts['partition'].nunique()
+
+    with pytest.raises(ValueError):
+        cugraph.louvain(G, resolution=0)
+    with pytest.raises(ValueError):
+        cugraph.louvain(G, max_level=0)
+
+
+def test_louvain_directed():
+    # Directed graphs (such as the generated ones) are clustered as the
+    # undirected graph of their edges
+    G = cugraph.generators.rmat(10, edge_factor=8, seed=1, backend='host')
+    src, dst, _ = G.view_edge_list()
+    parts, modularity_score, hierarchy = cugraph.louvain(
+        G, return_hierarchy=True)
+    assert modularity_score > 0
+
+    num_verts = G.number_of_vertices()
+    A = sparse.csr_matrix((np.ones(len(src)), (src, dst)),
+                          shape=(num_verts, num_verts))
+    A = (A + A.T).tocsr()
+    H = cugraph.Graph(backend='host')
+    H.add_adj_list(A.indptr.astype(np.int32), A.indices.astype(np.int32),
+                   A.data.astype(np.float32))
+    symmetric_parts, symmetric_score = cugraph.louvain(H)
+    assert (symmetric_parts == parts).all().all()
+    assert modularity_score == pytest.approx(symmetric_score)
+
+    first, _ = cugraph.louvain(G, max_level=1)
+    assert (first == hierarchy[0][0]).all().all()
+
+
+@pytest.mark.parametrize('graph_file', DATASETS)
+def test_louvain_stats(graph_file):
+    G = utils.read_graph(graph_file, edgevals=True)
+
+    # Louvain records the modularity gain of each local moving pass
+    parts, modularity_score, stats = cugraph.louvain(G, return_stats=True)
+    assert stats.converged and stats.counters['levels'] >= 1
+    assert stats.iterations == len(stats.residuals) > 0
+    assert all(r >= 0 for r in stats.residuals)
+    parts, modularity_score, hierarchy, stats = cugraph.louvain(
+        G, callback=lambda i, r: True, return_hierarchy=True,
+        return_stats=True)
+    assert stats.iterations == 1 and stats.stopped
+    assert len(hierarchy) == stats.counters['levels'] <= 1
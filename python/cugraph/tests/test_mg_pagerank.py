@@ -0,0 +1,68 @@
+# Copyright (c) 2019, NVIDIA CORPORATION.
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import numpy as np
+import pytest
+from scipy import sparse
+
+import cugraph
+from cugraph.tests import utils
+
+
+DATASETS = ['../datasets/dolphins.csv',
+            '../datasets/karate.csv',
+            '../datasets/netscience.csv']
+
+
+@pytest.mark.parametrize('graph_file', DATASETS)
+@pytest.mark.parametrize('num_ranks', [1, 3])
+def test_mg_pagerank_host(graph_file, num_ranks):
+    M = utils.read_csv_file_host(graph_file)
+    src = M['0'].to_numpy()
+    dst = M['1'].to_numpy()
+    G = utils.read_graph(graph_file)
+    expected = cugraph.pagerank(G, tol=1.0e-8, max_iter=500)
+
+    df = cugraph.mg_pagerank(np.array_split(src, num_ranks),
+                             np.array_split(dst, num_ranks),
+                             max_iter=500, tol=1.0e-8)
+    assert len(df) == len(expected)
+    assert np.allclose(df['pagerank'], expected['pagerank'], atol=1.0e-6)
+
+    # Vertex ranges of about the same number of edges
+    counts = np.bincount(dst, minlength=len(df))
+    part_offsets = cugraph.snmg.snmg_host.part_offsets_from_counts(
+        counts, num_ranks)
+    assert part_offsets[0] == 0 and part_offsets[-1] == len(df)
+    assert (np.diff(part_offsets) >= 0).all()
+    edges = np.diff(np.concatenate([[0], np.cumsum(counts)])[part_offsets])
+    assert edges.sum() == len(dst)
+    assert edges.max() <= len(dst) / num_ranks + counts.max()
+
+    # The distributed SpMV of the partial CSR matrices is A @ x
+    A = sparse.csr_matrix((np.ones(len(src)), (src, dst)),
+                          shape=(len(df), len(df)))
+    env = cugraph.snmg.snmg_host.SNMGHostEnv(num_ranks, len(df))
+    env.allocate('x', np.float64, len(df))
+    env.allocate('y', np.float64, len(df))
+    env.array('x')[:] = np.random.RandomState(0).rand(len(df))
+    part_offsets = cugraph.snmg.snmg_host.part_offsets_from_counts(
+        np.diff(A.indptr), num_ranks)
+    cugraph.snmg.snmg_host.run(env, _csrmv_rank, part_offsets, A)
+    assert np.allclose(env.array('y'), A @ env.array('x'))
+
+
+def _csrmv_rank(env, part_offsets, A):
+    lo, hi = part_offsets[env.rank], part_offsets[env.rank + 1]
+    cugraph.snmg.snmg_host.csrmv(env, part_offsets, A[lo:hi],
+                                 env.array('x'), env.array('y'))
@@ -0,0 +1,66 @@
+# Copyright (c) 2019, NVIDIA CORPORATION.
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import numpy as np
+import pytest
+
+import cugraph
+from cugraph.tests import utils
+
+
+DATASETS = ['../datasets/dolphins.csv',
+            '../datasets/karate.csv',
+            '../datasets/netscience.csv']
+
+
+@pytest.mark.parametrize('graph_file', DATASETS)
+def test_minhash(graph_file):
+    G = utils.read_graph(graph_file)
+    exact = cugraph.jaccard(G)
+    errors = []
+    for num_hashes in [16, 1024]:
+        mh = cugraph.link_prediction.MinHash(G, num_hashes, seed=1)
+        assert mh.signatures.shape == (G.number_of_vertices(), num_hashes)
+        assert mh.signatures.dtype == np.uint32
+        df = mh.jaccard(exact['source'], exact['destination'])
+        assert np.array_equal(df['source'], exact['source'])
+        errors.append(np.abs(df['jaccard_coeff'] -
+                             exact['jaccard_coeff']).mean())
+    # The standard error decreases with sqrt(num_hashes)
+    assert errors[1] < 0.02
+    assert errors[1] < errors[0] / 4
+
+    overlap = cugraph.overlap(G)
+    df = mh.overlap(overlap['source'], overlap['destination'])
+    assert np.abs(df['overlap_coeff'] - overlap['overlap_coeff']).mean() < \
+        0.05
+
+    # The candidates hold almost all the similar pairs
+    two_hop = G.get_two_hop_neighbors()
+    similar = cugraph.jaccard(G, two_hop['first'], two_hop['second'])
+    similar = similar[(similar['jaccard_coeff'] >= 0.6) &
+                      (similar['source'] < similar['destination'])]
+    candidates = mh.candidates(bands=256, threshold=0.4)
+    assert (candidates['source'] < candidates['destination']).all()
+    assert (candidates['jaccard_coeff'] >= 0.4).all()
+    found = set(zip(candidates['source'], candidates['destination']))
+    recall = np.mean([pair in found for pair in
+                      zip(similar['source'], similar['destination'])])
+    assert recall > 0.95
+    assert len(mh.candidates(bands=256, max_bucket_size=2)) <= \
+        len(mh.candidates(bands=256))
+
+    with pytest.raises(ValueError):
+        mh.jaccard([0, 1], [0])
+    with pytest.raises(ValueError):
+        mh.candidates(bands=2048)
@@ -18,11 +18,16 @@ import time
 import pytest
 import numpy as np
 
-import cudf
+try:
+    import cudf
+    import rmm
+    from rmm import rmm_config
+except ImportError:
+    cudf = None
+    rmm = None
+    rmm_config = None
 import cugraph
 from cugraph.tests import utils
-import rmm
-from rmm import rmm_config
 
 
 def cugraph_call(cu_M, first, second, edgevals=False):
@@ -98,6 +103,7 @@ DATASETS = ['../datasets/dolphins.csv',
 
 
 # Test all combinations of default/managed and pooled/non-pooled allocation
+@utils.requires_device
 @pytest.mark.parametrize('managed, pool',
                          list(product([False, True], [False, True])))
 @pytest.mark.parametrize('graph_file', DATASETS)
@@ -136,6 +142,7 @@ def test_overlap(managed, pool, graph_file):
 
 
 # Test all combinations of default/managed and pooled/non-pooled allocation
+@utils.requires_device
 @pytest.mark.parametrize('managed, pool',
                          list(product([False, True], [False, True])))
 @pytest.mark.parametrize('graph_file', DATASETS)
@@ -172,3 +179,18 @@ def test_overlap_edge_vals(managed, pool, graph_file):
         else:
             diff = abs(cpu_coeff[i] - cu_coeff[i])
             assert diff < 1.0e-6
+
+
+@pytest.mark.parametrize('graph_file', DATASETS)
+@pytest.mark.parametrize('backend', utils.BACKENDS)
+def test_overlap_backend(graph_file, backend):
+    G = utils.read_graph(graph_file, backend)
+    Gnx = utils.networkx_graph(graph_file, directed=False)
+
+    df = utils.to_host(cugraph.overlap(G))
+    for u, v, coeff in zip(df['source'], df['destination'],
+                           df['overlap_coeff']):
+        nu = set(Gnx[u])
+        nv = set(Gnx[v])
+        expected = len(nu & nv) / min(len(nu), len(nv))
+        assert coeff == pytest.approx(expected, abs=1.0e-6)
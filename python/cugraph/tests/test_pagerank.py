@@ -15,14 +15,20 @@ import gc
 from itertools import product
 import time
 import numpy as np
+import pandas as pd
 
 import pytest
 
-import cudf
+try:
+    import cudf
+    import rmm
+    from rmm import rmm_config
+except ImportError:
+    cudf = None
+    rmm = None
+    rmm_config = None
 import cugraph
 from cugraph.tests import utils
-import rmm
-from rmm import rmm_config
 
 # Temporarily suppress warnings till networkX fixes deprecation warnings
 # (Using or importing the ABCs from 'collections' instead of from
@@ -139,6 +145,7 @@ HAS_GUESS = [0, 1]
 
 
 # Test all combinations of default/managed and pooled/non-pooled allocation
+@utils.requires_device
 @pytest.mark.parametrize('managed, pool',
                          list(product([False, True], [False, True])))
 @pytest.mark.parametrize('graph_file', DATASETS)
@@ -181,3 +188,115 @@ def test_pagerank(managed, pool, graph_file, max_iter, tol, alpha,
             err = err + 1
     print("Mismatches:", err)
     assert err < (0.01*len(cugraph_pr))
+
+
+@pytest.mark.parametrize('graph_file', DATASETS)
+@pytest.mark.parametrize('backend', utils.BACKENDS)
+def test_pagerank_backend(graph_file, backend):
+    G = utils.read_graph(graph_file, backend)
+    Gnx = utils.networkx_graph(graph_file)
+
+    df = utils.to_host(cugraph.pagerank(G, alpha=0.85, max_iter=500,
+                                        tol=1.0e-8))
+    nx_pr = nx.pagerank(Gnx, alpha=0.85, max_iter=1000, tol=1.0e-10,
+                        weight=None)
+
+    assert df['pagerank'].dtype == np.float32
+    expected = np.array([nx_pr[v] for v in df['vertex']])
+    assert np.allclose(df['pagerank'], expected, atol=1.0e-6)
+
+
+@pytest.mark.parametrize('graph_file', DATASETS)
+def test_pagerank_stats(graph_file):
+    G = utils.read_graph(graph_file, edgevals=True)
+
+    df, stats = cugraph.pagerank(G, tol=1.0e-8, max_iter=500,
+                                 return_stats=True)
+    assert isinstance(stats, cugraph.SolverStats)
+    assert stats.converged and not stats.stopped
+    assert stats.iterations == len(stats.residuals) > 1
+    assert stats.residuals[-1] < 1.0e-8
+    assert list(stats.times) == ['csr_build', 'iterations', 'output']
+
+    # Early stop from the callback
+    calls = []
+
+    def stop_after_three(iteration, residual):
+        calls.append((iteration, residual))
+        return iteration == 3
+
+    df2, stats = cugraph.pagerank(G, tol=1.0e-8, max_iter=500,
+                                  callback=stop_after_three,
+                                  return_stats=True)
+    assert stats.iterations == 3 and stats.stopped
+    assert not stats.converged
+    assert [i for i, _ in calls] == [1, 2, 3]
+    assert not np.allclose(df['pagerank'], df2['pagerank'], atol=1.0e-8)
+
+
+@pytest.mark.parametrize('graph_file', DATASETS)
+@pytest.mark.parametrize('top_n', [None, 5])
+def test_personalized_pagerank_batch(graph_file, top_n):
+    G = utils.read_graph(graph_file)
+    num_verts = G.number_of_vertices()
+    rng = np.random.RandomState(0)
+    seeds = pd.DataFrame()
+    seeds['seed'] = np.repeat(np.arange(10) * 3, 2)
+    seeds['vertex'] = rng.randint(0, num_verts, len(seeds))
+    seeds['values'] = rng.rand(len(seeds)) + 0.5
+
+    # Several batches, the last one partial
+    df = cugraph.personalized_pagerank_batch(G, seeds, tol=1.0e-10,
+                                             max_iter=1000, top_n=top_n,
+                                             batch_size=4)
+    assert list(df.columns) == ['seed', 'vertex', 'pagerank']
+    for seed, group in df.groupby('seed', sort=False):
+        personalization = seeds[seeds['seed'] == seed]
+        pr = cugraph.pagerank(G, personalization=personalization,
+                              tol=1.0e-10, max_iter=1000)
+        if top_n is None:
+            assert np.array_equal(group['vertex'], pr['vertex'])
+            assert np.allclose(group['pagerank'], pr['pagerank'], atol=1e-6)
+        else:
+            assert len(group) == top_n
+            expected = np.sort(pr['pagerank'].to_numpy())[::-1][:top_n]
+            assert np.allclose(group['pagerank'], expected, atol=1e-6)
+            assert np.allclose(pr['pagerank'][group['vertex']],
+                               group['pagerank'], atol=1e-6)
+    assert list(df['seed'].unique()) == list(np.arange(10) * 3)
+
+    with pytest.raises(ValueError):
+        cugraph.personalized_pagerank_batch(
+            G, pd.DataFrame({'seed': [0], 'vertex': [num_verts]}))
+
+
+@pytest.mark.parametrize('graph_file', DATASETS)
+def test_personalized_pagerank_batch_stats(graph_file):
+    G = utils.read_graph(graph_file, edgevals=True)
+
+    # The batch solver drops each seed set from the block once it converges
+    num_verts = G.number_of_vertices()
+    seeds = pd.DataFrame({'seed': np.append(np.arange(6) // 2, 3),
+                          'vertex': np.append(np.arange(6), num_verts - 1),
+                          'values': np.ones(7)})
+    df, stats = cugraph.personalized_pagerank_batch(
+        G, seeds, tol=1.0e-6, max_iter=500, batch_size=3, return_stats=True)
+    seed_iterations = stats.counters['seed_iterations']
+    assert stats.converged and not stats.stopped
+    assert (stats.counters['seed_residuals'] < 1.0e-6).all()
+    assert len(seed_iterations) == 4
+    # The iterations of a block run until its slowest seed set converges
+    assert stats.iterations == seed_iterations[:3].max() + \
+        seed_iterations[3:].max() == len(stats.residuals)
+    # Each seed set converges on its own, as if solved alone
+    _, single = cugraph.personalized_pagerank_batch(
+        G, seeds, tol=1.0e-6, max_iter=500, batch_size=1, return_stats=True)
+    assert np.array_equal(single.counters['seed_iterations'],
+                          seed_iterations)
+    assert single.iterations == seed_iterations.sum()
+    df, stats = cugraph.personalized_pagerank_batch(
+        G, seeds, tol=1.0e-6, max_iter=500, batch_size=3,
+        callback=lambda i, r: i == 2, return_stats=True)
+    assert stats.stopped and not stats.converged
+    assert list(stats.counters['seed_iterations']) == [2, 2, 2, 0]
+    assert len(df) == 4 * num_verts
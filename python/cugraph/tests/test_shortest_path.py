@@ -0,0 +1,64 @@
+# Copyright (c) 2019, NVIDIA CORPORATION.
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import numpy as np
+import pytest
+
+import cugraph
+from cugraph.tests import utils
+
+
+DATASETS = ['../datasets/dolphins.csv',
+            '../datasets/karate.csv',
+            '../datasets/netscience.csv']
+
+
+@pytest.mark.parametrize('graph_file', DATASETS)
+@pytest.mark.parametrize('weighted', [False, True])
+def test_shortest_path(graph_file, weighted):
+    M = utils.read_csv_file_host(graph_file)
+    G = utils.read_graph(graph_file, edgevals=True)
+    weights = {(s, d): w for s, d, w in zip(M['0'], M['1'], M['2'])}
+    num_verts = G.number_of_vertices()
+
+    sources = np.arange(0, num_verts, max(1, num_verts // 10))
+    targets = sources[::-1].copy()
+    paths, distances = cugraph.shortest_path(G, sources, targets,
+                                             weighted=weighted)
+    assert len(paths) == len(distances) == len(sources)
+    for s, t, path, distance in zip(sources, targets, paths, distances):
+        if weighted:
+            df = cugraph.sssp(G, s)
+        else:
+            df = cugraph.bfs(G, s)
+        expected = df['distance'][t]
+        if weighted:
+            assert distance == pytest.approx(expected, rel=1.0e-5)
+        else:
+            assert distance == expected
+        if len(path) == 0:
+            assert df['predecessor'][t] == -1 and s != t
+            continue
+        assert path[0] == s and path[-1] == t
+        steps = list(zip(path[:-1], path[1:]))
+        assert all(step in weights for step in steps)
+        if weighted:
+            assert sum(weights[step] for step in steps) == \
+                pytest.approx(expected, rel=1.0e-5)
+        else:
+            assert len(steps) == expected
+
+    path, distance = cugraph.shortest_path(G, 0, 0)
+    assert list(path) == [0] and distance == 0
+    with pytest.raises(ValueError):
+        cugraph.shortest_path(G, 0, num_verts)
@@ -16,12 +16,17 @@ from itertools import product
 import time
 
 import numpy as np
+import pandas as pd
 import pytest
 
 import cugraph
 from cugraph.tests import utils
-import rmm
-from rmm import rmm_config
+try:
+    import rmm
+    from rmm import rmm_config
+except ImportError:
+    rmm = None
+    rmm_config = None
 
 # Temporarily suppress warnings till networkX fixes deprecation warnings
 # (Using or importing the ABCs from 'collections' instead of from
@@ -109,6 +114,7 @@ SOURCES = [1]
 
 
 # Test all combinations of default/managed and pooled/non-pooled allocation
+@utils.requires_device
 @pytest.mark.parametrize('managed, pool',
                          list(product([False, True], [False, True])))
 @pytest.mark.parametrize('graph_file', DATASETS)
@@ -149,6 +155,7 @@ def test_sssp(managed, pool, graph_file, source):
 
 
 # Test all combinations of default/managed and pooled/non-pooled allocation
+@utils.requires_device
 @pytest.mark.parametrize('managed, pool',
                          list(product([False, True], [False, True])))
 @pytest.mark.parametrize('graph_file', ['../datasets/netscience.csv'])
@@ -189,3 +196,79 @@ def test_sssp_edgevals(managed, pool, graph_file, source):
                 err = err + 1
 
     assert err == 0
+
+
+@pytest.mark.parametrize('graph_file', DATASETS)
+@pytest.mark.parametrize('backend', utils.BACKENDS)
+def test_sssp_backend(graph_file, backend):
+    G = utils.read_graph(graph_file, backend, edgevals=True)
+    Gnx = utils.networkx_graph(graph_file)
+
+    df = utils.to_host(cugraph.sssp(G, 0))
+    nx_dist = nx.single_source_dijkstra_path_length(Gnx, 0)
+    for v, d in zip(df['vertex'], df['distance']):
+        if v in nx_dist:
+            assert d == pytest.approx(nx_dist[v], rel=1.0e-5)
+        else:
+            assert d == np.finfo(np.float32).max
+
+
+@pytest.mark.parametrize('graph_file', DATASETS)
+@pytest.mark.parametrize('edgevals', [False, True])
+def test_traversal_cutoffs(graph_file, edgevals):
+    G = utils.read_graph(graph_file, edgevals=edgevals)
+    full = cugraph.filter_unreachable(cugraph.sssp(G, 0))
+    distances = full['distance'].to_numpy()
+
+    for cutoff in [0, 1, 2.5]:
+        df = cugraph.sssp(G, 0, max_distance=cutoff)
+        expected = full[distances <= cutoff]
+        assert np.array_equal(df['vertex'], expected['vertex'])
+        assert np.allclose(df['distance'], expected['distance'])
+        assert df['distance'].dtype == full['distance'].dtype
+
+    # Stop once the targets are reached
+    far = full['vertex'].to_numpy()[np.argsort(distances)]
+    targets = [far[len(far) // 3], far[len(far) // 4]]
+    df = cugraph.sssp(G, 0, targets=targets)
+    farthest = full.set_index('vertex')['distance'][targets].max()
+    expected = full[distances <= farthest]
+    assert np.array_equal(df['vertex'], expected['vertex'])
+    assert np.allclose(df['distance'], expected['distance'])
+    # Predecessors give shortest paths
+    d = dict(zip(df['vertex'], df['distance']))
+    for v, p in zip(df['vertex'], df['predecessor']):
+        if v != 0:
+            assert p in d and d[p] < d[v]
+
+    if not edgevals:
+        full = cugraph.filter_unreachable(cugraph.bfs(G, 0))
+        df = cugraph.bfs(G, 0, max_depth=2)
+        expected = full[full['distance'] <= 2]
+        assert np.array_equal(df['vertex'], expected['vertex'])
+        assert np.array_equal(df['distance'], expected['distance'])
+        assert np.array_equal(df['predecessor'], expected['predecessor'])
+        df = cugraph.bfs(G, 0, targets=targets)
+        assert np.array_equal(df['vertex'],
+                              cugraph.sssp(G, 0, targets=targets)['vertex'])
+
+    with pytest.raises(ValueError):
+        cugraph.bfs(G, 0, targets=[G.number_of_vertices()])
+
+
+def test_sssp_negative_weights():
+    # Bellman-Ford handles negative weights, the early stopping searches
+    # reject them
+    G = cugraph.Graph(backend='host')
+    G.add_edge_list(pd.Series([0, 0, 2], dtype=np.int32),
+                    pd.Series([1, 2, 1], dtype=np.int32),
+                    pd.Series([5.0, 6.0, -4.0], dtype=np.float32))
+    assert cugraph.sssp(G, 0)['distance'][1] == 2.0
+    with pytest.raises(ValueError):
+        cugraph.sssp(G, 0, targets=[1])
+    with pytest.raises(ValueError):
+        cugraph.sssp(G, 0, max_distance=10.0)
+    with pytest.raises(ValueError):
+        cugraph.shortest_path(G, 0, 1)
+    path, distance = cugraph.shortest_path(G, 0, 1, weighted=False)
+    assert list(path) == [0, 1] and distance == 1
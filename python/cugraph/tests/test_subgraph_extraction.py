@@ -17,11 +17,16 @@ from itertools import product
 import numpy as np
 import pytest
 
-import cudf
+try:
+    import cudf
+    import rmm
+    from rmm import rmm_config
+except ImportError:
+    cudf = None
+    rmm = None
+    rmm_config = None
 import cugraph
 from cugraph.tests import utils
-import rmm
-from rmm import rmm_config
 
 # Temporarily suppress warnings till networkX fixes deprecation warnings
 # (Using or importing the ABCs from 'collections' instead of from
@@ -64,6 +69,7 @@ DATASETS = ['../datasets/karate.csv',
 
 
 # Test all combinations of default/managed and pooled/non-pooled allocation
+@utils.requires_device
 @pytest.mark.parametrize('managed, pool',
                          list(product([False, True], [False, True])))
 @pytest.mark.parametrize('graph_file', DATASETS)
@@ -86,3 +92,16 @@ def test_subgraph_extraction(managed, pool, graph_file):
     cu_sg = cugraph_call(M, verts)
     nx_sg = nx_call(M, verts)
     assert compare_edges(cu_sg, nx_sg, verts)
+
+
+@pytest.mark.parametrize('graph_file', DATASETS)
+@pytest.mark.parametrize('backend', utils.BACKENDS)
+def test_subgraph_extraction_backend(graph_file, backend):
+    G = utils.read_graph(graph_file, backend)
+    Gnx = utils.networkx_graph(graph_file)
+
+    verts = np.array([0, 1, 2, 3, 4, 5], dtype=np.int32)
+    Sg = cugraph.subgraph(G, utils.series(verts, backend))
+    assert Sg.backend == backend
+    src, dst, _ = Sg.view_edge_list()
+    assert len(src) == Gnx.subgraph(verts).number_of_edges()
@@ -0,0 +1,96 @@
+# Copyright (c) 2019, NVIDIA CORPORATION.
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import cugraph
+from cugraph.tests import utils
+
+
+def test_vertex_dictionary(tmpdir):
+    M = utils.read_csv_file_host('../datasets/karate.csv')
+    src = M['0'] * 1000 + 7
+    dst = M['1'] * 1000 + 7
+    half = len(M) // 2
+
+    vd = cugraph.VertexDictionary()
+    s1, d1 = vd.encode(src[:half], dst[:half])
+    n1 = len(vd)
+    s2, d2 = vd.encode(src[half:], dst[half:])
+    assert len(vd) == len(np.unique(np.concatenate([src, dst])))
+    # Ids of the first batch are stable
+    assert np.array_equal(vd.encode(src[:half], add=False), s1)
+    assert d1.max() < n1
+    assert s1.dtype == np.int32
+    # The numbering map lists the ids of both batches in order of appearance
+    first_seen = pd.unique(np.concatenate([src[:half], dst[:half],
+                                           src[half:], dst[half:]]))
+    assert np.array_equal(vd.numbering_map, first_seen)
+
+    G = cugraph.Graph(backend='host')
+    G.add_edge_list(pd.concat([s1, s2], ignore_index=True),
+                    pd.concat([d1, d2], ignore_index=True))
+    df = vd.decode(cugraph.bfs(G, 0), columns=['vertex', 'predecessor'])
+    assert df['vertex'].iloc[0] == src.iloc[0]
+    assert set(df['vertex']) == set(src) | set(dst)
+    assert pd.isnull(df['predecessor']).sum() == 1
+
+    assert np.array_equal(vd.encode([1, src.iloc[0], 2], add=False),
+                          [-1, 0, -1])
+    with pytest.raises(ValueError):
+        vd.decode(pd.DataFrame({'vertex': [len(vd)]}))
+
+    # Save and load, and build from a cugraph.renumber numbering map
+    path = str(tmpdir.join('karate.vdict'))
+    vd.save(path)
+    vd2 = cugraph.VertexDictionary.load(path)
+    assert np.array_equal(vd2.encode(src, add=False), vd.encode(src))
+    _, _, numbering_map = cugraph.renumber(src, dst)
+    vd3 = cugraph.VertexDictionary(numbering_map)
+    assert np.array_equal(vd3.numbering_map, numbering_map)
+
+
+def test_vertex_dictionary_keys(tmpdir):
+    vd = cugraph.VertexDictionary()
+    src, dst = vd.encode(['a', 'b', 'c'], ['b', 'c', 'd'])
+    assert list(src) == [0, 1, 2]
+    assert list(dst) == [1, 2, 3]
+    df = vd.decode(pd.DataFrame({'vertex': [3, 0], 'x': [1.0, 2.0]}))
+    assert list(df['vertex']) == ['d', 'a']
+
+    path = str(tmpdir.join('strings.vdict'))
+    vd.save(path)
+    vd = cugraph.VertexDictionary.load(path)
+    assert list(vd.encode(['d', 'e'])) == [3, 4]
+
+    # Multi-column keys (host, port)
+    vd = cugraph.VertexDictionary()
+    src = pd.DataFrame({'host': ['a', 'a', 'b'], 'port': [80, 443, 80]})
+    dst = pd.DataFrame({'host': ['b', 'c', 'a'], 'port': [80, 22, 80]})
+    s, d = vd.encode(src, dst)
+    assert list(s) == [0, 1, 2]
+    assert list(d) == [2, 3, 0]
+    df = vd.decode(pd.DataFrame({'vertex': [3, 1], 'rank': [0.5, 0.5]}))
+    assert list(df.columns) == ['vertex_host', 'vertex_port', 'rank']
+    assert list(df['vertex_host']) == ['c', 'a']
+    assert list(df['vertex_port']) == [22, 443]
+    with pytest.raises(ValueError):
+        vd.encode(['a'])
+
+    path = str(tmpdir.join('multi.vdict'))
+    vd.save(path)
+    vd = cugraph.VertexDictionary.load(path)
+    assert vd.names == ['host', 'port']
+    assert list(vd.encode(dst, add=False)) == [2, 3, 0]
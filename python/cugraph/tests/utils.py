@@ -11,10 +11,34 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import pytest
 from scipy.sparse import coo_matrix
 
-import cudf
 import pandas as pd
+try:
+    import cudf
+except ImportError:
+    cudf = None
+
+import cugraph
+from cugraph.structure.graph import default_backend
+
+# Temporarily suppress warnings till networkX fixes deprecation warnings
+# (Using or importing the ABCs from 'collections' instead of from
+# 'collections.abc' is deprecated, and in 3.8 it will stop working) for
+# python 3.7.  Also, this import networkx needs to be relocated in the
+# third-party group once this gets fixed.
+import warnings
+with warnings.catch_warnings():
+    warnings.filterwarnings("ignore", category=DeprecationWarning)
+    import networkx as nx
+
+
+# The device tests need libcugraph and cudf, the host backend runs anywhere
+requires_device = pytest.mark.skipif(default_backend() != 'device',
+                                     reason='libcugraph or cudf is not '
+                                            'available')
+BACKENDS = ['host', pytest.param('device', marks=requires_device)]
 
 
 def read_csv_for_nx(csv_file, read_weights_in_sp=True):
@@ -41,3 +65,56 @@ def read_csv_file(csv_file, read_weights_in_sp=True):
     else:
         return cudf.read_csv(csv_file, delimiter=' ',
                              dtype=['int32', 'int32', 'float64'], header=None)
+
+
+def read_csv_file_host(csv_file, read_weights_in_sp=True):
+    print('Reading ' + str(csv_file) + '...')
+    if read_weights_in_sp is True:
+        weight_type = 'float32'
+    else:
+        weight_type = 'float64'
+    return pd.read_csv(csv_file, delimiter=' ', header=None,
+                       names=['0', '1', '2'],
+                       dtype={'0': 'int32', '1': 'int32', '2': weight_type})
+
+
+def read_graph(graph_file, backend='host', edgevals=False):
+    """
+    Return a cugraph.Graph of the given backend with the edges of graph_file
+    (and their weights if edgevals is True).
+    """
+    if backend == 'device':
+        M = read_csv_file(graph_file)
+    else:
+        M = read_csv_file_host(graph_file)
+    G = cugraph.Graph(backend=backend)
+    if edgevals:
+        G.add_edge_list(M['0'], M['1'], M['2'])
+    else:
+        G.add_edge_list(M['0'], M['1'])
+    return G
+
+
+def networkx_graph(graph_file, directed=True):
+    M = read_csv_for_nx(graph_file).tocsr()
+    if directed:
+        return nx.DiGraph(M)
+    return nx.Graph(M)
+
+
+def to_host(data):
+    """
+    Return data (a result of an algorithm) as a pandas object.
+    """
+    if cudf is not None and isinstance(data, (cudf.DataFrame, cudf.Series)):
+        return data.to_pandas()
+    return data
+
+
+def series(values, backend='host'):
+    """
+    Return values as a Series of the given backend.
+    """
+    if backend == 'device':
+        return cudf.Series(values)
+    return pd.Series(values)
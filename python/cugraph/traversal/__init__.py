@@ -11,5 +11,6 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from cugraph.traversal.bfs import bfs
+from cugraph.traversal.bfs import bfs, bfs_batch
 from cugraph.traversal.sssp import sssp, filter_unreachable
+from cugraph.traversal.shortest_path import shortest_path
@@ -11,14 +11,31 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from cugraph.traversal import bfs_wrapper
+from cugraph.structure import graph_host
+from cugraph.structure.graph import memory_budgeted
+from cugraph.traversal import bfs_host
+import numpy as np
+try:
+    import cudf
+    from cugraph.traversal import bfs_wrapper
+except ImportError:
+    cudf = None
+    bfs_wrapper = None
 
 
-def bfs(G, start, directed=True):
+@memory_budgeted
+def bfs(G, start, directed=True, max_depth=None, targets=None):
     """
     Find the distances and predecessors for a breadth first traversal of a
     graph.
 
+    By default the traversal visits every vertex reachable from start and
+    the result holds all the vertices of the graph. If max_depth or targets
+    is set, the traversal stops early and the result is compact: it only
+    holds the visited vertices (sorted by vertex id), i.e. the vertices at
+    most max_depth levels away from start and, once all the targets are
+    reached, no farther than the farthest target.
+
     Parameters
     ----------
     G : cugraph.graph
@@ -30,6 +47,10 @@ def bfs(G, start, directed=True):
         Indicates whether the graph in question is a directed graph, or whether
         each edge has a corresponding reverse edge. (Allows optimizations if
         the graph is undirected)
+    max_depth : Integer, optional
+        Stop the traversal after max_depth levels.
+    targets : cudf.Series, NumPy array or array-like, optional
+        Stop the traversal as soon as all these vertices are reached.
 
     Returns
     -------
@@ -42,6 +63,9 @@ def bfs(G, start, directed=True):
         df['predecessor'][i] gives for the i'th vertex the vertex it was
         reached from in the traversal
 
+        A pandas.DataFrame with the same columns is returned for graphs using
+        the host backend.
+
     Examples
     --------
     >>> M = cudf.read_csv('datasets/karate.csv', delimiter=' ',
@@ -51,8 +75,135 @@ def bfs(G, start, directed=True):
     >>> G = cugraph.Graph()
     >>> G.add_edge_list(sources, destinations, None)
     >>> df = cugraph.bfs(G, 0)
+    >>> neighborhood = cugraph.bfs(G, 0, max_depth=2)
     """
+    if max_depth is not None and max_depth < 0:
+        raise ValueError('max_depth must be non-negative')
+    targets = _targets(G, targets)
 
-    df = bfs_wrapper.bfs(G.graph_ptr, start, directed)
+    if G.backend == 'host':
+        df = bfs_host.bfs(G.graph_ptr, start, directed, max_depth, targets)
+    else:
+        df = bfs_wrapper.bfs(G.graph_ptr, start, directed)
+        if max_depth is not None or targets is not None:
+            df = _compact(df, max_depth, targets)
 
     return df
+
+
+def _targets(G, targets):
+    # Return targets as a sorted array of unique vertex ids
+    if targets is None:
+        return None
+    targets = np.unique(graph_host.to_host_array(targets, dtype=np.int64))
+    num_verts = G.number_of_vertices()
+    if len(targets) and (targets[0] < 0 or targets[-1] >= num_verts):
+        raise ValueError('targets must be vertex ids in [0, %d)' % num_verts)
+    return targets
+
+
+def _compact(df, cutoff, targets):
+    # Filter a complete device traversal down to the vertices a traversal
+    # stopped by cutoff or targets would have visited
+    distances = df['distance'].to_array()
+    if np.issubdtype(distances.dtype, np.integer):
+        reached = distances != np.iinfo(distances.dtype).max
+    else:
+        reached = distances != np.finfo(distances.dtype).max
+    if cutoff is not None:
+        reached &= distances <= cutoff
+    if targets is not None and reached[targets].all():
+        reached &= distances <= np.max(distances[targets], initial=0)
+    return df[cudf.Series(reached)]
+
+
+@memory_budgeted
+def bfs_batch(G, sources, depth_limit=None, dense=False):
+    """
+    Find the distances from each of a set of source vertices in a single
+    breadth first traversal of the graph. The traversal handles 64 sources at
+    a time, tracking the frontiers of all of them as the bits of one 64-bit
+    word per vertex, so the adjacency list of a vertex is expanded once per
+    level for all the sources that reached it.
+
+    Parameters
+    ----------
+    G : cugraph.graph
+        cuGraph graph descriptor, should contain the connectivity information
+        as an adjacency list.
+    sources : cudf.Series, NumPy array or array-like
+        The vertex ids from which the traversals begin.
+    depth_limit : Integer, optional
+        Stop the traversals after depth_limit levels. Vertices further than
+        depth_limit from a source are reported as unreachable from it.
+    dense : bool, optional
+        If True, return a dense distance array instead of a DataFrame.
+
+    Returns
+    -------
+    df : pandas.DataFrame or cudf.DataFrame
+        One row per (source, reached vertex) pair, sorted by source then
+        vertex (unreachable vertices are omitted):
+
+        df['source'][i] gives the source vertex of the i'th row
+
+        df['vertex'][i] gives the vertex id of the i'th row
+
+        df['distance'][i] gives the path distance from source to vertex
+
+        A cudf.DataFrame is returned for graphs using the device backend.
+
+    distances : NumPy array
+        If dense is True, an int32 array of shape [len(sources), V] where
+        distances[i, v] is the distance from sources[i] to v (2^31-1 if v is
+        unreachable).
+
+    Examples
+    --------
+    >>> M = cudf.read_csv('datasets/karate.csv', delimiter=' ',
+    >>>                   dtype=['int32', 'int32', 'float32'], header=None)
+    >>> G = cugraph.Graph()
+    >>> G.add_edge_list(M['0'], M['1'], None)
+    >>> distances = cugraph.bfs_batch(G, [0, 5, 33], dense=True)
+    """
+    sources = graph_host.to_host_array(sources, dtype=np.int64)
+    num_verts = G.number_of_vertices()
+    if len(sources) and (sources.min() < 0 or sources.max() >= num_verts):
+        raise ValueError('sources must be vertex ids in [0, %d)' % num_verts)
+    if depth_limit is not None and depth_limit < 0:
+        raise ValueError('depth_limit must be non-negative')
+
+    if G.backend == 'host':
+        return bfs_host.bfs_batch(G.graph_ptr, sources, depth_limit, dense)
+
+    # libcugraph has no multi-source BFS: run one traversal per source
+    unreachable = np.iinfo(np.int32).max
+    if dense:
+        distances = np.empty((len(sources), num_verts), dtype=np.int32)
+    else:
+        results = []
+    for i, source in enumerate(sources):
+        df = bfs_wrapper.bfs(G.graph_ptr, int(source))
+        if dense:
+            distances[i] = df['distance'].to_array()
+            if depth_limit is not None:
+                distances[i][distances[i] > depth_limit] = unreachable
+        else:
+            limit = unreachable - 1 if depth_limit is None else depth_limit  # NOQA
+            df = df.query('distance <= @limit')
+            result = cudf.DataFrame()
+            result['source'] = cudf.Series(np.full(len(df), source,
+                                                   dtype=np.int32))
+            result['vertex'] = df['vertex']
+            result['distance'] = df['distance']
+            results.append(result)
+
+    if dense:
+        return distances
+    if not results:
+        df = cudf.DataFrame()
+        df['source'] = cudf.Series(np.empty(0, dtype=np.int32))
+        df['vertex'] = cudf.Series(np.empty(0, dtype=np.int32))
+        df['distance'] = cudf.Series(np.empty(0, dtype=np.int32))
+        return df
+    return cudf.concat(results)
@@ -0,0 +1,191 @@
+# Copyright (c) 2019, NVIDIA CORPORATION.
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from cugraph.structure import graph_host
+import numpy as np
+import pandas as pd
+
+
+def bfs(graph_ptr, start, directed=True, max_depth=None, targets=None):
+    """
+    Host implementation of gdf_bfs
+    """
+    offsets, indices, _ = graph_host.view_adj_list(graph_ptr)
+    num_verts = len(offsets) - 1
+
+    df = pd.DataFrame()
+    if max_depth is None and targets is None:
+        df['vertex'] = graph_host.vertex_ids(num_verts)
+        df['distance'], df['predecessor'] = _bfs(offsets, indices, start)
+    else:
+        df['vertex'], df['distance'], df['predecessor'] = \
+            _bfs_limited(offsets, indices, start, max_depth, targets)
+
+    return df
+
+
+def _bfs(offsets, indices, start):
+    # Level synchronous traversal, each level is expanded in a single
+    # vectorized step.
+    num_verts = len(offsets) - 1
+    distances = np.full(num_verts, np.iinfo(np.int32).max, dtype=np.int32)
+    predecessors = np.full(num_verts, -1,
+                           dtype=graph_host.index_dtype(num_verts))
+
+    distances[start] = 0
+    frontier = np.asarray([start], dtype=indices.dtype)
+    depth = 0
+    while len(frontier) > 0:
+        depth += 1
+        owners, positions = graph_host.gather_neighbors(offsets, indices,
+                                                        frontier)
+        neighbors = indices[positions]
+        unvisited = distances[neighbors] == np.iinfo(np.int32).max
+        neighbors, first = np.unique(neighbors[unvisited], return_index=True)
+        distances[neighbors] = depth
+        predecessors[neighbors] = owners[unvisited][first]
+        frontier = neighbors
+
+    return distances, predecessors
+
+
+def contains(sorted_ids, values):
+    """
+    Return a mask of the values present in the sorted array sorted_ids.
+    """
+    if len(sorted_ids) == 0:
+        return np.zeros(len(values), dtype=bool)
+    positions = np.searchsorted(sorted_ids, values)
+    positions[positions == len(sorted_ids)] = 0
+    return sorted_ids[positions] == values
+
+
+def _bfs_limited(offsets, indices, start, max_depth, targets):
+    # Level synchronous traversal that only stores the visited vertices (as a
+    # sorted array), so the work and the memory used are proportional to the
+    # visited part of the graph. Stops after max_depth levels or once every
+    # vertex of targets is reached. Returns the vertices sorted by id.
+    num_verts = len(offsets) - 1
+    vertex_dtype = graph_host.index_dtype(num_verts)
+    if max_depth is None:
+        max_depth = num_verts
+    remaining = None
+    if targets is not None:
+        remaining = np.setdiff1d(targets, [start])
+
+    visited = np.asarray([start], dtype=vertex_dtype)
+    levels = [(visited, np.asarray([-1], dtype=vertex_dtype))]
+    frontier = visited
+    depth = 0
+    while len(frontier) > 0 and depth < max_depth and \
+            (remaining is None or len(remaining) > 0):
+        depth += 1
+        owners, positions = graph_host.gather_neighbors(offsets, indices,
+                                                        frontier)
+        neighbors, first = np.unique(indices[positions], return_index=True)
+        new = ~contains(visited, neighbors)
+        frontier = neighbors[new].astype(vertex_dtype)
+        levels.append((frontier, owners[first][new].astype(vertex_dtype)))
+        visited = np.union1d(visited, frontier)
+        if remaining is not None:
+            remaining = remaining[~contains(frontier, remaining)]
+
+    vertices = np.concatenate([v for v, _ in levels])
+    distances = np.concatenate([np.full(len(v), d, dtype=np.int32)
+                                for d, (v, _) in enumerate(levels)])
+    predecessors = np.concatenate([p for _, p in levels])
+    order = np.argsort(vertices)
+    return vertices[order], distances[order], predecessors[order]
+
+
+def bfs_batch(graph_ptr, sources, depth_limit=None, dense=False):
+    """
+    Host implementation of bfs_batch
+    """
+    offsets, indices, _ = graph_host.view_adj_list(graph_ptr)
+    num_verts = len(offsets) - 1
+    sources = graph_host.to_host_array(sources, dtype=np.int64)
+    if depth_limit is None:
+        depth_limit = num_verts
+
+    if dense:
+        distances = np.full((len(sources), num_verts),
+                            np.iinfo(np.int32).max, dtype=np.int32)
+    else:
+        levels = [(np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64),
+                   0)]
+
+    # Traverse 64 sources at a time, one bit of a uint64 word per source
+    for start in range(0, len(sources), 64):
+        block = sources[start:start + 64]
+        for vertices, lanes, depth in _bfs_block(offsets, indices, block,
+                                                 depth_limit):
+            if dense:
+                distances[start + lanes, vertices] = depth
+            else:
+                levels.append((start + lanes, vertices, depth))
+
+    if dense:
+        return distances
+
+    rows = np.concatenate([r for r, _, _ in levels])
+    vertices = np.concatenate([v for _, v, _ in levels])
+    depths = np.concatenate([np.full(len(r), d, dtype=np.int32)
+                             for r, _, d in levels])
+    order = np.lexsort((vertices, rows))
+
+    vertex_dtype = graph_host.index_dtype(num_verts)
+    df = pd.DataFrame()
+    df['source'] = sources[rows[order]].astype(vertex_dtype)
+    df['vertex'] = vertices[order].astype(vertex_dtype)
+    df['distance'] = depths[order]
+
+    return df
+
+
+def _lanes(words):
+    # Return the (position, bit) pairs of the set bits of a uint64 array
+    bits = np.unpackbits(words.astype('<u8').view(np.uint8).reshape(-1, 8),
+                         axis=1, bitorder='little')
+    return np.nonzero(bits)
+
+
+def _bfs_block(offsets, indices, sources, depth_limit):
+    # Multi-source BFS over up to 64 sources: bit i of visited[v] (frontier[v])
+    # is set if v was reached (is in the current frontier) for sources[i].
+    # Every level expands the union of the frontiers once and ORs the frontier
+    # words along the edges. Yields the (vertices, source lanes, depth) reached
+    # at each level.
+    num_verts = len(offsets) - 1
+    visited = np.zeros(num_verts, dtype=np.uint64)
+    np.bitwise_or.at(visited, sources,
+                     np.left_shift(np.uint64(1),
+                                   np.arange(len(sources), dtype=np.uint64)))
+    frontier = visited.copy()
+    active = np.flatnonzero(frontier)
+    depth = 0
+    while len(active) > 0:
+        positions, lanes = _lanes(frontier[active])
+        yield active[positions], lanes, depth
+        if depth == depth_limit:
+            break
+
+        depth += 1
+        owners, positions = graph_host.gather_neighbors(offsets, indices,
+                                                        active)
+        next_frontier = np.zeros(num_verts, dtype=np.uint64)
+        np.bitwise_or.at(next_frontier, indices[positions], frontier[owners])
+        next_frontier &= ~visited
+        visited |= next_frontier
+        frontier = next_frontier
+        active = np.flatnonzero(frontier)
@@ -0,0 +1,130 @@
+# Copyright (c) 2019, NVIDIA CORPORATION.
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from cugraph.structure import graph_host
+from cugraph.structure.graph import memory_budgeted
+from cugraph.traversal import shortest_path_host
+from cugraph.traversal.bfs import bfs
+from cugraph.traversal.sssp import sssp
+import numpy as np
+
+
+@memory_budgeted
+def shortest_path(G, source, target, weighted=True):
+    """
+    Find a shortest path from source to target and its length.
+
+    On the host backend the path is found with a bidirectional search, which
+    grows a search from each end of the path (over the adjacency list and the
+    transposed adjacency list) and stops as soon as the two searches meet:
+    bidirectional BFS for unweighted searches and bidirectional Dijkstra for
+    weighted searches. Only the neighbourhoods of source and target are
+    visited, instead of the whole graph for sssp.
+
+    Parameters
+    ----------
+    G : cugraph.Graph
+        cuGraph graph descriptor with connectivity information. Edge weights,
+        if used, must be non-negative.
+    source : int or array-like
+        Index of the first vertex of the path, or an array of source vertices
+        to find the paths of several (source, target) pairs.
+    target : int or array-like
+        Index of the last vertex of the path, or an array of target vertices
+        of the same length as source.
+    weighted : bool, optional
+        If True (the default) and the graph is weighted, minimize the sum of
+        the edge weights. Otherwise minimize the number of edges.
+
+    Returns
+    -------
+    path : NumPy array
+        The vertices of a shortest path, from source to target (empty if
+        target is unreachable from source).
+    distance : numpy scalar
+        The length of the path: the number of edges (int32) or the sum of the
+        edge weights (of the type of the weights). Unreachable targets have
+        the largest value of the type as distance, as in sssp.
+
+    If source and target are arrays, a list of paths and a NumPy array of
+    distances are returned, one per (source, target) pair.
+
+    Examples
+    --------
+    >>> M = cudf.read_csv('datasets/karate.csv', delimiter=' ',
+    >>>                   dtype=['int32', 'int32', 'float32'], header=None)
+    >>> G = cugraph.Graph()
+    >>> G.add_edge_list(M['0'], M['1'], M['2'])
+    >>> path, distance = cugraph.shortest_path(G, 0, 30)
+    >>> paths, distances = cugraph.shortest_path(G, [0, 1], [30, 29])
+    """
+    if np.ndim(source) == 0 and np.ndim(target) == 0:
+        _check_vertices(G, [source, target])
+        return _shortest_path(G, int(source), int(target), weighted)
+
+    sources = graph_host.to_host_array(source, dtype=np.int64)
+    targets = graph_host.to_host_array(target, dtype=np.int64)
+    if sources.shape != targets.shape:
+        raise ValueError('source and target must have the same length')
+    _check_vertices(G, sources)
+    _check_vertices(G, targets)
+
+    paths = []
+    distances = []
+    for s, t in zip(sources.tolist(), targets.tolist()):
+        path, distance = _shortest_path(G, s, t, weighted)
+        paths.append(path)
+        distances.append(distance)
+    if distances:
+        distances = np.asarray(distances)
+    else:
+        distances = np.empty(0, dtype=np.int32)
+
+    return paths, distances
+
+
+def _check_vertices(G, vertices):
+    vertices = np.asarray(vertices, dtype=np.int64)
+    num_verts = G.number_of_vertices()
+    if len(vertices) and (vertices.min() < 0 or vertices.max() >= num_verts):
+        raise ValueError('vertex ids must be in [0, %d)' % num_verts)
+
+
+def _shortest_path(G, source, target, weighted):
+    if G.backend == 'host':
+        return shortest_path_host.shortest_path(G.graph_ptr, source, target,
+                                                weighted)
+
+    # libcugraph has no point-to-point search: run a traversal from source
+    # that stops once target is reached and follow the predecessors back
+    if weighted:
+        df = sssp(G, source, targets=[target])
+    else:
+        df = bfs(G, source, targets=[target])
+    vertices = df['vertex'].to_array()
+    distances = df['distance'].to_array()
+    predecessors = df['predecessor'].to_array()
+
+    position = np.searchsorted(vertices, target)
+    if position == len(vertices) or vertices[position] != target:
+        if np.issubdtype(distances.dtype, np.integer):
+            unreachable = np.iinfo(distances.dtype).max
+        else:
+            unreachable = np.finfo(distances.dtype).max
+        return (np.empty(0, dtype=vertices.dtype),
+                distances.dtype.type(unreachable))
+
+    path = [target]
+    while path[-1] != source:
+        path.append(predecessors[np.searchsorted(vertices, path[-1])])
+    return np.asarray(path[::-1], dtype=vertices.dtype), distances[position]
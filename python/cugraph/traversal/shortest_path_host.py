@@ -0,0 +1,152 @@
+# Copyright (c) 2019, NVIDIA CORPORATION.
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import heapq
+
+from cugraph.structure import graph_host
+from cugraph.traversal import bfs_host
+import numpy as np
+
+
+def shortest_path(graph_ptr, source, target, weighted=True):
+    """
+    Host implementation of shortest_path
+    """
+    offsets, indices, weights = graph_host.view_adj_list(graph_ptr)
+    t_offsets, t_indices, t_weights = \
+        graph_host.view_transposed_adj_list(graph_ptr)
+    vertex_dtype = graph_host.index_dtype(len(offsets) - 1)
+
+    if weighted and weights is not None:
+        if len(weights) > 0 and weights.min() < 0:
+            raise ValueError('edge weights must be non-negative')
+        unreachable = np.finfo(weights.dtype).max
+        forward = (offsets, indices, weights)
+        backward = (t_offsets, t_indices, t_weights)
+        path, distance = _bidirectional_dijkstra(forward, backward, source,
+                                                 target)
+    else:
+        unreachable = np.int32(np.iinfo(np.int32).max)
+        path, distance = _bidirectional_bfs((offsets, indices),
+                                            (t_offsets, t_indices),
+                                            source, target)
+
+    if path is None:
+        return np.empty(0, dtype=vertex_dtype), unreachable
+    return (np.asarray(path, dtype=vertex_dtype),
+            unreachable.dtype.type(distance))
+
+
+def _walk(predecessors, vertex):
+    # Follow a {vertex: predecessor} map from vertex back to the root
+    path = [vertex]
+    while predecessors[path[-1]] != -1:
+        path.append(predecessors[path[-1]])
+    return path
+
+
+class _Search:
+    # Level synchronous BFS from one end of the path, storing the visited
+    # vertices as a sorted array
+    def __init__(self, offsets, indices, root):
+        self.offsets = offsets
+        self.indices = indices
+        self.visited = np.asarray([root], dtype=np.int64)
+        self.frontier = self.visited
+        self.depth = 0
+        self.distances = {root: 0}
+        self.predecessors = {root: -1}
+
+    def cost(self):
+        # Number of edges expanded by the next step
+        return int((self.offsets[self.frontier + 1] -
+                    self.offsets[self.frontier]).sum())
+
+    def step(self):
+        owners, positions = graph_host.gather_neighbors(
+            self.offsets, self.indices, self.frontier)
+        neighbors, first = np.unique(self.indices[positions],
+                                     return_index=True)
+        new = ~bfs_host.contains(self.visited, neighbors)
+        self.depth += 1
+        self.frontier = neighbors[new].astype(np.int64)
+        for v, p in zip(self.frontier.tolist(),
+                        owners[first][new].tolist()):
+            self.distances[v] = self.depth
+            self.predecessors[v] = p
+        self.visited = np.union1d(self.visited, self.frontier)
+
+
+def _bidirectional_bfs(forward, backward, source, target):
+    # Alternately expand a full level of the search with the cheaper frontier.
+    # The first level that reaches a vertex visited by the other search
+    # yields the shortest path, through its meeting vertex closest to the
+    # other end.
+    if source == target:
+        return [source], 0
+    searches = [_Search(*forward, source), _Search(*backward, target)]
+    while len(searches[0].frontier) > 0 and len(searches[1].frontier) > 0:
+        side = 0 if searches[0].cost() <= searches[1].cost() else 1
+        this, other = searches[side], searches[1 - side]
+        this.step()
+        meeting = this.frontier[bfs_host.contains(other.visited,
+                                                  this.frontier)]
+        if len(meeting) > 0:
+            middle = min(meeting.tolist(), key=other.distances.get)
+            head = _walk(searches[0].predecessors, middle)[::-1]
+            tail = _walk(searches[1].predecessors, middle)[1:]
+            return head + tail, this.depth + other.distances[middle]
+    return None, None
+
+
+def _bidirectional_dijkstra(forward, backward, source, target):
+    # Alternate Dijkstra steps from both ends, always settling the closest
+    # unsettled vertex of either search, and stop once the sum of the two
+    # queue minimums can no longer improve the best path found.
+    if source == target:
+        return [source], 0
+    distances = [{source: 0.0}, {target: 0.0}]
+    predecessors = [{source: -1}, {target: -1}]
+    settled = [set(), set()]
+    queues = [[(0.0, source)], [(0.0, target)]]
+    graphs = [forward, backward]
+    best, middle = np.inf, None
+
+    while queues[0] and queues[1]:
+        if queues[0][0][0] + queues[1][0][0] >= best:
+            break
+        side = 0 if queues[0][0][0] <= queues[1][0][0] else 1
+        d, u = heapq.heappop(queues[side])
+        if u in settled[side]:
+            continue
+        settled[side].add(u)
+
+        offsets, indices, weights = graphs[side]
+        start, end = offsets[u], offsets[u + 1]
+        for v, w in zip(indices[start:end].tolist(),
+                        weights[start:end].tolist()):
+            candidate = d + w
+            if candidate < distances[side].get(v, np.inf):
+                distances[side][v] = candidate
+                predecessors[side][v] = u
+                heapq.heappush(queues[side], (candidate, v))
+            if v in distances[1 - side]:
+                total = candidate + distances[1 - side][v]
+                if total < best:
+                    best, middle = total, v
+
+    if middle is None:
+        return None, None
+    head = _walk(predecessors[0], middle)[::-1]
+    tail = _walk(predecessors[1], middle)[1:]
+    return head + tail, best
@@ -11,11 +11,18 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from cugraph.traversal import sssp_wrapper
+from cugraph.structure.graph import memory_budgeted
+from cugraph.traversal import sssp_host
+from cugraph.traversal.bfs import _targets, _compact
+try:
+    from cugraph.traversal import sssp_wrapper
+except ImportError:
+    sssp_wrapper = None
 import numpy as np
 
 
-def sssp(G, source):
+@memory_budgeted
+def sssp(G, source, max_distance=None, targets=None):
     """
     Compute the distance and predecessors for shortest paths from the specified
     source to all the vertices in the graph. The distances column will store
@@ -26,6 +33,12 @@ def sssp(G, source):
     predecessor is also set to -1. Graphs with negative weight cycles are not
     supported.
 
+    If max_distance or targets is set, the traversal stops early and the
+    result is compact: it only holds the visited vertices (sorted by vertex
+    id), i.e. the vertices at distance at most max_distance from the source
+    and, once all the targets are reached, no farther than the farthest
+    target. Weights must then be non-negative.
+
     Parameters
     ----------
     graph : cuGraph.Graph
@@ -33,6 +46,11 @@ def sssp(G, source):
         if present, should be single or double precision floating point values.
     source : int
         Index of the source vertex.
+    max_distance : float, optional
+        Ignore the paths longer than max_distance.
+    targets : cudf.Series, NumPy array or array-like, optional
+        Stop the traversal as soon as the shortest paths to all these
+        vertices are known.
 
     Returns
     -------
@@ -43,6 +61,9 @@ def sssp(G, source):
         df['predecessor'][i] gives the vertex id of the vertex that was reached
         before the i'th vertex in the traversal.
 
+        A pandas.DataFrame with the same columns is returned for graphs using
+        the host backend.
+
     Examples
     --------
     >>> M = cudf.read_csv('datasets/karate.csv', delimiter=' ',
@@ -52,9 +73,23 @@ def sssp(G, source):
     >>> G = cugraph.Graph()
     >>> G.add_edge_list(sources, destinations, None)
     >>> distances = cugraph.sssp(G, 0)
+    >>> distances = cugraph.sssp(G, 0, targets=[5, 16])
     """
+    targets = _targets(G, targets)
+    if max_distance is not None or targets is not None:
+        # The early stop assumes that distances only grow along a path
+        _, _, value_col = G.view_adj_list()
+        if value_col is not None and len(value_col) > 0 and \
+                value_col.min() < 0:
+            raise ValueError('edge weights must be non-negative when '
+                             'max_distance or targets is set')
 
-    df = sssp_wrapper.sssp(G.graph_ptr, source)
+    if G.backend == 'host':
+        df = sssp_host.sssp(G.graph_ptr, source, max_distance, targets)
+    else:
+        df = sssp_wrapper.sssp(G.graph_ptr, source)
+        if max_distance is not None or targets is not None:
+            df = _compact(df, max_distance, targets)
 
     return df
 
@@ -0,0 +1,155 @@
+# Copyright (c) 2019, NVIDIA CORPORATION.
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from cugraph.structure import graph_host
+from cugraph.traversal import bfs_host
+import numpy as np
+import pandas as pd
+
+
+def sssp(graph_ptr, source, max_distance=None, targets=None):
+    """
+    Host implementation of gdf_sssp (gdf_bfs for unweighted graphs)
+    """
+    offsets, indices, value = graph_host.view_adj_list(graph_ptr)
+    num_verts = len(offsets) - 1
+
+    df = pd.DataFrame()
+    if max_distance is not None or targets is not None:
+        if value is None:
+            max_depth = None
+            if max_distance is not None:
+                max_depth = int(np.floor(max_distance))
+            df['vertex'], df['distance'], df['predecessor'] = \
+                bfs_host._bfs_limited(offsets, indices, source, max_depth,
+                                      targets)
+        else:
+            df['vertex'], df['distance'], df['predecessor'] = \
+                _sssp_limited(offsets, indices, value, source, max_distance,
+                              targets)
+        return df
+
+    df['vertex'] = graph_host.vertex_ids(num_verts)
+    if value is None:
+        df['distance'], df['predecessor'] = bfs_host._bfs(offsets, indices,
+                                                          source)
+    else:
+        df['distance'], df['predecessor'] = _sssp(offsets, indices, value,
+                                                  source)
+
+    return df
+
+
+def _sssp(offsets, indices, weights, source):
+    # Frontier based Bellman-Ford: the out-edges of the vertices whose
+    # distance decreased in the previous step are relaxed in a single
+    # vectorized step. Unreachable vertices keep the largest weight value as
+    # distance, following the device conventions.
+    num_verts = len(offsets) - 1
+    unreachable = np.finfo(weights.dtype).max
+    distances = np.full(num_verts, unreachable, dtype=weights.dtype)
+    predecessors = np.full(num_verts, -1,
+                           dtype=graph_host.index_dtype(num_verts))
+
+    distances[source] = 0
+    frontier = np.asarray([source], dtype=indices.dtype)
+    while len(frontier) > 0:
+        owners, positions = graph_host.gather_neighbors(offsets, indices,
+                                                        frontier)
+        neighbors = indices[positions]
+        candidates = distances[owners] + weights[positions]
+        improved = candidates < distances[neighbors]
+        owners = owners[improved]
+        neighbors = neighbors[improved]
+        candidates = candidates[improved]
+
+        # Keep the shortest candidate of each improved vertex
+        order = np.lexsort((candidates, neighbors))
+        neighbors = neighbors[order]
+        first = np.ones(len(neighbors), dtype=bool)
+        first[1:] = neighbors[1:] != neighbors[:-1]
+        frontier = neighbors[first]
+        distances[frontier] = candidates[order][first]
+        predecessors[frontier] = owners[order][first]
+
+    return distances, predecessors
+
+
+def _sssp_limited(offsets, indices, weights, source, max_distance, targets):
+    # Same relaxation as _sssp, but only the visited vertices are stored (in
+    # the sorted array ids, with their distances and predecessors) and paths
+    # longer than max_distance are pruned. With non-negative weights, a vertex
+    # whose distance is at most the smallest distance in the frontier is
+    # settled: the traversal stops once all targets are settled, and only
+    # vertices no farther than the farthest target are returned.
+    vertex_dtype = graph_host.index_dtype(len(offsets) - 1)
+    ids = np.asarray([source], dtype=vertex_dtype)
+    distances = np.zeros(1, dtype=weights.dtype)
+    predecessors = np.asarray([-1], dtype=vertex_dtype)
+
+    frontier = ids
+    while len(frontier) > 0:
+        if targets is not None and bfs_host.contains(ids, targets).all():
+            farthest = _farthest(ids, distances, targets)
+            if farthest <= distances[np.searchsorted(ids, frontier)].min():
+                break
+
+        owners, positions = graph_host.gather_neighbors(offsets, indices,
+                                                        frontier)
+        neighbors = indices[positions]
+        candidates = distances[np.searchsorted(ids, owners)] + \
+            weights[positions]
+        if max_distance is not None:
+            keep = candidates <= max_distance
+            owners = owners[keep]
+            neighbors = neighbors[keep]
+            candidates = candidates[keep]
+
+        # Keep the shortest candidate of each neighbor
+        order = np.lexsort((candidates, neighbors))
+        neighbors = neighbors[order]
+        first = np.ones(len(neighbors), dtype=bool)
+        first[1:] = neighbors[1:] != neighbors[:-1]
+        neighbors = neighbors[first].astype(vertex_dtype)
+        candidates = candidates[order][first]
+        owners = owners[order][first].astype(vertex_dtype)
+
+        # Update the visited vertices, insert the new ones
+        known = bfs_host.contains(ids, neighbors)
+        positions = np.searchsorted(ids, neighbors[known])
+        improved = candidates[known] < distances[positions]
+        distances[positions[improved]] = candidates[known][improved]
+        predecessors[positions[improved]] = owners[known][improved]
+        frontier = np.concatenate([neighbors[known][improved],
+                                   neighbors[~known]])
+
+        ids = np.concatenate([ids, neighbors[~known]])
+        distances = np.concatenate([distances, candidates[~known]])
+        predecessors = np.concatenate([predecessors, owners[~known]])
+        order = np.argsort(ids, kind='stable')
+        ids = ids[order]
+        distances = distances[order]
+        predecessors = predecessors[order]
+        frontier = np.sort(frontier)
+
+    if targets is not None and bfs_host.contains(ids, targets).all():
+        keep = distances <= _farthest(ids, distances, targets)
+        ids = ids[keep]
+        distances = distances[keep]
+        predecessors = predecessors[keep]
+
+    return ids, distances, predecessors
+
+
+def _farthest(ids, distances, targets):
+    return np.max(distances[np.searchsorted(ids, targets)], initial=0)
@@ -12,4 +12,10 @@
 # limitations under the License.
 
 # from cugraph.utilities.grmat import grmat_gen
-from cugraph.utilities.pointer_utils import device_of_gpu_pointer
+from cugraph.utilities.solver_stats import SolverStats
+from cugraph.utilities.executor import GraphExecutor, GraphFuture, submit
+try:
+    from cugraph.utilities.pointer_utils import device_of_gpu_pointer
+except ImportError:
+    # Built without the device extensions, only the host backend is usable
+    device_of_gpu_pointer = None
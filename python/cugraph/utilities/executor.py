@@ -0,0 +1,275 @@
+# Copyright (c) 2019, NVIDIA CORPORATION.
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+from collections import deque
+from concurrent.futures import CancelledError, Future
+import inspect
+import queue
+import threading
+
+import cugraph
+
+
+class GraphFuture(Future):
+    """
+    A concurrent.futures.Future of an algorithm run by a GraphExecutor. It
+    can be awaited from asyncio code, and unlike a plain Future it can be
+    cancelled while running: iterative solvers supporting callbacks (on the
+    host backend) stop at the end of their current iteration.
+    """
+    def __init__(self):
+        super().__init__()
+        self._cancel_requested = threading.Event()
+        self._interruptible = False
+
+    def cancel(self):
+        """
+        Cancel the algorithm. Return False if it already finished or if it
+        is running and cannot be interrupted, True otherwise.
+        """
+        if super().cancel():
+            return True
+        if self.running() and self._interruptible:
+            self._cancel_requested.set()
+            return True
+        return False
+
+    def cancelled(self):
+        if super().cancelled():
+            return True
+        return self.done() and self._cancel_requested.is_set() and \
+            isinstance(self.exception(), CancelledError)
+
+    def __await__(self):
+        return asyncio.wrap_future(self).__await__()
+
+
+class GraphExecutor:
+    """
+    Pool of worker threads running cuGraph algorithms in the background, so
+    that the calling thread (for instance an asyncio event loop) can overlap
+    I/O, renumbering or result serialization with the computation.
+
+    The executor holds a reference to the graph of every submitted job until
+    it completes. Jobs on the same graph run one at a time (a graph builds
+    its representations lazily and is not thread safe), jobs on different
+    graphs run concurrently on up to max_workers threads. The jobs waiting
+    for a running job on their graph are kept aside in a queue per graph,
+    so they never hold a worker thread.
+
+    Parameters
+    ----------
+    max_workers : int, optional
+        Number of worker threads, 1 by default (the device backend runs
+        one algorithm at a time on the GPU anyway).
+    max_queue : int, optional
+        Largest number of jobs waiting for a worker. When the queue is full
+        submit blocks (or raises queue.Full), which pushes back on the
+        producers. Unbounded by default.
+
+    Examples
+    --------
+    >>> executor = cugraph.GraphExecutor(max_workers=2, max_queue=8)
+    >>> future = executor.submit(cugraph.pagerank, G, alpha=0.9)
+    >>> df = future.result()
+    >>> df = await executor.submit('louvain', G)
+    >>> executor.shutdown()
+    """
+    def __init__(self, max_workers=1, max_queue=None):
+        if max_workers < 1:
+            raise ValueError('max_workers must be at least 1')
+        if max_queue is not None and max_queue < 0:
+            raise ValueError('max_queue must be non-negative')
+        # Jobs ready to run, at most one per graph
+        self._jobs = queue.Queue()
+        self._slots = None
+        if max_queue is not None:
+            self._slots = threading.BoundedSemaphore(max_workers + max_queue)
+        # Graphs with a job ready or running, mapped to the queue of their
+        # other jobs (in submission order)
+        self._waiting = {}
+        self._lock = threading.Lock()
+        self._shutdown = False
+        self._stopped = False
+        self._threads = []
+        for i in range(max_workers):
+            t = threading.Thread(target=self._work, daemon=True,
+                                 name='cugraph-executor-%d' % i)
+            t.start()
+            self._threads.append(t)
+
+    def submit(self, algorithm, G, *args, block=True, timeout=None,
+               **kwargs):
+        """
+        Schedule algorithm(G, *args, **kwargs) and return its GraphFuture.
+
+        Parameters
+        ----------
+        algorithm : callable or string
+            A cuGraph algorithm, or the name of one (for instance
+            'pagerank').
+        G : cugraph.Graph
+            The graph passed as first argument of the algorithm.
+        block : bool, optional
+            If the queue is full, wait for a free slot (the default) or raise
+            queue.Full immediately.
+        timeout : float, optional
+            Largest wait for a free slot in seconds, then raise queue.Full.
+        """
+        if isinstance(algorithm, str):
+            name = algorithm
+            algorithm = getattr(cugraph, name, None)
+            if not callable(algorithm):
+                raise ValueError('unknown algorithm %r' % name)
+        elif not callable(algorithm):
+            raise TypeError('algorithm must be callable or a string')
+        if self._shutdown:
+            raise RuntimeError('cannot submit after shutdown')
+        if self._slots is not None and \
+                not self._slots.acquire(block, timeout):
+            raise queue.Full('the executor queue is full')
+
+        future = GraphFuture()
+        future._interruptible = _interruptible(algorithm, G)
+        job = (future, algorithm, G, args, kwargs)
+        with self._lock:
+            if G in self._waiting:
+                self._waiting[G].append(job)
+            else:
+                self._waiting[G] = deque()
+                self._jobs.put(job)
+        return future
+
+    def _work(self):
+        while True:
+            job = self._jobs.get()
+            if job is None:
+                return
+            future, algorithm, G, args, kwargs = job
+            try:
+                if future.set_running_or_notify_cancel():
+                    self._run(future, algorithm, G, args, kwargs)
+            finally:
+                self._next(G)
+                del job, G
+                if self._slots is not None:
+                    self._slots.release()
+
+    def _next(self, G):
+        # Make the next job on G ready, once its previous job is done
+        with self._lock:
+            waiting = self._waiting[G]
+            if waiting:
+                self._jobs.put(waiting.popleft())
+            else:
+                del self._waiting[G]
+                if self._shutdown and not self._waiting:
+                    self._stop()
+
+    def _stop(self):
+        # Called with self._lock held, once no job is left
+        if not self._stopped:
+            self._stopped = True
+            for _ in self._threads:
+                self._jobs.put(None)
+
+    def _run(self, future, algorithm, G, args, kwargs):
+        if future._interruptible:
+            user_callback = kwargs.get('callback')
+
+            def callback(iteration, residual):
+                if future._cancel_requested.is_set():
+                    return True
+                return user_callback is not None and \
+                    user_callback(iteration, residual)
+            kwargs = dict(kwargs, callback=callback)
+        try:
+            result = algorithm(G, *args, **kwargs)
+        except BaseException as e:
+            future.set_exception(e)
+            return
+        if future._cancel_requested.is_set():
+            future.set_exception(CancelledError())
+        else:
+            future.set_result(result)
+
+    def shutdown(self, wait=True):
+        """
+        Stop the workers once the queued jobs are done. Jobs submitted after
+        shutdown raise RuntimeError.
+        """
+        with self._lock:
+            self._shutdown = True
+            if not self._waiting:
+                self._stop()
+        if wait:
+            for t in self._threads:
+                t.join()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.shutdown()
+        return False
+
+
+def _interruptible(algorithm, G):
+    # Iterative solvers take a callback, only called on the host backend
+    try:
+        parameters = inspect.signature(algorithm).parameters
+    except (TypeError, ValueError):
+        return False
+    return 'callback' in parameters and \
+        getattr(G, 'backend', None) == 'host'
+
+
+_default_executor = None
+_default_lock = threading.Lock()
+
+
+def submit(algorithm, G, *args, **kwargs):
+    """
+    Run a cuGraph algorithm in the background on the default GraphExecutor
+    (one worker thread, unbounded queue) and return a GraphFuture, a
+    concurrent.futures.Future that can also be awaited.
+
+    Parameters
+    ----------
+    algorithm : callable or string
+        A cuGraph algorithm, or the name of one (for instance 'pagerank').
+    G : cugraph.Graph
+        The graph passed as first argument of the algorithm.
+    *args, **kwargs
+        The other arguments of the algorithm.
+
+    Returns
+    -------
+    future : cugraph.GraphFuture
+        Its result is the result of the algorithm. future.cancel() cancels a
+        queued job, or stops a running iterative solver (pagerank,
+        katz_centrality, spectral clustering on the host backend) after its
+        current iteration.
+
+    Examples
+    --------
+    >>> future = cugraph.submit(cugraph.pagerank, G, alpha=0.85)
+    >>> df = future.result()
+    >>> df = await cugraph.submit('katz_centrality', G)
+    """
+    global _default_executor
+    with _default_lock:
+        if _default_executor is None:
+            _default_executor = GraphExecutor()
+    return _default_executor.submit(algorithm, G, *args, **kwargs)
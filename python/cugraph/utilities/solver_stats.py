@@ -0,0 +1,90 @@
+# Copyright (c) 2019, NVIDIA CORPORATION.
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from contextlib import contextmanager
+import time
+
+
+class SolverStats:
+    """
+    Convergence telemetry of a run of an iterative solver (pagerank,
+    personalized_pagerank_batch, IncrementalPageRank, katz_centrality,
+    louvain, spectral clustering and DistributedGraph.pagerank), returned by
+    the solvers when called with return_stats=True.
+
+    Attributes
+    ----------
+    iterations : int or None
+        Number of iterations run. None if the backend does not report it
+        (device backend).
+    residuals : list of float
+        Residual of each iteration, in the solver's own norm (the one compared
+        with its tolerance).
+    times : dict
+        Wall time in seconds of each phase of the run (for instance
+        'csr_build', 'iterations' and 'output'), in execution order.
+    converged : bool or None
+        True if the solver reached its tolerance, None if unknown.
+    stopped : bool
+        True if the callback stopped the solver early.
+    counters : dict
+        Other solver specific counts (for instance the number of operator
+        applications of an eigensolver).
+    """
+    def __init__(self, callback=None):
+        self.iterations = 0
+        self.residuals = []
+        self.times = {}
+        self.converged = None
+        self.stopped = False
+        self.counters = {}
+        self._callback = callback
+
+    def start_device_run(self, callback):
+        """
+        Prepare the record of a device run: libcugraph does not report
+        per-iteration information and cannot call back into Python.
+        """
+        if callback is not None:
+            raise NotImplementedError("callback is only supported on the "
+                                      "host backend")
+        self.iterations = None
+
+    @contextmanager
+    def phase(self, name):
+        """
+        Context manager adding the time spent in its block to times[name].
+        """
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.times[name] = self.times.get(name, 0.0) + \
+                time.perf_counter() - start
+
+    def record(self, residual):
+        """
+        Record an iteration with the given residual and call the callback.
+        Return True if the callback asked the solver to stop.
+        """
+        self.iterations += 1
+        self.residuals.append(residual)
+        if self._callback is not None and \
+                self._callback(self.iterations, residual):
+            self.stopped = True
+        return self.stopped
+
+    def __repr__(self):
+        return ('SolverStats(iterations=%r, converged=%r, stopped=%r, '
+                'times=%r)' % (self.iterations, self.converged, self.stopped,
+                               self.times))
@@ -0,0 +1,82 @@
+import argparse
+import time
+
+import numpy as np
+
+import cugraph
+from cugraph.link_prediction.minhash import MinHash
+from run_benchmarks import loadDataFile, createGraph
+
+
+parser = argparse.ArgumentParser(description='Compare the MinHash estimates '
+                                 'of the Jaccard similarity with the exact '
+                                 'cugraph.jaccard output, for increasing '
+                                 'numbers of hash functions.')
+parser.add_argument('file', type=str,
+                    help='Path to the input file')
+parser.add_argument('--file_type', type=str, default="csv",
+                    choices=["mtx", "csv"],
+                    help='Input file type: csv or mtx. Default is csv')
+parser.add_argument('--delimiter', type=str, choices=["tab", "space"],
+                    default="space",
+                    help='Delimiter for csv files (default is space)')
+parser.add_argument('--backend', type=str, default=None,
+                    choices=["host", "device"],
+                    help='Graph backend, see run_benchmarks.py')
+parser.add_argument('--num_hashes', type=int, action="append",
+                    help='Number of hash functions, can be repeated. '
+                    'Default is 16, 64, 256 and 1024')
+parser.add_argument('--pairs', type=str, default="edges",
+                    choices=["edges", "two_hop"],
+                    help='Pairs compared: the edges (the default) or the '
+                    'two-hop pairs')
+parser.add_argument('--seed', type=int, default=0,
+                    help='Seed of the hash functions. Default is 0')
+args = parser.parse_args()
+
+backend = args.backend or cugraph.structure.graph.default_backend()
+delimiter = {"space": ' ', "tab": '\t'}[args.delimiter]
+G = createGraph(loadDataFile(args.file, args.file_type, backend, delimiter),
+                backend)
+
+if args.pairs == "edges":
+    first = second = None
+else:
+    two_hop = G.get_two_hop_neighbors()
+    first, second = two_hop['first'], two_hop['second']
+
+st = time.perf_counter()
+exact = cugraph.jaccard(G, first, second)
+exactTime = time.perf_counter() - st
+first, second = exact['source'], exact['destination']
+expected = np.asarray(exact['jaccard_coeff'].to_pandas()
+                      if hasattr(exact, 'to_pandas')
+                      else exact['jaccard_coeff'], dtype=np.float64)
+defined = ~np.isnan(expected)
+
+print("%d pairs, exact jaccard: %.6f s" % (len(expected), exactTime))
+print()
+header = ["num_hashes", "build (s)", "estimate (s)", "mean abs error",
+          "p95 abs error", "max abs error", "signatures (bytes)"]
+rows = []
+for numHashes in args.num_hashes or [16, 64, 256, 1024]:
+    st = time.perf_counter()
+    mh = MinHash(G, numHashes, seed=args.seed)
+    buildTime = time.perf_counter() - st
+    st = time.perf_counter()
+    estimate = mh.jaccard(first, second)
+    estimateTime = time.perf_counter() - st
+    estimate = np.asarray(estimate['jaccard_coeff'].to_pandas()
+                          if hasattr(estimate, 'to_pandas')
+                          else estimate['jaccard_coeff'], dtype=np.float64)
+    error = np.abs(estimate - expected)[defined]
+    if len(error) == 0:
+        error = np.zeros(1)
+    rows.append([numHashes, "%.6f" % buildTime, "%.6f" % estimateTime,
+                 "%.4f" % error.mean(), "%.4f" % np.percentile(error, 95),
+                 "%.4f" % error.max(), mh.signatures.nbytes])
+
+widths = [max(len(str(row[i])) for row in [header] + rows)
+          for i in range(len(header))]
+for row in [header] + rows:
+    print(" | ".join(str(c).ljust(w) for c, w in zip(row, widths)))
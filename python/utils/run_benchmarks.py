@@ -1,13 +1,22 @@
 import argparse
+import csv
+import json
 import os
+import platform
 import sys
 import time
+import tracemalloc
 from collections import OrderedDict
 
+import numpy as np
+import pandas as pd
 from scipy.io import mmread
 
 import cugraph
-import cudf
+try:
+    import cudf
+except ImportError:
+    cudf = None
 
 
 ########################################
@@ -17,7 +26,10 @@ def getAlgoData(G, edgelist_gdf, args):
     """
     keyname = algo method/function name
     args = args to pass the method/function (default is no args)
+    params = parameters identifying the run in the results and baselines
+             (default is no parameters)
     obj = object containing the method/function (default is the cugraph module)
+    callable = function to run instead of the keyname method/function of obj
     extraWrappers = list of functions that return a callable, used for
                     "wrapping" the algo to modify its environment, add timers,
                     log calls, etc.
@@ -25,12 +37,17 @@ def getAlgoData(G, edgelist_gdf, args):
     algoData = {"pagerank":
                 {"args": (G, args.damping_factor, None, args.max_iter,
                           args.tolerance),
+                 "params": {"alpha": args.damping_factor,
+                            "max_iter": args.max_iter,
+                            "tol": args.tolerance},
                  },
                 "bfs":
                 {"args": (G, args.source, True),
+                 "params": {"source": args.source},
                  },
                 "sssp":
                 {"args": (G, args.source),
+                 "params": {"source": args.source},
                  "extraWrappers": [noStdoutWrapper],
                  },
                 "jaccard":
@@ -50,9 +67,11 @@ def getAlgoData(G, edgelist_gdf, args):
                  },
                 "spectralBalancedCutClustering":
                 {"args": (G, 2),
+                 "params": {"num_clusters": 2},
                  },
                 "spectralModularityMaximizationClustering":
                 {"args": (G, 2),
+                 "params": {"num_clusters": 2},
                  },
                 "renumber":
                 {"args": (edgelist_gdf["src"], edgelist_gdf["dst"]),
@@ -67,49 +86,137 @@ def getAlgoData(G, edgelist_gdf, args):
                 {"obj": G,
                  },
                 }
+    # Degree of vertex subsets of increasing size (drawn with replacement),
+    # the subsets are only drawn if the algorithm is run
+    for size in DEGREE_SUBSET_SIZES:
+        algoData["degree_subset_%d" % size] = \
+            {"callable": degreeSubset,
+             "setup": lambda size=size: (G, randomVertexSubset(G, size)),
+             "params": {"size": size},
+             }
     return algoData
 
 
-def loadDataFile(file_name, file_type, delimiter=' '):
+DEGREE_SUBSET_SIZES = [10, 1000, 100000, 10000000]
+
+
+def degreeSubset(G, vertex_subset):
+    return G.degree(vertex_subset)
+
+
+def randomVertexSubset(G, size):
+    if G is None:
+        return None
+    vertices = np.random.randint(0, G.number_of_vertices(), size=size,
+                                 dtype=np.int32)
+    return seriesOf(G.backend, vertices)
+
+
+def dataFrameOf(backend):
+    if backend == 'host':
+        return pd.DataFrame()
+    return cudf.DataFrame()
+
+
+def seriesOf(backend, values):
+    if backend == 'host':
+        return pd.Series(values)
+    return cudf.Series(values)
+
+
+def loadDataFile(file_name, file_type, backend, delimiter=' '):
     if file_type == "mtx":
-        edgelist_gdf = read_mtx(file_name)
+        edgelist_gdf = read_mtx(file_name, backend)
     elif file_type == "csv":
-        edgelist_gdf = read_csv(file_name, delimiter)
+        edgelist_gdf = read_csv(file_name, backend, delimiter)
     else:
         raise ValueError("bad file type: '%s'" % file_type)
     return edgelist_gdf
 
 
-def createGraph(edgelist_gdf, auto_csr):
-    G = cugraph.Graph()
+def createGraph(edgelist_gdf, backend, memory_budget=None):
+    G = cugraph.Graph(backend=backend, memory_budget=memory_budget)
     G.add_edge_list(edgelist_gdf["src"], edgelist_gdf["dst"],
                     edgelist_gdf["val"])
+    return G
+
+
+def buildAdjLists(G, auto_csr):
+    # Precompute the adjacency lists so that the conversions are not timed
+    # with the algorithms. With a memory budget, the Graph releases the
+    # representations not fitting the budget (the edge list first) and the
+    # algorithms rebuild them when needed.
     if auto_csr == 0:
         G.view_adj_list()
         G.view_transposed_adj_list()
-    return G
 
 
-def read_mtx(mtx_file):
+def loadGraphFile(file_name, backend, memory_budget=None):
+    # The binary graph file holds the adjacency list: there is nothing to
+    # parse or convert.
+    return cugraph.load(file_name, backend=backend,
+                        memory_budget=memory_budget)
+
+
+def generateGraph(generator, scale, edge_factor, seed, backend,
+                  memory_budget=None):
+    # Graphs of 2**scale vertices and about edge_factor * 2**scale edges
+    num_vertices = 2 ** scale
+    if generator == "rmat":
+        return cugraph.generators.rmat(scale, edge_factor, seed=seed,
+                                       backend=backend,
+                                       memory_budget=memory_budget)
+    if generator == "erdos_renyi":
+        return cugraph.generators.erdos_renyi(
+            num_vertices, min(1.0, edge_factor / (num_vertices - 1)),
+            seed=seed, backend=backend, memory_budget=memory_budget)
+    if generator == "barabasi_albert":
+        return cugraph.generators.barabasi_albert(
+            num_vertices, edge_factor, seed=seed, backend=backend,
+            memory_budget=memory_budget)
+    raise ValueError("bad generator: '%s'" % generator)
+
+
+def edgeListOf(G):
+    src, dst, val = G.view_edge_list()
+    gdf = dataFrameOf(G.backend)
+    gdf['src'] = src
+    gdf['dst'] = dst
+    if val is None:
+        gdf['val'] = 1.0
+    else:
+        gdf['val'] = val
+    return gdf
+
+
+def read_mtx(mtx_file, backend):
     M = mmread(mtx_file).asfptype()
-    gdf = cudf.DataFrame()
-    gdf['src'] = cudf.Series(M.row)
-    gdf['dst'] = cudf.Series(M.col)
+    gdf = dataFrameOf(backend)
+    gdf['src'] = seriesOf(backend, M.row)
+    gdf['dst'] = seriesOf(backend, M.col)
     if M.data is None:
         gdf['val'] = 1.0
     else:
-        gdf['val'] = cudf.Series(M.data)
+        gdf['val'] = seriesOf(backend, M.data)
 
     return gdf
 
 
-def read_csv(csv_file, delimiter):
+def read_csv(csv_file, backend, delimiter):
     cols = ["src", "dst"]
     dtypes = OrderedDict([
             ("src", "int32"),
             ("dst", "int32")
             ])
 
+    if backend == 'host':
+        gdf = pd.read_csv(csv_file, names=cols, delimiter=delimiter,
+                          dtype=dict(dtypes), usecols=[0, 1])
+        gdf['val'] = 1.0
+        if gdf.isnull().values.any():
+            print("The reader failed to parse the input")
+        return gdf
+
     gdf = cudf.read_csv(csv_file, names=cols, delimiter=delimiter,
                         dtype=list(dtypes.values()))
     gdf['val'] = 1.0
@@ -137,34 +244,170 @@ def noStdoutWrapper(algoFunction):
     return wrapper
 
 
-def logExeTime(algoFunction, perfData):
-    def wrapper(*algoArgs):
-        retVal = None
-        try:
-            st = time.time()
+def measure(algoFunction, algoArgs, warmup, repetitions, trackMemory):
+    """
+    Run algoFunction(*algoArgs) warmup times untimed, then repetitions times
+    timed, then once more under tracemalloc if trackMemory is set (the
+    tracing slows the run down, it is not timed). Return the measurement
+    record and the value returned by the last run. An exception stops the
+    measurement and is recorded in the record.
+    """
+    record = OrderedDict(status="ok", error=None, times=[])
+    retVal = None
+    try:
+        for _ in range(warmup):
             retVal = algoFunction(*algoArgs)
-        except Exception as e:
-            perfData.append((algoFunction.__name__, "ERROR: %s" % e))
-            return
-        perfData.append((algoFunction.__name__, (time.time()-st)))
-        return retVal
-    return wrapper
+        for _ in range(repetitions):
+            st = time.perf_counter()
+            retVal = algoFunction(*algoArgs)
+            record["times"].append(time.perf_counter() - st)
+        if trackMemory:
+            tracemalloc.start()
+            try:
+                retVal = algoFunction(*algoArgs)
+                record["peak_memory"] = tracemalloc.get_traced_memory()[1]
+            finally:
+                tracemalloc.stop()
+    except Exception as e:
+        record["status"] = "error"
+        record["error"] = "%s: %s" % (type(e).__name__, e)
+    record.update(statistics(record["times"]))
+    record.setdefault("peak_memory", None)
+    return record, retVal
+
+
+def statistics(times):
+    if not times:
+        return OrderedDict((k, None) for k in
+                           ["min", "median", "p95", "mean", "std"])
+    times = np.asarray(times)
+    return OrderedDict([("min", float(times.min())),
+                        ("median", float(np.median(times))),
+                        ("p95", float(np.percentile(times, 95))),
+                        ("mean", float(times.mean())),
+                        ("std", float(times.std()))])
+
+
+def resultKey(record):
+    return (record["dataset"], record["algorithm"],
+            json.dumps(record["params"], sort_keys=True))
+
+
+def newRecord(dataset, phase, algorithm, params, measurement):
+    record = OrderedDict([("dataset", dataset), ("phase", phase),
+                          ("algorithm", algorithm), ("params", params)])
+    record.update(measurement)
+    return record
+
+
+CSV_FIELDS = ["dataset", "phase", "algorithm", "params", "status", "error",
+              "repetitions", "min", "median", "p95", "mean", "std",
+              "peak_memory"]
+
+
+def writeResults(path, metadata, records):
+    if path.endswith(".csv"):
+        with open(path, "w", newline="") as f:
+            writer = csv.DictWriter(f, fieldnames=CSV_FIELDS)
+            writer.writeheader()
+            for r in records:
+                row = {k: r.get(k) for k in CSV_FIELDS}
+                row["params"] = json.dumps(r["params"], sort_keys=True)
+                row["repetitions"] = len(r["times"])
+                writer.writerow(row)
+    else:
+        with open(path, "w") as f:
+            json.dump({"metadata": metadata, "results": records}, f,
+                      indent=2)
+
+
+def readResults(path):
+    if path.endswith(".csv"):
+        records = []
+        with open(path, newline="") as f:
+            for row in csv.DictReader(f):
+                row["params"] = json.loads(row["params"])
+                row["median"] = float(row["median"]) if row["median"] \
+                    else None
+                records.append(row)
+        return records
+    with open(path) as f:
+        return json.load(f)["results"]
+
+
+def compare(records, baseline, threshold):
+    """
+    Compare the median times of records with the ones of the matching
+    baseline records (same dataset, algorithm and parameters). Return a list
+    of (record, baseline median, ratio, verdict) where verdict is
+    "regression" if the time grew by more than threshold (a fraction),
+    "improvement" if it shrank by more than threshold, "ok", or "new" if the
+    run has no usable baseline.
+    """
+    baselineMedians = {resultKey(b): b.get("median") for b in baseline}
+    comparison = []
+    for r in records:
+        base = baselineMedians.get(resultKey(r))
+        if base is None or r["median"] is None or base <= 0:
+            comparison.append((r, base, None, "new"))
+            continue
+        ratio = r["median"] / base
+        if ratio > 1.0 + threshold:
+            verdict = "regression"
+        elif ratio < 1.0 - threshold:
+            verdict = "improvement"
+        else:
+            verdict = "ok"
+        comparison.append((r, base, ratio, verdict))
+    return comparison
+
+
+def formatTime(t):
+    return "-" if t is None else "%.6f" % t
+
+
+def printTable(rows, header):
+    widths = [max(len(str(row[i])) for row in [header] + rows)
+              for i in range(len(header))]
+    for row in [header] + rows:
+        print(" | ".join(str(c).ljust(w) for c, w in zip(row, widths)))
 
 
 def parseCLI(argv):
     parser = argparse.ArgumentParser(description='CuGraph benchmark script.')
-    parser.add_argument('file', type=str,
-                        help='Path to the input file')
+    parser.add_argument('file', type=str, nargs='?', default=None,
+                        help='Path to the input file, not used with '
+                        '--generator')
     parser.add_argument('--file_type', type=str, default="mtx",
-                        choices=["mtx", "csv"],
-                        help='Input file type: csv or mtx. If csv, cuDF '
+                        choices=["mtx", "csv", "bin"],
+                        help='Input file type: csv, mtx or bin. If csv, cuDF '
                         'reader is used (set for  [src dest] pairs '
                         'separated by a tab). If mtx, Scipy reder is used '
-                        '(slow but supports weights). Default is mtx.')
+                        '(slow but supports weights). If bin, the file is a '
+                        'cugraph binary graph file (see --save), loaded '
+                        'without parsing. Default is mtx.')
+    parser.add_argument('--generator', type=str, default=None,
+                        choices=["rmat", "erdos_renyi", "barabasi_albert"],
+                        help='Benchmark a generated graph of 2**scale '
+                        'vertices and about edge_factor * 2**scale edges '
+                        '(seeded with --seed) instead of an input file')
+    parser.add_argument('--scale', type=int, default=16,
+                        help='Scale of the generated graph. Default is 16')
+    parser.add_argument('--edge_factor', type=int, default=16,
+                        help='Edge factor of the generated graph. Default '
+                        'is 16')
+    parser.add_argument('--save', type=str, default=None,
+                        help='Save the graph to this path as a cugraph '
+                        'binary graph file, to be used with --file_type bin '
+                        'in later runs')
     parser.add_argument('--algo', type=str, action="append",
                         help='Algorithm to run, must be one of %s, or "all"'
                         % ", ".join(['"%s"' % k
                                      for k in getAllPossibleAlgos()]))
+    parser.add_argument('--backend', type=str, default=None,
+                        choices=["host", "device"],
+                        help='Graph backend. Default is device if libcugraph '
+                        'and cudf are available, host otherwise')
     parser.add_argument('--damping_factor', type=float, default=0.85,
                         help='Damping factor for pagerank algo. Default is '
                         '0.85')
@@ -180,8 +423,34 @@ def parseCLI(argv):
                         help='Automatically do the csr and transposed '
                         'transformations. Default is 0, switch to another '
                         'value to enable')
+    parser.add_argument('--memory_budget', type=int, default=None,
+                        help='Maximum number of bytes held by the edge list '
+                        'and adjacency lists of the graph. Default is no '
+                        'limit')
+    parser.add_argument('--warmup', type=int, default=1,
+                        help='Untimed runs of each algo before the timed '
+                        'ones. Default is 1')
+    parser.add_argument('--repetitions', type=int, default=5,
+                        help='Timed runs of each algo. Default is 5')
+    parser.add_argument('--no_memory', action="store_true",
+                        help='Do not measure the peak host memory of each '
+                        'algo (an extra, untimed, traced run)')
+    parser.add_argument('--seed', type=int, default=0,
+                        help='Seed of the random vertex subsets. Default is '
+                        '0')
+    parser.add_argument('--output', type=str, default=None,
+                        help='Write the results to this path, as CSV if it '
+                        'ends with .csv and as JSON otherwise')
+    parser.add_argument('--baseline', type=str, default=None,
+                        help='Results of a previous run (JSON or CSV) to '
+                        'compare with. The script exits with status 1 if a '
+                        'regression is found')
+    parser.add_argument('--threshold', type=float, default=0.1,
+                        help='Relative growth of the median time flagged as '
+                        'a regression when comparing with --baseline. '
+                        'Default is 0.1 (10%%)')
     parser.add_argument('--times_only', action="store_true",
-                        help='Only output the times, no table')
+                        help='Only output the median times, no table')
     parser.add_argument('--delimiter', type=str, choices=["tab", "space"],
                         default="space",
                         help='Delimiter for csv files (default is space)')
@@ -196,12 +465,20 @@ def getAllPossibleAlgos():
 
 ###############################################################################
 if __name__ == "__main__":
-    perfData = []
     args = parseCLI(sys.argv[1:])
     delimiter = {"space": ' ', "tab": '\t'}[args.delimiter]
+    backend = args.backend or cugraph.structure.graph.default_backend()
+    if args.generator is not None:
+        dataset = "%s_scale%d_ef%d_seed%d" % (args.generator, args.scale,
+                                              args.edge_factor, args.seed)
+    elif args.file is not None:
+        dataset = os.path.basename(args.file)
+    else:
+        raise ValueError("an input file or --generator is required")
+    np.random.seed(args.seed)
 
     allPossibleAlgos = getAllPossibleAlgos()
-    if args.algo:
+    if args.algo and args.algo != ["all"]:
         if (set(args.algo) - set(allPossibleAlgos)) != set():
             raise ValueError(
                 "bad algo(s): '%s', must be in set of %s" %
@@ -210,41 +487,115 @@ if __name__ == "__main__":
     else:
         algosToRun = allPossibleAlgos
 
-    # Load the data file and create a Graph, include exe time in perfData
-    edgelist_gdf = logExeTime(loadDataFile, perfData)(args.file,
-                                                      args.file_type,
-                                                      delimiter)
-    G = logExeTime(createGraph, perfData)(edgelist_gdf, args.auto_csr)
+    records = []
+
+    def buildPhase(name, function, *functionArgs):
+        # Graph build phases are timed once: they are not repeated
+        record, retVal = measure(function, functionArgs, 0, 1,
+                                 not args.no_memory)
+        records.append(newRecord(dataset, "build", name, {}, record))
+        return retVal
+
+    # Load the data file and create a Graph, timing the reading, the graph
+    # creation and the adjacency list builds separately from the algorithms
+    if args.generator is not None:
+        G = buildPhase("generateGraph", generateGraph, args.generator,
+                       args.scale, args.edge_factor, args.seed, backend,
+                       args.memory_budget)
+        if G is None:
+            raise RuntimeError("could not generate graph!")
+        edgelist_gdf = edgeListOf(G)
+    elif args.file_type == "bin":
+        G = buildPhase("loadGraphFile", loadGraphFile, args.file, backend,
+                       args.memory_budget)
+        if G is None:
+            raise RuntimeError("could not load graph!")
+        edgelist_gdf = edgeListOf(G)
+    else:
+        edgelist_gdf = buildPhase("loadDataFile", loadDataFile, args.file,
+                                  args.file_type, backend, delimiter)
+        if edgelist_gdf is None:
+            raise RuntimeError("could not read %s!" % args.file)
+        G = buildPhase("createGraph", createGraph, edgelist_gdf, backend,
+                       args.memory_budget)
 
     if G is None:
         raise RuntimeError("could not create graph!")
+    buildPhase("buildAdjLists", buildAdjLists, G, args.auto_csr)
+
+    if args.save is not None:
+        G.save(args.save)
 
     # Get the data on the algorithms present and how to run them
     algoData = getAlgoData(G, edgelist_gdf, args)
 
     # For each algo to run, look up the object it belongs to (the cugraph
-    # module by default), the args it needs passed (none by default), and any
-    # extra function wrappers that should be applied (none by default).
+    # module by default), the args it needs passed (none by default, or
+    # returned by its untimed setup callable), and any extra function
+    # wrappers that should be applied (none by default).
     for algo in algosToRun:
         obj = algoData[algo].get("obj", cugraph)
         algoArgs = algoData[algo].get("args", ())
+        if "setup" in algoData[algo]:
+            algoArgs = algoData[algo]["setup"]()
         extraWrappers = algoData[algo].get("extraWrappers", [])
 
         # get the callable, wrap it in any wrappers (which results in a wrapped
-        # callable), wrap it in the logger, then finally call it with algoArgs.
-        callable = getattr(obj, algo)
+        # callable), then measure it with algoArgs.
+        callable = algoData[algo].get("callable", None)
+        if callable is None:
+            callable = getattr(obj, algo)
         for wrapper in extraWrappers:
             callable = wrapper(callable)
-        callable = logExeTime(callable, perfData)
-        callable(*algoArgs)
+        record, _ = measure(callable, algoArgs, args.warmup,
+                            args.repetitions, not args.no_memory)
+        records.append(newRecord(dataset, "algorithm", algo,
+                                 algoData[algo].get("params", {}), record))
+
+    metadata = OrderedDict([
+        ("cugraph_version", cugraph.__version__),
+        ("backend", backend),
+        ("python", platform.python_version()),
+        ("machine", platform.node()),
+        ("timestamp", time.strftime("%Y-%m-%dT%H:%M:%S")),
+        ("warmup", args.warmup),
+        ("repetitions", args.repetitions),
+        ("graph_memory_usage", G.memory_usage()),
+    ])
+    if args.output is not None:
+        writeResults(args.output, metadata, records)
+
+    comparison = None
+    if args.baseline is not None:
+        comparison = compare(records, readResults(args.baseline),
+                             args.threshold)
 
     print()
     if args.times_only:
-        print(",".join([str(exeTime) for (name, exeTime) in perfData]))
+        print(",".join([formatTime(r["median"]) for r in records]))
     else:
-        # Print a formatted table of the perfData
-        nameCellWidth = max([len(name) for (name, _) in perfData])
-        exeTimeCellWith = max([len(str(exeTime)) for (_, exeTime) in perfData])
-        for (name, exeTime) in perfData:
-            print("%s | %s" % (name.ljust(nameCellWidth),
-                               str(exeTime).ljust(exeTimeCellWith)))
+        rows = []
+        for i, r in enumerate(records):
+            row = [r["phase"], r["algorithm"], formatTime(r["min"]),
+                   formatTime(r["median"]), formatTime(r["p95"]),
+                   "-" if r["peak_memory"] is None else r["peak_memory"],
+                   r["status"] if r["error"] is None else r["error"]]
+            if comparison is not None:
+                _, base, ratio, verdict = comparison[i]
+                row += [formatTime(base),
+                        "-" if ratio is None else "%.3f" % ratio, verdict]
+            rows.append(row)
+        header = ["phase", "name", "min (s)", "median (s)", "p95 (s)",
+                  "peak host memory (bytes)", "status"]
+        if comparison is not None:
+            header += ["baseline median (s)", "ratio", "verdict"]
+        printTable(rows, header)
+        print()
+        print("Graph memory usage (bytes): %s" % G.memory_usage())
+
+    if comparison is not None:
+        regressions = [r["algorithm"] for r, _, _, verdict in comparison
+                       if verdict == "regression"]
+        if regressions:
+            print("Regressions: %s" % ", ".join(regressions))
+            sys.exit(1)